@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2019-2022 Intel Corporation
+# Copyright (C) 2019-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -252,6 +252,48 @@ class StatsCollect(_SpecStatsCollect.SpecStatsCollect):
         self._reject_aggr_stnames(set(intervals), "set interval")
         super().set_intervals(intervals)
 
+    def set_compression(self, compression):
+        """
+        Set compression methods for statistics collectors. The 'compression' argument should be a
+        dictionary with statistics collector names as keys and the compression method name (e.g.,
+        "gzip") as the value. The statistics are compressed on the fly by 'stc-agent', and the
+        compressed raw statistics files are decompressed transparently when loaded. This method
+        should be called prior to the 'configure()' method.
+        """
+
+        self._reject_aggr_stnames(set(compression), "set compression")
+        super().set_compression(compression)
+
+    def set_segments(self, segments):
+        """
+        Split the collected statistics into segments. The 'segments' argument should be a dictionary
+        with statistics collector names as keys and '{"time": <seconds>, "size": <bytes>}'
+        dictionaries as values. The output of a collector rolls over to a new segment file every
+        'time' seconds, or when the segment reaches 'size' bytes, and the segments are listed in a
+        manifest file. Loading a time window of the statistics reads only the segments overlapping
+        the window. This method should be called prior to the 'configure()' method.
+        """
+
+        self._reject_aggr_stnames(set(segments), "set segments")
+        super().set_segments(segments)
+
+    def set_placement(self, cpus=None, nice=None, cgroup=None):
+        """
+        Configure where the in-band statistics collectors run on the SUT. The arguments are as
+        follows.
+          * cpus - list of housekeeping CPU numbers to bind the collectors to. Use it to keep the
+                   collectors off the measured CPUs, so that they do not wake the measured CPUs up
+                   and do not pollute their C-state residency and frequency statistics.
+          * nice - the niceness to run the collectors with.
+          * cgroup - path to the cgroup directory on the SUT to run the collectors in.
+
+        The collectors are started by 'stc-agent' and inherit its placement. The CPUs are recorded
+        in the 'info.yml' file of the result. This method should be called prior to the
+        'configure()' method. By default, the collectors may run on any CPU.
+        """
+
+        super().set_placement(cpus=cpus, nice=nice, cgroup=cgroup)
+
     def get_toolpath(self, stname):
         """
         Get currently configured path to the tool collecting the 'stname' statistics. The path is on
@@ -306,6 +348,10 @@ class StatsCollect(_SpecStatsCollect.SpecStatsCollect):
          * 'set_disabled_stats()' and 'set_enabled_stats()' prior to to enable/disable certain
             statistics.
          * 'set_intervals()' - to configure the statistics collectors' intervals.
+         * 'set_compression()' - to configure the statistics collectors' output compression.
+         * 'set_segments()' - to split the statistics collectors' output into segments.
+         * 'set_placement()' - to configure the CPUs, the niceness and the cgroup of the statistics
+            collectors.
          * 'set_prop()' - to configure statistics collectors' properties.
          * 'set_toolpath()' - to configure statistics collectors' tools paths.
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2019-2022 Intel Corporation
+# Copyright (C) 2019-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -13,12 +13,17 @@ from pepclibs.helperlibs import Logging, Trivial, ClassHelpers
 from pepclibs.helperlibs.Exceptions import Error
 from statscollectlibs.collector import StatsCollect
 from statscollectlibs.deploy import DeployBase
+from statscollectlibs.helperlibs import Compression
 from statscollectlibs.result import _WORawResult
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
 DEFAULT_STNAMES = ("turbostat", "sysinfo")
 
+# The units of the segment time limits (in seconds) and of the segment size limits (in bytes).
+_SEGMENT_TIME_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+_SEGMENT_SIZE_UNITS = {"KiB": 1024, "MiB": 1024 * 1024, "GiB": 1024 * 1024 * 1024}
+
 class StatsCollectBuilder(ClassHelpers.SimpleCloseContext):
     """This class provides the API for building an instance of 'StatsCollect'."""
 
@@ -83,11 +88,117 @@ class StatsCollectBuilder(ClassHelpers.SimpleCloseContext):
 
             self.intervals[stname] = float(interval)
 
+    def parse_compression(self, compression):
+        """
+        Parse a string containing statistics collectors' compression methods. The arguments are as
+        follows:
+        * compression - a comma-separated list of "stname:method" entries, where 'stname' is the
+                        statistics name, and 'method' is the compression method (e.g., "gzip").
+
+        This method parses statistics collectors' compression methods into the 'compression' class
+        property.
+        """
+
+        for entry in Trivial.split_csv_line(compression):
+            split = Trivial.split_csv_line(entry, sep=":")
+            if len(split) != 2:
+                methods = ", ".join(Compression.SUFFIXES)
+                raise Error(f"bad compression entry '{entry}', should be 'stname:method', where "
+                            f"'stname' is the statistics name and 'method' is the method for "
+                            f"compressing the 'stname' statistics, one of: {methods}.")
+            stname, method = split # pylint: disable=unbalanced-tuple-unpacking
+            StatsCollect.check_stname(stname)
+
+            if method not in Compression.SUFFIXES:
+                methods = ", ".join(Compression.SUFFIXES)
+                raise Error(f"bad compression method '{method}' for the '{stname}' statistics: "
+                            f"should be one of: {methods}")
+
+            self.compression[stname] = method
+
+    def parse_segments(self, segments):
+        """
+        Parse a string containing statistics collectors' segment limits. The arguments are as
+        follows:
+        * segments - a comma-separated list of "stname:limit" entries, where 'stname' is the
+                     statistics name, and 'limit' is the time (e.g., "30m" or "1h") or the size
+                     (e.g., "500MiB") of the segments to split the collected 'stname' statistics
+                     into. The time and the size limits may be specified for the same statistics.
+
+        This method parses statistics collectors' segment limits into the 'segments' class property.
+        """
+
+        time_units = ", ".join(_SEGMENT_TIME_UNITS)
+        size_units = ", ".join(_SEGMENT_SIZE_UNITS)
+
+        for entry in Trivial.split_csv_line(segments):
+            split = Trivial.split_csv_line(entry, sep=":")
+            if len(split) != 2:
+                raise Error(f"bad segments entry '{entry}', should be 'stname:limit', where "
+                            f"'stname' is the statistics name and 'limit' is the segment time "
+                            f"(units: {time_units}) or size (units: {size_units}).")
+            stname, limit = split # pylint: disable=unbalanced-tuple-unpacking
+            StatsCollect.check_stname(stname)
+
+            for key, units in (("size", _SEGMENT_SIZE_UNITS), ("time", _SEGMENT_TIME_UNITS)):
+                unit = next((unit for unit in units if limit.endswith(unit)), None)
+                if unit:
+                    break
+            else:
+                raise Error(f"bad segment limit '{limit}' for the '{stname}' statistics: should "
+                            f"be a time (units: {time_units}) or a size (units: {size_units})")
+
+            val = limit[:-len(unit)].strip()
+            if not Trivial.is_float(val) or float(val) * units[unit] < 1:
+                raise Error(f"bad segment {key} limit '{limit}' for the '{stname}' statistics: "
+                            f"should be a positive number followed by the unit")
+
+            self.segments.setdefault(stname, {})[key] = int(float(val) * units[unit])
+
+    def parse_placement(self, cpus=None, nice=None, cgroup=None):
+        """
+        Parse the statistics collectors placement. The arguments are as follows.
+        * cpus - a comma-separated list of CPU numbers and CPU number ranges (e.g., "0-1,8") to
+                 run the in-band statistics collectors on.
+        * nice - the niceness to run the in-band statistics collectors with.
+        * cgroup - path to the cgroup directory on the SUT to run the in-band statistics collectors
+                   in.
+
+        This method parses the placement into the 'cpus', 'nice', and 'cgroup' class properties.
+        """
+
+        if cpus is not None:
+            self.cpus = set()
+            for entry in Trivial.split_csv_line(cpus):
+                split = [val.strip() for val in entry.split("-")]
+                if len(split) > 2 or not all(Trivial.is_int(val) for val in split):
+                    raise Error(f"bad CPU number or range '{entry}' in CPUs list '{cpus}', should "
+                                f"be a non-negative integer or a range, like '0-3'")
+
+                first, last = int(split[0]), int(split[-1])
+                if first > last:
+                    raise Error(f"bad CPU range '{entry}' in CPUs list '{cpus}': the first CPU "
+                                f"number is greater than the last one")
+                self.cpus.update(range(first, last + 1))
+
+            if not self.cpus:
+                raise Error("the list of CPUs to run statistics collectors on is empty")
+
+        if nice is not None:
+            if not Trivial.is_int(nice) or not -20 <= int(nice) <= 19:
+                raise Error(f"bad statistics collectors niceness '{nice}', should be an integer "
+                            f"in the [-20, 19] range")
+            self.nice = int(nice)
+
+        if cgroup is not None:
+            self.cgroup = cgroup
+
     def build_stcoll(self, pman, res, local_outdir=None, remote_outdir=None, local_path=None,
                      remote_path=None):
         """
         Build and return an instance of 'StatsCollect' based on the statistics named in the class
-        properties 'discover', 'include', 'exclude' and 'intervals'. Arguments are the same as
+        properties 'discover', 'include', 'exclude', 'intervals', 'compression', 'segments',
+        'cpus', 'nice', and 'cgroup'. Arguments are the same as
         'StatsCollect.StatsCollect.__init__()', except for:
          * local_path - path to the 'stc-agent' program on the local system. By default, this method
                         will search for 'stc-agent' on the local system.
@@ -128,6 +239,9 @@ class StatsCollectBuilder(ClassHelpers.SimpleCloseContext):
         stcoll.set_stcagent_path(local_path=local_path, remote_path=remote_path)
 
         stcoll.set_intervals(self.intervals)
+        stcoll.set_compression(self.compression)
+        stcoll.set_segments(self.segments)
+        stcoll.set_placement(cpus=self.cpus, nice=self.nice, cgroup=self.cgroup)
 
         if self.discover:
             stcoll.set_enabled_stats(self.discover)
@@ -184,6 +298,17 @@ class StatsCollectBuilder(ClassHelpers.SimpleCloseContext):
         # Statistics collection intervals. Maps statistic names to collection intervals which are in
         # seconds.
         self.intervals = {}
+        # Statistics compression methods. Maps statistic names to the methods for compressing the
+        # collected statistics.
+        self.compression = {}
+        # Statistics segment limits. Maps statistic names to '{"time": <seconds>, "size": <bytes>}'
+        # dictionaries.
+        self.segments = {}
+        # The CPUs, the niceness, and the cgroup to run the in-band statistics collectors with.
+        # 'None' means no restrictions.
+        self.cpus = None
+        self.nice = None
+        self.cgroup = None
 
     def close(self):
         """Close the statistics collector."""
@@ -20,6 +20,7 @@ the SUT via an external channel (e.g., AC power meter, IPMI out-of-band).
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import copy
+import json
 import time
 import typing
 import socket
@@ -29,7 +30,7 @@ from pepclibs.helperlibs import Logging, LocalProcessManager, Trivial, ClassHelp
 from pepclibs.helperlibs.Exceptions import Error, ErrorExists
 from statscollectlibs.collector import _SysInfo
 from statscollectlibs.deploy import DeployHelpersBase
-from statscollectlibs.helperlibs import ProcHelpers, RemoteHelpers
+from statscollectlibs.helperlibs import Compression, ProcHelpers, RemoteHelpers, Segments
 
 if typing.TYPE_CHECKING:
     from typing import Final, TypedDict
@@ -58,6 +59,11 @@ if typing.TYPE_CHECKING:
             interface: IPMI interface name to use (e.g., 'lanplus').
             devnode: Device node to use for collecting statistics.
             pmtype: The power meter type.
+            keyframes: Write every N-th '/proc/interrupts' snapshot in full, and only the changed
+                       interrupt counters in between.
+            helper: Take '/proc/interrupts' snapshots with the helper process instead of taking
+                    them in the 'stc-agent' process.
+            sensors: Comma-separated list of IPMI sensor names and metric categories to collect.
         """
 
         opts: str
@@ -67,6 +73,9 @@ if typing.TYPE_CHECKING:
         interface: str | None
         devnode: str | None
         pmtype: str | None
+        keyframes: str | None
+        helper: bool | None
+        sensors: str | None
     class _STInfoTypedDict(TypedDict, total=False):
         """
         The statistics information dictionary type.
@@ -75,10 +84,19 @@ if typing.TYPE_CHECKING:
             interval: The wake up period in seconds for the statistics collector.
             inband: 'True' if the statistics collector is "in band" and 'False' if it is
                      "out-of-band".
+            compress: The compression method for the collected statistics, or 'None' if the
+                      statistics are not compressed.
+            segment_time: Split the collected statistics into segments of this many seconds, or
+                          'None' for no time limit.
+            segment_size: Split the collected statistics into segments of this many bytes, or
+                          'None' for no size limit.
         """
 
         interval: float | None
         inband: bool
+        compress: str | None
+        segment_time: int | None
+        segment_size: int | None
         fallible: bool
         enabled: bool
         toolpath: str | None
@@ -109,6 +127,11 @@ DELIMITER: Final[bytes] = b"--\n"
 #             turbostat), in which case 'stc-agent' will assume the tool is in '$PATH'. But
 #             users can modify this field and specify full path to the tool.
 # * description: the statistics collector description.
+# * compress: the method for compressing the collected statistics on the fly (e.g., "gzip"). The
+#             statistics are not compressed by default.
+# * segment_time: split the collected statistics into segments (separate files) of 'segment_time'
+#                 seconds. The statistics are not split by default.
+# * segment_size: split the collected statistics into segments of 'segment_size' bytes.
 # * props: a sub-dictionary containing various collector-specific properties.
 # * paths: a sub-dictionary containing various sub-paths to statistic-specific data.
 #
@@ -121,6 +144,13 @@ DELIMITER: Final[bytes] = b"--\n"
 #     user: name of the BMC user to use when talking to the BMC host (same as 'ipmitool -U').
 #     pwdfile: path to a file containing the password to use when talking to the host (same as
 #             'ipmitool -f').
+#     sensors: comma-separated list of sensors to collect. Besides sensor names, the list may
+#              include IPMI metric categories (e.g., "Power"), which select all the sensors of the
+#              category. All sensors are collected by default.
+# ipmi-inband:
+#     sensors: same as in 'ipmi-oob'.
+# ipmi-power:
+#     host, user, pwdfile: same as in 'ipmi-oob'.
 # acpower:
 #     devnode: the power meter device node to use for reading power consumption data.
 #     pmtype: the power meter type.
@@ -164,6 +194,15 @@ STINFO: dict[str, _STInfoTypedDict] = {
         "description" : "Collect snapshots of the '/proc/interrupts' file, which includes "
                         "interrupts count for every interrupt type on every CPU.",
         "paths": {"stats": "interrupts.raw.txt"},
+        "props" : {
+            # Write every N-th snapshot in full, and only the changed interrupt counters in
+            # between. Not set by default, which means that every snapshot is written in full.
+            "keyframes" : None,
+            # Take the snapshots with the 'toolpath' helper process instead of taking them in the
+            # 'stc-agent' process. Not set by default, which means that the snapshots are taken in
+            # the 'stc-agent' process.
+            "helper" : None,
+        }
     },
     "ipmi-oob" : {
         "interval" : 5,
@@ -181,6 +220,7 @@ STINFO: dict[str, _STInfoTypedDict] = {
             "user" : None,
             "pwdfile" : None,
             "interface" : None,
+            "sensors" : None,
         }
     },
     "ipmi-inband" : {
@@ -191,6 +231,27 @@ STINFO: dict[str, _STInfoTypedDict] = {
         "description" : "Same as the 'ipmi-oob' statistics, but the data are collected by running "
                         "'ipmitool' on the SUT (in-band).",
         "paths" : {"stats": "ipmi-inband.raw.txt"},
+        "props" : {
+            "sensors" : None,
+        }
+    },
+    "ipmi-power" : {
+        "interval" : 1,
+        "inband" : False,
+        "fallible" : True,
+        "toolpath" : "stc-agent-ipmi-helper",
+        "description" : "Periodically run the 'ipmitool dcmi power reading' command to collect the "
+                        "SUT power consumption measured by the BMC. Like the 'ipmi-oob' "
+                        "statistics, the data are collected out of band. Reading a single power "
+                        "value is a lot cheaper than reading all the IPMI sensors, so the "
+                        "collection interval can be a lot shorter.",
+        "paths" : {"stats": "ipmi-power.raw.txt"},
+        "props" : {
+            "host" : None,
+            "user" : None,
+            "pwdfile" : None,
+            "interface" : None,
+        }
     },
     "acpower" : {
         "interval" : 1,
@@ -204,6 +265,16 @@ STINFO: dict[str, _STInfoTypedDict] = {
             "pmtype" : None,
         }
     },
+    "stc-overhead" : {
+        "interval" : 5,
+        "inband" : True,
+        "toolpath" : None,
+        "description" : "Collect the overhead of statistics collection: CPU usage, memory, context "
+                        "switches, and disk I/O of 'stc-agent' and of every statistics collector "
+                        "process. The statistics collected in the 'stc-agent' process (e.g., "
+                        "'interrupts') are accounted to 'stc-agent'.",
+        "paths": {"stats": "stc-overhead.raw.txt"},
+    },
 }
 
 class SCReplyError(Error):
@@ -238,6 +309,12 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         self.labels_path = None
         # Path to the statistics sub-directory.
         self.statsdir = None
+        # The CPUs to run the statistics collectors on ('None' means all CPUs).
+        self.cpus = None
+        # The niceness and the cgroup to run the statistics collectors with ('None' means the
+        # 'stc-agent' defaults).
+        self._nice = None
+        self._cgroup = None
 
         # Log level for some of the high-level messages.
         self.infolvl = Logging.DEBUG
@@ -390,11 +467,8 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
 
         raise Error(f"time out waiting for the 'stc-agent' response at {self._stca_id}")
 
-    def _send_command(self, cmd, arg=None):
-        """Send a command to 'stc-agent', verify and return the response."""
-
-        if arg:
-            cmd += " " + arg
+    def _exchange(self, cmd):
+        """Send a command to 'stc-agent' and return the response."""
 
         stca_str = f"'stc-agent' at {self._stca_id}"
         check_log_msg = f"Check 'stc-agent' log file{self._pman.hostmsg}':\n{self._logpath}"
@@ -410,13 +484,19 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
                         f"{msg}") from err
 
         try:
-            msg = self._recv_msg()
+            return self._recv_msg()
         except (Error, socket.error) as err:
             self._keep_outdir = True
             msg = Error(f"{err}\n{check_log_msg}").indent(2)
             raise Error(f"failed receiving the reply to the following command from {stca_str}: "
                         f"{cmd}\n{msg}") from err
 
+    def _check_response(self, cmd, msg):
+        """
+        Verify the 'msg' response of 'stc-agent' to the 'cmd' command. Return the data included
+        into the response, or 'None' if there is no data.
+        """
+
         if msg == "OK":
             return None
 
@@ -424,14 +504,66 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
             return msg[3:]
 
         self._keep_outdir = True
+        stca_str = f"'stc-agent' at {self._stca_id}"
+        check_log_msg = f"Check 'stc-agent' log file{self._pman.hostmsg}':\n{self._logpath}"
         raise SCReplyError(f"{stca_str} did not respond with 'OK' to the following command:\n{cmd}"
                            f"\nInstead, the response was the following:\n{msg}\n{check_log_msg}")
 
-    def _set_collector_property(self, name, prop, value):
-        """Set the 'prop' property of the 'name' statistic collector to the 'value' value."""
+    def _send_command(self, cmd, arg=None):
+        """Send a command to 'stc-agent', verify and return the response."""
 
-        if value is not None:
-            self._send_command("set-collector-property", arg=f"{name} {prop} {value}")
+        if arg:
+            cmd += " " + arg
+
+        return self._check_response(cmd, self._exchange(cmd))
+
+    def _send_commands(self, cmds):
+        """
+        Send a list of commands to 'stc-agent' in one batch, verify the responses and return the
+        list of the data included into the responses. The arguments are as follows.
+          * cmds - list of commands to send.
+
+        This is the same as sending the commands one-by-one with '_send_command()', but takes a
+        single round trip. An older 'stc-agent' that does not support batches gets the commands
+        one-by-one.
+        """
+
+        if not cmds:
+            return []
+
+        batch = f"batch {json.dumps(cmds)}"
+        msg = self._exchange(batch)
+        if msg == "Bad command: batch":
+            _LOG.debug("'stc-agent' at %s does not support batches", self._stca_id)
+            return [self._send_command(cmd) for cmd in cmds]
+
+        data = self._check_response(batch, msg)
+        try:
+            responses = json.loads(data)
+        except (TypeError, ValueError) as err:
+            self._keep_outdir = True
+            raise Error(f"bad batch response from 'stc-agent' at {self._stca_id}:\n{msg}") from err
+
+        # The commands following a failed command are not executed, so there are less responses
+        # than commands if a command failed.
+        results = [self._check_response(cmd, response) for cmd, response in zip(cmds, responses)]
+        if len(results) != len(cmds):
+            self._keep_outdir = True
+            raise Error(f"'stc-agent' at {self._stca_id} responded to {len(results)} out of "
+                        f"{len(cmds)} batch commands:\n{msg}")
+
+        return results
+
+    @staticmethod
+    def _get_property_cmds(name, prop, value):
+        """
+        Return the list of commands for setting the 'prop' property of the 'name' statistic
+        collector to the 'value' value.
+        """
+
+        if value is None:
+            return []
+        return [f"set-collector-property {name} {prop} {value}"]
 
     def set_intervals(self, intervals):
         """
@@ -456,6 +588,87 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
 
         return actual
 
+    def set_compression(self, compression):
+        """
+        Set compression methods for statistics collectors. The 'compression' argument should be a
+        dictionary with statistics collector names as keys and the compression method name (e.g.,
+        "gzip") as the value. This method should be called prior to the 'configure()' method. By
+        default the collected statistics are not compressed.
+        """
+
+        for stname, method in compression.items():
+            if stname == "sysinfo":
+                raise Error("the 'sysinfo' statistics cannot be compressed")
+            # The compression is done by 'stc-agent', so the compression method availability is
+            # checked by 'stc-agent' too.
+            if method not in Compression.SUFFIXES:
+                methods = ", ".join(Compression.SUFFIXES)
+                raise Error(f"bad compression method '{method}' for '{stname}' statistics, "
+                            f"supported methods are: {methods}")
+
+            stinfo = self.stinfo[stname]
+            stinfo["compress"] = method
+            if not Segments.is_manifest(stinfo["paths"]["stats"]):
+                stinfo["paths"]["stats"] = Compression.add_suffix(stinfo["paths"]["stats"],
+                                                                  method)
+
+    def set_segments(self, segments):
+        """
+        Split the collected statistics into segments. The 'segments' argument should be a dictionary
+        with statistics collector names as keys and '{"time": <seconds>, "size": <bytes>}'
+        dictionaries as values. The collector output rolls over to a new segment file every
+        'time' seconds, or when the segment size reaches 'size' bytes. Either key may be omitted or
+        'None'. This method should be called prior to the 'configure()' method. By default the
+        collected statistics are not split into segments.
+        """
+
+        for stname, limits in segments.items():
+            if stname == "sysinfo":
+                raise Error("the 'sysinfo' statistics cannot be split into segments")
+
+            for key in ("time", "size"):
+                val = limits.get(key)
+                if val is not None and (not Trivial.is_int(val) or int(val) <= 0):
+                    raise Error(f"bad segment {key} limit '{val}' for '{stname}' statistics, "
+                                f"should be a positive integer")
+
+            stinfo = self.stinfo[stname]
+            stinfo["segment_time"] = limits.get("time")
+            stinfo["segment_size"] = limits.get("size")
+            if stinfo["segment_time"] is not None or stinfo["segment_size"] is not None:
+                stinfo["paths"]["stats"] = Segments.get_manifest_name(stinfo["paths"]["stats"])
+
+    def set_placement(self, cpus=None, nice=None, cgroup=None):
+        """
+        Configure where the statistics collectors run. The arguments are as follows.
+          * cpus - list of CPU numbers to bind 'stc-agent' and all the statistics collectors to.
+          * nice - the niceness to run 'stc-agent' and all the statistics collectors with.
+          * cgroup - path to the cgroup directory to run 'stc-agent' and all the statistics
+                     collectors in, on the same host where 'stc-agent' runs.
+
+        The arguments that are 'None' are not changed. This method should be called prior to the
+        'configure()' method.
+        """
+
+        if cpus is not None:
+            cpus = list(cpus)
+            if not cpus:
+                raise Error("the list of CPUs to run statistics collectors on is empty")
+            for cpu in cpus:
+                if not Trivial.is_int(cpu) or int(cpu) < 0:
+                    raise Error(f"bad CPU number '{cpu}' to run statistics collectors on, should "
+                                f"be a non-negative integer")
+            self.cpus = sorted(set(int(cpu) for cpu in cpus))
+
+        if nice is not None:
+            if not Trivial.is_int(nice) or not -20 <= int(nice) <= 19:
+                raise Error(f"bad statistics collectors niceness '{nice}', should be an integer "
+                            f"in the [-20, 19] range")
+            self._nice = int(nice)
+
+        if cgroup is not None:
+            self._cgroup = cgroup
+
     def set_stcagent_path(self, path):
         """
         Configure the 'stc-agent' program path. The arguments are as follows.
@@ -510,7 +723,8 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         # Add some margin of safety.
         max_interval += 1
 
-        if self._stname_enabled("ipmi-inband") or self._stname_enabled("ipmi-oob"):
+        if self._stname_enabled("ipmi-inband") or self._stname_enabled("ipmi-oob") or \
+           self._stname_enabled("ipmi-power"):
             # IPMI may be very slow sometimes, so give it at least 10 seconds.
             max_interval = max(10, max_interval)
 
@@ -538,8 +752,6 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
           * metrics - a dictionary with additional metrics to add along with the label.
         """
 
-        import json # pylint: disable=import-outside-toplevel
-
         if not name.isalnum():
             raise Error(f"bad label name '{name}': must be alphanumeric")
 
@@ -882,26 +1094,41 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         if not self._sock:
             self._connect()
 
-        self._send_command("set-stats", arg=",".join(stnames))
+        # Send all the configuration commands in one batch to save the round trips.
+        cmds = [f"set-stats {','.join(stnames)}"]
 
         for stname in stnames:
-            self._set_collector_property(stname, "outdir", self.statsdir)
-            self._set_collector_property(stname, "logdir", self._logsdir)
-            self._set_collector_property(stname, "toolpath", self.stinfo[stname]["toolpath"])
-            self._set_collector_property(stname, "interval", self.stinfo[stname]["interval"])
+            cmds += self._get_property_cmds(stname, "outdir", self.statsdir)
+            cmds += self._get_property_cmds(stname, "logdir", self._logsdir)
+            cmds += self._get_property_cmds(stname, "toolpath", self.stinfo[stname]["toolpath"])
+            cmds += self._get_property_cmds(stname, "interval", self.stinfo[stname]["interval"])
+            cmds += self._get_property_cmds(stname, "compress", self.stinfo[stname]["compress"])
+            cmds += self._get_property_cmds(stname, "segment_time",
+                                            self.stinfo[stname]["segment_time"])
+            cmds += self._get_property_cmds(stname, "segment_size",
+                                            self.stinfo[stname]["segment_size"])
 
             # During discovery, all collectors should be fallible so that if one fails, it doesn't
             # block the discovery of other collectors.
             fallible = True if for_discovery else self.stinfo[stname]["fallible"]
-            self._set_collector_property(stname, "fallible", fallible)
+            cmds += self._get_property_cmds(stname, "fallible", fallible)
 
         # Configure all the statistics-specific properties.
         for stname in stnames:
             for name, value in self.stinfo[stname]["props"].items():
                 if value:
-                    self._set_collector_property(stname, name, value)
+                    cmds += self._get_property_cmds(stname, name, value)
+
+        # Keep 'stc-agent' and the collectors it starts off the measured CPUs.
+        if self.cpus:
+            cmds.append(f"set-agent-property cpus {','.join(str(cpu) for cpu in self.cpus)}")
+        if self._nice is not None:
+            cmds.append(f"set-agent-property nice {self._nice}")
+        if self._cgroup:
+            cmds.append(f"set-agent-property cgroup {self._cgroup}")
 
-        self._send_command("configure")
+        cmds.append("configure")
+        self._send_commands(cmds)
 
     def configure(self, stnames=None):
         """Configure statistic collectors."""
@@ -961,6 +1188,12 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
                 info["enabled"] = False
             if "fallible" not in info:
                 info["fallible"] = False
+            if "compress" not in info:
+                info["compress"] = None
+            if "segment_time" not in info:
+                info["segment_time"] = None
+            if "segment_size" not in info:
+                info["segment_size"] = None
             if "props" not in info:
                 info["props"] = {}
 
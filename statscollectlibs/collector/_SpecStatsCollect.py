@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2019-2022 Intel Corporation
+# Copyright (C) 2019-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -11,7 +11,7 @@ This module provides the 'SpecStatsCollect' class, which implements specific (no
 statistics collection.
 """
 
-from pepclibs.helperlibs import Logging, ClassHelpers, ProjectFiles, ToolChecker
+from pepclibs.helperlibs import Logging, ClassHelpers, ProjectFiles, ToolChecker, Trivial
 from pepclibs.helperlibs.Exceptions import Error
 from statscollectlibs import _StatsConfig
 from statscollectlibs.collector import _Collectors
@@ -191,6 +191,31 @@ class SpecStatsCollect(ClassHelpers.SimpleCloseContext):
             intervals.update(self._oobagent.set_intervals(oob_intervals))
         return intervals
 
+    def set_compression(self, compression):
+        """Same as 'StatsCollect.set_compression()'."""
+
+        inb_stnames, oob_stnames = self._separate_inb_vs_oob(set(compression))
+
+        self._inbagent.set_compression({stname: compression[stname] for stname in inb_stnames})
+        if self._oobagent:
+            self._oobagent.set_compression({stname: compression[stname]
+                                            for stname in oob_stnames})
+
+    def set_segments(self, segments):
+        """Same as 'StatsCollect.set_segments()'."""
+
+        inb_stnames, oob_stnames = self._separate_inb_vs_oob(set(segments))
+
+        self._inbagent.set_segments({stname: segments[stname] for stname in inb_stnames})
+        if self._oobagent:
+            self._oobagent.set_segments({stname: segments[stname] for stname in oob_stnames})
+
+    def set_placement(self, cpus=None, nice=None, cgroup=None):
+        """Same as 'StatsCollect.set_placement()'."""
+
+        # Only the in-band collectors run on the SUT.
+        self._inbagent.set_placement(cpus=cpus, nice=nice, cgroup=cgroup)
+
     def _get_stinfo(self, stname):
         """Get statistics description dictionary for the 'stname' statistics."""
 
@@ -405,6 +430,8 @@ class SpecStatsCollect(ClassHelpers.SimpleCloseContext):
 
         self._copy_inband_data()
         self.res.info["stinfo"] = self.get_stinfo()
+        if self._inbagent.cpus and self._inbagent.get_enabled_stats():
+            self.res.info["stats_cpus"] = Trivial.rangify(self._inbagent.cpus)
         self.res.write_info()
 
     def _apply_config_file(self):
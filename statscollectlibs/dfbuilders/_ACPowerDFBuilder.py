@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2024 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Adam Hawley <adam.james.hawley@intel.com>
@@ -14,11 +14,95 @@ file.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import io
+import os
+import typing
 from pathlib import Path
 import pandas
 from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import Segments
 from statscollectlibs.mdc import ACPowerMDC
 
+if typing.TYPE_CHECKING:
+    from typing import BinaryIO, Final
+    from statscollectlibs.helperlibs.Segments import RangeType
+
+# The size of the chunks to read when looking for the last line of the raw statistics file.
+_CHUNK_SIZE: Final[int] = 64 * 1024
+
+class _LimitedReader(io.RawIOBase):
+    """
+    A read-only file-like object providing only the first 'size' bytes of a file, without copying
+    them.
+    """
+
+    def __init__(self, fobj: BinaryIO, size: int):
+        """
+        Initialize a class instance.
+
+        Args:
+            fobj: The file object to read from, positioned at the beginning of the file.
+            size: Count of bytes to provide.
+        """
+
+        super().__init__()
+
+        self._fobj = fobj
+        self._left = size
+
+    def readable(self) -> bool:
+        """Return 'True', the object is readable."""
+
+        return True
+
+    def readinto(self, buf) -> int:
+        """
+        Read up to 'len(buf)' bytes into 'buf'.
+
+        Args:
+            buf: The buffer to read into.
+
+        Returns:
+            The count of bytes read, 0 at the end of the data.
+        """
+
+        if self._left <= 0:
+            return 0
+
+        with memoryview(buf) as mv:
+            cnt = self._fobj.readinto(mv[:min(len(mv), self._left)])
+        self._left -= cnt
+        return cnt
+
+def _get_last_line_offset(fobj: BinaryIO) -> int:
+    """
+    Find the last line of a file by reading it from the end.
+
+    Args:
+        fobj: The file object to find the last line in.
+
+    Returns:
+        The offset of the first byte of the last line.
+    """
+
+    # Ignore the terminating newline, if any.
+    end = fobj.seek(0, os.SEEK_END)
+    if end:
+        fobj.seek(end - 1)
+        if fobj.read(1) == b"\n":
+            end -= 1
+
+    while end > 0:
+        start = max(0, end - _CHUNK_SIZE)
+        fobj.seek(start)
+        chunk = fobj.read(end - start)
+        idx = chunk.rfind(b"\n")
+        if idx >= 0:
+            return start + idx + 1
+        end = start
+
+    return 0
+
 class ACPowerDFBuilder:
     """
     Provide the capability of building a 'pandas.DataFrame' object out of a raw AC Power statistics
@@ -36,24 +120,52 @@ class ACPowerDFBuilder:
         # measurements.
         self.time_colname = "TimeElapsed"
 
-    def build_df(self, path: Path) -> pandas.DataFrame:
+    def _read_csv(self, fobj: BinaryIO) -> pandas.DataFrame:
         """
-        Build the AC power statistics dataframe from the raw statistics file.
+        Read the raw AC power statistics CSV data into a dataframe.
 
         Args:
-            path: The file path to the raw AC power statistics file.
+            fobj: The seekable file object to read the CSV data from.
 
         Returns:
-            pandas.DataFrame: A DataFrame containing the data from the AC power statistics file.
+            pandas.DataFrame: A DataFrame containing the CSV data.
         """
 
         # Read only the columns defined in the MDC.
         usecols = [metric for metric in self.mdo.mdd if metric != self.time_colname]
 
+        # The last line is either the message 'yokotool' prints when it exits, or a partially
+        # written line. Exclude it and parse the rest with the fast C engine.
+        size = _get_last_line_offset(fobj)
+        fobj.seek(0)
+        with io.BufferedReader(_LimitedReader(fobj, size)) as reader:
+            return pandas.read_csv(reader, engine="c", dtype="float64", usecols=usecols,
+                                   skipinitialspace=True)
+
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
+        """
+        Build the AC power statistics dataframe from the raw statistics file.
+
+        Args:
+            path: The file path to the raw AC power statistics file.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
+
+        Returns:
+            pandas.DataFrame: A DataFrame containing the data from the AC power statistics file.
+        """
+
         try:
-            # The 'skipfooter' parameter only available with the "python" engine.
-            df = pandas.read_csv(path, skipfooter=1, engine="python", dtype="float64",
-                                 usecols=usecols)
+            with Segments.open_binary(path, *segments_range) as fobj:
+                if fobj.seekable():
+                    df = self._read_csv(fobj)
+                else:
+                    # Compressed and segmented files are not seekable, read them into memory.
+                    with io.BytesIO(fobj.read()) as bfobj:
+                        df = self._read_csv(bfobj)
+        except OSError as err:
+            msg = Error(str(err)).indent(2)
+            raise Error(f"Failed to read AC power CSV '{path}':\n{msg}") from err
         except (pandas.errors.ParserError, ValueError) as err:
             # Failed 'dtype' conversion can cause 'ValueError', otherwise most parsing exceptions
             # are of type 'pandas.errors.ParserError'.
@@ -1,17 +1,28 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2025 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
 
 """
-Miscellaneous helper functions shared by dataframe builder classes.
+Miscellaneous helpers shared by dataframe builder classes.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import typing
+import numpy
+import pandas
+from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import Segments
+
+if typing.TYPE_CHECKING:
+    from typing import Any
+    from pathlib import Path
+    from statscollectlibs.helperlibs.Segments import RangeType
+
 def split_colname(colname: str) -> tuple[str | None, str]:
     """
     Split a dataframe column name into scope and metric parts.
@@ -35,3 +46,80 @@ def split_colname(colname: str) -> tuple[str | None, str]:
         return None, colname
 
     return split[0], split[1]
+
+def get_parser_input(path: Path, segments_range: RangeType) -> dict[str, Any]:
+    """
+    Return the parser keyword arguments for parsing a raw statistics file. If the file is segmented
+    and the segments range is limited, return an opened stream of the segments overlapping the
+    range, otherwise return the path.
+
+    Args:
+        path: The raw statistics file path.
+        segments_range: The '(begin_ts, end_ts)' time-stamps range of the segments to parse.
+
+    Returns:
+        A dictionary with either the 'path' or the 'lines' key.
+    """
+
+    if not Segments.is_manifest(path) or segments_range == (None, None):
+        return {"path": path}
+
+    try:
+        return {"lines": Segments.open_text(path, *segments_range)}
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to open '{path}':\n{errmsg}") from err
+
+class ColumnsAccumulator:
+    """
+    Accumulate dataframe rows column-by-column and build the dataframe once at the end.
+
+    Building a dataframe by concatenating one-row dataframes is quadratic in the number of rows.
+    This class appends row values to per-column lists instead, and creates the dataframe only once.
+    Columns that are missing in some rows are filled with 'NaN' values, which matches the behavior
+    of 'pandas.concat()'.
+    """
+
+    def __init__(self):
+        """Initialize a class instance."""
+
+        # The column lists indexed by column name, in the order of the first column appearance.
+        self._cols: dict[str, list[Any]] = {}
+        # Count of accumulated rows.
+        self.rows_cnt = 0
+
+    def add_row(self, row: dict[str, Any]):
+        """
+        Append a row to the accumulated columns.
+
+        Args:
+            row: The row to append, a dictionary in the '{colname: value}' format.
+        """
+
+        cols = self._cols
+        rows_cnt = self.rows_cnt
+
+        for colname, val in row.items():
+            col = cols.get(colname)
+            if col is None:
+                # A new column, pad it with 'NaN' values for all the previous rows.
+                col = cols[colname] = [numpy.nan] * rows_cnt
+            col.append(val)
+
+        self.rows_cnt = rows_cnt = rows_cnt + 1
+
+        if len(row) != len(cols):
+            # Some columns are missing in this row, pad them with 'NaN'.
+            for col in cols.values():
+                if len(col) < rows_cnt:
+                    col.append(numpy.nan)
+
+    def get_df(self) -> pandas.DataFrame:
+        """
+        Build and return the dataframe out of the accumulated columns.
+
+        Returns:
+            The dataframe with all the accumulated rows.
+        """
+
+        return pandas.DataFrame.from_dict(self._cols)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2025 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Adam Hawley <adam.james.hawley@intel.com>
@@ -19,15 +19,18 @@ Terminology.
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import math
 import typing
 from pathlib import Path
+import numpy
 import pandas
-from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.dfbuilders import _DFHelpers
 from statscollectlibs.mdc import IPMIMDC
 from statscollectlibs.parsers import IPMIParser
 
 if typing.TYPE_CHECKING:
     from typing import Any
+    from statscollectlibs.helperlibs.Segments import RangeType
 
 class IPMIDFBuilder:
     """
@@ -45,72 +48,51 @@ class IPMIDFBuilder:
         # measurements.
         self.time_colname = "TimeElapsed"
 
-    # TODO: annotate IPMIparser, use correct type in this module.
-    @staticmethod
-    def _dataset_to_df(dataset: dict[str, tuple[Any, str]],
-                       include_metrics: set[str] | None = None):
-        """
-        Convert a dataset dictionary from 'IPMIParser' to a pandas dataframe.
-
-        Args:
-            dataset: A dataset dictionary from the 'IPMIParser'.
-            include_metrics: A set of metric names to include in the dataframe. If None, include all
-                             metrics.
-
-        Returns:
-            pandas.DataFrame: A dataframe containing the metrics as columns and their values in the
-                              rows.
-        """
-
-        def _reduce_dp():
-            """
-            Reduce the parsed IPMI datapoint dictionary to only include metrics in
-            'include_metrics'.
-            """
-
-            for metric, pair in dataset.items():
-                val = pair[0]
-                if val is None:
-                    # If "no reading" is parsed in a line of a raw IPMI file, 'None' is returned. In
-                    # this case, we should exclude that IPMI metric.
-                    continue
-                if include_metrics and metric not in include_metrics:
-                    continue
-                yield metric, val
-
-        reduced_dp = {metric:[val] for metric, val in _reduce_dp()}
-        return pandas.DataFrame.from_dict(reduced_dp)
-
-    def build_df(self, path: Path) -> pandas.DataFrame:
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
         """
         Build the IPMI statistics dataframe from the raw statistics file.
 
         Args:
             path: The file path to the raw IPMI statistics file.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
 
         Returns:
             pandas.DataFrame: A DataFrame containing the data from the IPMI statistics file.
+
+        Notes:
+            - The metrics are defined by the sensors that have a reading in the first snapshot.
+            - The readings of sensors missing in a snapshot (e.g., "no reading") are NaN.
         """
 
-        parser = IPMIParser.IPMIParser(path, derivatives=True).next()
+        parser_input = _DFHelpers.get_parser_input(path, segments_range)
+        columns = IPMIParser.IPMIParser(**parser_input).get_columns()
+        timestamps = numpy.frombuffer(columns["timestamps"], dtype=numpy.float64)
 
-        try:
-            # Read the first data point from raw statistics file.
-            dataset = next(parser)
-        except StopIteration as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"empty or incorrectly formatted IPMI raw statistics file:\n"
-                        f"{errmsg}") from err
+        # Compose the first snapshot dataset for the metrics definition class.
+        dataset: dict[str, tuple[Any, str]] = {self.ts_colname: (timestamps[0], "")}
+        for name, col in columns["columns"].items():
+            if not math.isnan(col[0]):
+                dataset[name] = (col[0], columns["units"][name] or "")
+        dataset[self.time_colname] = (0.0, "")
 
         self.mdo = IPMIMDC.IPMIMDC(dataset)
 
-        include_metrics = set(self.mdo.mdd.keys())
-
-        sdf = self._dataset_to_df(dataset, include_metrics=include_metrics)
-
-        # Add the rest of the data from the raw IPMI statistics file to 'sdf'.
-        for dataset in parser:
-            df = self._dataset_to_df(dataset, include_metrics=include_metrics)
-            sdf = pandas.concat([sdf, df], ignore_index=True)
-
-        return sdf
+        data: dict[str, numpy.ndarray] = {}
+        for metric in self.mdo.mdd:
+            if metric == self.ts_colname:
+                data[metric] = timestamps
+            elif metric == self.time_colname:
+                data[metric] = timestamps - timestamps[0]
+            else:
+                col = numpy.frombuffer(columns["columns"].pop(metric), dtype=numpy.float64)
+                if metric not in columns["floats"] and not numpy.isnan(col).any():
+                    # All the readings are integers, keep them as integers.
+                    col = col.astype(numpy.int64)
+                data[metric] = col
+
+        # Release the columns of the sensors that are not included in the dataframe.
+        del columns
+
+        # The columns are not used for anything else, so there is no need to copy them.
+        return pandas.DataFrame(data, copy=False)
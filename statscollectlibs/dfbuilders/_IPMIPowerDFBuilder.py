@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide the capability of building a 'pandas.DataFrame' object out of a raw DCMI power reading
+statistics file.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import math
+import typing
+from pathlib import Path
+import numpy
+import pandas
+from pepclibs.helperlibs.Exceptions import ErrorBadFormat
+from statscollectlibs.dfbuilders import _DFHelpers
+from statscollectlibs.mdc import IPMIPowerMDC
+from statscollectlibs.parsers import IPMIPowerParser
+
+if typing.TYPE_CHECKING:
+    from statscollectlibs.helperlibs.Segments import RangeType
+
+class IPMIPowerDFBuilder:
+    """
+    Provide the capability of building a 'pandas.DataFrame' object out of a raw DCMI power reading
+    statistics file.
+    """
+
+    def __init__(self):
+        """Initialize a class instance."""
+
+        self.mdo = IPMIPowerMDC.IPMIPowerMDC()
+
+        # Name of the dataframe column containing the time since the epoch time-stamps.
+        self.ts_colname = "Timestamp"
+        # Name of the dataframe column containing the time elapsed since the beginning of the
+        # measurements.
+        self.time_colname = "TimeElapsed"
+
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
+        """
+        Build the DCMI power reading statistics dataframe from the raw statistics file.
+
+        Args:
+            path: The file path to the raw DCMI power reading statistics file.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
+
+        Returns:
+            pandas.DataFrame: A DataFrame containing the data from the raw statistics file. Missing
+                              readings are NaN.
+        """
+
+        nan = math.nan
+        columns: dict[str, list[int | float]] = {}
+        for metric in self.mdo.mdd:
+            if metric != self.time_colname:
+                columns[metric] = []
+
+        parser_input = _DFHelpers.get_parser_input(path, segments_range)
+        for dataset in IPMIPowerParser.IPMIPowerParser(**parser_input).next():
+            for metric, col in columns.items():
+                col.append(dataset.get(metric, nan))
+
+        timestamps = columns[self.ts_colname]
+        if not timestamps:
+            raise ErrorBadFormat(f"No DCMI power readings found in '{path}'")
+
+        data = {metric: numpy.array(col, dtype=numpy.float64) for metric, col in columns.items()}
+        data[self.time_colname] = data[self.ts_colname] - timestamps[0]
+
+        return pandas.DataFrame(data, columns=list(self.mdo.mdd), copy=False)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2025 Intel Corporation
+# Copyright (C) 2025-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -14,6 +14,7 @@ from __future__ import annotations  # Remove when switching to Python 3.10+.
 
 import typing
 from pathlib import Path
+import numpy
 import pandas
 from pepclibs.helperlibs import Logging, Trivial
 from pepclibs.helperlibs.Exceptions import Error
@@ -22,7 +23,8 @@ from statscollectlibs.parsers import InterruptsParser
 from statscollectlibs.mdc import InterruptsMDC
 
 if typing.TYPE_CHECKING:
-    from statscollectlibs.parsers.InterruptsParser import DataSetTypedDict
+    from statscollectlibs.helperlibs.Segments import RangeType
+    from statscollectlibs.parsers.InterruptsParser import MatrixDataSetTypedDict
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
@@ -31,16 +33,19 @@ class InterruptsDFBuilder:
     Parse raw interrupt statistics file and build a dataframe.
     """
 
-    def __init__(self, cpus: list[int] | None = None):
+    def __init__(self, cpus: list[int] | None = None, index_dir: Path | None = None):
         """
         Initialize the class instance.
 
         Args:
             cpus: CPU numbers to include in the dataframe. If 'None', do not include any individual
                   CPU columns in the dataframe.
+            index_dir: Path to the directory to save the interrupts snapshots index in, and to load
+                       the saved index from. The index is kept only in memory by default.
         """
 
         self._cpus = cpus
+        self._index_dir = index_dir
 
         self.mdo: InterruptsMDC.InterruptsMDC | None = None
 
@@ -72,103 +77,108 @@ class InterruptsDFBuilder:
 
         # These are initialized in 'build_df()'.
         self._path: Path
-        self._data: list[list[int | float]]
-        self._first_ts: float | None
-
-    def _get_totals(self, dataset: DataSetTypedDict, sname: str) -> dict[str, int]:
+        self._segments_range: RangeType
+        # The scope names in the order of the scope matrix columns: "System", then the CPUs.
+        self._scopes: list[str]
+        # The IRQ names in the order of the scope matrix rows: the selected IRQs, then the totals
+        # metrics.
+        self._irqnames: list[str]
+        # The scope matrices of all the '/proc/interrupts' snapshots added so far.
+        self._smatrices: list[numpy.ndarray]
+        # The time-stamps of all the '/proc/interrupts' snapshots added so far.
+        self._timestamps: list[float]
+
+        # The IRQ names and CPU numbers of the last added dataset, and the corresponding indexes.
+        # Used for detecting when the parser's IRQ names index or CPU numbers list change.
+        #   * _ds_irqs: The IRQ names of the last added dataset.
+        #   * _ds_irq_mask: The "IRQ*" interrupt rows mask of the interrupt counts matrix.
+        #   * _ds_rows: The interrupt counts matrix rows of the selected IRQs, -1 for IRQs that are
+        #               not in the interrupt counts matrix yet.
+        #   * _ds_cpus: The CPU numbers of the last added dataset.
+        #   * _ds_cols: The interrupt counts matrix columns of the CPUs in 'self._cpus'.
+        self._ds_irqs: tuple[str, ...] | None = None
+        self._ds_irq_mask: numpy.ndarray
+        self._ds_rows: numpy.ndarray
+        self._ds_cpus: list[int] | None = None
+        self._ds_cols: numpy.ndarray
+
+    def _update_ds_indexes(self, dataset: MatrixDataSetTypedDict):
         """
-        Calculate and return the total number of interrupts.
+        Update the IRQ names and CPU numbers indexes if they changed in the parser.
 
         Args:
-            dataset: The dataset containing the interrupt counters.
-            sname: The scope to calculate the total number of interrupts for.
-
-        Returns:
-            dict[str, int]: A dictionary containing the total counts:
-              * "Total": The sum of all interrupts.
-              * "Total_IRQ": The sum of "IRQ*" interrupts.
-              * "Total_XYZ": The sum of non-"IRQ*" interrupts.
+            dataset: The dataset to update the indexes for.
         """
 
-        irq_cpu = None
-        if sname.startswith("CPU"):
-            irq_cpu = int(sname[3:])
-        elif sname != "System":
-            raise Error(f"BUG: unsupported scope '{sname}'") from None
-
-        total_irqs = 0
-        total_xyz = 0
-
-        for cpu, irqs_info in dataset["cpu2irqs"].items():
-            if irq_cpu is not None and irq_cpu != cpu:
-                continue
-
-            for irqname, cnt in irqs_info.items():
-                if irqname.startswith("IRQ"):
-                    total_irqs += cnt
-                else:
-                    total_xyz += cnt
-
-        return {self._total_metric: total_irqs + total_xyz,
-                self._total_irq_metric: total_irqs,
-                self._total_xyz_metric: total_xyz}
-
-    def _add_dataset(self,
-                     dataset: DataSetTypedDict,
-                     irq_colnames: list[str],
-                     no_data_colnames: list[str]):
+        if dataset["irqs"] is not self._ds_irqs:
+            self._ds_irqs = dataset["irqs"]
+            irq2idx = {irqname: idx for idx, irqname in enumerate(self._ds_irqs)}
+            self._ds_irq_mask = numpy.array([irqname.startswith("IRQ")
+                                             for irqname in self._ds_irqs], dtype=bool)
+            sel_irqnames = self._irqnames[:-len(self._total_metrics_set)]
+            self._ds_rows = numpy.array([irq2idx.get(irqname, -1) for irqname in sel_irqnames],
+                                        dtype=numpy.intp)
+
+        if dataset["cpus"] is not self._ds_cpus:
+            self._ds_cpus = dataset["cpus"]
+            cpu2col = {cpu: col for col, cpu in enumerate(self._ds_cpus)}
+            cols = []
+            for cpu in self._cpus or []:
+                if cpu not in cpu2col:
+                    raise Error(f"No data for CPU '{cpu}' in the '/proc/interrupts' snapshot "
+                                f"with time-stamp {dataset['timestamp']} in file '{self._path}'")
+                cols.append(cpu2col[cpu])
+            self._ds_cols = numpy.array(cols, dtype=numpy.intp)
+
+    def _add_dataset(self, dataset: MatrixDataSetTypedDict):
         """
-        Add a dataset to 'self._data', a temporary dictionary storing all data before building the
-        dataframe. The dictionary structure is: "{ index: dataline }", where 'index' is the
-        dataframe row index, and 'dataline' is a list containing values for the timestamps and every
-        column name in 'irq_colnames'. Here is a list structure example:
+        Add a dataset to 'self._smatrices', the list of scope matrices of all the
+        '/proc/interrupts' snapshots. The rows of a scope matrix correspond to IRQ names
+        ('self._irqnames'), the columns correspond to scopes ('self._scopes'). Here is a scope
+        matrix example:
 
-            [ TimeElapsed value, Timestamp value,
-              System-IRQa value, System-IRQb value, ...,
-              CPUx-IRQc value, CPUx-IRQc value, ...
-              System-Total, System-Total_IRQ, System-Total_XYZ ]
+                         System  CPU0  CPU1
+            LOC          [  100,   50,   50 ]
+            IRQ5         [   10,    0,   10 ]
+            Total        [  110,   50,   60 ]
+            Total_IRQ    [   10,    0,   10 ]
+            Total_XYZ    [  100,   50,   50 ]
+
+        The scope matrix is calculated from the 'IRQs x CPUs' interrupt counts matrix with a
+        handful of array reductions, regardless of the count of CPUs and IRQs.
 
         Args:
             dataset: Parsed dataset to add.
-            irq_colnames: Non-time dataframe column names to include.
-            no_data_colnames: Non-time dataframe column names to include, but do not have data yet.
-                              Use 0 for the values.
         """
 
         if "timestamp" not in dataset:
             raise Error("BUG: missing 'timestamp' in the parsed dataset") from None
 
-        if self._first_ts is None:
-            self._first_ts = dataset["timestamp"]
+        self._update_ds_indexes(dataset)
 
-        totals: dict[str, dict[str, int]] = {}
-        data: list[int | float] = [dataset["timestamp"] - self._first_ts, dataset["timestamp"]]
+        counts = dataset["counts"]
+        sel_cnt = len(self._ds_rows)
+        smatrix = numpy.empty((len(self._irqnames), len(self._scopes)), dtype=numpy.int64)
 
-        # Calculate and add the interrupts for every column in 'irq_colnames'.
-        for colname in irq_colnames:
-            sname, irqname = _DFHelpers.split_colname(colname)
-            if not sname:
-                continue
-
-            if irqname.startswith("Total"):
-                if sname not in totals:
-                    totals[sname] = self._get_totals(dataset, sname)
-                data.append(totals[sname][irqname])
-                continue
-
-            if sname == "System":
-                sum_all_cpus = 0
-                for irqs_info in dataset["cpu2irqs"].values():
-                    sum_all_cpus += irqs_info.get(irqname, 0)
-                data.append(sum_all_cpus)
-            elif sname.startswith("CPU"):
-                data.append(dataset["cpu2irqs"][int(sname[3:])][irqname])
-            else:
-                raise Error(f"BUG: unsupported scope '{sname}' in column name "
-                            f"'{colname}'") from None
-
-        data += [0] * len(no_data_colnames)
-        self._data.append(data)
+        # The selected IRQs. The IRQs that are not in the interrupt counts matrix yet have zero
+        # counts.
+        sel_counts = counts[self._ds_rows]
+        sel_counts[self._ds_rows < 0] = 0
+        smatrix[:sel_cnt, 0] = sel_counts.sum(axis=1)
+        smatrix[:sel_cnt, 1:] = sel_counts[:, self._ds_cols]
+
+        # The totals: per-CPU sums of all interrupts and of "IRQ*" interrupts.
+        cpu_totals = counts.sum(axis=0)
+        cpu_irq_totals = counts[self._ds_irq_mask].sum(axis=0)
+
+        smatrix[sel_cnt, 0] = cpu_totals.sum()
+        smatrix[sel_cnt, 1:] = cpu_totals[self._ds_cols]
+        smatrix[sel_cnt + 1, 0] = cpu_irq_totals.sum()
+        smatrix[sel_cnt + 1, 1:] = cpu_irq_totals[self._ds_cols]
+        smatrix[sel_cnt + 2] = smatrix[sel_cnt] - smatrix[sel_cnt + 1]
+
+        self._smatrices.append(smatrix)
+        self._timestamps.append(dataset["timestamp"])
 
     def _fetch_hottest_irqs(self, irqs: dict[str, int], scope: str) -> list[str]:
         """
@@ -214,7 +224,10 @@ class InterruptsDFBuilder:
 
         colnames = []
 
-        parser = InterruptsParser.InterruptsParser(self._path)
+        # The first and last snapshots are found using the snapshots index, without parsing the
+        # entire file.
+        parser = InterruptsParser.InterruptsParser(self._path, index_dir=self._index_dir,
+                                                   segments_range=self._segments_range)
         first_ds, last_ds = parser.get_first_and_last()
 
         # Calculate how many interrupts of each type occurred for the System scope.
@@ -260,84 +273,93 @@ class InterruptsDFBuilder:
 
         return colnames
 
-    def _get_existing_colnames(self, dataset: DataSetTypedDict, colnames: list[str]) -> list[str]:
+    def _init_layout(self, irq_colnames: list[str]):
         """
-        Find and return the list of column names from 'colnames' present in 'dataset'.
+        Initialize the scope matrix layout: the scope names and the IRQ names.
 
         Args:
-            dataset: Dataset to check for 'colnames' in.
-            colnames: List of column names to check.
-
-        Returns:
-            List of column names from 'colnames' present in 'dataset'.
+            irq_colnames: Non-time dataframe column names to include.
         """
 
-        new_colnames = []
+        self._scopes = ["System"]
+        if self._cpus is not None:
+            self._scopes += [f"CPU{cpu}" for cpu in self._cpus]
 
-        for colname in colnames:
+        self._irqnames = []
+        for colname in irq_colnames:
             _, irqname = _DFHelpers.split_colname(colname)
-            if irqname in dataset["irq_info"] or irqname in self._total_metrics_set:
-                new_colnames.append(colname)
+            if irqname not in self._total_metrics_set and irqname not in self._irqnames:
+                self._irqnames.append(irqname)
+
+        self._irqnames += [self._total_metric, self._total_irq_metric, self._total_xyz_metric]
 
-        return new_colnames
+        self._ds_irqs = None
+        self._ds_cpus = None
 
-    def build_df(self, path: Path) -> pandas.DataFrame:
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
         """
         Build the interrupts statistics dataframe from the raw statistics file.
 
         Args:
             path: Raw interrupts statistics file path.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
 
         Returns:
             Pandas dataframe including the parsed interrupt statistics data.
         """
 
         self._path = path
-        self._data = []
-        self._first_ts = None
-
-        parser = InterruptsParser.InterruptsParser(path)
-        generator = parser.next()
-
-        dataset = next(generator)
+        self._segments_range = segments_range
+        self._smatrices = []
+        self._timestamps = []
 
         irq_colnames = self._construct_irq_colnames()
+        self._init_layout(irq_colnames)
 
-        # IRQ rate colnames.
-        irq_rate_colnames = [colname + "_rate" for colname in irq_colnames]
-
-        # Construct the dataframe. Values for the 'no_data_colnames' columns will be 0, and they
-        # will be filled with the actual data later, when the data is available.
-        self._add_dataset(dataset, irq_colnames, no_data_colnames=irq_rate_colnames)
-        for dataset in generator:
-            self._add_dataset(dataset, irq_colnames, no_data_colnames=irq_rate_colnames)
+        parser = InterruptsParser.InterruptsParser(path, segments_range=segments_range)
+        for dataset in parser.next_matrix():
+            self._add_dataset(dataset)
 
-        # The raw file is parsed, and all the data are in 'self._data'. Now build the dataframe.
-        colnames = self.time_colnames + irq_colnames
+        # Stack the scope matrices into a 3-dimensional array: snapshots x IRQs x scopes.
+        smatrices = numpy.stack(self._smatrices)
+        timestamps = numpy.array(self._timestamps, dtype=numpy.float64)
 
-        df = pandas.DataFrame(self._data, columns=colnames + irq_rate_colnames)
-
-        # Drop the unneeded and potentially large 'self._data'.
-        del self._data
-        self._data = []
+        # Drop the unneeded and potentially large list of scope matrices.
+        self._smatrices = []
+        self._timestamps = []
 
         # Interrupt counters are counts of serviced interrupts since the system has booted up. Turn
-        # them into counts of interrupts serviced during the measurement interval. Ensure the type
-        # is integer.
-        #
-        # The first row will end up with zeros (would be 'NaN's, but 'fillna(0)' turns them to
-        # zeros). This is because the delta cannot be calculated for the first row.
-        df[irq_colnames] = df[irq_colnames].diff().fillna(0).astype(int)
-
-        # Calculate the measurement intervals.
-        intervals = df[self.time_colname].diff().fillna(0)
-
-        # Add requests per second metrics.
-        for colname, rate_colname in zip(irq_colnames, irq_rate_colnames):
-            df[rate_colname] = df[colname] / intervals
-
-        # Remove the first row, because it contains all zeros the column 'diff()' operation.
-        df = df.iloc[1:]
+        # them into counts of interrupts serviced during the measurement interval. The delta cannot
+        # be calculated for the first snapshot, so the dataframe does not include it.
+        deltas = numpy.diff(smatrices, axis=0)
+        intervals = numpy.diff(timestamps)
+
+        # Calculate the interrupt rates.
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            rates = deltas / intervals[:, numpy.newaxis, numpy.newaxis]
+
+        # Pick the dataframe columns from the 3-dimensional arrays.
+        rows = []
+        cols = []
+        for colname in irq_colnames:
+            sname, irqname = _DFHelpers.split_colname(colname)
+            rows.append(self._irqnames.index(irqname))
+            cols.append(self._scopes.index(str(sname)))
+
+        data: dict[str, numpy.ndarray] = {}
+        data[self.time_colname] = timestamps[1:] - timestamps[0]
+        data[self.ts_colname] = timestamps[1:]
+
+        irq_data = deltas[:, rows, cols]
+        rate_data = rates[:, rows, cols]
+        for idx, colname in enumerate(irq_colnames):
+            data[colname] = irq_data[:, idx]
+        for idx, colname in enumerate(irq_colnames):
+            data[colname + "_rate"] = rate_data[:, idx]
+
+        # Keep the index the same as if the first row was dropped from the dataframe.
+        df = pandas.DataFrame(data, index=pandas.RangeIndex(1, len(timestamps)))
 
         self._build_mdo(list(df.columns))
         return df
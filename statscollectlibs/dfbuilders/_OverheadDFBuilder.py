@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide the capability of building a 'pandas.DataFrame' object out of a raw statistics collection
+overhead statistics file.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import math
+import typing
+from pathlib import Path
+import numpy
+import pandas
+from pepclibs.helperlibs.Exceptions import ErrorBadFormat
+from statscollectlibs.dfbuilders import _DFHelpers
+from statscollectlibs.mdc import OverheadMDC
+from statscollectlibs.parsers import OverheadParser
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+    from statscollectlibs.helperlibs.Segments import RangeType
+    from statscollectlibs.parsers.OverheadParser import DataSetTypedDict
+
+# The metrics calculated from the cumulative values of the raw statistics as rates, the
+# corresponding raw statistics value names, and the rate multipliers.
+_RATE_METRICS: Final[dict[str, tuple[str, float]]] = {
+    "CPU%": ("cpu", 100.0),
+    "Wakeups": ("vcsw", 1.0),
+    "Preemptions": ("nvcsw", 1.0),
+    "DiskRead": ("read", 1.0 / 1024),
+    "DiskWrite": ("write", 1.0 / 1024),
+}
+
+# The metrics taken from the raw statistics as is, the corresponding raw statistics value names,
+# and the multipliers.
+_GAUGE_METRICS: Final[dict[str, tuple[str, float]]] = {
+    "RSS": ("rss", 1.0 / (1024 * 1024)),
+    "Processes": ("pids", 1.0),
+}
+
+class OverheadDFBuilder:
+    """
+    Provide the capability of building a 'pandas.DataFrame' object out of a raw statistics
+    collection overhead statistics file.
+
+    The dataframe columns are "<scope>-<metric>", where the scope is a process group name (e.g.,
+    "stc_agent" or "turbostat", with dashes replaced by underscores), or "Total" for all the process
+    groups together.
+    """
+
+    def __init__(self):
+        """Initialize a class instance."""
+
+        self.mdo: OverheadMDC.OverheadMDC | None = None
+
+        # Name of the dataframe column containing the time since the epoch time-stamps.
+        self.ts_colname = "Timestamp"
+        # Name of the dataframe column containing the time elapsed since the beginning of the
+        # measurements.
+        self.time_colname = "TimeElapsed"
+
+        # Name of the scope of all the process groups together.
+        self._total_scope = "Total"
+
+    @staticmethod
+    def _get_values(datasets: list[DataSetTypedDict], name: str, key: str) -> numpy.ndarray:
+        """
+        Return the values of a process group from all the samples.
+
+        Args:
+            datasets: The samples.
+            name: The process group name.
+            key: The value name.
+
+        Returns:
+            The values, NaN in samples the process group or the value is missing from.
+        """
+
+        nan = math.nan
+        return numpy.array([dataset["groups"].get(name, {}).get(key, nan)
+                            for dataset in datasets], dtype=numpy.float64)
+
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
+        """
+        Build the collection overhead statistics dataframe from the raw statistics file.
+
+        Args:
+            path: The file path to the raw collection overhead statistics file.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
+
+        Returns:
+            pandas.DataFrame: A DataFrame containing the collection overhead of every process group
+                              during every measurement interval.
+
+        Notes:
+            - The rates cannot be calculated for the first sample, so the dataframe does not
+              include it.
+            - Process groups that are not running are considered to have zero overhead.
+        """
+
+        parser_input = _DFHelpers.get_parser_input(path, segments_range)
+        datasets = list(OverheadParser.OverheadParser(**parser_input).next())
+        if len(datasets) < 2:
+            raise ErrorBadFormat(f"Less than 2 collection overhead samples found in '{path}'")
+
+        names: dict[str, None] = {}
+        for dataset in datasets:
+            names.update(dict.fromkeys(dataset["groups"]))
+
+        timestamps = numpy.array([dataset["Timestamp"] for dataset in datasets],
+                                 dtype=numpy.float64)
+        intervals = numpy.diff(timestamps)
+
+        data: dict[str, numpy.ndarray] = {}
+        data[self.time_colname] = timestamps[1:] - timestamps[0]
+        data[self.ts_colname] = timestamps[1:]
+
+        # The process groups columns and the totals of all the process groups.
+        gdata: dict[str, numpy.ndarray] = {}
+        totals: dict[str, numpy.ndarray] = {}
+        for name in names:
+            # The dash separates the scope and the metric in the column names.
+            scope = name.replace("-", "_")
+            for metric, (key, mult) in _RATE_METRICS.items():
+                vals = self._get_values(datasets, name, key)
+                if numpy.isnan(vals).all():
+                    continue
+                # The cumulative values go down if a process of the group exits without being
+                # waited for, or is replaced.
+                deltas = numpy.clip(numpy.diff(vals), 0, None)
+                with numpy.errstate(divide="ignore", invalid="ignore"):
+                    rates = numpy.nan_to_num(deltas * mult / intervals, nan=0.0)
+                gdata[f"{scope}-{metric}"] = rates
+
+            for metric, (key, mult) in _GAUGE_METRICS.items():
+                vals = self._get_values(datasets, name, key)[1:]
+                gdata[f"{scope}-{metric}"] = numpy.nan_to_num(vals * mult, nan=0.0)
+
+            for metric in list(_RATE_METRICS) + list(_GAUGE_METRICS):
+                colname = f"{scope}-{metric}"
+                if colname not in gdata:
+                    continue
+                if metric in totals:
+                    totals[metric] = totals[metric] + gdata[colname]
+                else:
+                    totals[metric] = gdata[colname].copy()
+
+        for metric, vals in totals.items():
+            data[f"{self._total_scope}-{metric}"] = vals
+        data.update(gdata)
+
+        # Keep the index the same as if the first row was dropped from the dataframe.
+        df = pandas.DataFrame(data, index=pandas.RangeIndex(1, len(timestamps)))
+
+        metrics = [self.time_colname, self.ts_colname]
+        metrics += [metric for metric in list(_RATE_METRICS) + list(_GAUGE_METRICS)
+                    if metric in totals]
+        self.mdo = OverheadMDC.OverheadMDC(metrics)
+
+        return df
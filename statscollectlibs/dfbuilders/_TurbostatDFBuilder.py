@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2024 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -23,21 +23,25 @@ from statscollectlibs.mdc import TurbostatMDC
 
 if typing.TYPE_CHECKING:
     from typing import Any
+    from statscollectlibs.helperlibs.Segments import RangeType
 
 class TurbostatDFBuilder:
     """
     Provide the capability of building a 'pandas.DataFrames' out of raw turbostat statistics files.
     """
 
-    def __init__(self, cpus: list[int] | None = None):
+    def __init__(self, cpus: list[int] | None = None, jobs: int = 1):
         """
         Initialize the class instance.
 
         Args:
             cpus: The measured CPU numbers.
+            jobs: Count of worker processes to use for parsing the raw turbostat statistics file.
+                  Parse sequentially by default.
         """
 
         self._cpus = cpus
+        self._jobs = jobs
         self.mdo: TurbostatMDC.TurbostatMDC | None = None
 
         # Name of the dataframe column containing the time since the epoch time-stamps.
@@ -49,12 +53,12 @@ class TurbostatDFBuilder:
         # Theis is initialized in 'build_df()'.
         self._path: Path
 
-    def _build_cols_dict(self,
-                         tstat: dict[str, Any],
-                         scope: str, cpu: int | None = None) -> dict[str, list[Any]]:
+    def _build_row(self,
+                   tstat: dict[str, Any],
+                   scope: str, cpu: int | None = None) -> dict[str, Any]:
         """
-        Build a columns dictionary for 'pandas.DataFrame.from_dict()'. Prefix the turbostat metrics
-        with the scope name.
+        Build a dataframe row dictionary out of turbostat metrics. Prefix the turbostat metrics with
+        the scope name.
 
         Args:
             tstat: Dictionary containing turbostat metrics in the format '{metric: value}'.
@@ -62,11 +66,10 @@ class TurbostatDFBuilder:
             cpu: The CPU number if the scope is "CPU".
 
         Returns:
-            dict: A dictionary in the format '{column_name: [value]}' suitable for use with
-                  'pandas.DataFrame.from_dict()'.
+            dict: A dictionary in the format '{column_name: value}'.
         """
 
-        cols_dict = {}
+        row = {}
         dont_prefix_metrics = {self.ts_colname, self.time_colname}
 
         if scope == "System":
@@ -86,9 +89,9 @@ class TurbostatDFBuilder:
             else:
                 colname = f"{prefix}-{metric}"
 
-            cols_dict[colname] = [value]
+            row[colname] = value
 
-        return cols_dict
+        return row
 
     def _extract_cpu_data(self, cpu: int, dataset):
         """
@@ -111,35 +114,36 @@ class TurbostatDFBuilder:
         return cpu_tstat
 
     # TODO: implement proper type hint for dataset and add it.
-    def _dataset_to_df(self, dataset: dict[Any, Any]) -> pandas.DataFrame:
+    def _dataset_to_row(self, dataset: dict[Any, Any]) -> dict[str, Any]:
         """
-        Convert a dataset dictionary from 'TurbostatParser' to a pandas dataframe. The dataframe
-        columns will be prefixed with the scope name.
+        Convert a dataset dictionary from 'TurbostatParser' to a dataframe row dictionary. The
+        column names will be prefixed with the scope name.
 
         Args:
             dataset: The dataset dictionary from 'TurbostatParser'.
 
         Returns:
-            pandas.DataFrame: A dataframe containing the turbostat data with appropriate column
-                   prefixes.
+            dict: A dictionary in the format '{column_name: value}' containing the turbostat data
+                  with appropriate column prefixes.
         """
 
-        # Prepare the "columns dictionary", which has the '{colname: [value]}' format. This format
-        # is required by 'pandas.DataFrame.from_dict()'. Start with the system-wide scope metrics.
-        cols_dict = self._build_cols_dict(dataset["totals"], "System")
+        # Start with the system-wide scope metrics.
+        row = self._build_row(dataset["totals"], "System")
         if self._cpus is not None:
             for cpu in self._cpus:
                 cpu_tstat = self._extract_cpu_data(cpu, dataset)
-                cols_dict.update(self._build_cols_dict(cpu_tstat, "CPU", cpu=cpu))
+                row.update(self._build_row(cpu_tstat, "CPU", cpu=cpu))
 
-        return pandas.DataFrame.from_dict(cols_dict)
+        return row
 
-    def build_df(self, path: Path) -> pandas.DataFrame:
+    def build_df(self, path: Path, segments_range: RangeType = (None, None)) -> pandas.DataFrame:
         """
         Build the turbostat statistics dataframe from the raw statistics file.
 
         Args:
             path: The file path to the raw turbostat statistics file.
+            segments_range: If 'path' is a segments manifest, load only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
 
         Returns:
             pandas.DataFrame: A DataFrame containing the data from the turbostat statistics file.
@@ -150,7 +154,12 @@ class TurbostatDFBuilder:
 
         self._path = path
 
-        parser = TurbostatParser.TurbostatParser(path, derivatives=True)
+        # The dataframe includes only the system totals and the measured CPUs, so do not parse
+        # metrics of other CPUs.
+        cpus = self._cpus if self._cpus is not None else []
+
+        parser_input = _DFHelpers.get_parser_input(path, segments_range)
+        parser = TurbostatParser.TurbostatParser(**parser_input, derivatives=True, cpus=cpus)
         generator = parser.next()
 
         try:
@@ -159,6 +168,8 @@ class TurbostatDFBuilder:
         except StopIteration:
             raise Error(f"Empty or incorrectly formatted 'turbostat' statistics file "
                         f"'{path}") from None
+        finally:
+            generator.close()
 
         # Sanity check.
         if self.ts_colname not in dataset["totals"]:
@@ -166,21 +177,26 @@ class TurbostatDFBuilder:
                                  f"include time-stamps.\nCollect turbostat statistics with the "
                                  f"'--enable Time_Of_Day_Seconds' option to include time-stamps.")
 
-        # Initialise 'df' with the first datapoint in the raw statistics file.
-        df = self._dataset_to_df(dataset)
-
         self.mdo = TurbostatMDC.TurbostatMDC(list(dataset["totals"]))
 
-        # The very first dataframe was built without taking into account that some metrics are not
-        # needed. Remove the corresponding columns.
-        for colname in df.columns:
-            _, metric = _DFHelpers.split_colname(colname)
-            if metric not in self.mdo.mdd:
-                df.drop(columns=[colname], inplace=True)
-
-        # Add the rest of the data from the raw turbostat statistics file to 'sdf'.
-        for dataset in generator:
-            next_row_df = self._dataset_to_df(dataset)
-            df = pandas.concat([df, next_row_df], ignore_index=True)
+        # Now that the metrics are known, parse the entire file again, but skip the metrics that
+        # are not in the metrics definition dictionary.
+        parser_input = _DFHelpers.get_parser_input(path, segments_range)
+        parser = TurbostatParser.TurbostatParser(**parser_input, derivatives=True, cpus=cpus,
+                                                 metrics=self.mdo.mdd)
+
+        # Accumulate the data column-by-column and build the dataframe only once at the end.
+        # Concatenating one-row dataframes instead would be quadratic in the number of turbostat
+        # tables.
+        accum = _DFHelpers.ColumnsAccumulator()
+
+        if self._jobs > 1 and "path" in parser_input:
+            # Parse the file in parallel, the worker processes convert the datasets to dataframe
+            # rows.
+            for row in parser.next_parallel(self._jobs, handler=self._dataset_to_row):
+                accum.add_row(row)
+        else:
+            for dataset in parser.next():
+                accum.add_row(self._dataset_to_row(dataset))
 
-        return df
+        return accum.get_df()
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide streaming compression and decompression of raw statistics files.
+
+The statistics collectors may run for days, so their output is compressed on the fly. The compressed
+stream is flushed periodically, and everything written before the last flush point can be
+decompressed even if the collector or the whole system crashes. The decompressor tolerates truncated
+files for the same reason: it returns all the data up to the cut.
+
+The compression method is defined by the file name suffix:
+    - '.gz': gzip, uses the Python standard library.
+    - '.zst': zstd, requires the 'zstandard' Python module.
+    - '.lz4': lz4, requires the 'lz4' Python module.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import io
+import zlib
+import types
+import typing
+from pathlib import Path
+from pepclibs.helperlibs.Exceptions import Error
+
+try:
+    zstandard: types.ModuleType | None
+    import zstandard
+except ImportError:
+    # The zstd compression method is not available without the 'zstandard' module.
+    zstandard = None
+
+try:
+    lz4frame: types.ModuleType | None
+    import lz4.frame as lz4frame
+except ImportError:
+    # The lz4 compression method is not available without the 'lz4' module.
+    lz4frame = None
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Any, Final
+
+# Maps the supported compression methods to the compressed file name suffixes.
+SUFFIXES: Final[dict[str, str]] = {"gzip": ".gz", "zstd": ".zst", "lz4": ".lz4"}
+
+# Maps the compression methods to the Python modules they require.
+_MODULES: Final[dict[str, str]] = {"zstd": "zstandard", "lz4": "lz4"}
+
+# Size of the compressed data chunks read from compressed files.
+_READ_CHUNK_SIZE: Final[int] = 256 * 1024
+
+def check_method(method: str):
+    """
+    Check that a compression method is supported and available.
+
+    Args:
+        method: The compression method name to check.
+
+    Raises:
+        Error: The compression method is unknown, or the Python module it requires is not
+               installed.
+    """
+
+    if method not in SUFFIXES:
+        methods = ", ".join(SUFFIXES)
+        raise Error(f"Unknown compression method '{method}', supported methods are: {methods}")
+
+    if (method == "zstd" and not zstandard) or (method == "lz4" and not lz4frame):
+        raise Error(f"The '{method}' compression method requires the '{_MODULES[method]}' Python "
+                    f"module, which is not installed")
+
+def get_method(path: Path | str) -> str | None:
+    """
+    Return the compression method of a file, as defined by its name suffix.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The compression method name, or 'None' if the file is not compressed.
+    """
+
+    suffix = Path(path).suffix
+    for method, method_suffix in SUFFIXES.items():
+        if suffix == method_suffix:
+            return method
+    return None
+
+def add_suffix(path: Path | str, method: str | None) -> str:
+    """
+    Return a file path with the compressed file name suffix of a compression method. Replace the
+    compressed file name suffix, if the path already has one.
+
+    Args:
+        path: The file path.
+        method: The compression method name, 'None' means no compression.
+
+    Returns:
+        The file path with the compression suffix.
+    """
+
+    path = str(path)
+    if get_method(path):
+        path = str(Path(path).with_suffix(""))
+    if method:
+        path += SUFFIXES[method]
+    return path
+
+class StreamCompressor:
+    """
+    Compress a data stream and write it to a file object.
+
+    Public methods overview:
+
+    - 'write()': compress data and write it to the file object.
+    - 'flush()': create a flush point.
+    - 'close()': finish the compressed stream.
+    """
+
+    def __init__(self, method: str, fobj: IO[bytes]):
+        """
+        Initialize a class instance.
+
+        Args:
+            method: The compression method name.
+            fobj: The binary file object to write the compressed data to. Not closed by 'close()'.
+        """
+
+        check_method(method)
+
+        self.method = method
+        self._fobj = fobj
+
+        self._compressor: Any = None
+        # Whether an lz4 frame was started, but not finished yet.
+        self._lz4_frame = False
+
+        if method == "gzip":
+            self._compressor = zlib.compressobj(wbits=31)
+        elif method == "zstd":
+            assert zstandard is not None
+            self._compressor = zstandard.ZstdCompressor().compressobj()
+        else:
+            assert lz4frame is not None
+            self._compressor = lz4frame.LZ4FrameCompressor()
+
+    def write(self, data: bytes):
+        """
+        Compress data and write it to the file object. The data may be buffered by the compressor
+        until the next flush point.
+
+        Args:
+            data: The data to compress.
+        """
+
+        if self.method == "lz4":
+            if not self._lz4_frame:
+                self._fobj.write(self._compressor.begin())
+                self._lz4_frame = True
+        self._fobj.write(self._compressor.compress(data))
+
+    def flush(self):
+        """
+        Create a flush point: write out all the data buffered by the compressor, so that all the
+        data written so far can be decompressed.
+        """
+
+        if self.method == "gzip":
+            self._fobj.write(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+        elif self.method == "zstd":
+            assert zstandard is not None
+            self._fobj.write(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+        elif self._lz4_frame:
+            # The lz4 frame format has no flush points, finish the frame instead. The next
+            # 'write()' starts a new one.
+            self._fobj.write(self._compressor.flush())
+            self._lz4_frame = False
+
+        self._fobj.flush()
+
+    def close(self):
+        """Finish the compressed stream."""
+
+        if self.method == "lz4":
+            self.flush()
+        else:
+            self._fobj.write(self._compressor.flush())
+            self._fobj.flush()
+
+class StreamDecompressor:
+    """
+    Decompress a compressed data stream incrementally. Multiple concatenated compressed streams
+    (e.g., lz4 frames or gzip members) are decompressed one after the other.
+    """
+
+    def __init__(self, method: str):
+        """
+        Initialize a class instance.
+
+        Args:
+            method: The compression method name.
+        """
+
+        check_method(method)
+
+        self.method = method
+        self._decompressor: Any = self._new_decompressor()
+
+    def _new_decompressor(self) -> Any:
+        """Create and return a decompressor object for the next compressed stream."""
+
+        if self.method == "gzip":
+            return zlib.decompressobj(wbits=31)
+        if self.method == "zstd":
+            assert zstandard is not None
+            return zstandard.ZstdDecompressor().decompressobj()
+
+        assert lz4frame is not None
+        return lz4frame.LZ4FrameDecompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress the next piece of the compressed data stream.
+
+        Args:
+            data: The next piece of the compressed data.
+
+        Returns:
+            The decompressed data available so far.
+
+        Raises:
+            Error: The compressed data are corrupted.
+        """
+
+        result = b""
+        try:
+            while data:
+                result += self._decompressor.decompress(data)
+                if not getattr(self._decompressor, "eof", False):
+                    break
+                data = self._decompressor.unused_data
+                self._decompressor = self._new_decompressor()
+        except Exception as err: # pylint: disable=broad-except
+            # The zlib, zstandard, and lz4 modules raise different exception types.
+            raise Error(f"Bad {self.method} compressed data: {err}") from err
+
+        return result
+
+class _DecompressedReader(io.RawIOBase):
+    """A raw binary stream of the decompressed data of a compressed file."""
+
+    def __init__(self, fobj: IO[bytes], method: str):
+        """
+        Initialize a class instance.
+
+        Args:
+            fobj: The compressed file object, closed by 'close()'.
+            method: The compression method name.
+        """
+
+        super().__init__()
+
+        self._fobj = fobj
+        self._decompressor = StreamDecompressor(method)
+        # The decompressed data and the offset of the data not read yet in it.
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+
+    def readable(self) -> bool:
+        """Return 'True', the stream is readable."""
+
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Read decompressed data into a pre-allocated buffer.
+
+        Args:
+            buffer: The buffer to read the data into.
+
+        Returns:
+            The count of bytes read, '0' at the end of the file.
+        """
+
+        while self._pos >= len(self._buf) and not self._eof:
+            data = self._fobj.read(_READ_CHUNK_SIZE)
+            if not data:
+                self._eof = True
+                break
+            try:
+                self._buf = self._decompressor.decompress(data)
+            except Error as err:
+                raise OSError(f"Failed to decompress '{self._fobj.name}': {err}") from err
+            self._pos = 0
+
+        # Do not copy the rest of the decompressed data on every read, which is slow for small
+        # reads.
+        size = min(len(buffer), len(self._buf) - self._pos)
+        buffer[:size] = memoryview(self._buf)[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def close(self):
+        """Close the stream and the compressed file object."""
+
+        if not self.closed:
+            self._fobj.close()
+        super().close()
+
+def open_binary(path: Path | str) -> IO[bytes]:
+    """
+    Open a possibly compressed file for reading in binary mode. Decompress the file transparently if
+    it is compressed.
+
+    Args:
+        path: Path to the file to open.
+
+    Returns:
+        The binary file object. Only seekable if the file is not compressed.
+    """
+
+    method = get_method(path)
+    # pylint: disable-next=consider-using-with
+    fobj = open(path, "rb")
+    if not method:
+        return fobj
+
+    try:
+        check_method(method)
+    except Error as err:
+        fobj.close()
+        raise OSError(str(err)) from err
+
+    return io.BufferedReader(_DecompressedReader(fobj, method))
+
+def open_text(path: Path | str) -> IO[str]:
+    """
+    Open a possibly compressed UTF-8 text file for reading. Decompress the file transparently if it
+    is compressed.
+
+    Args:
+        path: Path to the file to open.
+
+    Returns:
+        The text file object.
+    """
+
+    if not get_method(path):
+        return open(path, "r", encoding="utf-8") # pylint: disable=consider-using-with
+
+    return io.TextIOWrapper(open_binary(path), encoding="utf-8")
@@ -0,0 +1,602 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2025-2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide samplers reading statistics directly from procfs and sysfs files, and a thread running
+multiple samplers on a shared timer.
+
+A sampler opens the files it reads once, and then reads them into re-used buffers every time a
+sample is taken, so taking a sample does not involve starting processes or opening files. Samples
+are returned as bytes in the same format the corresponding helper tools print them, so that the
+same parsers can be used regardless of how the statistics were collected.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import time
+import typing
+import threading
+from pepclibs.helperlibs import ClassHelpers
+from pepclibs.helperlibs.Exceptions import Error
+
+if typing.TYPE_CHECKING:
+    from typing import Callable, Final
+
+# The initial size of the file read buffer, grown when necessary.
+_INITIAL_BUFSIZE: Final[int] = 64 * 1024
+
+# The initial size of the '/proc/<pid>/*' files read buffer.
+_PID_BUFSIZE: Final[int] = 4096
+
+# The '/proc/<pid>/status' and '/proc/<pid>/io' keys and the corresponding overhead sample keys.
+_STATUS_KEYS: Final[dict[bytes, str]] = {b"VmRSS": "rss",
+                                         b"voluntary_ctxt_switches": "vcsw",
+                                         b"nonvoluntary_ctxt_switches": "nvcsw"}
+_IO_KEYS: Final[dict[bytes, str]] = {b"read_bytes": "read", b"write_bytes": "write"}
+
+class ProcFileReader(ClassHelpers.SimpleCloseContext):
+    """
+    Read the entire contents of a procfs or sysfs file into a re-used buffer without seeking.
+    """
+
+    def __init__(self, path: str, bufsize: int = _INITIAL_BUFSIZE):
+        """
+        Initialize a class instance.
+
+        Args:
+            path: Path to the file to read.
+            bufsize: The initial size of the read buffer, grown when necessary.
+        """
+
+        self._path = path
+        self._buf = bytearray(bufsize)
+        self._fd = -1
+
+        try:
+            self._fd = os.open(path, os.O_RDONLY)
+        except OSError as err:
+            raise Error(f"Failed to open '{path}': {err}") from err
+
+    def close(self):
+        """Close the file."""
+
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def read(self) -> bytearray:
+        """
+        Read the entire file contents.
+
+        Returns:
+            The file contents.
+        """
+
+        while True:
+            size = 0
+            with memoryview(self._buf) as mv:
+                while size < len(mv):
+                    try:
+                        cnt = os.preadv(self._fd, [mv[size:]], size)
+                    except OSError as err:
+                        raise Error(f"Failed to read '{self._path}': {err}") from err
+                    if not cnt:
+                        break
+                    size += cnt
+
+            if size < len(self._buf):
+                return self._buf[:size]
+
+            # The buffer is too small. Grow it and re-read the entire file to get a consistent
+            # snapshot.
+            self._buf = bytearray(len(self._buf) * 2)
+
+class _DeltaEncoder:
+    """
+    Encode '/proc/interrupts' snapshots as the changed counters compared to the preceding snapshot.
+    """
+
+    def __init__(self):
+        """Initialize a class instance."""
+
+        # The header line of the last snapshot.
+        self._header = ""
+        # The CPUs count of the last snapshot.
+        self._cpus_cnt = 0
+        # The lines of the last snapshot, excluding the header.
+        self._lines: list[str] = []
+        # The IRQ name, interrupt counters, and description elements of every line of the last
+        # snapshot, 'None' for the lines that were not parsed.
+        self._parsed: list[tuple[str, list[int], list[str]] | None] = []
+
+    def _parse_line(self, line: str) -> tuple[str, list[int], list[str]]:
+        """
+        Split a '/proc/interrupts' line to the IRQ name, interrupt counters, and the description.
+
+        Args:
+            line: The line to split.
+
+        Returns:
+            A tuple of the IRQ name, the interrupt counters, and the description elements.
+        """
+
+        elts = line.split(maxsplit=self._cpus_cnt + 1)
+        counts: list[int] = []
+        for elt in elts[1:self._cpus_cnt + 1]:
+            if not elt.isdigit():
+                break
+            counts.append(int(elt))
+
+        return elts[0], counts, elts[len(counts) + 1:]
+
+    def keyframe(self, contents: str):
+        """
+        Remember a snapshot printed in full.
+
+        Args:
+            contents: The '/proc/interrupts' snapshot contents with extra white-spaces removed.
+        """
+
+        lines = contents.splitlines()
+        self._header = lines[0]
+        self._cpus_cnt = len(self._header.split())
+        self._lines = lines[1:]
+        self._parsed = [None] * len(self._lines)
+
+    def encode(self, contents: str) -> list[str] | None:
+        """
+        Encode a snapshot as the changed counters compared to the preceding snapshot.
+
+        Args:
+            contents: The '/proc/interrupts' snapshot contents with extra white-spaces removed.
+
+        Returns:
+            The delta lines, or 'None' if the snapshot cannot be delta-encoded and has to be printed
+            in full.
+        """
+
+        lines = contents.splitlines()
+        if not lines or lines[0] != self._header or len(lines) - 1 != len(self._lines):
+            return None
+
+        deltas = []
+        for idx, line in enumerate(lines[1:]):
+            prev_line = self._lines[idx]
+            if line == prev_line:
+                continue
+
+            name, counts, descr = self._parse_line(line)
+            prev_parsed = self._parsed[idx]
+            if prev_parsed is None:
+                prev_parsed = self._parse_line(prev_line)
+            prev_name, prev_counts, prev_descr = prev_parsed
+
+            # A renamed IRQ or a changed description cannot be delta-encoded, print a keyframe.
+            if name != prev_name or descr != prev_descr or len(counts) != len(prev_counts):
+                return None
+
+            deltas.append(name + " " + " ".join(f"{col}:{cnt - prev_cnt}"
+                                               for col, (cnt, prev_cnt)
+                                               in enumerate(zip(counts, prev_counts))
+                                               if cnt != prev_cnt))
+
+            self._lines[idx] = line
+            self._parsed[idx] = (name, counts, descr)
+
+        return deltas
+
+def _compact(contents: bytearray) -> bytes:
+    """
+    Shrink the '/proc/interrupts' file contents by replacing sequences of spaces with a single
+    space. The file contents is very sparse and on large servers takes a lot of space.
+
+    Args:
+        contents: The '/proc/interrupts' file contents.
+
+    Returns:
+        The compacted file contents without the trailing white-spaces.
+    """
+
+    return b" ".join(filter(None, contents.split(b" "))).rstrip()
+
+class SamplerBase(ClassHelpers.SimpleCloseContext):
+    """
+    The base class for samplers. Sub-classes open the files they read in the constructor, and
+    implement 'sample()'.
+    """
+
+    def sample(self) -> bytes:
+        """
+        Take a sample.
+
+        Returns:
+            The sample in the output format of the sampler, ending with a newline.
+
+        Raises:
+            Error: Failed to read the sampled files.
+        """
+
+        raise NotImplementedError
+
+class InterruptsSampler(SamplerBase):
+    """
+    Take '/proc/interrupts' snapshots in the format of the 'stc-agent-proc-interrupts-helper' tool.
+    """
+
+    def __init__(self, keyframes: int = 1, path: str = "/proc/interrupts"):
+        """
+        Initialize a class instance.
+
+        Args:
+            keyframes: Format every 'keyframes'-th snapshot in full, and only the changed interrupt
+                       counters in between.
+            path: Path to the file to take snapshots of.
+        """
+
+        if keyframes <= 0:
+            raise Error(f"Bad keyframes value '{keyframes}': Must be positive")
+
+        self._keyframes = keyframes
+        self._encoder = _DeltaEncoder()
+        # Count of snapshots formatted since the last keyframe.
+        self._since_keyframe = 0
+        self._reader = ProcFileReader(path)
+
+    def close(self):
+        """Close the '/proc/interrupts' file."""
+
+        ClassHelpers.close(self, close_attrs=("_reader",))
+
+    def sample(self) -> bytes:
+        """
+        Take a '/proc/interrupts' snapshot.
+
+        Returns:
+            The snapshot, either in full or as the changed interrupt counters, followed by the
+            "# CPU time" comment line with the CPU time it took to take the snapshot.
+        """
+
+        # Use the thread CPU time, because the sampler may run in a multi-threaded process.
+        cpu_time = time.thread_time()
+        timestamp = time.time()
+        contents = _compact(self._reader.read())
+
+        deltas = None
+        if self._keyframes > 1 and self._since_keyframe < self._keyframes - 1:
+            deltas = self._encoder.encode(contents.decode("utf-8"))
+
+        if deltas is None:
+            data = b"Timestamp: %r\n%s\n" % (timestamp, contents)
+            if self._keyframes > 1:
+                self._encoder.keyframe(contents.decode("utf-8"))
+            self._since_keyframe = 0
+        else:
+            deltas.insert(0, f"Delta: {timestamp!r} {len(deltas)}")
+            deltas.append("")
+            data = "\n".join(deltas).encode("utf-8")
+            self._since_keyframe += 1
+
+        # Record the CPU time it took to take the snapshot, so that the sampling overhead could be
+        # verified. The parsers skip comment lines.
+        cpu_time = time.thread_time() - cpu_time
+        return data + b"# CPU time: %.6f\n" % cpu_time
+
+class _TimerEntry:
+    """A callback run periodically by 'SamplerThread'."""
+
+    def __init__(self, interval: float, callback: Callable[[], bool]):
+        """
+        Initialize a class instance.
+
+        Args:
+            interval: The callback run interval in seconds.
+            callback: The callback to run.
+        """
+
+        self.interval = interval
+        self.callback = callback
+        # The monotonic time of the next callback run.
+        self.deadline = time.monotonic()
+
+class SamplerThread:
+    """
+    Run multiple periodic callbacks, typically taking samples, in a single thread. The thread is
+    started when the first callback is added, and exits when the last callback is removed.
+    """
+
+    def __init__(self, name: str = "sampler"):
+        """
+        Initialize a class instance.
+
+        Args:
+            name: Name of the thread.
+        """
+
+        self._name = name
+        self._cond = threading.Condition()
+        # The callbacks indexed by their names.
+        self._entries: dict[str, _TimerEntry] = {}
+        # Name of the callback currently being run, empty if none.
+        self._running = ""
+        self._thread: threading.Thread | None = None
+
+    def add(self, name: str, interval: float, callback: Callable[[], bool]):
+        """
+        Add a callback and run it right away, then every 'interval' seconds.
+
+        Args:
+            name: Unique name of the callback.
+            interval: The callback run interval in seconds.
+            callback: The callback to run. Returns 'False' to stop being run. Must not raise
+                      exceptions.
+        """
+
+        if interval <= 0:
+            raise Error(f"Bad interval '{interval}' for '{name}': Must be positive")
+
+        with self._cond:
+            if name in self._entries:
+                raise Error(f"BUG: '{name}' is already added to the '{self._name}' thread")
+
+            self._entries[name] = _TimerEntry(interval, callback)
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def remove(self, name: str):
+        """
+        Remove a callback. Wait for the callback to return if it is being run.
+
+        Args:
+            name: Name of the callback to remove.
+        """
+
+        with self._cond:
+            self._entries.pop(name, None)
+            self._cond.notify_all()
+            if threading.current_thread() is not self._thread:
+                while self._running == name:
+                    self._cond.wait()
+
+    def _run(self):
+        """Run the callbacks at their deadlines until there are no callbacks."""
+
+        with self._cond:
+            try:
+                while self._entries:
+                    name, entry = min(self._entries.items(), key=lambda item: item[1].deadline)
+
+                    now = time.monotonic()
+                    if now < entry.deadline:
+                        self._cond.wait(entry.deadline - now)
+                        continue
+
+                    self._running = name
+                    self._cond.release()
+                    try:
+                        keep = entry.callback()
+                    finally:
+                        self._cond.acquire()
+                        self._running = ""
+                        self._cond.notify_all()
+
+                    if not keep:
+                        if self._entries.get(name) is entry:
+                            del self._entries[name]
+                        continue
+
+                    # Use absolute deadlines, so that the time it takes to run the callback does not
+                    # accumulate and the samples do not drift. Skip the missed deadlines.
+                    entry.deadline += entry.interval
+                    now = time.monotonic()
+                    if now >= entry.deadline:
+                        entry.deadline += (int((now - entry.deadline) / entry.interval) + 1) * \
+                                          entry.interval
+            finally:
+                self._thread = None
+
+class _PidReaders(ClassHelpers.SimpleCloseContext):
+    """The pre-opened '/proc/<pid>/*' files of a process."""
+
+    def __init__(self, pid: int):
+        """
+        Initialize a class instance.
+
+        Args:
+            pid: PID of the process to open the files of.
+        """
+
+        self.stat: ProcFileReader | None = None
+        self.status: ProcFileReader | None = None
+        self.io: ProcFileReader | None = None
+        self.children: ProcFileReader | None = None
+
+        self.stat = ProcFileReader(f"/proc/{pid}/stat", bufsize=_PID_BUFSIZE)
+        try:
+            self.status = ProcFileReader(f"/proc/{pid}/status", bufsize=_PID_BUFSIZE)
+            # The I/O accounting file of a process owned by another user is not accessible, and the
+            # children file requires 'CONFIG_PROC_CHILDREN'. Do without them.
+            try:
+                self.io = ProcFileReader(f"/proc/{pid}/io", bufsize=_PID_BUFSIZE)
+            except Error:
+                pass
+            try:
+                self.children = ProcFileReader(f"/proc/{pid}/task/{pid}/children",
+                                               bufsize=_PID_BUFSIZE)
+            except Error:
+                pass
+        except Error:
+            self.close()
+            raise
+
+    def close(self):
+        """Close the files."""
+
+        ClassHelpers.close(self, close_attrs=("stat", "status", "io", "children"))
+
+class OverheadSampler(SamplerBase):
+    """
+    Sample the CPU time, memory, context switches, and disk I/O of groups of processes, e.g.,
+    statistics collectors. Every sample starts with a "Timestamp: <time_since_epoch>" line, followed
+    by a line per process group of the following format:
+
+    <group>: pids=<N> cpu=<seconds> rss=<bytes> vcsw=<N> nvcsw=<N> read=<bytes> write=<bytes>
+
+    The values are cumulative totals over all processes of the group: the user and system CPU time
+    (including the waited-for children), the resident set size, the voluntary and non-voluntary
+    context switches count, and the storage bytes read and written. The 'read' and 'write' keys
+    are omitted if the I/O accounting file of any process of the group is not accessible.
+    """
+
+    def __init__(self, get_groups: Callable[[], dict[str, int]], self_name: str):
+        """
+        Initialize a class instance.
+
+        Args:
+            get_groups: A function returning the process groups to sample: a dictionary indexed by
+                        group names with PIDs of the group leader processes as values. A group
+                        includes the leader process and all its descendants.
+            self_name: Name of the group of the sampling process itself. Unlike other groups, it
+                       does not include the descendants of the process.
+        """
+
+        self._get_groups = get_groups
+        self._self_name = self_name
+        self._self_pid = os.getpid()
+        self._clk_tck = os.sysconf("SC_CLK_TCK")
+        # The pre-opened files of the sampled processes, indexed by PID.
+        self._readers: dict[int, _PidReaders] = {}
+
+    def close(self):
+        """Close all the opened files."""
+
+        for readers in getattr(self, "_readers", {}).values():
+            readers.close()
+        self._readers = {}
+
+    def _get_readers(self, pid: int, seen: dict[int, _PidReaders]) -> _PidReaders | None:
+        """
+        Return the pre-opened files of a process, open them if necessary.
+
+        Args:
+            pid: PID of the process.
+            seen: The files of the processes sampled so far, the files are added to it.
+
+        Returns:
+            The process files, or 'None' if the process does not exist anymore.
+        """
+
+        readers = self._readers.pop(pid, None)
+        if not readers:
+            try:
+                readers = _PidReaders(pid)
+            except Error:
+                return None
+
+        seen[pid] = readers
+        return readers
+
+    def _sample_pid(self, readers: _PidReaders, vals: dict[str, float]) -> list[int] | None:
+        """
+        Read the files of a process and add the values to the process group values.
+
+        Args:
+            readers: The process files.
+            vals: The process group values to add the process values to.
+
+        Returns:
+            The PIDs of the process children, or 'None' if the process does not exist anymore.
+        """
+
+        assert readers.stat is not None and readers.status is not None
+
+        try:
+            # The command name in parenthesis may include spaces, skip it.
+            stat = readers.stat.read()
+            fields = stat[stat.rindex(b")") + 2:].split()
+            # The user, system, and waited-for children user and system times in clock ticks.
+            vals["cpu"] += sum(int(field) for field in fields[11:15]) / self._clk_tck
+
+            for line in bytes(readers.status.read()).splitlines():
+                key, _, val = line.partition(b":")
+                if key in _STATUS_KEYS:
+                    val = val.split()[0]
+                    # The RSS is in kiB.
+                    vals[_STATUS_KEYS[key]] += int(val) * (1024 if key == b"VmRSS" else 1)
+
+            children = []
+            if readers.children:
+                children = [int(pid) for pid in readers.children.read().split()]
+        except (Error, ValueError, IndexError):
+            return None
+
+        if readers.io:
+            try:
+                for line in bytes(readers.io.read()).splitlines():
+                    key, _, val = line.partition(b":")
+                    if key in _IO_KEYS and "read" in vals:
+                        vals[_IO_KEYS[key]] += int(val)
+            except (Error, ValueError):
+                readers.io.close()
+                readers.io = None
+
+        if not readers.io:
+            vals.pop("read", None)
+            vals.pop("write", None)
+
+        vals["pids"] += 1
+        return children
+
+    def sample(self) -> bytes:
+        """
+        Sample the process groups.
+
+        Returns:
+            The sample of all the process groups that have at least one running process.
+        """
+
+        lines = [f"Timestamp: {time.time()!r}"]
+        # The files of the processes sampled this time.
+        seen: dict[int, _PidReaders] = {}
+
+        groups = {self._self_name: self._self_pid}
+        groups.update(self._get_groups())
+
+        for name, leader in groups.items():
+            vals: dict[str, float] = dict.fromkeys(("pids", "cpu", "rss", "vcsw", "nvcsw", "read",
+                                                    "write"), 0)
+            pids = [leader]
+            while pids:
+                pid = pids.pop()
+                if pid in seen:
+                    continue
+                readers = self._get_readers(pid, seen)
+                if not readers:
+                    continue
+                children = self._sample_pid(readers, vals)
+                if children is None:
+                    # The process has exited, or the PID was re-used.
+                    seen.pop(pid).close()
+                    continue
+                if pid != self._self_pid:
+                    pids += children
+
+            if vals["pids"]:
+                lines.append(f"{name}: " + " ".join(f"{key}={val:.2f}" if key == "cpu" else
+                                                    f"{key}={int(val)}"
+                                                    for key, val in vals.items()))
+
+        # Close the files of the processes that are not sampled anymore.
+        for readers in self._readers.values():
+            readers.close()
+        self._readers = seen
+
+        lines.append("")
+        return "\n".join(lines).encode("utf-8")
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide reading and writing of segmented raw statistics files.
+
+The output of a long-running statistics collector may be split into segments: the collector output
+rolls over to a new file every N seconds or every M bytes. The segments are listed in a manifest
+file, along with the time-stamps of the first and the last samples in every segment. This makes it
+possible to read only the segments overlapping a time window, instead of parsing the entire output
+from the beginning.
+
+The manifest is a JSON file of the following format.
+
+    {"format": 1,
+     "header_size": <size>,
+     "segments": [{"name": <segment file name>, "begin": <time-stamp>, "end": <time-stamp>}, ...]}
+
+Every segment starts with the same 'header_size' bytes: a copy of the collector output preceding
+the first sample (e.g., the turbostat system information, or the CSV file heading), so that every
+segment is a valid raw statistics file on its own. When multiple segments are read, the header is
+skipped in all of them but the first one, so the result looks like a single raw statistics file.
+
+The time-stamps are 'null' when unknown, e.g., for the segment the collector was writing to when
+it crashed. Segments may be compressed, in which case the segment file names have a compression
+suffix (refer to the 'Compression' module).
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import io
+import os
+import json
+import typing
+from pathlib import Path
+from pepclibs.helperlibs.Exceptions import Error, ErrorBadFormat
+from statscollectlibs.helperlibs import Compression
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Any, Final, Sequence, TypedDict
+
+    # A '(begin_ts, end_ts)' time-stamps range, 'None' means no limit.
+    RangeType = tuple[float | None, float | None]
+
+    class SegmentTypedDict(TypedDict):
+        """
+        A segment description in the manifest.
+
+        Attributes:
+            name: The segment file name, relative to the manifest file directory.
+            begin: Time-stamp of the first sample in the segment, or 'None' if unknown.
+            end: Time-stamp of the last sample in the segment, or 'None' if unknown.
+        """
+
+        name: str
+        begin: float | None
+        end: float | None
+
+    class ManifestTypedDict(TypedDict):
+        """
+        The segments manifest.
+
+        Attributes:
+            format: The manifest format version.
+            header_size: Size of the header every segment starts with, in bytes.
+            segments: The segments in the order they were written.
+        """
+
+        format: int
+        header_size: int
+        segments: list[SegmentTypedDict]
+
+# The manifest file name suffix.
+MANIFEST_SUFFIX: Final[str] = ".segments.json"
+
+# The manifest format version.
+_FORMAT_VERSION: Final[int] = 1
+
+def is_manifest(path: Path | str) -> bool:
+    """
+    Check whether a raw statistics file path is a segments manifest path.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        'True' if the path is a segments manifest path, 'False' otherwise.
+    """
+
+    return str(path).endswith(MANIFEST_SUFFIX)
+
+def get_manifest_name(outfile: str) -> str:
+    """
+    Return the manifest file name for a collector output file name.
+
+    Args:
+        outfile: The collector output file name, e.g., "turbostat.raw.txt".
+
+    Returns:
+        The manifest file name, e.g., "turbostat.segments.json".
+    """
+
+    return outfile.split(".", 1)[0] + MANIFEST_SUFFIX
+
+def get_segment_name(outfile: str, idx: int) -> str:
+    """
+    Return the file name of a segment of the collector output.
+
+    Args:
+        outfile: The collector output file name, e.g., "turbostat.raw.txt.gz".
+        idx: The segment number.
+
+    Returns:
+        The segment file name, e.g., "turbostat-0001.raw.txt.gz".
+    """
+
+    base, dot, rest = outfile.partition(".")
+    return f"{base}-{idx:04d}{dot}{rest}"
+
+def new_manifest() -> ManifestTypedDict:
+    """
+    Create and return an empty segments manifest.
+
+    Returns:
+        The segments manifest without segments.
+    """
+
+    return {"format": _FORMAT_VERSION, "header_size": 0, "segments": []}
+
+def write_manifest(path: Path, manifest: ManifestTypedDict):
+    """
+    Write a segments manifest file. The file is replaced atomically, so that readers never see a
+    partially written manifest.
+
+    Args:
+        path: The manifest file path.
+        manifest: The segments manifest to write.
+
+    Raises:
+        Error: Failed to write the manifest file.
+    """
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fobj:
+            json.dump(manifest, fobj, indent=1)
+            fobj.write("\n")
+            fobj.flush()
+            os.fsync(fobj.fileno())
+        tmp_path.replace(path)
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to write segments manifest '{path}':\n{errmsg}") from err
+
+def read_manifest(path: Path) -> ManifestTypedDict:
+    """
+    Read and validate a segments manifest file.
+
+    Args:
+        path: The manifest file path.
+
+    Returns:
+        The segments manifest.
+
+    Raises:
+        Error: Failed to read the manifest file.
+        ErrorBadFormat: The manifest file has bad format.
+    """
+
+    try:
+        with open(path, "r", encoding="utf-8") as fobj:
+            manifest: Any = json.load(fobj)
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to read segments manifest '{path}':\n{errmsg}") from err
+    except ValueError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise ErrorBadFormat(f"Bad segments manifest '{path}':\n{errmsg}") from err
+
+    if not isinstance(manifest, dict) or manifest.get("format") != _FORMAT_VERSION:
+        raise ErrorBadFormat(f"Bad segments manifest '{path}': Unsupported format")
+
+    header_size = manifest.get("header_size")
+    segments = manifest.get("segments")
+    if not isinstance(header_size, int) or header_size < 0 or not isinstance(segments, list):
+        raise ErrorBadFormat(f"Bad segments manifest '{path}': Bad 'header_size' or 'segments'")
+
+    for segment in segments:
+        if not isinstance(segment, dict) or not isinstance(segment.get("name"), str) or \
+           os.path.basename(segment["name"]) != segment["name"]:
+            raise ErrorBadFormat(f"Bad segments manifest '{path}': Bad segment '{segment}'")
+        for key in ("begin", "end"):
+            segment.setdefault(key, None)
+            if segment[key] is not None and not isinstance(segment[key], (int, float)):
+                raise ErrorBadFormat(f"Bad segments manifest '{path}': Bad '{key}' time-stamp of "
+                                     f"segment '{segment['name']}'")
+
+    if not segments:
+        raise ErrorBadFormat(f"Bad segments manifest '{path}': No segments")
+
+    return manifest
+
+def select_segments(manifest: ManifestTypedDict,
+                    begin_ts: float | None = None,
+                    end_ts: float | None = None) -> list[SegmentTypedDict]:
+    """
+    Return the segments overlapping a time window. Segments with unknown time-stamps are considered
+    to overlap any time window.
+
+    Args:
+        manifest: The segments manifest.
+        begin_ts: The time window start time-stamp, 'None' means no limit.
+        end_ts: The time window end time-stamp, 'None' means no limit.
+
+    Returns:
+        List of the segments overlapping the time window.
+    """
+
+    selected = []
+    for segment in manifest["segments"]:
+        if begin_ts is not None and segment["end"] is not None and segment["end"] < begin_ts:
+            continue
+        if end_ts is not None and segment["begin"] is not None and segment["begin"] > end_ts:
+            continue
+        selected.append(segment)
+
+    return selected
+
+def get_first_timestamp(path: Path) -> float | None:
+    """
+    Return the time-stamp of the first sample of a segmented raw statistics file.
+
+    Args:
+        path: The manifest file path.
+
+    Returns:
+        The time-stamp of the first sample, or 'None' if it is unknown.
+    """
+
+    for segment in read_manifest(path)["segments"]:
+        if segment["begin"] is not None:
+            return segment["begin"]
+    return None
+
+class _SegmentsReader(io.RawIOBase):
+    """A raw binary stream of the concatenated data of multiple segments."""
+
+    def __init__(self, paths: Sequence[Path], header_size: int):
+        """
+        Initialize a class instance.
+
+        Args:
+            paths: The segment file paths to read, in order.
+            header_size: Size of the header every segment starts with. The header is skipped in
+                         all segments but the first one.
+        """
+
+        super().__init__()
+
+        self._paths = list(paths)
+        self._header_size = header_size
+        # Count of the segments opened so far, and the currently read segment file object.
+        self._opened = 0
+        self._fobj: IO[bytes] | None = None
+
+    def readable(self) -> bool:
+        """Return 'True', the stream is readable."""
+
+        return True
+
+    def _open_next(self) -> bool:
+        """
+        Open the next segment file, skip its header if needed.
+
+        Returns:
+            'True' if the next segment was opened, 'False' if there are no more segments.
+        """
+
+        if self._fobj:
+            self._fobj.close()
+            self._fobj = None
+
+        if self._opened >= len(self._paths):
+            return False
+
+        path = self._paths[self._opened]
+        self._fobj = Compression.open_binary(path)
+
+        if self._opened and self._header_size:
+            header = self._fobj.read(self._header_size)
+            if len(header) != self._header_size:
+                raise OSError(f"Segment '{path}' is shorter than the {self._header_size} bytes "
+                              f"header")
+
+        self._opened += 1
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Read the concatenated segments data into a pre-allocated buffer.
+
+        Args:
+            buffer: The buffer to read the data into.
+
+        Returns:
+            The count of bytes read, '0' at the end of the last segment.
+        """
+
+        while True:
+            if self._fobj:
+                data = self._fobj.read(len(buffer))
+                if data:
+                    buffer[:len(data)] = data
+                    return len(data)
+            if not self._open_next():
+                return 0
+
+    def close(self):
+        """Close the stream and the currently read segment file."""
+
+        if self._fobj:
+            self._fobj.close()
+            self._fobj = None
+        super().close()
+
+def open_binary(path: Path,
+                begin_ts: float | None = None,
+                end_ts: float | None = None) -> IO[bytes]:
+    """
+    Open a possibly segmented and compressed raw statistics file for reading in binary mode. If
+    'path' is a segments manifest, return a stream of the concatenated segments data, otherwise
+    the same as 'Compression.open_binary()'.
+
+    Args:
+        path: Path to the raw statistics file or to the segments manifest.
+        begin_ts: If specified, read only the segments with samples taken at or after this
+                  time-stamp. Ignored if 'path' is not a segments manifest.
+        end_ts: If specified, read only the segments with samples taken at or before this
+                time-stamp. Ignored if 'path' is not a segments manifest.
+
+    Returns:
+        The binary file object. Only seekable if the file is neither segmented, nor compressed.
+    """
+
+    if not is_manifest(path):
+        return Compression.open_binary(path)
+
+    try:
+        manifest = read_manifest(path)
+    except Error as err:
+        raise OSError(str(err)) from err
+
+    paths = [path.parent / segment["name"]
+             for segment in select_segments(manifest, begin_ts=begin_ts, end_ts=end_ts)]
+    return io.BufferedReader(_SegmentsReader(paths, manifest["header_size"]))
+
+def open_text(path: Path,
+              begin_ts: float | None = None,
+              end_ts: float | None = None) -> IO[str]:
+    """
+    Open a possibly segmented and compressed UTF-8 raw statistics file for reading. Refer to
+    'open_binary()' for the arguments description.
+
+    Returns:
+        The text file object.
+    """
+
+    if not is_manifest(path):
+        return Compression.open_text(path)
+
+    return io.TextIOWrapper(open_binary(path, begin_ts=begin_ts, end_ts=end_ts), encoding="utf-8")
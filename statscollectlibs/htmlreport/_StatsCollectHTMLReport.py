@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2022-2025 Intel Corporation
+# Copyright (C) 2022-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -21,6 +21,7 @@ from statscollectlibs.result import RORawResult, LoadedResult
 
 if typing.TYPE_CHECKING:
     from typing import cast
+    from statscollectlibs.result._StatsCache import StatsCache
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
@@ -37,7 +38,9 @@ class StatsCollectHTMLReport:
                  rsts: list[RORawResult.RORawResult],
                  outdir: Path,
                  cpus: list[int] | None = None,
-                 logpath: Path | None = None):
+                 logpath: Path | None = None,
+                 jobs: int = 1,
+                 cache: StatsCache | None = None):
         """
         Initialize a class instance.
 
@@ -47,6 +50,9 @@ class StatsCollectHTMLReport:
             cpus: List of CPU numbers to include in the report along with the system-wide
                   statistics.
             logpath: The HTML report generation log file path.
+            jobs: Count of worker processes to use for parsing raw statistics files.
+            cache: The cache of the dataframes built from raw statistics files, or 'None' to always
+                   build the dataframes from the raw statistics files.
         """
 
         self.rsts = rsts
@@ -71,7 +77,7 @@ class StatsCollectHTMLReport:
 
         # Build the loaded test result objects, but do not load them yet.
         for res in self.rsts:
-            lres = LoadedResult.LoadedResult(res, cpus=cpus)
+            lres = LoadedResult.LoadedResult(res, cpus=cpus, jobs=jobs, cache=cache)
             self._lrsts.append(lres)
 
     def _add_intro_tbl_links(self, label: str, paths: dict[str, Path]):
@@ -135,6 +141,15 @@ class StatsCollectHTMLReport:
         for res in rsts:
             date_row.add_cell(res.reportid, res.info.get("duration"))
 
+        # Add the CPUs the statistics collectors ran on.
+        if any(res.info.get("stats_cpus") for res in rsts):
+            descr = "The CPUs the in-band statistics collectors were bound to. The collectors " \
+                    "did not run on the other CPUs, so they did not disturb C-states and " \
+                    "frequencies of the other CPUs."
+            cpus_row = self._intro_tbl.add_row("Collection CPUs", hovertext=descr)
+            for res in rsts:
+                cpus_row.add_cell(res.reportid, res.info.get("stats_cpus"))
+
         # Add links to the raw directories.
         if self.copy_raw:
             self._add_intro_tbl_links("Raw result", self._raw_paths)
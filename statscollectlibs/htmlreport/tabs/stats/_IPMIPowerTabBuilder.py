@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide the capability of populating the DCMI power reading statistics tab.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+from statscollectlibs.result.LoadedResult import LoadedResult
+from statscollectlibs.htmlreport.tabs.stats import  _StatTabBuilderBase
+from statscollectlibs.htmlreport.tabs._TabConfig import DTabConfig
+
+class IPMIPowerTabBuilder(_StatTabBuilderBase.StatTabBuilderBase):
+    """Provide the capability of populating the DCMI power reading statistics tab."""
+
+    name = "IPMI Power"
+    stnames = ["ipmi-power"]
+
+    def __init__(self,
+                 lrsts: list[LoadedResult],
+                 outdir: Path,
+                 basedir: Path | None = None,
+                 xmetric: str | None = None):
+        """
+        Initialize a class instance.
+
+        Args:
+            lrsts: A list of loaded test results to include in the tab.
+            outdir: The output directory in which to create the sub-directory for the container tab.
+            basedir: The base directory of the report. All paths should be made relative to this.
+                     Defaults to 'outdir'.
+            xmetric: Name of the metric to use for the X-axis of the plots. If not provided, the
+                     X-axis will use the time elapsed since the beginning of the measurements.
+        """
+
+        super().__init__(lrsts, outdir, basedir=basedir, xcolname=xmetric)
+
+    def get_tab_cfg(self) -> DTabConfig:
+        """
+        Get a 'DTabConfig' instance with the DCMI power reading data tab configuration.
+
+        Returns:
+            A data tab (D-tab) configuration object describing how the DCMI power reading HTML tab
+            should be built.
+        """
+
+        dtab_cfg = self._get_dtab_cfg("InstPower")
+
+        # By default the tab will be titled after the metric. Change the title to "IPMI Power".
+        dtab_cfg.name = self.name
+        return dtab_cfg
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide the capability to populate the statistics collection overhead tab.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+from pathlib import Path
+from statscollectlibs.result.LoadedResult import LoadedResult
+from statscollectlibs.dfbuilders import _DFHelpers
+from statscollectlibs.htmlreport.tabs.stats import _StatTabBuilderBase
+from statscollectlibs.htmlreport.tabs._TabConfig import CTabConfig, DTabConfig
+
+if typing.TYPE_CHECKING:
+    from statscollectlibs.mdc.MDCBase import MDTypedDict
+    from statscollectlibs.htmlreport.tabs.stats._StatTabBuilderBase import CDTypedDict
+
+class OverheadTabBuilder(_StatTabBuilderBase.StatTabBuilderBase):
+    """Provide the capability to populate the statistics collection overhead tab."""
+
+    name = "Collection Overhead"
+    stnames = ["stc-overhead"]
+
+    def __init__(self,
+                 lrsts: list[LoadedResult],
+                 outdir: Path,
+                 basedir: Path | None = None,
+                 xmetric: str | None = None):
+        """
+        Initialize a class instance.
+
+        Args:
+            lrsts: A list of loaded test results to include in the tab.
+            outdir: The output directory in which to create the sub-directory for the container tab.
+            basedir: The base directory of the report. All paths should be made relative to this.
+                     Defaults to 'outdir'.
+            xmetric: Name of the metric to use for the X-axis of the plots. If not provided, the
+                     X-axis will use the time elapsed since the beginning of the measurements.
+        """
+
+        super().__init__(lrsts, outdir, basedir=basedir, xcolname=xmetric)
+
+    def _build_cdd(self,
+                   mdd: dict[str, MDTypedDict],
+                   colnames: list[str] | None = None) -> dict[str, CDTypedDict]:
+        """
+        Build a columns definition dictionary (CDD) that describes columns in dataframes.
+
+        Args:
+            mdd: The metrics definition dictionary (MDD) for metrics that will be included in the
+                 tab. It describes metrics, while CDD describes columns. Coulumns include the
+                 scope as well. For example, there is a "CPU%" metric, which may have 2 columns -
+                 "Total-CPU%" for all the collectors, and "turbostat-CPU%" for turbostat.
+            colnames: list of dataframe column names to use for the CDD. By default, assume column
+                      names are the same as metric names.
+
+        Returns:
+            CDTypedDict: The Columns Definition Dictionary.
+        """
+
+        cdd = super()._build_cdd(mdd, colnames=colnames)
+
+        if not colnames:
+            return cdd
+
+        # Describe the processes the columns are about.
+        for colname in colnames:
+            sname, _ = _DFHelpers.split_colname(colname)
+            if sname is None:
+                continue
+
+            cd = cdd[colname]
+            if sname == "Total":
+                cd["descr"] += " This represents all the statistics collectors processes, " \
+                               "including the 'stc-agent' process."
+            elif sname == "stc_agent":
+                cd["descr"] += " This represents the 'stc-agent' process, including the " \
+                               "statistics collected in the 'stc-agent' process."
+            else:
+                cd["descr"] += f" This represents the '{sname}' statistics collector process and " \
+                               f"its child processes."
+
+        return cdd
+
+    def get_tab_cfg(self) -> CTabConfig:
+        """
+        Get a container tab (C-tab) configuration object for the collection overhead statistics.
+        The C-tab includes a sub-C-tab for all the statistics collectors together, and a sub-C-tab
+        for every statistics collector. These C-tabs include D-tabs for the individual metrics:
+
+        Collection Overhead C-tab:
+            - Total
+                - D-tab for each metric.
+            - stc_agent
+                - D-tab for each metric.
+            - A C-tab for every statistics collector.
+
+        Returns:
+            The collection overhead statistics container tab (C-tab) configuration object
+            ('CTabConfig').
+        """
+
+        # Scope -> list of 'DTabConfig' objects.
+        dtabs: dict[str, list[DTabConfig]] = {}
+
+        for colname in self._colnames:
+            sname, metric = _DFHelpers.split_colname(colname)
+            if sname is None:
+                continue
+
+            if sname not in dtabs:
+                dtabs[sname] = []
+            dtabs[sname].append(self._get_dtab_cfg(colname, title=metric))
+
+        ctabs = [CTabConfig(sname, dtabs=sname_dtabs) for sname, sname_dtabs in dtabs.items()]
+        return CTabConfig(self.name, ctabs=ctabs)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2025 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -22,6 +22,7 @@ from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound, ErrorBadFormat
 from statscollectlibs.htmlreport.tabs import BuiltTab
 from statscollectlibs.htmlreport.tabs.stats import _TurbostatTabBuilder, _InterruptsTabBuilder
 from statscollectlibs.htmlreport.tabs.stats import _ACPowerTabBuilder, _IPMITabBuilder
+from statscollectlibs.htmlreport.tabs.stats import _IPMIPowerTabBuilder, _OverheadTabBuilder
 from statscollectlibs.htmlreport.tabs.sysinfo import _SysInfoTabBuilder
 from statscollectlibs.result.LoadedResult import LoadedResult
 
@@ -31,12 +32,16 @@ if typing.TYPE_CHECKING:
     _TabBuilderClassType = Union[Type[_TurbostatTabBuilder.TurbostatTabBuilder],
                                  Type[_InterruptsTabBuilder.InterruptsTabBuilder],
                                  Type[_ACPowerTabBuilder.ACPowerTabBuilder],
-                                 Type[_IPMITabBuilder.IPMITabBuilder]]
+                                 Type[_IPMITabBuilder.IPMITabBuilder],
+                                 Type[_IPMIPowerTabBuilder.IPMIPowerTabBuilder],
+                                 Type[_OverheadTabBuilder.OverheadTabBuilder]]
 
     _TabBuilderType = Union[_TurbostatTabBuilder.TurbostatTabBuilder,
                             _InterruptsTabBuilder.InterruptsTabBuilder,
                             _ACPowerTabBuilder.ACPowerTabBuilder,
-                            _IPMITabBuilder.IPMITabBuilder]
+                            _IPMITabBuilder.IPMITabBuilder,
+                            _IPMIPowerTabBuilder.IPMIPowerTabBuilder,
+                            _OverheadTabBuilder.OverheadTabBuilder]
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
@@ -104,7 +109,9 @@ class _StatsTabBuilder:
         classes_list: list[_TabBuilderClassType] = [_TurbostatTabBuilder.TurbostatTabBuilder,
                                                     _InterruptsTabBuilder.InterruptsTabBuilder,
                                                     _IPMITabBuilder.IPMITabBuilder,
-                                                    _ACPowerTabBuilder.ACPowerTabBuilder]
+                                                    _IPMIPowerTabBuilder.IPMIPowerTabBuilder,
+                                                    _ACPowerTabBuilder.ACPowerTabBuilder,
+                                                    _OverheadTabBuilder.OverheadTabBuilder]
 
         classes_dict: dict[str, _TabBuilderClassType] = {}
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2022-2025 Intel Corporation
+# Copyright (C) 2022-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Authors: Adam Hawley <adam.james.hawley@intel.com>
@@ -17,9 +17,19 @@ from pepclibs.helperlibs.Exceptions import Error
 from statscollectlibs.mdc import MDCBase
 
 if typing.TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Final
     from statscollectlibs.mdc.MDCBase import MDTypedDict
 
+# IPMI metrics are categorized based on the unit. For example, "RPM" metrics are categorized as fan
+# speed. The category names match the metrics definitions file.
+UNIT2CATEGORY: Final[dict[str, str]] = {
+    "RPM": "FanSpeed",
+    "degrees C": "Temperature",
+    "Watts": "Power",
+    "Amps": "Current",
+    "Volts": "Voltage",
+}
+
 class IPMIMDC(MDCBase.MDCBase):
     """
     The IPMI metrics definition class provides API to IPMI metrics definitions, which describe the
@@ -47,8 +57,7 @@ class IPMIMDC(MDCBase.MDCBase):
     @staticmethod
     def _get_category(unit: str) -> str | None:
         """
-        Metrics are categorized based on the unit. For example, "RPM" metrics are categorized as fan
-        speed. Return the category name based on the unit.
+        Return the category name based on the unit.
 
         Args:
             unit: The unit name of a metric.
@@ -57,14 +66,7 @@ class IPMIMDC(MDCBase.MDCBase):
             str: The name of the metric category, or 'None' if no category exists for the unit.
         """
 
-        unit2category = {
-            "RPM": "FanSpeed",
-            "degrees C": "Temperature",
-            "Watts": "Power",
-            "Amps": "Current",
-            "Volts": "Voltage",
-        }
-        return unit2category.get(unit)
+        return UNIT2CATEGORY.get(unit)
 
     def _populate(self, dataset: dict[str, tuple[Any, str]]):
         """
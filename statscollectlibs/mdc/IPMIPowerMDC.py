@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Provide the DCMI power reading metrics definition class."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+from statscollectlibs.mdc import MDCBase
+
+class IPMIPowerMDC(MDCBase.MDCBase):
+    """
+    The DCMI power reading metrics definition class provides API to DCMI power reading metrics
+    definitions, which describe the metrics provided by the "ipmi-power" raw statistics files.
+    """
+
+    def __init__(self):
+        """Initialize a class instance."""
+
+        super().__init__("stats-collect", Path("defs/statscollect/ipmi-power.yml"))
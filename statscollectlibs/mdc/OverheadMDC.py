@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Provide the statistics collection overhead metrics definition class."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+from statscollectlibs.mdc import MDCBase
+
+class OverheadMDC(MDCBase.MDCBase):
+    """
+    The statistics collection overhead metrics definition class provides API to the collection
+    overhead metrics definitions, which describe the metrics provided by the "stc-overhead" raw
+    statistics files.
+    """
+
+    def __init__(self, metrics: list[str]):
+        """
+        Initialize a class instance.
+
+        Args:
+            metrics: List of metric names to keep in the metrics definition dictionary.
+        """
+
+        super().__init__("stats-collect", Path("defs/statscollect/stc-overhead.yml"))
+        self.mangle(metrics)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2014-2025 Intel Corporation
+# Copyright (C) 2014-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Erik Veijola <erik.veijola@intel.com>
@@ -10,53 +10,247 @@
 """
 Parse raw IPMI statistics, which may contain multiple snapshots of 'ipmitool' output (data sets),
 separated with the "Timestamp | <time_since_epoch>" lines.
+
+There are two parsing modes.
+    - The dictionary mode ('next()'): every snapshot is represented by a dictionary indexed by
+      sensor names with '(value, unit)' tuples as values.
+    - The columns mode ('get_columns()'): all the snapshots are parsed in one go into per-sensor
+      arrays of values. This mode is a lot faster and uses a lot less memory for large files.
 """
 
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
 import re
-from pepclibs.helperlibs import Trivial
+import math
+import typing
+from array import array
 from pepclibs.helperlibs.Exceptions import ErrorBadFormat
 from statscollectlibs.parsers import _ParserBase
 
+if typing.TYPE_CHECKING:
+    from typing import Generator, Final, Pattern, TypedDict
+
+    class ColumnsTypedDict(TypedDict):
+        """
+        The IPMI statistics columns dictionary type returned by 'IPMIParser.get_columns()'.
+
+        Attributes:
+            timestamps: Time since epoch of every snapshot (array of type 'd').
+            columns: A dictionary indexed by sensor names, where the values are arrays of type 'd'
+                     with a sensor reading for every snapshot. Missing readings (e.g., "no reading",
+                     or the sensor is absent in a snapshot) are NaN.
+            units: A dictionary indexed by sensor names, where the values are the sensor units, or
+                   'None' if the sensor never had a reading.
+            floats: Names of the sensors with at least one non-integer reading.
+        """
+
+        timestamps: array
+        columns: dict[str, array]
+        units: dict[str, str | None]
+        floats: set[str]
+
+# Regular expression to match timestamp lines. Example: "Timestamp | 1705672515.054093".
+# TODO: Remove 'timestamp' support in 2027.
+_TS_REGEX: Final[Pattern] = re.compile(r"^(Timestamp|timestamp) \| (\d+\.\d+)$")
+
+# The sensor values that mean there is no reading.
+_NO_READING: Final[tuple[str, ...]] = ("no reading", "disabled")
+
+def _str_to_num(val: str, line: str) -> int | float:
+    """
+    Convert a sensor reading string to a number.
+
+    Args:
+        val: The sensor reading string to convert.
+        line: The raw IPMI statistics line the reading comes from (for error messages).
+
+    Returns:
+        The sensor reading as an integer or a floating point number.
+    """
+
+    try:
+        return int(val)
+    except ValueError:
+        try:
+            return float(val)
+        except ValueError:
+            raise ErrorBadFormat(f"Bad raw IPMI statistics: bad sensor reading '{val}' in line "
+                                 f"'{line}'") from None
+
 class IPMIParser(_ParserBase.ParserBase):
     """Parse raw IPMI statistics."""
 
-    def _next_entry(self):
-        """Yield entries from raw IPMI statistics."""
+    def _parse_timestamp(self, line: str) -> float | None:
+        """
+        Parse a (presumably) timestamp line.
+
+        Args:
+            line: The line to parse.
 
-        # Example of a line with the timestamp format:
-        # Timestamp | 1705672515.054093
-        # TODO: Remove 'timestamp' support in 2027.
-        ts_regex = re.compile(r"^(Timestamp|timestamp) \| (\d+\.\d+)$")
-        entry_regex = re.compile(r"^(.+)\|(.+)\|(.+)$")
-        get_ts = Trivial.str_to_num
+        Returns:
+            The time-stamp if the line is a timestamp line, 'None' otherwise.
+        """
 
-        ts_line = next(self._lines, None).strip()
-        match = re.match(ts_regex, ts_line)
+        match = re.match(_TS_REGEX, line)
         if not match:
+            return None
+        return float(match[2])
+
+    def _next_entry(self) -> Generator[tuple[str, int | float | None, str | None], None, None]:
+        """Yield entries from raw IPMI statistics."""
+
+        ts_line = next(self._lines, "").strip()
+        timestamp = self._parse_timestamp(ts_line)
+        if timestamp is None:
             raise ErrorBadFormat(f"Bad raw IPMI statistics: expected a timestamp line "
                                  f"(e.g., 'Timestamp | 1705672515.054093'), got: '{ts_line}'")
         # Always yield 'Timestamp' (capital T) to normalize old 'timestamp' (lowercase) format.
-        yield ("Timestamp", get_ts(match[2].strip()), "")
+        yield ("Timestamp", timestamp, "")
 
         for line in self._lines:
             line = line.strip()
-            match = re.match(ts_regex, line)
-            if match:
-                timestamp = get_ts(match[2].strip())
-                # Always yield 'Timestamp' (capital T) to normalize old 'timestamp' (lowercase)
-                # format.
-                yield ("Timestamp", timestamp, "")
-            else:
-                # Example of the string:
-                # System Fan 4     | 2491 RPM          | ok
-                match = re.match(entry_regex, line)
-                if match:
-                    val = match[2].strip()
-                    data = val.split(" ", 1)
-                    if val not in ["no reading", "disabled"] and len(data) > 1:
-                        yield (match[1].strip(), Trivial.str_to_num(data[0]), data[1])
-                    else:
-                        yield (match[1].strip(), None, None)
+            if line[:10] in ("Timestamp ", "timestamp "):
+                timestamp = self._parse_timestamp(line)
+                if timestamp is not None:
+                    yield ("Timestamp", timestamp, "")
+                    continue
+
+            # Example of the string:
+            # System Fan 4     | 2491 RPM          | ok
+            # The sensor name may include the '|' character, so split from the right.
+            elts = line.rsplit("|", 2)
+            if len(elts) != 3:
+                continue
+
+            if not elts[0] or not elts[1] or not elts[2]:
+                continue
+
+            name = elts[0].strip()
+            val = elts[1].strip()
+
+            if val not in _NO_READING:
+                data = val.split(" ", 1)
+                if len(data) > 1:
+                    yield (name, _str_to_num(data[0], line), data[1])
+                    continue
+
+            yield (name, None, None)
+
+    def get_columns(self) -> ColumnsTypedDict:
+        """
+        Parse all the snapshots and return the sensor readings as per-sensor columns.
+
+        Returns:
+            The columns dictionary of type 'ColumnsTypedDict'.
+
+        Notes:
+            - IPMI sensor names are not necessarily unique within a snapshot. Duplicate names get
+              the "_<number>" suffix, just like in 'next()'.
+            - The sensors usually come in the same order in every snapshot. The order of the first
+              snapshot is used to map sensors to columns without looking up the names. The names
+              are looked up only for the snapshots where the order is different.
+        """
+
+        nan = math.nan
+        timestamps = array("d")
+        columns: dict[str, array] = {}
+        units: dict[str, str | None] = {}
+        floats: set[str] = set()
+
+        # The raw sensor names (as they appear in the input, including the padding white-spaces),
+        # the sensor names, the columns, and the column names in the order of the first snapshot.
+        layout: list[str] = []
+        layout_names: list[str] = []
+        layout_cols: list[array] = []
+        layout_keys: list[str] = []
+
+        row = -1
+        pos = 0
+        in_order = True
+        duplicates: dict[str, int] = {}
+
+        try:
+            for line in self._lines:
+                elts = line.rsplit("|", 2)
+                if len(elts) != 3:
+                    # Timestamp lines include only one '|' character.
+                    timestamp = self._parse_timestamp(line.strip())
+                    if timestamp is not None:
+                        row += 1
+                        pos = 0
+                        in_order = True
+                        timestamps.append(timestamp)
+                        for col in columns.values():
+                            col.append(nan)
+                    elif row < 0 and line.strip():
+                        raise ErrorBadFormat(f"Bad raw IPMI statistics: expected a timestamp line "
+                                             f"(e.g., 'Timestamp | 1705672515.054093'), got: "
+                                             f"'{line.strip()}'")
+                    continue
+
+                raw_name, raw_val, status = elts
+                if row < 0:
+                    raise ErrorBadFormat(f"Bad raw IPMI statistics: expected a timestamp line "
+                                         f"(e.g., 'Timestamp | 1705672515.054093'), got: "
+                                         f"'{line.strip()}'")
+                if not raw_name or not raw_val or not status.strip("\r\n"):
+                    continue
+
+                # Example of the value: "2491 RPM", "22 degrees C", "no reading".
+                num, sep, unit = raw_val.strip().partition(" ")
+
+                if in_order:
+                    if pos < len(layout) and layout[pos] == raw_name:
+                        if sep and num != "no":
+                            val = _str_to_num(num, line)
+                            layout_cols[pos][row] = val
+                            key = layout_keys[pos]
+                            if val.__class__ is float:
+                                floats.add(key)
+                            if units[key] is None:
+                                units[key] = unit
+                        pos += 1
+                        continue
+
+                    # This is either the first snapshot, or the sensor is not in the order of the
+                    # first snapshot. Switch to looking up the names for the rest of the snapshot.
+                    # Count the already seen names first.
+                    in_order = False
+                    duplicates = {}
+                    for name in layout_names[:pos]:
+                        duplicates[name] = duplicates.get(name, 0) + 1
+
+                name = raw_name.strip()
+                cnt = duplicates.get(name, 0)
+                duplicates[name] = cnt + 1
+                key = f"{name}_{cnt}" if cnt else name
+
+                col = columns.get(key)
+                if col is None:
+                    col = columns[key] = array("d", [nan]) * (row + 1)
+                    units[key] = None
+                    if row == 0:
+                        # Learn the sensors order from the first snapshot.
+                        layout.append(raw_name)
+                        layout_names.append(name)
+                        layout_cols.append(col)
+                        layout_keys.append(key)
+
+                if sep and num != "no":
+                    val = _str_to_num(num, line)
+                    col[row] = val
+                    if val.__class__ is float:
+                        floats.add(key)
+                    if units[key] is None:
+                        units[key] = unit
+        finally:
+            if hasattr(self._lines, "close"):
+                self._lines.close()
+
+        if row < 0:
+            raise ErrorBadFormat("Bad raw IPMI statistics: no timestamp lines found")
+
+        return {"timestamps": timestamps, "columns": columns, "units": units, "floats": floats}
 
     def _add_derivatives(self, data_set):
         """"Add derivative metrics to the data set."""
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Parse raw DCMI power reading statistics, which contain multiple snapshots of the 'ipmitool dcmi
+power reading' output, separated with the "Timestamp | <time_since_epoch>" lines.
+
+Example of a snapshot:
+
+Timestamp | 1705672515.054093
+Instantaneous power reading: 180 Watts
+Minimum during sampling period: 23 Watts
+Maximum during sampling period: 350 Watts
+Average power reading over sample period: 177 Watts
+IPMI timestamp: Thu Jan 18 12:00:00 2024
+Sampling period: 00000001 Seconds.
+Power reading state is: activated
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+from pepclibs.helperlibs.Exceptions import ErrorBadFormat
+from statscollectlibs.parsers import _ParserBase
+
+if typing.TYPE_CHECKING:
+    from typing import Generator, Final
+
+# The DCMI power reading names and the corresponding metric names.
+_METRICS: Final[dict[str, str]] = {
+    "Instantaneous power reading": "InstPower",
+    "Minimum during sampling period": "MinPower",
+    "Maximum during sampling period": "MaxPower",
+    "Average power reading over sample period": "AvgPower",
+}
+
+class IPMIPowerParser(_ParserBase.ParserBase):
+    """
+    Parse raw DCMI power reading statistics. Every snapshot is represented by a dictionary indexed
+    by metric names ("Timestamp", "InstPower", "MinPower", "MaxPower", "AvgPower") with numeric
+    values.
+
+    Notes:
+        - Snapshots where the BMC reports that power reading is not activated include only the
+          "Timestamp" key, because the readings are meaningless.
+    """
+
+    def _next(self) -> Generator[dict[str, int | float], None, None]:
+        """
+        Yield the snapshots one-by-one.
+
+        Yields:
+            A dictionary indexed by metric names with numeric values.
+        """
+
+        dataset: dict[str, int | float] = {}
+
+        for line in self._lines:
+            line = line.strip()
+            if line.startswith("Timestamp | "):
+                if dataset:
+                    yield dataset
+
+                try:
+                    dataset = {"Timestamp": float(line[12:])}
+                except ValueError:
+                    raise ErrorBadFormat(f"Bad raw DCMI power statistics: bad time-stamp line "
+                                         f"'{line}'") from None
+                continue
+
+            name, sep, val = line.partition(":")
+            if not sep:
+                continue
+
+            if not dataset:
+                if line.startswith("#"):
+                    continue
+                raise ErrorBadFormat(f"Bad raw DCMI power statistics: expected a timestamp line "
+                                     f"(e.g., 'Timestamp | 1705672515.054093'), got: '{line}'")
+
+            if name == "Power reading state is":
+                if val.strip() != "activated":
+                    dataset = {"Timestamp": dataset["Timestamp"]}
+                continue
+
+            metric = _METRICS.get(name)
+            if not metric:
+                continue
+
+            # Example of the value: "180 Watts".
+            num = val.strip().partition(" ")[0]
+            try:
+                dataset[metric] = int(num)
+            except ValueError:
+                raise ErrorBadFormat(f"Bad raw DCMI power statistics: bad power reading '{num}' "
+                                     f"in line '{line}'") from None
+
+        if dataset:
+            yield dataset
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2025 Intel Corporation
+# Copyright (C) 2025-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -9,20 +9,52 @@
 """
 Parse raw interrupts statistics, which may contain multiple snapshots of the "/proc/interrupts" file
 contents separated by "Timestamp | <time_since_epoch>" lines.
+
+There are two parsing modes.
+    - The dictionary mode ('next()'): every snapshot is represented by a dictionary of dictionaries
+      with per-CPU interrupt counts.
+    - The matrix mode ('next_matrix()'): every snapshot is represented by a 2-dimensional NumPy
+      array of interrupt counts, where rows correspond to IRQs and columns correspond to CPUs. This
+      mode is a lot faster and uses a lot less memory on large systems.
+
+The raw interrupts statistics may also be in the compact format, where only some snapshots are
+complete (keyframes), and the snapshots in between include only the changed interrupt counters. Such
+snapshots start with a "Delta: <time_since_epoch> <lines_count>" line followed by '<lines_count>'
+lines of the "<IRQ>: <column>:<increment> ..." format, where '<column>' is the 0-based interrupt
+counter column and '<increment>' is the counter increment since the preceding snapshot. The parser
+reconstructs complete snapshots from the deltas transparently.
+
+The parser can also build an index of file offsets and time-stamps of all the snapshots in a single
+pass over the file. The index is used for direct access to any snapshot (e.g., the first or the
+last one) and for parsing only the snapshots within a time window. The index can be saved in a
+directory, such as the dataframes cache directory, so that it is built only once. The index file
+name is a hash of the raw interrupts statistics file path, size, and modification time.
+
+Compressed raw interrupts statistics files are decompressed transparently. The index offsets of a
+compressed file refer to the decompressed data, and the index is not saved for compressed files,
+because seeking to an offset requires decompressing the preceding data anyway. Segmented raw
+interrupts statistics files are read as the concatenation of the segments, optionally limited to
+the segments overlapping a time-stamps range. The index is not saved for them either.
 """
 
 from __future__ import annotations  # Remove when switching to Python 3.10+.
 
 import re
 import os
+import json
+import mmap
 import typing
+import hashlib
 import itertools
 from pathlib import Path
-from pepclibs.helperlibs import Trivial
+import numpy
+from pepclibs.helperlibs import Logging, Trivial
 from pepclibs.helperlibs.Exceptions import Error, ErrorBadFormat
+from statscollectlibs.helperlibs import Compression, Segments
 
 if typing.TYPE_CHECKING:
     from typing import IO, Generator, Iterator, TypedDict, Sequence, Literal, Pattern, Final, cast
+    from statscollectlibs.helperlibs.Segments import RangeType
 
     class IRQInfoTypedDict(TypedDict, total=False):
         """
@@ -57,9 +89,46 @@ if typing.TYPE_CHECKING:
         cpu2irqs: dict[int, dict[str, int]]
         irq_info: dict[str, IRQInfoTypedDict]
 
+    class MatrixDataSetTypedDict(TypedDict, total=False):
+        """
+        The data set dictionary type yielded by the '_InterruptsParser' parser in the matrix mode.
+
+        Attributes:
+            timestamp: Time since epoch when the '/proc/interrupts' snapshot was taken.
+            cpus: CPU numbers corresponding to the 'counts' matrix columns. The same list object is
+                  used in all the snapshots until the CPUs change (e.g., a CPU goes offline).
+            irqs: IRQ names corresponding to the 'counts' matrix rows. The IRQ names index is
+                  stable: new IRQs are appended to the end, so a row number refers to the same IRQ
+                  in all snapshots. The same tuple object is used in all the snapshots until a new
+                  IRQ appears.
+            counts: The interrupt counts matrix (IRQs x CPUs) of type 'numpy.int64'. The counts are
+                    0 for the IRQs missing in the snapshot.
+            irq_info: A dictionary indexed by IRQ names, where the values are dictionaries of type
+                      'IRQInfoTypedDict'. The same dictionary object is shared between all the
+                      snapshots. It includes all the IRQs seen so far and describes every IRQ as it
+                      was seen the first time.
+        """
+
+        timestamp: float
+        cpus: list[int]
+        irqs: tuple[str, ...]
+        counts: numpy.ndarray
+        irq_info: dict[str, IRQInfoTypedDict]
+
 # Regular expression to match timestamp lines in the input data.
 # TODO: Remove 'timestamp' support in 2027.
 _TIMESTAMP_REGEX: Final[Pattern] = re.compile(r"^[Tt]imestamp: (\d+\.\d+)$")
+# Regular expression to match delta snapshot lines in the input data.
+_DELTA_REGEX: Final[Pattern] = re.compile(r"^Delta: (\d+\.\d+) (\d+)$")
+# Regular expression for finding timestamp and delta snapshot lines in the entire file contents.
+# The first group is 'None' for timestamp lines.
+_TIMESTAMP_REGEX_BYTES: Final[Pattern[bytes]] = \
+            re.compile(rb"^(?:[Tt]imestamp|(Delta)): (\d+\.\d+)(?: \d+)?[ \t\r]*$", re.MULTILINE)
+
+# The snapshots index file format version.
+_INDEX_FORMAT_VERSION: Final[int] = 2
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
 class InterruptsParser:
     """
@@ -67,13 +136,22 @@ class InterruptsParser:
     "/proc/interrupts" file contents separated by "Timestamp: <time_since_epoch>" lines.
     """
 
-    def __init__(self, path: Path | None = None, lines: Iterator[str] | IO[str] | None = None):
+    def __init__(self,
+                 path: Path | None = None,
+                 lines: Iterator[str] | IO[str] | None = None,
+                 index_dir: Path | None = None,
+                 segments_range: RangeType = (None, None)):
         """
         Initialize a class instance. The arguments are as follows.
 
         Args:
             path: The path to the file containing the interrupts data.
             lines: An iterator or file object providing the lines of the interrupts data.
+            index_dir: Path to the directory to save the snapshots index in (e.g., the dataframes
+                       cache directory), and to load the up-to-date saved index from. The index is
+                       kept only in memory by default.
+            segments_range: If 'path' is a segments manifest, read only the segments overlapping
+                            this '(begin_ts, end_ts)' time-stamps range. 'None' means no limit.
         """
 
         if path and lines:
@@ -88,18 +166,50 @@ class InterruptsParser:
 
         self._path = path
         self._lines = lines
+        self._index_dir = index_dir
+        self._segments_range = segments_range
+
+        # The snapshots index: file offsets of the time-stamp lines and the time-stamps. Built or
+        # loaded on demand by '_get_index()'.
+        self._offsets: numpy.ndarray | None = None
+        self._timestamps: numpy.ndarray | None = None
+        # Numbers of the complete (non-delta) snapshots in the snapshots index.
+        self._keyframes: numpy.ndarray | None = None
+        self._file_size = 0
 
         # These are initialized in '_next()'. Just type hints here.
+        self._matrix: bool
         self._probe_exception_msg: str | None
         self._timestamp: float
-        self._dataset: DataSetTypedDict
-        self._last_yielded_dataset: DataSetTypedDict
+        self._dataset: DataSetTypedDict | MatrixDataSetTypedDict
+        self._last_yielded_irqname: str | None
         self._cpu2irqs: dict[int, dict[str, int]]
         self._irq_info: dict[str, IRQInfoTypedDict]
         self._cpus: list[int]
         self._first_lines: list[str]
         self._yielded_cnt: int
 
+        # The compact format data, also initialized in '_next()'.
+        #   * _delta: Whether the current snapshot is a delta snapshot.
+        #   * _delta_left: Count of delta lines of the current snapshot that are not parsed yet.
+        #   * _raw_counts: Interrupt counts of the last snapshot, as they appear in the input (e.g.,
+        #                  a single counter for the "ERR" IRQ), indexed by IRQ names.
+        self._delta: bool
+        self._delta_left: int
+        self._raw_counts: dict[str, list[int]]
+
+        # The matrix mode data, also initialized in '_next()'.
+        #   * _irq2idx: The stable IRQ names index, maps IRQ names to 'counts' matrix rows.
+        #   * _irqs: IRQ names tuple corresponding to '_irq2idx', 'None' if it has to be re-created.
+        #   * _rows: Interrupt counts of the current snapshot, one list per IRQ.
+        #   * _row_names: IRQ names corresponding to '_rows'.
+        #   * _in_order: Whether '_row_names' are the same as the '_irq2idx' keys in the same order.
+        self._irq2idx: dict[str, int]
+        self._irqs: tuple[str, ...] | None
+        self._rows: list[list[int]]
+        self._row_names: list[str]
+        self._in_order: bool
+
     def _parse_timestamp(self, line: str) -> float | None:
         """
         Parse a (presumably) timestamp line.
@@ -118,6 +228,24 @@ class InterruptsParser:
 
         return float(match[1])
 
+    def _parse_delta_header(self, line: str) -> tuple[float, int] | None:
+        """
+        Parse a (presumably) delta snapshot header line.
+
+        Args:
+            line: The line to parse.
+
+        Returns:
+            If the line is a delta snapshot header line, return a tuple of the floating point
+            timestamp value and the count of delta lines. Otherwise, return 'None'.
+        """
+
+        match = re.match(_DELTA_REGEX, line)
+        if not match:
+            return None
+
+        return float(match[1]), int(match[2])
+
     def _parse_header(self, line: str) -> list[int]:
         """
         Parse the header line of the "/proc/interrupts" table - it contains the CPU numbers.
@@ -185,20 +313,262 @@ class InterruptsParser:
         self._first_lines = [line1, line2]
         return True
 
+    def _has_data(self) -> bool:
+        """
+        Check if any IRQ lines of the current snapshot have been parsed.
+
+        Returns:
+            True if the current snapshot includes at least one IRQ line, False otherwise.
+        """
+
+        if self._matrix:
+            return bool(self._rows)
+        return bool(self._cpu2irqs)
+
+    def _get_last_irqname(self) -> str:
+        """
+        Return the name of the last IRQ in the current snapshot.
+
+        Returns:
+            The last IRQ name of the current snapshot.
+        """
+
+        if self._matrix:
+            return self._row_names[-1]
+        return next(reversed(self._irq_info))
+
     def _finalise_dataset(self):
         """
         Compose the final dataset from the parsed data in 'self._datadict'.
         """
 
-        if not self._cpu2irqs:
+        if not self._has_data():
             raise Error("BUG: No CPUs found in the interrupts statistics")
         if not self._irq_info:
             raise Error("BUG: No IRQs found in the interrupts statistics")
 
-        self._dataset["cpu2irqs"] = self._cpu2irqs
-        self._dataset["irq_info"] = self._irq_info
+        if not self._matrix:
+            if typing.TYPE_CHECKING:
+                dataset = cast(DataSetTypedDict, self._dataset)
+            else:
+                dataset = self._dataset
+            dataset["cpu2irqs"] = self._cpu2irqs
+            dataset["irq_info"] = self._irq_info
+            return
+
+        if self._irqs is None:
+            self._irqs = tuple(self._irq2idx)
+
+        if self._in_order and len(self._rows) == len(self._irqs):
+            counts = numpy.array(self._rows, dtype=numpy.int64)
+        else:
+            counts = numpy.zeros((len(self._irqs), len(self._cpus)), dtype=numpy.int64)
+            counts[[self._irq2idx[irq_name] for irq_name in self._row_names]] = self._rows
+
+        if typing.TYPE_CHECKING:
+            mdataset = cast(MatrixDataSetTypedDict, self._dataset)
+        else:
+            mdataset = self._dataset
+        mdataset["cpus"] = self._cpus
+        mdataset["irqs"] = self._irqs
+        mdataset["counts"] = counts
+        mdataset["irq_info"] = self._irq_info
+
+    def _start_dataset(self, delta_lines_cnt: int | None = None):
+        """
+        Start a new dataset for the current time-stamp.
+
+        Args:
+            delta_lines_cnt: Count of delta lines if the new dataset is a delta snapshot, 'None' if
+                             it is a complete snapshot.
+        """
+
+        if typing.TYPE_CHECKING:
+            self._dataset = DataSetTypedDict(timestamp=self._timestamp)
+        else:
+            self._dataset = {"timestamp": self._timestamp}
+
+        if self._matrix:
+            self._rows = []
+            self._row_names = []
+            self._in_order = True
+        else:
+            self._cpu2irqs = {}
+            if delta_lines_cnt is None:
+                self._irq_info = {}
+            else:
+                # The IRQs of a delta snapshot are the same as in the preceding snapshot.
+                self._irq_info = dict(self._irq_info)
+
+        if delta_lines_cnt is None:
+            self._delta = False
+            self._delta_left = 0
+            self._raw_counts = {}
+        else:
+            self._delta = True
+            self._delta_left = delta_lines_cnt
+
+    def _parse_delta_line(self, line: str):
+        """
+        Parse a delta snapshot line and apply the counter increments to 'self._raw_counts'.
+
+        Args:
+            line: The line to parse.
+        """
+
+        if not self._delta_left:
+            raise ErrorBadFormat("Unexpected line in a delta snapshot, all the delta lines have "
+                                 "already been parsed")
 
-    def _parse_line(self, line: str) -> Generator[DataSetTypedDict, None, None]:
+        elts = line.split()
+        irq_name = elts[0][:-1]
+        if Trivial.is_int(irq_name):
+            irq_name = f"IRQ{irq_name}"
+
+        irq_counts = self._raw_counts.get(irq_name)
+        if irq_counts is None:
+            raise ErrorBadFormat(f"IRQ '{irq_name}' is not present in the preceding snapshot")
+
+        for elt in elts[1:]:
+            col, sep, incr = elt.partition(":")
+            try:
+                if not sep or not col.isdigit():
+                    raise ValueError
+                irq_counts[int(col)] += int(incr)
+            except (ValueError, IndexError):
+                raise ErrorBadFormat(f"Bad '{irq_name}' counter increment '{elt}': should be "
+                                     f"'<column>:<increment>' with column in the 0-"
+                                     f"{len(irq_counts) - 1} range") from None
+
+        self._delta_left -= 1
+
+    def _finish_delta(self):
+        """
+        Add the interrupt counts reconstructed from the delta lines to the current delta snapshot.
+        """
+
+        if self._delta_left:
+            raise ErrorBadFormat(f"Incomplete delta snapshot at time-stamp "
+                                 f"{self._dataset['timestamp']}: {self._delta_left} delta lines "
+                                 f"are missing")
+
+        for irq_name, irq_counts in self._raw_counts.items():
+            if self._matrix:
+                self._add_matrix_counts(irq_name, irq_counts)
+            else:
+                self._add_dict_counts(irq_name, irq_counts)
+
+    def _parse_irq_info(self, irq_name: str, elts: list[str]):
+        """
+        Parse the IRQ information columns of a '/proc/interrupts' line and add them to
+        'self._irq_info'.
+
+        Args:
+            irq_name: Name of the IRQ.
+            elts: The split '/proc/interrupts' line.
+        """
+
+        irq_num = elts[0][:-1]
+        irq_infos: list[str | None] = [irq_num]
+        for val in elts[len(self._cpus) + 1:]:
+            irq_infos.append(val)
+
+        # Sometimes one or more of the last 3 columns are missing. Pad the list with 'None's.
+        keys: Sequence[Literal["irq_num", "chip_name", "hwirq", "action"]] = \
+                                                    ("irq_num", "chip_name", "hwirq", "action")
+        for _ in range(len(keys) - len(irq_infos)):
+            irq_infos.append(None)
+
+        self._irq_info[irq_name] = {}
+        for key, _val in zip(keys, irq_infos):
+            self._irq_info[irq_name][key] = _val
+
+    def _add_matrix_row(self, irq_name: str, elts: list[str]):
+        """
+        Add the interrupt counts of a '/proc/interrupts' line to the current snapshot in the matrix
+        mode.
+
+        Args:
+            irq_name: Name of the IRQ.
+            elts: The split '/proc/interrupts' line.
+        """
+
+        cpus_cnt = len(self._cpus)
+        vals = elts[1:cpus_cnt + 1]
+
+        try:
+            irq_counts = [int(val) for val in vals]
+        except ValueError:
+            # Find the bad value and raise a user-friendly exception.
+            for cpu, val in zip(self._cpus, vals):
+                Trivial.str_to_int(val, what=f"{irq_name} count for CPU{cpu}")
+            raise
+
+        if not irq_counts:
+            raise ErrorBadFormat(f"No interrupt counts for '{irq_name}'")
+
+        self._raw_counts[irq_name] = irq_counts
+        self._add_matrix_counts(irq_name, irq_counts, elts)
+
+    def _add_matrix_counts(self,
+                           irq_name: str,
+                           irq_counts: list[int],
+                           elts: list[str] | None = None):
+        """
+        Add the interrupt counts of an IRQ to the current snapshot in the matrix mode.
+
+        Args:
+            irq_name: Name of the IRQ.
+            irq_counts: The interrupt counts of the IRQ.
+            elts: The split '/proc/interrupts' line, used for parsing the information about IRQs
+                  that have not been seen before. May be 'None' for the already known IRQs.
+        """
+
+        cpus_cnt = len(self._cpus)
+        if len(irq_counts) != cpus_cnt:
+            # Special lines like "MIS" and "ERR" do not have per-CPU counters, use the same
+            # counter value for all CPUs, just like in the dictionary mode.
+            irq_counts = irq_counts + [irq_counts[-1]] * (cpus_cnt - len(irq_counts))
+
+        idx = self._irq2idx.get(irq_name)
+        if idx is None:
+            if elts is None:
+                raise Error(f"BUG: No information about new IRQ '{irq_name}'")
+            idx = len(self._irq2idx)
+            self._irq2idx[irq_name] = idx
+            self._irqs = None
+            self._parse_irq_info(irq_name, elts)
+
+        if idx != len(self._rows):
+            self._in_order = False
+
+        self._rows.append(irq_counts)
+        self._row_names.append(irq_name)
+
+    def _add_dict_counts(self, irq_name: str, irq_counts: list[int]):
+        """
+        Add the interrupt counts of an IRQ to the current snapshot in the dictionary mode.
+
+        Args:
+            irq_name: Name of the IRQ.
+            irq_counts: The interrupt counts of the IRQ.
+        """
+
+        if len(irq_counts) != len(self._cpus):
+            # There are special lines like "MIS" and "ERR", which count various sorts of
+            # errors, and they do not have per-CPU counters. Extend the list with the same
+            # counter value.
+            cnt = irq_counts[-1]
+            missing_cnt = len(self._cpus) + 1 - len(irq_counts)
+            irq_counts = irq_counts + [cnt] * missing_cnt
+
+        for cpu, irqcnt in zip(self._cpus, irq_counts):
+            if cpu not in self._cpu2irqs:
+                self._cpu2irqs[cpu] = {}
+            self._cpu2irqs[cpu][irq_name] = irqcnt
+
+    def _parse_line(self, line: str) -> Generator[DataSetTypedDict | MatrixDataSetTypedDict,
+                                                  None, None]:
         """
         Parse a single line of the raw interrupts statistics file.
 
@@ -206,42 +576,50 @@ class InterruptsParser:
             line: The line to parse.
 
         Yields:
-            DataSetTypedDict: A dataset dictionary containing the parsed '/proc/interrupts'
-            snapshot.
+            A dataset dictionary containing the parsed '/proc/interrupts' snapshot.
         """
 
+        delta_lines_cnt = None
         timestamp = self._parse_timestamp(line)
+        if timestamp is None and line.startswith("Delta:"):
+            delta_header = self._parse_delta_header(line)
+            if delta_header is None:
+                raise ErrorBadFormat("Bad delta snapshot header line, expected "
+                                     "'Delta: <time_since_epoch> <lines_count>'")
+            timestamp, delta_lines_cnt = delta_header
+
         if timestamp is not None:
             # A new dataset starts.
             self._timestamp = timestamp
 
             if not self._dataset:
                 # This is the very first dataset.
-                if typing.TYPE_CHECKING:
-                    self._dataset = DataSetTypedDict(timestamp=self._timestamp)
-                else:
-                    self._dataset = {"timestamp": self._timestamp}
+                if delta_lines_cnt is not None:
+                    raise ErrorBadFormat("A delta snapshot without a preceding complete snapshot")
+                self._start_dataset()
                 return
 
+            if self._delta:
+                self._finish_delta()
+
             self._finalise_dataset()
             yield self._dataset
 
-            self._last_yielded_dataset = self._dataset
+            self._last_yielded_irqname = self._get_last_irqname()
             self._yielded_cnt += 1
 
-            if typing.TYPE_CHECKING:
-                self._dataset = DataSetTypedDict(timestamp=self._timestamp)
-            else:
-                self._dataset = {"timestamp": self._timestamp}
-            self._cpu2irqs = {}
-            self._irq_info = {}
+            self._start_dataset(delta_lines_cnt)
+        elif self._delta:
+            self._parse_delta_line(line)
         else:
             if line.startswith("CPU"):
                 # This is the header line. Keep in mind that CPUs may go online/offline, which
                 # adds/removes CPUs in '/proc/interrupt' snapshots. For this reason, it is necessary
                 # to parse all header lines. Otherwise, it would be enough to parse only the first
                 # one.
-                self._cpus = self._parse_header(line)
+                cpus = self._parse_header(line)
+                if not self._matrix or cpus != self._cpus:
+                    self._cpus = cpus
                 return
 
             # The last "Actions" column may contain spaces. Limiting the splits to the number of
@@ -254,54 +632,40 @@ class InterruptsParser:
             if Trivial.is_int(irq_name):
                 irq_name = f"IRQ{irq_name}"
 
+            if self._matrix:
+                self._add_matrix_row(irq_name, elts)
+                return
+
             irq_counts = []
             for cpu, irq_cnt in zip(self._cpus, elts[1:]):
                 cnt = Trivial.str_to_int(irq_cnt, what=f"{irq_name} count for CPU{cpu}")
                 irq_counts.append(cnt)
 
-            if len(irq_counts) != len(self._cpus):
-                # There are special lines like "MIS" and "ERR", which count various sorts of
-                # errors, and they do not have per-CPU counters. Extend the list with the same
-                # counter value.
-                cnt = irq_counts[-1]
-                missing_cnt = len(self._cpus) + 1 - len(irq_counts)
-                irq_counts.extend([cnt] * missing_cnt)
+            self._raw_counts[irq_name] = irq_counts
+            self._add_dict_counts(irq_name, irq_counts)
+            self._parse_irq_info(irq_name, elts)
 
-            for cpu, irqcnt in zip(self._cpus, irq_counts):
-                if cpu not in self._cpu2irqs:
-                    self._cpu2irqs[cpu] = {}
-                self._cpu2irqs[cpu][irq_name] = irqcnt
-
-            irq_num = elts[0][:-1]
-            irq_infos: list[str | None] = [irq_num]
-            for val in elts[len(self._cpus) + 1:]:
-                irq_infos.append(val)
-
-            # Sometimes one or more of the last 3 columns are missing. Pad the list with 'None's.
-            keys: Sequence[Literal["irq_num", "chip_name", "hwirq", "action"]] = \
-                                                        ("irq_num", "chip_name", "hwirq", "action")
-            for _ in range(len(keys) - len(irq_infos)):
-                irq_infos.append(None)
-
-            self._irq_info[irq_name] = {}
-            for key, _val in zip(keys, irq_infos):
-                self._irq_info[irq_name][key] = _val
-
-    def _next(self, lines: Iterator[str] | IO[str]) -> Generator[DataSetTypedDict, None, None]:
+    def _next(self,
+              lines: Iterator[str] | IO[str],
+              matrix: bool = False) -> Generator[DataSetTypedDict | MatrixDataSetTypedDict,
+                                                 None, None]:
         """
         Yield dataset dictionaries corresponding to one snapshot of interrupts statistics.
 
         Args:
             lines: The lines to parse.
+            matrix: Use the matrix mode and yield datasets of type 'MatrixDataSetTypedDict' if
+                    'True', use the dictionary mode and yield datasets of type 'DataSetTypedDict'
+                    otherwise.
 
         Yields:
-            DataSetTypedDict: A dataset dictionary containing the parsed '/proc/interrupts'
-                              snapshot.
+            A dataset dictionary containing the parsed '/proc/interrupts' snapshot.
 
         Raises:
             ErrorBadFormat: The input data is not raw interrupt statistics data.
         """
 
+        self._matrix = matrix
         self._probe_exception_msg = None
         self._timestamp = 0.0
         self._dataset = {}
@@ -309,9 +673,19 @@ class InterruptsParser:
         self._irq_info = {}
         self._cpus = []
         self._first_lines = []
-        self._last_yielded_dataset = {}
+        self._last_yielded_irqname = None
         self._yielded_cnt = 0
 
+        self._delta = False
+        self._delta_left = 0
+        self._raw_counts = {}
+
+        self._irq2idx = {}
+        self._irqs = None
+        self._rows = []
+        self._row_names = []
+        self._in_order = True
+
         self.probe(lines)
 
         if len(self._cpus) == 0:
@@ -340,36 +714,62 @@ class InterruptsParser:
         if self._yielded_cnt == 0:
             if not self._dataset.get("timestamp"):
                 raise ErrorBadFormat("No 'Timestamp:' lines found")
-            if not self._cpu2irqs:
+            if not self._has_data():
                 raise ErrorBadFormat("No '/proc/interrupts' snapshots found")
 
-        if self._cpu2irqs:
+        if self._delta:
+            # If the last delta snapshot is incomplete, do not yield it.
+            if not self._delta_left:
+                self._finish_delta()
+                self._finalise_dataset()
+                yield self._dataset
+            return
+
+        if self._has_data():
             self._finalise_dataset()
             # If the last dataset is incomplete, do not yield it.
             if self._yielded_cnt == 0:
                 # No datasets yielded yet, can't really detect if the current one is cut or not,
                 # just yield it.
                 yield self._dataset
-            else:
-                last_irqname = list(self._last_yielded_dataset["irq_info"])[-1]
-                if list(self._irq_info)[-1] == last_irqname:
-                    yield self._dataset
+            elif self._get_last_irqname() == self._last_yielded_irqname:
+                yield self._dataset
 
-    def next(self) -> Generator[DataSetTypedDict, None, None]:
+    def _iterate(self,
+                 matrix: bool,
+                 begin_ts: float | None = None,
+                 end_ts: float | None = None) -> \
+                    Generator[DataSetTypedDict | MatrixDataSetTypedDict, None, None]:
         """
-        Yield dictionaries of type 'DataSetTypedDict' corresponding to one snapshot of interrupts
-        statistics at a time.
+        Open the input file if needed and yield datasets corresponding to one snapshot of
+        interrupts statistics at a time.
+
+        Args:
+            matrix: Use the matrix mode if 'True', use the dictionary mode otherwise.
+            begin_ts: If specified, skip the snapshots taken before this time-stamp.
+            end_ts: If specified, skip the snapshots taken after this time-stamp.
 
         Yields:
-            Datasets of type 'DataSetTypedDict' containing the parsed '/proc/interrupts' snapshot.
+            A dataset dictionary containing the parsed '/proc/interrupts' snapshot.
         """
 
         opened = False
+        skip = 0
         try:
-            if self._path:
+            if begin_ts is not None or end_ts is not None:
+                if not self._path:
+                    raise Error("Cannot read a time window from an iterator, please provide the "
+                                "file path instead")
+
+                start, end, skip = self._get_window_range(begin_ts, end_ts)
+                if start >= end:
+                    return
+
+                self._lines = self._read_range(start, end)
+                opened = True
+            elif self._path:
                 try:
-                    # pylint: disable=consider-using-with
-                    self._lines = open(self._path, "r", encoding="utf-8")
+                    self._lines = Segments.open_text(self._path, *self._segments_range)
                     opened = True
                 except OSError as err:
                     errmsg = Error(str(err)).indent(2)
@@ -381,7 +781,7 @@ class InterruptsParser:
                 _lines = self._lines
 
             try:
-                yield from self._next(_lines)
+                yield from itertools.islice(self._next(_lines, matrix=matrix), skip, None)
             except OSError as err:
                 errmsg = "An error occurred"
                 if self._path:
@@ -397,141 +797,389 @@ class InterruptsParser:
                 io_lines.close()
                 self._lines = None
 
-    def _locate_last_snapshot(self, fobj: IO[str], max_pos: int | None = None) -> int:
+    def next(self,
+             begin_ts: float | None = None,
+             end_ts: float | None = None) -> Generator[DataSetTypedDict, None, None]:
         """
-        Locate the file position of the last interrupts statistics snapshot in a file.
+        Yield dictionaries of type 'DataSetTypedDict' corresponding to one snapshot of interrupts
+        statistics at a time.
 
         Args:
-            fobj: The interrupts statistics file object to search for the last snapshot in.
-            max_pos: Limit the search to the first 'max_pos' bytes of the file. In other words,
-                     assume that file size is 'max_pos'. If 'None', the file size will be the
-                     true size of the file.
+            begin_ts: If specified, skip the snapshots taken before this time-stamp. Requires the
+                      file path, and uses the snapshots index to seek directly to the first
+                      snapshot.
+            end_ts: If specified, skip the snapshots taken after this time-stamp. Requires the
+                    file path.
 
-        Returns:
-            The file position of the last interrupts statistics snapshot in the file.
+        Yields:
+            Datasets of type 'DataSetTypedDict' containing the parsed '/proc/interrupts' snapshot.
         """
 
-        # Will search from the end in blocks of size 'block_size'.
-        block_size = 4096
+        for dataset in self._iterate(False, begin_ts=begin_ts, end_ts=end_ts):
+            if typing.TYPE_CHECKING:
+                yield cast(DataSetTypedDict, dataset)
+            else:
+                yield dataset
 
-        # Get the file size.
-        fobj.seek(0, os.SEEK_END)
-        file_size = fobj.tell()
+    def next_matrix(self,
+                    begin_ts: float | None = None,
+                    end_ts: float | None = None) -> Generator[MatrixDataSetTypedDict, None, None]:
+        """
+        Yield dictionaries of type 'MatrixDataSetTypedDict' corresponding to one snapshot of
+        interrupts statistics at a time. Unlike 'next()', represent the interrupt counts with
+        'IRQs x CPUs' NumPy matrices.
 
-        if max_pos is None:
-            max_pos = file_size
-        elif max_pos > file_size:
-            raise Error(f"File '{self._path}' is smaller than the specified size {max_pos}")
+        Args:
+            begin_ts: If specified, skip the snapshots taken before this time-stamp. Requires the
+                      file path, and uses the snapshots index to seek directly to the first
+                      snapshot.
+            end_ts: If specified, skip the snapshots taken after this time-stamp. Requires the
+                    file path.
 
-        block_size = min(block_size, max_pos)
+        Yields:
+            Datasets of type 'MatrixDataSetTypedDict' containing the parsed '/proc/interrupts'
+            snapshot.
+        """
 
-        last_timestamp_pos = -1
+        for dataset in self._iterate(True, begin_ts=begin_ts, end_ts=end_ts):
+            if typing.TYPE_CHECKING:
+                yield cast(MatrixDataSetTypedDict, dataset)
+            else:
+                yield dataset
 
-        # Start from the end of the file, and search for the timestamp line in 'block_size' blocks.
-        for iteration in range(max_pos // block_size):
-            position = max(max_pos - block_size * (iteration + 1), 0)
+    def _get_index_path(self, size: int, mtime: int) -> Path:
+        """
+        Return path to the snapshots index file.
 
-            fobj.seek(position)
+        Args:
+            size: The raw interrupts statistics file size.
+            mtime: The raw interrupts statistics file modification time in nanoseconds.
 
-            # Skip the first incomplete line.
-            fobj.readline()
+        Returns:
+            The snapshots index file path.
 
-            while True:
-                prev_pos = fobj.tell()
-                if prev_pos > position + block_size:
-                    break
+        Notes:
+            - Unlike the dataframes cache key, the index file key does not include the raw file
+              contents hash, because hashing the file takes about as long as building the index.
+        """
 
-                line = fobj.readline()
-                if not line:
-                    break
+        assert self._path is not None and self._index_dir is not None
 
-                if fobj.tell() >= max_pos:
-                    break
+        key = {"format": _INDEX_FORMAT_VERSION,
+               "path": str(self._path.resolve()),
+               "size": size,
+               "mtime": mtime}
 
-                timestamp = self._parse_timestamp(line)
-                if timestamp is not None:
-                    last_timestamp_pos = prev_pos
+        keyhash = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return self._index_dir / f"interrupts-index-{keyhash}.npz"
 
-            if last_timestamp_pos >= 0:
-                break
+    def _load_index(self, size: int, mtime: int) -> bool:
+        """
+        Load the snapshots index from the index file, if it exists and matches the raw file.
 
-            if position == 0:
-                break
+        Args:
+            size: The raw interrupts statistics file size.
+            mtime: The raw interrupts statistics file modification time in nanoseconds.
 
-        if last_timestamp_pos < 0:
-            raise Error(f"Failed to locate the last interrupts statistics snapshot in "
-                        f"'{self._path}' in file positions range of 0-{max_pos}")
+        Returns:
+            True if the index was loaded, False otherwise.
+        """
 
-        return last_timestamp_pos
+        index_path = self._get_index_path(size, mtime)
 
-    def get_first_and_last(self) -> tuple[DataSetTypedDict, DataSetTypedDict]:
+        try:
+            with numpy.load(index_path) as npz:
+                if list(npz["meta"]) != [_INDEX_FORMAT_VERSION, size, mtime]:
+                    _LOG.debug("Ignoring stale interrupts snapshots index '%s'", index_path)
+                    return False
+                self._offsets = npz["offsets"]
+                self._timestamps = npz["timestamps"]
+                self._keyframes = npz["keyframes"]
+            # Mark the index as recently used for the dataframes cache eviction.
+            os.utime(index_path)
+        except FileNotFoundError:
+            return False
+        except Exception as err: # pylint: disable=broad-except
+            _LOG.debug("Failed to load interrupts snapshots index '%s': %s", index_path, err)
+            return False
+
+        return True
+
+    def _save_index_file(self, size: int, mtime: int):
         """
-        Parse and return the first and last interrupts statistics datasets.
+        Save the snapshots index to the index file. Failures are not fatal, because the index can
+        always be re-built.
 
-        Returns:
-            A tuple containing the first and last interrupts statistics datasets. If there is only
-            one '/proc/interrupts' snapshot, the first and second elements of the tuple will be the
-            same (different objects, same contents).
+        Args:
+            size: The raw interrupts statistics file size.
+            mtime: The raw interrupts statistics file modification time in nanoseconds.
         """
 
-        if not self._path:
-            raise Error("Cannot get first and last snapshots from an iterator, please provide the "
-                        "file path instead")
+        assert self._index_dir is not None
 
-        dataset1 = next(self.next())
-        dataset1 = dataset1.copy()
+        index_path = self._get_index_path(size, mtime)
+        tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        meta = numpy.array([_INDEX_FORMAT_VERSION, size, mtime], dtype=numpy.int64)
 
         try:
-            # pylint: disable=consider-using-with
-            fobj = open(self._path, "r", encoding="utf-8")
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as fobj:
+                numpy.savez(fobj, meta=meta, offsets=self._offsets, timestamps=self._timestamps,
+                            keyframes=self._keyframes)
+            tmp_path.replace(index_path)
         except OSError as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"Failed to open '{self._path}':\n{errmsg}") from err
+            _LOG.debug("Failed to save interrupts snapshots index '%s': %s", index_path, err)
+            tmp_path.unlink(missing_ok=True)
+
+    def _build_index(self):
+        """
+        Build the snapshots index: find file offsets and time-stamps of all the time-stamp and delta
+        snapshot header lines in a single pass over the file.
+        """
+
+        assert self._path is not None
+
+        offsets: list[int] = []
+        timestamps: list[float] = []
+        keyframes: list[int] = []
 
         try:
-            pos = self._locate_last_snapshot(fobj)
-        except OSError as err:
+            if Compression.get_method(self._path) or Segments.is_manifest(self._path):
+                pos = 0
+                with Segments.open_binary(self._path, *self._segments_range) as fobj:
+                    for line in fobj:
+                        match = _TIMESTAMP_REGEX_BYTES.match(line)
+                        if match:
+                            if match[1] is None:
+                                keyframes.append(len(offsets))
+                            offsets.append(pos)
+                            timestamps.append(float(match[2]))
+                        pos += len(line)
+                self._file_size = pos
+            else:
+                with open(self._path, "rb") as fobj:
+                    self._file_size = os.fstat(fobj.fileno()).st_size
+                    if self._file_size:
+                        with mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            for match in _TIMESTAMP_REGEX_BYTES.finditer(mapped):
+                                if match[1] is None:
+                                    keyframes.append(len(offsets))
+                                offsets.append(match.start())
+                                timestamps.append(float(match[2]))
+        except (OSError, ValueError) as err:
             errmsg = Error(str(err)).indent(2)
-            raise Error(f"I/O error on file '{self._path}':\n{errmsg}") from err
+            raise Error(f"Failed to index interrupts statistics file '{self._path}':\n"
+                        f"{errmsg}") from err
+
+        self._offsets = numpy.array(offsets, dtype=numpy.int64)
+        self._timestamps = numpy.array(timestamps, dtype=numpy.float64)
+        self._keyframes = numpy.array(keyframes, dtype=numpy.int64)
+
+    def _get_index(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Return the snapshots index, load or build it if necessary.
+
+        Returns:
+            A tuple of two arrays: file offsets of the time-stamp lines and the time-stamps.
+        """
+
+        if self._offsets is not None and self._timestamps is not None:
+            return self._offsets, self._timestamps
+
+        if not self._path:
+            raise Error("Cannot index snapshots of an iterator, please provide the file path "
+                        "instead")
 
         try:
-            fobj.seek(pos)
+            stinfo = self._path.stat()
         except OSError as err:
             errmsg = Error(str(err)).indent(2)
-            raise Error(f"Cannot set file position to {pos} for file "
-                        f"'{self._path}':\n{errmsg}") from err
+            raise Error(f"Failed to access '{self._path}':\n{errmsg}") from err
 
-        try:
-            dataset2 = next(self._next(fobj))
-        except StopIteration:
-            raise Error("Failed to locate the last interrupts statistics snapshot in "
-                        f"'{self._path}") from None
+        save_index = self._index_dir is not None and not Compression.get_method(self._path) and \
+                     not Segments.is_manifest(self._path)
+        if save_index and self._load_index(stinfo.st_size, stinfo.st_mtime_ns):
+            self._file_size = stinfo.st_size
+        else:
+            self._build_index()
+            if save_index:
+                self._save_index_file(stinfo.st_size, stinfo.st_mtime_ns)
 
-        # Check if the last snapshot is cut.
-        last_irqname1 = list(dataset1["irq_info"].keys())[-1]
-        last_irqname2 = list(dataset2["irq_info"].keys())[-1]
+        assert self._offsets is not None and self._timestamps is not None
+        return self._offsets, self._timestamps
+
+    def _get_window_range(self,
+                          begin_ts: float | None,
+                          end_ts: float | None) -> tuple[int, int, int]:
+        """
+        Return the file offsets range containing the snapshots taken within a time window. Refer to
+        '_get_snapshots_range()' for more details.
 
-        if last_irqname1 == last_irqname2:
-            return dataset1, dataset2.copy()
+        Args:
+            begin_ts: The time window start time-stamp, 'None' means the first snapshot.
+            end_ts: The time window end time-stamp, 'None' means the last snapshot.
+
+        Returns:
+            A tuple of the start and end file offsets, and the count of snapshots to skip.
+        """
+
+        offsets, timestamps = self._get_index()
+
+        first = 0
+        if begin_ts is not None:
+            first = int(numpy.searchsorted(timestamps, begin_ts, side="left"))
+
+        last = len(offsets)
+        if end_ts is not None:
+            last = int(numpy.searchsorted(timestamps, end_ts, side="right"))
+
+        return self._get_snapshots_range(first, last)
+
+    def _get_snapshots_range(self, first: int, last: int) -> tuple[int, int, int]:
+        """
+        Return the file offsets range of snapshots number 'first' to 'last - 1'. In case of the
+        compact format, the delta snapshots cannot be parsed without the preceding snapshots, so the
+        range starts at the closest complete snapshot preceding snapshot 'first', and the caller
+        has to skip the snapshots preceding snapshot 'first'.
+
+        Args:
+            first: Number of the first snapshot.
+            last: Number of the snapshot following the last snapshot.
+
+        Returns:
+            A tuple of the start and end file offsets, and the count of snapshots to skip.
+        """
+
+        offsets, _ = self._get_index()
+        assert self._keyframes is not None
+
+        if first >= last:
+            return 0, 0, 0
+
+        skip = 0
+        pos = int(numpy.searchsorted(self._keyframes, first, side="right")) - 1
+        if pos >= 0:
+            skip = first - int(self._keyframes[pos])
+            first -= skip
+
+        start = int(offsets[first])
+        if last < len(offsets):
+            end = int(offsets[last])
+        else:
+            end = self._file_size
+
+        return start, end, skip
+
+    def _read_range(self, start: int, end: int) -> Generator[str, None, None]:
+        """
+        Yield the lines of the input file within a file offsets range.
+
+        Args:
+            start: The start file offset, must be the beginning of a line.
+            end: The end file offset.
+
+        Yields:
+            Lines of the input file.
+        """
+
+        assert self._path is not None
 
-        # The last snapshot is cut, find the second to last snapshot.
         try:
-            pos = self._locate_last_snapshot(fobj, max_pos=pos)
+            with Segments.open_binary(self._path, *self._segments_range) as fobj:
+                if fobj.seekable():
+                    fobj.seek(start)
+                    pos = start
+                else:
+                    pos = 0
+                for line in fobj:
+                    if pos >= end:
+                        break
+                    pos += len(line)
+                    if pos > start:
+                        yield line.decode("utf-8")
         except OSError as err:
             errmsg = Error(str(err)).indent(2)
             raise Error(f"I/O error on file '{self._path}':\n{errmsg}") from err
 
-        try:
-            fobj.seek(pos)
-        except OSError as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"Cannot set file position to {pos} for file "
-                        f"'{self._path}':\n{errmsg}") from err
+    def get_snapshots_count(self) -> int:
+        """
+        Return the count of '/proc/interrupts' snapshots in the file. The snapshots are counted by
+        the time-stamp lines, so the last snapshot may be cut.
+
+        Returns:
+            The count of snapshots.
+        """
 
+        offsets, _ = self._get_index()
+        return len(offsets)
+
+    def get_snapshot(self, idx: int) -> DataSetTypedDict:
+        """
+        Parse and return a single '/proc/interrupts' snapshot. Use the snapshots index to seek
+        directly to the snapshot without parsing the preceding ones.
+
+        Args:
+            idx: Number of the snapshot to parse. Negative numbers count from the end, e.g., '-1'
+                 is the last snapshot.
+
+        Returns:
+            The parsed interrupts statistics dataset.
+        """
+
+        cnt = self.get_snapshots_count()
+        if idx < -cnt or idx >= cnt:
+            raise Error(f"Bad '/proc/interrupts' snapshot number {idx}: file '{self._path}' "
+                        f"includes {cnt} snapshots")
+        if idx < 0:
+            idx += cnt
+
+        start, end, skip = self._get_snapshots_range(idx, idx + 1)
+
+        lines = self._read_range(start, end)
         try:
-            dataset2 = next(self._next(fobj))
+            dataset = next(itertools.islice(self._next(lines), skip, None))
         except StopIteration:
-            raise Error(f"Failed to locate the last interrupts statistics snapshot in "
-                        f"'{self._path}") from None
+            raise ErrorBadFormat(f"Failed to parse '/proc/interrupts' snapshot number {idx} in "
+                                 f"'{self._path}'") from None
+        finally:
+            lines.close()
+
+        if typing.TYPE_CHECKING:
+            return cast(DataSetTypedDict, dataset)
+        return dataset
+
+    def get_first_and_last(self) -> tuple[DataSetTypedDict, DataSetTypedDict]:
+        """
+        Parse and return the first and last interrupts statistics datasets. Use the snapshots
+        index to seek directly to the snapshots.
+
+        Returns:
+            A tuple containing the first and last interrupts statistics datasets. If there is only
+            one '/proc/interrupts' snapshot, the first and second elements of the tuple will be the
+            same (different objects, same contents).
+        """
+
+        if not self._path:
+            raise Error("Cannot get first and last snapshots from an iterator, please provide the "
+                        "file path instead")
+
+        dataset1 = self.get_snapshot(0)
+        last_irqname1 = list(dataset1["irq_info"].keys())[-1]
+
+        cnt = self.get_snapshots_count()
+        if cnt == 1:
+            return dataset1, self.get_snapshot(0)
+
+        try:
+            dataset2 = self.get_snapshot(-1)
+        except ErrorBadFormat:
+            # The last snapshot may be so badly cut that it does not include any IRQ lines, or it
+            # may be an incomplete delta snapshot.
+            dataset2 = None
+
+        # Check if the last snapshot is cut.
+        if dataset2 and list(dataset2["irq_info"].keys())[-1] == last_irqname1:
+            return dataset1, dataset2
 
-        return dataset1, dataset2.copy()
+        # The last snapshot is cut, use the second to last snapshot.
+        return dataset1, self.get_snapshot(-2)
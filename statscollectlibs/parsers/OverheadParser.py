@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Parse raw statistics collection overhead statistics, which contain multiple samples of the
+'stc-agent' and the statistics collectors process groups resource usage, separated with the
+"Timestamp: <time_since_epoch>" lines.
+
+Example of a sample:
+
+Timestamp: 1705672515.054093
+stc-agent: pids=1 cpu=1.52 rss=13086720 vcsw=130 nvcsw=11 read=0 write=40960
+turbostat: pids=2 cpu=0.31 rss=5246976 vcsw=52 nvcsw=4
+
+The values are cumulative totals over all the processes of the group. The 'read' and 'write' keys
+are omitted if the disk I/O of the group is not known.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+from pepclibs.helperlibs.Exceptions import ErrorBadFormat
+from statscollectlibs.parsers import _ParserBase
+
+if typing.TYPE_CHECKING:
+    from typing import Generator, TypedDict
+
+    class DataSetTypedDict(TypedDict):
+        """
+        A collection overhead sample.
+
+        Attributes:
+            Timestamp: The time since the epoch the sample was taken at.
+            groups: The process groups resource usage: a dictionary indexed by the group names,
+                    with dictionaries of the group values indexed by the value names ("pids",
+                    "cpu", "rss", etc) as values.
+        """
+
+        Timestamp: float
+        groups: dict[str, dict[str, float]]
+
+class OverheadParser(_ParserBase.ParserBase):
+    """
+    Parse raw statistics collection overhead statistics. Every sample is represented by a
+    'DataSetTypedDict' dictionary.
+    """
+
+    def _next(self) -> Generator[DataSetTypedDict, None, None]:
+        """
+        Yield the samples one-by-one.
+
+        Yields:
+            The collection overhead sample dictionary.
+        """
+
+        dataset: DataSetTypedDict | None = None
+
+        for line in self._lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if line.startswith("Timestamp: "):
+                if dataset:
+                    yield dataset
+
+                try:
+                    dataset = {"Timestamp": float(line[11:]), "groups": {}}
+                except ValueError:
+                    raise ErrorBadFormat(f"Bad raw collection overhead statistics: bad time-stamp "
+                                         f"line '{line}'") from None
+                continue
+
+            if not dataset:
+                raise ErrorBadFormat(f"Bad raw collection overhead statistics: expected a "
+                                     f"timestamp line (e.g., 'Timestamp: 1705672515.054093'), "
+                                     f"got: '{line}'")
+
+            name, sep, vals = line.partition(": ")
+            if not sep:
+                raise ErrorBadFormat(f"Bad raw collection overhead statistics: bad line '{line}'")
+
+            group: dict[str, float] = {}
+            for item in vals.split():
+                key, _, val = item.partition("=")
+                try:
+                    group[key] = float(val)
+                except ValueError:
+                    raise ErrorBadFormat(f"Bad raw collection overhead statistics: bad value "
+                                         f"'{item}' in line '{line}'") from None
+
+            dataset["groups"][name] = group
+
+        if dataset:
+            yield dataset
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2016-2024 Intel Corporation
+# Copyright (C) 2016-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -21,9 +21,15 @@ Terminology.
 """
 
 # TODO: Files with data from turbustat that was run as a normal user, not root
+import io
+import os
 import re
+import math
+import concurrent.futures
+import numpy
 from pepclibs.helperlibs import Logging, Trivial
 from pepclibs.helperlibs.Exceptions import Error, ErrorBadFormat
+from statscollectlibs.helperlibs import Compression, Segments
 from statscollectlibs.parsers import _ParserBase
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
@@ -31,6 +37,9 @@ _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 # The default regular expression for turbostat columns to parse.
 _TABLE_START_REGEX = r".*\s*Avg_MHz\s+Busy%\s+Bzy_MHz\s+.*"
 
+# The regular expression for matching the turbostat table heading line in a binary file.
+_TABLE_START_REGEX_BYTES = re.compile(_TABLE_START_REGEX.encode("utf-8"))
+
 # Regular expression for matching requestable C-state names.
 _REQ_CSTATES_REGEX = r"^((POLL)|(C\d+[ESP]*)|(C\d+ACPI))$"
 _REQ_CSTATES_REGEX_COMPILED = re.compile(_REQ_CSTATES_REGEX)
@@ -76,114 +85,334 @@ def get_totals_func_name(metric):
         return "wavg"
     return "avg"
 
+def _find_table_start(fobj, pos):
+    """
+    Find the first turbostat table heading line starting at file position 'pos' or after it. The
+    arguments are as follows.
+      * fobj - the binary file object of the raw turbostat statistics file.
+      * pos - the file position to start searching at. If 'pos' is not the beginning of the file,
+              the line at 'pos' is assumed to be incomplete and it is skipped.
+
+    Return the file position of the heading line or 'None' if there are no heading lines.
+    """
+
+    fobj.seek(pos)
+    if pos:
+        fobj.readline()
+
+    while True:
+        pos = fobj.tell()
+        line = fobj.readline()
+        if not line:
+            return None
+        if re.match(_TABLE_START_REGEX_BYTES, line):
+            return pos
+
+def split_into_chunks(path, chunks_cnt):
+    """
+    Split a raw turbostat statistics file into chunks at the table heading boundaries. The
+    arguments are as follows.
+      * path - path to the raw turbostat statistics file.
+      * chunks_cnt - the wanted count of chunks.
+
+    Return a tuple of the "nontable" data end file position and the list of chunks. Every chunk is
+    a '(warmup_pos, start_pos, end_pos)' tuple, where 'start_pos' and 'end_pos' are the chunk
+    boundaries, and 'warmup_pos' is the file position of the table preceding the chunk ('None' for
+    the first chunk). The preceding table is needed for calculating the derivative metrics of the
+    first table in the chunk.
+    """
+
+    try:
+        with open(path, "rb") as fobj:
+            size = fobj.seek(0, os.SEEK_END)
+            nontable_end = _find_table_start(fobj, 0)
+            if nontable_end is None:
+                return 0, [(None, 0, size)]
+
+            chunks = []
+            warmup_pos = None
+            start_pos = 0
+            for idx in range(1, chunks_cnt):
+                pos = nontable_end + ((size - nontable_end) * idx) // chunks_cnt
+                pos = max(pos, start_pos + 1)
+                if pos >= size:
+                    break
+
+                next_warmup_pos = _find_table_start(fobj, pos)
+                if next_warmup_pos is None:
+                    break
+                next_start_pos = _find_table_start(fobj, next_warmup_pos + 1)
+                if next_start_pos is None:
+                    break
+
+                chunks.append((warmup_pos, start_pos, next_start_pos))
+                warmup_pos = next_warmup_pos
+                start_pos = next_start_pos
+    except OSError as err:
+        errmsg = Error(str(err)).indent(2)
+        raise Error(f"Failed to split turbostat statistics file '{path}' into chunks:\n"
+                    f"{errmsg}") from err
+
+    chunks.append((warmup_pos, start_pos, size))
+    return nontable_end, chunks
+
+def _parse_chunk(path, derivatives, cpus, metrics, nontable_end, chunk, first_ts, handler):
+    """
+    Parse a chunk of a raw turbostat statistics file. This function is executed in a worker
+    process. The arguments are as follows.
+      * path - path to the raw turbostat statistics file.
+      * derivatives - whether the derivative metrics should be added.
+      * cpus - same as in TurbostatParser.__init__().
+      * metrics - same as in TurbostatParser.__init__().
+      * nontable_end - file position of the end of the "nontable" data.
+      * chunk - the '(warmup_pos, start_pos, end_pos)' chunk tuple.
+      * first_ts - the smallest time-stamp of the very first table in the file.
+      * handler - a function to apply to every parsed table dictionary, or 'None'.
+
+    Return the list of parsed table dictionaries (or the handler results).
+    """
+
+    warmup_pos, start_pos, end_pos = chunk
+
+    with open(path, "rb") as fobj:
+        data = b""
+        if start_pos:
+            # Every chunk needs the "nontable" data, which includes information like the TDP.
+            data = fobj.read(nontable_end)
+        pos = start_pos if warmup_pos is None else warmup_pos
+        fobj.seek(pos)
+        data += fobj.read(end_pos - pos)
+
+    parser = _ChunkParser(io.StringIO(data.decode("utf-8")), derivatives, first_ts,
+                          int(warmup_pos is not None), cpus=cpus, metrics=metrics)
+
+    results = []
+    for tdict in parser.next():
+        if handler:
+            results.append(handler(tdict))
+        else:
+            results.append(tdict)
+
+    return results
+
 class TurbostatParser(_ParserBase.ParserBase):
     """The 'turbostat' tool output parser."""
 
-    @staticmethod
-    def _summarize(fname, vals, weights=None, count=None):
-        """Apply the 'fname' function to the 'vals' values."""
-
-        if fname == "sum":
-            return sum(vals)
-        if fname == "avg":
-            return sum(vals) / count
-        if fname == "wavg":
-            return sum(val * weight for val, weight in zip(vals, weights)) / count
-        if fname == "min":
-            return min(vals)
-        if fname == "max":
-            return max(vals)
-        raise Error(f"BUG: unknown summary function '{fname}'")
-
-    @staticmethod
-    def _get_core_metric_values(coreinfo, metric):
-        """Yield 'metric' values for all CPUs in a core."""
-
-        for cpuinfo in coreinfo["cpus"].values():
-            if metric in cpuinfo:
-                yield cpuinfo[metric]
-
-    @staticmethod
-    def _get_package_metric_values(pkginfo, metric):
-        """Yield 'metric' values for all CPUs in a package."""
-
-        for cpuinfo in pkginfo["cpus"].values():
-            if metric in cpuinfo:
-                yield cpuinfo[metric]
-
-    @staticmethod
-    def _get_system_metric_values(tdict, metric):
-        """Yield 'metric' values for all CPUs in the system."""
-
-        for cpuinfo in tdict["cpus"].values():
-            if metric in cpuinfo:
-                yield cpuinfo[metric]
-
-    def _summarize_metric(self, info, metric, level_name):
-        """Calculate the 'level_name' level "total" value for metric 'metric'."""
-
-        method_name = f"_get_{level_name}_metric_values"
-        get_values_method = getattr(self, method_name)
-        vals = get_values_method(info, metric)
-
-        fname = self._metric2fname[metric]
-        count = weights = None
-        if fname in ("avg", "wavg"):
-            count = sum(1 for _ in get_values_method(info, metric))
-            if fname == "wavg":
-                weights = get_values_method(info, "Busy%")
-
-        val = self._summarize(fname, vals, weights=weights, count=count)
-        return self._heading2type[metric](val)
-
-    @staticmethod
-    def _get_requestable_cstate_metrics(info):
-        """Yield metric names related to requestable C-states."""
+    def _construct_tcols(self):
+        """
+        Build the list of metrics (columns) of the table matrix, which is used for calculating the
+        totals. Also build the per-summary function column indices.
+        """
 
-        for cnt_metric in list(info):
-            if not re.match(_REQ_CSTATES_REGEX_COMPILED, cnt_metric):
+        tcols = {}
+        for level in ("package", "core"):
+            for metric in self._metrics[level]:
+                # With the CPU projection, only the metrics parsed for all CPUs can be summarized.
+                if self._totals_metrics is None or metric in self._totals_metrics:
+                    tcols[metric] = None
+
+        if self._derivatives:
+            if self._time_elapsed_metric:
+                tcols[self._time_elapsed_metric] = None
+            if self._pkgwatt_tdp_metric:
+                tcols[self._pkgwatt_tdp_metric] = None
+            iterator = self._get_requestable_cstate_metrics(self._metrics["system"])
+            for _, rate_metric, time_metric, _ in iterator:
+                tcols[rate_metric] = None
+                tcols[time_metric] = None
+
+        # The weights for the weighted average summary function.
+        tcols["Busy%"] = None
+
+        # Only numeric metrics with a known summary function can be summarized.
+        self._tcols = [metric for metric in tcols if metric in self._metric2fname and
+                       self._heading2type.get(metric) in (int, float)]
+        self._tcol2idx = {metric: idx for idx, metric in enumerate(self._tcols)}
+
+        for level in ("package", "core"):
+            self._level_tcols[level] = [metric for metric in self._metrics[level]
+                                        if metric in self._tcol2idx]
+
+        fname2idxs = {}
+        for idx, metric in enumerate(self._tcols):
+            fname2idxs.setdefault(self._metric2fname[metric], []).append(idx)
+        self._fname2tcols = {fname: numpy.array(idxs) for fname, idxs in fname2idxs.items()}
+
+    def _construct_topology_index(self, tdict):
+        """
+        Build the topology index arrays mapping table matrix rows (CPUs) to package and core group
+        indices. The arrays are re-used for the following tables unless the topology changes (e.g.,
+        a CPU goes offline).
+        """
+
+        if self._tbl_topology == self._topology:
+            return
+
+        self._topology = self._tbl_topology
+
+        pkg2idx = {}
+        core2idx = {}
+        pkg_idx = []
+        core_idx = []
+        for package, core in self._topology:
+            pkg_idx.append(pkg2idx.setdefault(package, len(pkg2idx)))
+            core_idx.append(core2idx.setdefault((package, core), len(core2idx)))
+
+        self._pkg2idx = pkg2idx
+        self._core2idx = core2idx
+        self._pkg_idx = numpy.array(pkg_idx, dtype=numpy.intp)
+        self._core_idx = numpy.array(core_idx, dtype=numpy.intp)
+        self._sys_idx = numpy.zeros(len(self._topology), dtype=numpy.intp)
+
+        if len(tdict["cpus"]) != len(self._topology):
+            raise Error("BUG: topology and CPU counts mismatch")
+
+    def _build_table_matrix(self, tdict):
+        """
+        Build and return the table matrix: a NumPy array with a row per CPU and a column per metric
+        in 'self._tcols'. Missing values are represented by 'NaN'.
+        """
+
+        nan = numpy.nan
+        tcols = self._tcols
+        rows = [[cpuinfo.get(metric, nan) for metric in tcols]
+                for cpuinfo in tdict["cpus"].values()]
+        return numpy.array(rows, dtype=numpy.float64).reshape(len(rows), len(tcols))
+
+    def _summarize_groups(self, matrix, group_idx, groups_cnt):
+        """
+        Calculate the "totals" for all metrics of the table matrix 'matrix' and for all groups of
+        CPUs (e.g., packages) in one pass. The arguments are as follows.
+          * matrix - the table matrix.
+          * group_idx - array of group indices for every matrix row.
+          * groups_cnt - count of groups.
+
+        Return a matrix with a row per group and a column per metric. Use 'NaN' for the totals that
+        cannot be calculated because there are no values for the metric in the group.
+        """
+
+        present = ~numpy.isnan(matrix)
+        values = numpy.where(present, matrix, 0.0)
+
+        counts = numpy.zeros((groups_cnt, matrix.shape[1]))
+        numpy.add.at(counts, group_idx, present)
+
+        result = numpy.full((groups_cnt, matrix.shape[1]), numpy.nan)
+
+        for fname, cols in self._fname2tcols.items():
+            if fname in ("sum", "avg", "wavg"):
+                vals = values[:, cols]
+                if fname == "wavg":
+                    vals = vals * values[:, self._tcol2idx["Busy%"]][:, None]
+                sums = numpy.zeros((groups_cnt, len(cols)))
+                numpy.add.at(sums, group_idx, vals)
+                if fname == "sum":
+                    result[:, cols] = sums
+                else:
+                    cnts = counts[:, cols]
+                    result[:, cols] = numpy.divide(sums, cnts, out=numpy.full_like(sums, numpy.nan),
+                                                   where=cnts > 0)
+            elif fname in ("min", "max"):
+                if fname == "min":
+                    ufunc = numpy.fmin
+                    init = numpy.inf
+                else:
+                    ufunc = numpy.fmax
+                    init = -numpy.inf
+                vals = numpy.full((groups_cnt, len(cols)), init)
+                ufunc.at(vals, group_idx, matrix[:, cols])
+                vals[counts[:, cols] == 0] = numpy.nan
+                result[:, cols] = vals
+            else:
+                raise Error(f"BUG: unknown summary function '{fname}'")
+
+        return result
+
+    def _get_totals(self, totals_row, metrics, skip_metrics=None):
+        """
+        Build and return the totals dictionary for metrics 'metrics' out of a row of the matrix
+        returned by '_summarize_groups()'. The row is expected to be converted to a python list,
+        because indexing NumPy arrays element-by-element is slow.
+        """
+
+        totals = {}
+        for metric in metrics:
+            if skip_metrics and metric in skip_metrics:
+                continue
+            idx = self._tcol2idx.get(metric)
+            if idx is None:
                 continue
+            val = totals_row[idx]
+            if math.isnan(val):
+                continue
+            totals[metric] = self._heading2type[metric](val)
+
+        return totals
 
-            rate_metric = f"{cnt_metric}_rate" # C-state requests rate.
-            time_metric = f"{cnt_metric}_time" # Avg. time in C-state per request.
-            resd_metric = f"{cnt_metric}%"     # Requestable C-state residency.
+    def _get_requestable_cstate_metrics(self, info):
+        """Yield metric names related to requestable C-states."""
 
-            yield cnt_metric, rate_metric, time_metric, resd_metric
+        cache = self._req_cstate_metrics
+        for cnt_metric in list(info):
+            # Matching the regular expression is relatively expensive, and this is done for every
+            # CPU in every table, so cache the results.
+            metrics = cache.get(cnt_metric, False)
+            if metrics is False:
+                metrics = None
+                if re.match(_REQ_CSTATES_REGEX_COMPILED, cnt_metric):
+                    rate_metric = f"{cnt_metric}_rate" # C-state requests rate.
+                    time_metric = f"{cnt_metric}_time" # Avg. time in C-state per request.
+                    resd_metric = f"{cnt_metric}%"     # Requestable C-state residency.
+                    metrics = (cnt_metric, rate_metric, time_metric, resd_metric)
+                cache[cnt_metric] = metrics
+
+            if metrics:
+                yield metrics
 
     def _construct_totals(self, tdict):
         """
         Calculate the totals for package and core levels. Whenever possible, use the totals provided
         by turbostat. The totals are added to the "totals" key of the corresponding level dictionary
         in 'tdict'.
+
+        The totals are calculated using grouped reductions over the table matrix, which has a row
+        per CPU and a column per metric. This calculates the totals for all packages and cores in
+        one pass.
         """
 
+        if self._tcols is None:
+            self._construct_tcols()
+        self._construct_topology_index(tdict)
+
+        matrix = self._build_table_matrix(tdict)
+
         if self._derivatives:
+            sys_metrics = []
             if self._time_elapsed_metric:
-                summary = self._summarize_metric(tdict, self._time_elapsed_metric, "system")
-                tdict["totals"][self._time_elapsed_metric] = summary
-
+                sys_metrics.append(self._time_elapsed_metric)
             if self._pkgwatt_tdp_metric:
-                summary = self._summarize_metric(tdict, self._pkgwatt_tdp_metric, "system")
-                tdict["totals"][self._pkgwatt_tdp_metric] = summary
+                sys_metrics.append(self._pkgwatt_tdp_metric)
 
             iterator = self._get_requestable_cstate_metrics(tdict["totals"])
             for _, rate_metric, time_metric, _ in iterator:
-                tdict["totals"][rate_metric] = self._summarize_metric(tdict, rate_metric, "system")
-                tdict["totals"][time_metric] = self._summarize_metric(tdict, time_metric, "system")
-
-        for pkginfo in tdict["packages"].values():
-            pkginfo["totals"] = {}
-            for metric in self._metrics["package"]:
-                if metric in self._dropped_metrics:
-                    continue
-                pkginfo["totals"][metric] = self._summarize_metric(pkginfo, metric, "package")
-
-            for pkginfo in pkginfo["cores"].values():
-                pkginfo["totals"] = {}
-                for metric in self._metrics["core"]:
-                    if metric in self._dropped_metrics:
-                        continue
-                    pkginfo["totals"][metric] = self._summarize_metric(pkginfo, metric, "core")
+                sys_metrics += [rate_metric, time_metric]
+
+            if sys_metrics:
+                sys_totals = self._summarize_groups(matrix, self._sys_idx, 1).tolist()
+                tdict["totals"].update(self._get_totals(sys_totals[0], sys_metrics))
+
+        pkg_totals = self._summarize_groups(matrix, self._pkg_idx, len(self._pkg2idx)).tolist()
+        core_totals = self._summarize_groups(matrix, self._core_idx, len(self._core2idx)).tolist()
+
+        for package, pkginfo in tdict["packages"].items():
+            pkg_row = pkg_totals[self._pkg2idx[package]]
+            pkginfo["totals"] = self._get_totals(pkg_row, self._level_tcols["package"],
+                                                 skip_metrics=self._dropped_metrics)
+
+            for core, coreinfo in pkginfo["cores"].items():
+                core_row = core_totals[self._core2idx[(package, core)]]
+                coreinfo["totals"] = self._get_totals(core_row, self._level_tcols["core"],
+                                                      skip_metrics=self._dropped_metrics)
 
     def _construct_metrics(self, tlines):
         """
@@ -482,6 +711,7 @@ class TurbostatParser(_ParserBase.ParserBase):
         cpu_count = core_count = pkg_count = 0
         pkginfo = {}
         coreinfo = {}
+        self._tbl_topology = topology = []
 
         for cpuinfo in tlines.values():
             # Make sure there is always the "Core" and "Package" keys.
@@ -495,6 +725,7 @@ class TurbostatParser(_ParserBase.ParserBase):
             cpu = cpuinfo["CPU"]
 
             tdict["cpus"][cpu] = cpuinfo
+            topology.append((package, core))
 
             if package not in packages:
                 packages[package] = pkginfo = {"first_cpu": cpu, "cpus": {}}
@@ -612,6 +843,92 @@ class TurbostatParser(_ParserBase.ParserBase):
 
         return line_data
 
+    def _parse_cpu_line(self, line, elts):
+        """
+        Parse a turbostat CPU line, skipping the CPUs and metrics that are not projected. The
+        arguments are as follows.
+          * line - the turbostat CPU line.
+          * elts - the line split at least up to the "CPU" column.
+        """
+
+        if self._cpu_col is None:
+            return self._parse_turbostat_line(elts)
+
+        try:
+            cpu = int(elts[self._cpu_col])
+        except (IndexError, ValueError):
+            # Let the generic code handle the malformed line.
+            return self._parse_turbostat_line(line.split())
+
+        if self._cpus_filter is None or cpu in self._cpus_filter:
+            cols, maxsplit = self._sel_cols, self._sel_maxsplit
+        else:
+            cols, maxsplit = self._other_cols, self._other_maxsplit
+
+        # Do not split the part of the line after the last needed column.
+        elts = line.split(None, maxsplit)
+        elts_cnt = len(elts)
+
+        line_data = {}
+        for idx, key, type_func in cols:
+            if idx >= elts_cnt:
+                break
+
+            value = elts[idx]
+            if value in ("-", "(neg)"):
+                self._dropped_metrics.add(key)
+                continue
+
+            line_data[key] = type_func(value)
+
+        return line_data
+
+    def _get_projection_cols(self, heading, keys):
+        """
+        Build and return the '(columns, maxsplit)' tuple for parsing projected CPU lines. The
+        columns is a list of '(index, key, type)' tuples for heading keys in 'keys'. The 'maxsplit'
+        is the 'str.split()' argument for splitting the line just past the last needed column.
+        """
+
+        cols = [(idx, key, self._heading2type[key]) for idx, key in enumerate(heading)
+                if key in keys]
+        return cols, cols[-1][0] + 1
+
+    def _construct_projection(self, heading):
+        """
+        Build the columns to parse for the projected and the not projected CPUs. The not projected
+        CPU lines are still partially parsed, because the system totals of the derivative metrics
+        and the package power sanity check need values for all CPUs.
+        """
+
+        if self._cpus_filter is None and self._metrics_filter is None:
+            return
+        if "CPU" not in heading:
+            return
+
+        # The metrics needed for all CPUs.
+        required = {"Time_Of_Day_Seconds", "PkgWatt"}
+        if self._derivatives:
+            for metrics in self._get_requestable_cstate_metrics(heading):
+                cnt_metric, rate_metric, time_metric, resd_metric = metrics
+                if self._metrics_filter is None or rate_metric in self._metrics_filter or \
+                   time_metric in self._metrics_filter:
+                    required.update((cnt_metric, resd_metric))
+
+        if self._cpus_filter is not None:
+            self._totals_metrics = set(required)
+
+        required.update(_TOPOLOGY_KEYS)
+
+        if self._metrics_filter is None:
+            sel_keys = set(heading)
+        else:
+            sel_keys = required | self._metrics_filter
+
+        self._sel_cols, self._sel_maxsplit = self._get_projection_cols(heading, sel_keys)
+        self._other_cols, self._other_maxsplit = self._get_projection_cols(heading, required)
+        self._cpu_col = heading.index("CPU")
+
     def _construct_heading2type(self, heading, sys_totals):
         """
         Build the dictionary mapping heading entries (metric names, topology keys) to the python
@@ -704,11 +1021,16 @@ class TurbostatParser(_ParserBase.ParserBase):
                 continue
 
             self._orig_line = line
-            line = line.split()
-            if Trivial.is_float(line[0]):
+            if self._cpu_col is None:
+                elts = line.split()
+            else:
+                # Projected CPU lines are split only as far as needed.
+                elts = line.split(None, self._cpu_col + 1)
+
+            if Trivial.is_float(elts[0]):
                 # This is the continuation of the table we are currently parsing. The system totals
                 # line has already been parsed, and this line is for a CPU.
-                line_dict = self._parse_turbostat_line(line)
+                line_dict = self._parse_cpu_line(line, elts)
                 if "CPU" not in line_dict:
                     raise ErrorBadFormat(f"'CPU' value was not found in the following turbostat "
                                          f"line:\n{self._orig_line}")
@@ -717,12 +1039,7 @@ class TurbostatParser(_ParserBase.ParserBase):
                 # This is the start of the new table.
                 if tlines:
                     # Yield the turbostat table dictionary of the previous table.
-                    tdict = self._construct_tdict(tlines)
-                    if self._validate_tdict(tdict):
-                        yield tdict
-                        self._prev_tdict = tdict
-                        self._tables_cnt += 1
-                        self._dropped_metrics = set()
+                    yield from self._yield_tdict(tlines)
                     tlines = {}
                 elif self._tables_cnt:
                     # This is not the first table, but nothing to yield from the previous table.
@@ -730,7 +1047,7 @@ class TurbostatParser(_ParserBase.ParserBase):
                                          f"data or totals line\nLast read turbostat line:\n"
                                          f"{self._orig_line}")
 
-                heading = line # The first line is the table heading.
+                heading = line.split() # The first line is the table heading.
 
                 # The next line is the system level totals.
                 try:
@@ -744,6 +1061,7 @@ class TurbostatParser(_ParserBase.ParserBase):
                 line = line.split()
                 if not self._heading2type:
                     self._construct_heading2type(heading, line)
+                    self._construct_projection(heading)
 
                 # The very first line after the table heading is the system totals line. It does not
                 # include any CPU number.
@@ -761,22 +1079,115 @@ class TurbostatParser(_ParserBase.ParserBase):
                          "read turbostat line:\n%s", self._orig_line)
             return
 
+        yield from self._yield_tdict(tlines)
+
+    def _yield_tdict(self, tlines):
+        """
+        Construct the turbostat table dictionary out of parsed turbostat lines 'tlines', validate
+        and yield it. Do not yield warm-up tables.
+        """
+
         tdict = self._construct_tdict(tlines)
-        if self._validate_tdict(tdict):
-            yield tdict
+        valid = self._validate_tdict(tdict)
+
+        warmup = self._warmup_tables > 0
+        if warmup:
+            self._warmup_tables -= 1
+
+        if valid:
+            if not warmup:
+                yield tdict
             self._prev_tdict = tdict
             self._tables_cnt += 1
             self._dropped_metrics = set()
 
-    def __init__(self, path=None, lines=None, derivatives=False):
+    def next_parallel(self, jobs, handler=None):
+        """
+        Same as 'next()', but parse the turbostat output in parallel. Split the raw turbostat
+        statistics file into chunks at table heading boundaries, parse the chunks in a pool of
+        worker processes, and yield the results in order. The arguments are as follows.
+          * jobs - count of worker processes to use.
+          * handler - a function to apply to every table dictionary in the worker process. If
+                      provided, yield the handler results instead of the table dictionaries. The
+                      function and its results must be picklable.
+
+        Notes.
+          * The parallel mode requires the 'path' constructor argument.
+          * The derivative metrics depending on the previous table are stitched across chunk
+            boundaries: every worker parses the last table of the preceding chunk too, but does not
+            yield it.
+          * The invalid tables limits are checked per-chunk.
+          * Compressed and segmented files cannot be split into chunks, so they are parsed
+            sequentially.
+        """
+
+        if not self._path:
+            raise Error("BUG: parallel parsing requires the raw turbostat statistics file path")
+
+        if jobs < 2 or Compression.get_method(self._path) or Segments.is_manifest(self._path):
+            for tdict in self.next():
+                yield handler(tdict) if handler else tdict
+            return
+
+        nontable_end, chunks = split_into_chunks(self._path, jobs)
+        if len(chunks) < 2:
+            for tdict in self.next():
+                yield handler(tdict) if handler else tdict
+            return
+
+        # The elapsed time derivative metric is calculated relative to the very first table
+        # time-stamp, which has to be known to all the workers.
+        first_ts = None
+        if self._derivatives:
+            with open(self._path, "r", encoding="utf-8") as fobj:
+                parser = TurbostatParser(lines=fobj, derivatives=True, cpus=self._cpus_filter,
+                                         metrics=self._metrics_filter)
+                for _ in parser.next():
+                    first_ts = parser._first_ts # pylint: disable=protected-access
+                    break
+
+        _LOG.debug("Parsing turbostat statistics file '%s' in %d chunks using %d workers",
+                   self._path, len(chunks), jobs)
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(_parse_chunk, self._path, self._derivatives,
+                                           self._cpus_filter, self._metrics_filter, nontable_end,
+                                           chunk, first_ts, handler)
+                           for chunk in chunks]
+                for future in futures:
+                    yield from future.result()
+        finally:
+            if hasattr(self._lines, "close"):
+                self._lines.close()
+
+    def __init__(self, path=None, lines=None, derivatives=False, cpus=None, metrics=None):
         """
         The class constructor. Arguments are as follows.
           * path - same as in ParserBase.__init__().
           * lines - same as in ParserBase.__init__().
           * derivatives - whether the derivative metrics should be added.
+          * cpus - collection of CPU numbers to parse all the metrics for ('None' means all CPUs).
+          * metrics - collection of metric names to parse for CPUs in 'cpus' ('None' means all
+                      metrics).
+
+        Notes.
+          * The 'cpus' and 'metrics' arguments are a projection: CPU lines of other CPUs, and other
+            metrics are not tokenized, type-converted, and stored. The projection is applied only to
+            the CPU lines, the system totals line is always parsed completely.
+          * The metrics needed for calculating the system totals of the derivative metrics and for
+            the package power sanity check are parsed for all CPUs regardless of the projection.
+          * With the 'cpus' projection, the package and core totals are calculated only for the
+            metrics parsed for all CPUs.
         """
 
         self._derivatives = derivatives
+        self._cpus_filter = None
+        if cpus is not None:
+            self._cpus_filter = set(cpus)
+        self._metrics_filter = None
+        if metrics is not None:
+            self._metrics_filter = set(metrics)
         self._pkgwatt_tdp_metric = None
         self._time_elapsed_metric = None
         self._first_ts = None
@@ -826,5 +1237,63 @@ class TurbostatParser(_ParserBase.ParserBase):
         self._prev_tdict = {}
         # Names of metrics that were dropped during table parsing, because of a bad value.
         self._dropped_metrics = set()
+        # Count of the first tables that should be parsed, but not yielded. Used in parallel mode,
+        # where the last table of the preceding chunk is parsed only to calculate the derivative
+        # metrics.
+        self._warmup_tables = 0
+
+        # The requestable C-state metric names tuple cache indexed by the metric name.
+        self._req_cstate_metrics = {}
+
+        # Index of the "CPU" heading column, 'None' if no projection is used.
+        self._cpu_col = None
+        # The '(index, key, type)' tuples for the columns to parse for the projected CPUs and the
+        # other CPUs, and the 'str.split()' maximum split counts.
+        self._sel_cols = []
+        self._sel_maxsplit = -1
+        self._other_cols = []
+        self._other_maxsplit = -1
+
+        # The table matrix columns (metric names) and the column indices.
+        self._tcols = None
+        self._tcol2idx = {}
+        # The package and core level metrics that are table matrix columns.
+        self._level_tcols = {}
+        # The metrics to calculate the package and core totals for ('None' means all metrics).
+        self._totals_metrics = None
+        # The table matrix column indices indexed by the summary function name.
+        self._fname2tcols = {}
+        # The '(package, core)' pairs for every CPU of the currently parsed table.
+        self._tbl_topology = []
+        # The topology the index arrays below were built for.
+        self._topology = None
+        # Map package numbers and '(package, core)' pairs to the group indices.
+        self._pkg2idx = {}
+        self._core2idx = {}
+        # The topology index arrays: package, core, and system group index for every table matrix
+        # row (CPU).
+        self._pkg_idx = None
+        self._core_idx = None
+        self._sys_idx = None
 
         super().__init__(path, lines)
+
+class _ChunkParser(TurbostatParser):
+    """Parse a chunk of turbostat output in parallel mode."""
+
+    def __init__(self, lines, derivatives, first_ts, warmup_tables, cpus=None, metrics=None):
+        """
+        The class constructor. Arguments are as follows.
+          * lines - same as in ParserBase.__init__().
+          * derivatives - same as in TurbostatParser.__init__().
+          * first_ts - the smallest time-stamp of the very first table in the file, or 'None' to
+                       use the time-stamp of the first table of the chunk.
+          * warmup_tables - count of the first tables to parse, but not yield.
+          * cpus - same as in TurbostatParser.__init__().
+          * metrics - same as in TurbostatParser.__init__().
+        """
+
+        super().__init__(lines=lines, derivatives=derivatives, cpus=cpus, metrics=metrics)
+
+        self._first_ts = first_ts
+        self._warmup_tables = warmup_tables
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2015-2025 Intel Corporation
+# Copyright (C) 2015-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -15,6 +15,7 @@ from __future__ import annotations  # Remove when switching to Python 3.10+.
 import typing
 from pathlib import Path
 from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import Segments
 
 if typing.TYPE_CHECKING:
     from typing import IO, Generator, Iterator, cast
@@ -27,7 +28,9 @@ class ParserBase:
         Initialize a class instance. The arguments are as follows.
 
         Args:
-            path: Path to the turbostat output file that should be parsed.
+            path: Path to the turbostat output file that should be parsed. Compressed files are
+                  decompressed transparently, and segments manifest paths are read as the
+                  concatenation of all the segments.
             lines: An iterable object which provides the turbostat output to parse one-by-one.
         """
 
@@ -42,8 +45,7 @@ class ParserBase:
 
         if path:
             try:
-                # pylint: disable=consider-using-with
-                self._lines = open(path, "r", encoding="utf-8")
+                self._lines = Segments.open_text(path)
             except OSError as err:
                 errmsg = Error(str(err)).indent(2)
                 raise Error(f"Failed to open '{path}':\n{errmsg}") from err
@@ -66,10 +68,13 @@ class ParserBase:
             Parser-specific datasets.
         """
 
-        yield from self._next()
-        if hasattr(self._lines, "close"):
-            if typing.TYPE_CHECKING:
-                io_lines = cast(IO[str], self._lines)
-            else:
-                io_lines = self._lines
-            io_lines.close()
+        try:
+            yield from self._next()
+        finally:
+            # Close the input even if the generator is closed before it is exhausted.
+            if hasattr(self._lines, "close"):
+                if typing.TYPE_CHECKING:
+                    io_lines = cast(IO[str], self._lines)
+                else:
+                    io_lines = self._lines
+                io_lines.close()
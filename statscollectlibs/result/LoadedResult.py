@@ -23,13 +23,18 @@ from statscollectlibs.result import RORawResult
 if typing.TYPE_CHECKING:
     from statscollectlibs.mdc.MDCBase import MDTypedDict
     from statscollectlibs.result.LoadedStatistic import TimeStampLimitsTypedDict
+    from statscollectlibs.result._StatsCache import StatsCache
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
 class LoadedResult:
     """The loaded version of a raw test result."""
 
-    def __init__(self, res: RORawResult.RORawResult, cpus: list[int] | None = None):
+    def __init__(self,
+                 res: RORawResult.RORawResult,
+                 cpus: list[int] | None = None,
+                 jobs: int = 1,
+                 cache: StatsCache | None = None):
         """
         Initialize a class instance.
 
@@ -38,10 +43,15 @@ class LoadedResult:
                  object.
             cpus: List of CPU numbers to include load the statistics for. Default is to load for all
                   CPUs.
+            jobs: Count of worker processes to use for parsing raw statistics files.
+            cache: The cache of the dataframes built from raw statistics files, or 'None' to always
+                   build the dataframes from the raw statistics files.
         """
 
         self.res = res
         self.cpus = cpus
+        self.jobs = jobs
+        self.cache = cache
 
         self.reportid = self.res.reportid
 
@@ -75,7 +85,8 @@ class LoadedResult:
         # Build the loaded statistics objects, but do not actually load them yet.
         for stname, stinfo in self.res.info["stinfo"].items():
             self.lsts[stname] = LoadedStatsitic(stname, self.res, ll=self.lls.get(stname),
-                                                cpus=self.cpus)
+                                                cpus=self.cpus, jobs=self.jobs,
+                                                cache=self.cache)
             if "MDD" in res.info["wlinfo"]:
                 self.lsts[stname].set_ldd(res.info["wlinfo"]["MDD"])
 
@@ -1,7 +1,7 @@
 
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2025 Intel Corporation
+# Copyright (C) 2025-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -18,13 +18,17 @@ import numpy
 from pepclibs.helperlibs import Logging
 from pepclibs.helperlibs.Exceptions import Error, ErrorBadFormat
 from statscollectlibs.dfbuilders import _TurbostatDFBuilder, _InterruptsDFBuilder, _ACPowerDFBuilder
-from statscollectlibs.dfbuilders import _IPMIDFBuilder
+from statscollectlibs.dfbuilders import _IPMIDFBuilder, _IPMIPowerDFBuilder, _OverheadDFBuilder
+from statscollectlibs.helperlibs import Segments
 from statscollectlibs.result.RORawResult import RORawResult
 from statscollectlibs.result.LoadedLabels import LoadedLabels
 
 if typing.TYPE_CHECKING:
     from typing import Any, Union, TypedDict
+    from pathlib import Path
+    from statscollectlibs.result._StatsCache import StatsCache
     from statscollectlibs.mdc.MDCBase import MDTypedDict
+    from statscollectlibs.helperlibs.Segments import RangeType
 
     class TimeStampLimitsTypedDict(TypedDict, total=False):
         """
@@ -50,7 +54,9 @@ if typing.TYPE_CHECKING:
     DFBuilderType = Union[_TurbostatDFBuilder.TurbostatDFBuilder,
                           _InterruptsDFBuilder.InterruptsDFBuilder,
                           _ACPowerDFBuilder.ACPowerDFBuilder,
-                          _IPMIDFBuilder.IPMIDFBuilder]
+                          _IPMIDFBuilder.IPMIDFBuilder,
+                          _IPMIPowerDFBuilder.IPMIPowerDFBuilder,
+                          _OverheadDFBuilder.OverheadDFBuilder]
 
 _LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
 
@@ -64,7 +70,9 @@ class LoadedStatsitic:
                  stname: str,
                  res: RORawResult,
                  ll: LoadedLabels | None = None,
-                 cpus: list[int] | None = None):
+                 cpus: list[int] | None = None,
+                 jobs: int = 1,
+                 cache: StatsCache | None = None):
         """
         Initialize a class instance.
 
@@ -74,12 +82,18 @@ class LoadedStatsitic:
             ll: The loaded labels object for this statistic, or 'None' if there are no labels.
             cpus: List of CPU numbers to include load the statistics for. Default is to load for all
                   CPUs.
+            jobs: Count of worker processes to use for parsing the raw statistics file, if the
+                  statistic supports parallel parsing.
+            cache: The cache of the dataframes built from raw statistics files, or 'None' to always
+                   build the dataframe from the raw statistics file.
         """
 
         self.stname = stname
         self.res = res
         self.ll = ll
         self.cpus = cpus
+        self.jobs = jobs
+        self._cache = cache
 
         self.ldd: dict[str, MDTypedDict] = {}
 
@@ -144,26 +158,58 @@ class LoadedStatsitic:
                 # 'label' corresponds to.
                 self.df.loc[filtered_rows, metric] = val
 
-    def _apply_ts_limits(self):
-        """Apply time-stamp limits to the statistics dataframe."""
+    def _apply_ts_limits(self, ts_limits: TimeStampLimitsTypedDict):
+        """
+        Apply time-stamp limits to the statistics dataframe.
+
+        Args:
+            ts_limits: The time-stamp limits to apply.
+        """
 
-        if not self._ts_limits:
+        if not ts_limits:
             return
 
-        if self._ts_limits["absolute"]:
+        if ts_limits["absolute"]:
             colname = self.ts_colname
         else:
             colname = self.time_colname
 
-        self.df.drop(self.df.loc[self.df[colname] < self._ts_limits["begin"]].index, inplace=True)
-        self.df.drop(self.df.loc[self.df[colname] > self._ts_limits["end"]].index, inplace=True)
+        self.df.drop(self.df.loc[self.df[colname] < ts_limits["begin"]].index, inplace=True)
+        self.df.drop(self.df.loc[self.df[colname] > ts_limits["end"]].index, inplace=True)
 
         # Normalize the Elapsed time column to start from 0.
         self.df[self.time_colname] -= self.df[self.time_colname].iloc[0]
 
+    def _get_absolute_ts_limits(self, path: Path) -> TimeStampLimitsTypedDict:
+        """
+        Return the time-stamp limits of a segmented raw statistics file as absolute time-stamps.
+
+        Args:
+            path: The segments manifest path.
+
+        Returns:
+            The absolute time-stamp limits, or the original time-stamp limits if the time-stamp of
+            the first sample is unknown.
+
+        Notes:
+            - The relative time-stamp limits are relative to the first sample of the raw statistics
+              file, which is the first sample of the first segment.
+        """
+
+        if self._ts_limits["absolute"]:
+            return self._ts_limits
+
+        first_ts = Segments.get_first_timestamp(path)
+        if first_ts is None:
+            return self._ts_limits
+
+        return {"begin": first_ts + self._ts_limits["begin"],
+                "end": first_ts + self._ts_limits["end"],
+                "absolute": True}
+
     def _build_df(self, dfbldr: DFBuilderType):
         """
-        Build the statistics dataframe.
+        Build the statistics dataframe, or take it from the cache, if available.
 
         Args:
             dfbldr: The dataframe builder object responsible for loading the data.
@@ -174,22 +220,57 @@ class LoadedStatsitic:
 
         path = self.res.get_stats_path(self.stname)
 
-        _LOG.debug("Loading raw statistics file '%s'", path)
+        # The dataframe builder parameters affecting the resulting dataframe.
+        params: dict[str, Any] = {}
+        if self.stname in ("turbostat", "interrupts"):
+            params["cpus"] = self.cpus
+
+        ts_limits = self._ts_limits
+        segments_range: RangeType = (None, None)
+        if ts_limits and Segments.is_manifest(path):
+            # Load only the segments overlapping the time-stamp limits. The dataframe does not
+            # start at the first sample in this case, so relative time-stamp limits cannot be
+            # applied to the dataframe, use absolute time-stamp limits instead.
+            ts_limits = self._get_absolute_ts_limits(path)
+            if ts_limits["absolute"]:
+                segments_range = (ts_limits["begin"], ts_limits["end"])
+                params["segments_range"] = list(segments_range)
+
+        cached = None
+        entry_path = None
+        if self._cache:
+            # Hashing the raw statistics file is expensive, so do it only once.
+            entry_path = self._cache.get_entry_path(self.stname, path, params)
+            if entry_path:
+                cached = self._cache.get(entry_path)
+
+        if cached:
+            self.df, self.mdd, self.categories = cached
+        else:
+            _LOG.debug("Loading raw statistics file '%s'", path)
+
+            try:
+                self.df = dfbldr.build_df(path, segments_range=segments_range)
+            except ErrorBadFormat:
+                raise
+            except Exception as err:
+                errmsg = Error(str(err)).indent(2)
+                raise Error(f"Unable to load raw statistics file at path '{path}':\n{errmsg}") \
+                      from err
 
-        try:
-            self.df = dfbldr.build_df(path)
-        except ErrorBadFormat:
-            raise
-        except Exception as err:
-            errmsg = Error(str(err)).indent(2)
-            raise Error(f"Unable to load raw statistics file at path '{path}':\n{errmsg}") from err
+            assert dfbldr.mdo is not None
+            self.mdd = dfbldr.mdo.mdd
+            self.categories = dfbldr.mdo.categories
+
+            if self._cache and entry_path:
+                self._cache.put(entry_path, self.df, self.mdd, self.categories)
 
         if self.ts_colname not in self.df:
             raise Error(f"Metric '{self.ts_colname}' was not found in statistics file '{path}'.")
 
         self._apply_labels()
 
-        self._apply_ts_limits()
+        self._apply_ts_limits(ts_limits)
 
         # Convert the elapsed time metric to the "datetime" format so that diagrams use a
         # human-readable format.
@@ -219,13 +300,19 @@ class LoadedStatsitic:
         dfbldr: DFBuilderType
 
         if self.stname == "turbostat":
-            dfbldr = _TurbostatDFBuilder.TurbostatDFBuilder(cpus=self.cpus)
+            dfbldr = _TurbostatDFBuilder.TurbostatDFBuilder(cpus=self.cpus, jobs=self.jobs)
         elif self.stname == "interrupts":
-            dfbldr = _InterruptsDFBuilder.InterruptsDFBuilder(cpus=self.cpus)
+            # Keep the interrupts snapshots index next to the cached dataframes.
+            index_dir = self._cache.cachedir if self._cache else None
+            dfbldr = _InterruptsDFBuilder.InterruptsDFBuilder(cpus=self.cpus, index_dir=index_dir)
         elif self.stname == "acpower":
             dfbldr = _ACPowerDFBuilder.ACPowerDFBuilder()
         elif self.stname in ("ipmi-inband", "ipmi-oob"):
             dfbldr = _IPMIDFBuilder.IPMIDFBuilder()
+        elif self.stname == "ipmi-power":
+            dfbldr = _IPMIPowerDFBuilder.IPMIPowerDFBuilder()
+        elif self.stname == "stc-overhead":
+            dfbldr = _OverheadDFBuilder.OverheadDFBuilder()
         else:
             raise Error(f"Unsupported statistic '{self.stname}'")
 
@@ -234,10 +321,6 @@ class LoadedStatsitic:
 
         self._build_df(dfbldr)
 
-        assert dfbldr.mdo is not None
-        self.mdd = dfbldr.mdo.mdd
-        self.categories = dfbldr.mdo.categories
-
         if self.ll:
             for lname in self.ldd:
                 if lname in self.df:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2023-2025 Intel Corporation
+# Copyright (C) 2023-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -405,6 +405,10 @@ class RORawResult(_RawResultBase.RawResultBase):
         if "stderr" in info:
             info["stderr"] = Path(info["stderr"])
 
+        if "stats_cpus" in info:
+            # A single CPU number is loaded as an integer.
+            self.info["stats_cpus"] = str(info["stats_cpus"])
+
         if "stinfo" in info:
             self.info["stinfo"] = self._validate_stinfo(info["stinfo"])
         else:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # vim: ts=4 sw=4 tw=100 et ai si
 #
-# Copyright (C) 2022-2025 Intel Corporation
+# Copyright (C) 2022-2026 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 #
 # Author: Artem Bityutskiy <artem.bityutskiy@linux.intel.com>
@@ -80,6 +80,8 @@ if typing.TYPE_CHECKING:
             stdout: Path to the file containing the standard output of the test command.
             stderr: Path to the file containing the standard error of the test command.
             duration: For how long the test ran, time in human readable format (e.g., "1h 2m 3s").
+            stats_cpus: The CPUs the in-band statistics collectors were bound to, in the rangified
+                        form (e.g., "0-1,8"). Missing if the collectors were not bound to CPUs.
             wlinfo: Workload information associated with the raw test result. Applicable only for
                     certain workloads supported by this project. None of unsupported ("generic")
                     workloads.
@@ -91,11 +93,12 @@ if typing.TYPE_CHECKING:
         stdout: Path
         stderr: Path
         duration: str
+        stats_cpus: str
         stinfo: dict[str, RawResultSTInfoTypedDict]
         wlinfo: RawResultWLInfoTypedDict
 
 RAW_RESULT_INFO_KEYS_SET: Final[set[str]] = {"toolname", "toolver", "reportid", "stdout", "stderr",
-                                             "duration", "stinfo", "wlinfo" }
+                                             "duration", "stats_cpus", "stinfo", "wlinfo" }
 RAW_RESULT_WLINFO_KEYS_SET: Final[set[str]] = {"wldata_path", "wlname", "MDD"}
 
 # The latest supported raw results directory format version.
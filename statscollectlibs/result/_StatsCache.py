@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""
+Provide an on-disk cache of the dataframes built from raw statistics files.
+
+Building a dataframe from a large raw statistics file (e.g., turbostat) takes a lot of time, but the
+raw statistics files do not change once collected. The cache stores the built dataframes in parquet
+files, so that re-generating reports for the same test results does not re-parse the raw files.
+
+Every cache entry is a single parquet file. The file name is a hash of the cache key, which
+includes the raw statistics file size, modification time, and contents hash, the stats-collect
+version, and the dataframe builder parameters (e.g., the CPU numbers). For segmented raw statistics
+files, the key also includes the names, sizes, and modification times of the selected segment files.
+The metrics definition dictionary and the categories are stored in the parquet file metadata.
+
+The cache directory also stores the interrupts snapshots index files ('*.npz') written by the
+interrupts parser. They are evicted together with the cache entries.
+
+The cache size is bounded, the least recently used entries are evicted when the cache grows too
+big.
+"""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import os
+import json
+import typing
+import hashlib
+import itertools
+from pathlib import Path
+import pyarrow
+from pyarrow import parquet
+from pepclibs.helperlibs import Logging
+from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import Segments
+from statscollecttools import ToolInfo
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final
+    import pandas
+    from statscollectlibs.mdc.MDCBase import MDTypedDict
+
+_LOG = Logging.getLogger(f"{Logging.MAIN_LOGGER_NAME}.stats-collect.{__name__}")
+
+# The cache entry format version. Increment it when the format of the cached dataframes or of the
+# metadata changes in an incompatible way.
+_FORMAT_VERSION: Final[int] = 1
+
+# The parquet file metadata key for storing the metrics definition dictionary and the categories.
+_METADATA_KEY: Final[bytes] = b"stats-collect"
+
+# The default maximum cache size in bytes.
+DEFAULT_MAX_SIZE: Final[int] = 1024 * 1024 * 1024
+
+def get_default_cachedir() -> Path:
+    """
+    Return the default cache directory path.
+
+    Returns:
+        Path: The '$XDG_CACHE_HOME/stats-collect' directory path, or '~/.cache/stats-collect' if the
+              'XDG_CACHE_HOME' environment variable is not set.
+    """
+
+    basedir = os.environ.get("XDG_CACHE_HOME")
+    if basedir:
+        return Path(basedir) / ToolInfo.TOOLNAME
+    return Path.home() / ".cache" / ToolInfo.TOOLNAME
+
+class StatsCache:
+    """
+    The on-disk cache of the dataframes built from raw statistics files.
+
+    Public methods overview.
+        - get_entry_path() - return the cache entry path for a raw statistics file.
+        - get() - return the cached dataframe, metrics definition dictionary, and categories.
+        - put() - store a dataframe, metrics definition dictionary, and categories in the cache.
+
+    Notes:
+        - The cache is an optimization, so errors are not fatal. They are logged as debug messages
+          and result in a cache miss.
+    """
+
+    def __init__(self, cachedir: Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize a class instance.
+
+        Args:
+            cachedir: Path to the cache directory. Default is the directory returned by
+                      'get_default_cachedir()'.
+            max_size: The maximum total size of the cache entries in bytes.
+        """
+
+        if cachedir is None:
+            cachedir = get_default_cachedir()
+
+        self.cachedir = cachedir
+        self.max_size = max_size
+
+    def get_entry_path(self, stname: str, path: Path, params: dict[str, Any]) -> Path | None:
+        """
+        Calculate the cache key and return the path to the cache entry for a raw statistics file.
+
+        Args:
+            stname: Name of the statistic (e.g., "turbostat").
+            path: Path to the raw statistics file or to the segments manifest.
+            params: The dataframe builder parameters affecting the resulting dataframe, e.g., the
+                    CPU numbers. The 'segments_range' parameter selects the segments to load if
+                    'path' is a segments manifest.
+
+        Returns:
+            Path: The cache entry path, or 'None' if the raw statistics file cannot be hashed.
+
+        Notes:
+            - Calculating the cache key reads the entire raw statistics file, so the cache entry
+              path should be calculated once and passed to both 'get()' and 'put()'.
+        """
+
+        try:
+            stinfo = path.stat()
+
+            hasher = hashlib.sha256()
+            with open(path, "rb") as fobj:
+                while True:
+                    chunk = fobj.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+        except OSError as err:
+            _LOG.debug("Failed to hash raw statistics file '%s': %s", path, err)
+            return None
+
+        key = {"format": _FORMAT_VERSION,
+               "version": ToolInfo.VERSION,
+               "stname": stname,
+               "size": stinfo.st_size,
+               "mtime": stinfo.st_mtime_ns,
+               "hash": hasher.hexdigest(),
+               "params": params}
+
+        if Segments.is_manifest(path):
+            segments = self._get_segments_key(path, params.get("segments_range", (None, None)))
+            if segments is None:
+                return None
+            key["segments"] = segments
+
+        keyhash = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return self.cachedir / f"{stname}-{keyhash}.parquet"
+
+    @staticmethod
+    def _get_segments_key(path: Path, segments_range: Any) -> list[list[Any]] | None:
+        """
+        Return the segments part of the cache key for a segmented raw statistics file.
+
+        Args:
+            path: Path to the segments manifest.
+            segments_range: The '(begin_ts, end_ts)' time-stamps range of the segments to load.
+
+        Returns:
+            The list of '[name, size, mtime]' lists for the selected segment files, or 'None' if the
+            manifest cannot be read or a segment file cannot be accessed.
+
+        Notes:
+            - The segments are not hashed, because the selected segments may be large. The last
+              segment grows while the statistics are being collected, which changes its size and
+              modification time.
+        """
+
+        try:
+            manifest = Segments.read_manifest(path)
+            selected = Segments.select_segments(manifest, begin_ts=segments_range[0],
+                                                end_ts=segments_range[1])
+
+            segments: list[list[Any]] = []
+            for segment in selected:
+                stinfo = (path.parent / segment["name"]).stat()
+                segments.append([segment["name"], stinfo.st_size, stinfo.st_mtime_ns])
+        except (Error, OSError) as err:
+            _LOG.debug("Failed to get the segments of raw statistics file '%s': %s", path, err)
+            return None
+
+        return segments
+
+    def get(self, entry_path: Path) -> tuple[pandas.DataFrame,
+                                             dict[str, MDTypedDict],
+                                             dict[str, Any]] | None:
+        """
+        Return the cached dataframe for a raw statistics file.
+
+        Args:
+            entry_path: The cache entry path returned by 'get_entry_path()'.
+
+        Returns:
+            tuple: A '(df, mdd, categories)' tuple, or 'None' if the dataframe is not in the cache.
+        """
+
+        try:
+            if not entry_path.exists():
+                _LOG.debug("Cache miss: '%s'", entry_path)
+                return None
+
+            table = parquet.read_table(entry_path)
+            metadata = json.loads(table.schema.metadata[_METADATA_KEY])
+            df = table.to_pandas()
+
+            # Mark the entry as recently used.
+            os.utime(entry_path)
+        except Exception as err: # pylint: disable=broad-except
+            _LOG.debug("Failed to read cached dataframe from '%s': %s", entry_path, err)
+            return None
+
+        _LOG.debug("Cache hit: '%s'", entry_path)
+        return df, metadata["mdd"], metadata["categories"]
+
+    def put(self,
+            entry_path: Path,
+            df: pandas.DataFrame,
+            mdd: dict[str, MDTypedDict],
+            categories: dict[str, Any]):
+        """
+        Store the dataframe built for a raw statistics file in the cache.
+
+        Args:
+            entry_path: The cache entry path returned by 'get_entry_path()'.
+            df: The dataframe built for the raw statistics file.
+            mdd: The metrics definition dictionary for the dataframe.
+            categories: The metric categories dictionary for the dataframe.
+        """
+
+        tmp_path: Path | None = None
+
+        try:
+            self.cachedir.mkdir(parents=True, exist_ok=True)
+
+            table = pyarrow.Table.from_pandas(df)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_METADATA_KEY] = json.dumps({"mdd": mdd, "categories": categories})
+            table = table.replace_schema_metadata(metadata)
+
+            # Write to a temporary file first, so that concurrent readers never see partially
+            # written entries.
+            tmp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+            parquet.write_table(table, tmp_path)
+            tmp_path.replace(entry_path)
+            tmp_path = None
+        except Exception as err: # pylint: disable=broad-except
+            _LOG.debug("Failed to cache dataframe in '%s': %s", entry_path, err)
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+            return
+
+        _LOG.debug("Cached dataframe in '%s'", entry_path)
+        self._evict()
+
+    def _evict(self):
+        """Remove the least recently used cache entries until the cache fits the size limit."""
+
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+
+        try:
+            for entry_path in itertools.chain(self.cachedir.glob("*.parquet"),
+                                              self.cachedir.glob("*.npz")):
+                stinfo = entry_path.stat()
+                entries.append((stinfo.st_mtime, stinfo.st_size, entry_path))
+                total += stinfo.st_size
+
+            entries.sort()
+            for _, size, entry_path in entries:
+                if total <= self.max_size:
+                    break
+                _LOG.debug("Evicting cache entry '%s'", entry_path)
+                entry_path.unlink(missing_ok=True)
+                total -= size
+        except OSError as err:
+            _LOG.debug("Failed to evict cache entries in '%s': %s", self.cachedir, err)
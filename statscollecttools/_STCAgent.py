@@ -15,23 +15,30 @@ internal sub-tool of the 'stats-collect' tool, not intended to be used directly
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import os
+import re
 import sys
 import json
+import array
+import asyncio
 import time
 import typing
 import socket
+import select
 import signal
 import tempfile
 import argparse
+import threading
 import contextlib
+import collections
 from pathlib import Path
 from pepclibs.helperlibs import Logging, ArgParse, LocalProcessManager, Trivial, ClassHelpers
 from pepclibs.helperlibs.Exceptions import Error, ErrorPermissionDenied
-from statscollectlibs.helperlibs import ProcHelpers
+from statscollectlibs.helperlibs import Compression, ProcHelpers, ProcSamplers, Segments
 from statscollecttools import ToolInfo, _Common
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Callable, Final, IO, Iterable, Sequence, TypedDict, cast, NoReturn
+    from typing import Any, Awaitable, Callable, Final, IO, Iterable, Sequence, TypedDict, cast
+    from typing import Generator, Iterator, NoReturn
 
     class _CmdlineArgsTypedDict(TypedDict, total=False):
         """
@@ -58,6 +65,22 @@ if typing.TYPE_CHECKING:
 
         outdir: Path
 
+    class _AgentPropsTypedDict(_BasePropsTypedDict, total=False):
+        """
+        Properties of the statistics collection agent.
+
+        Attributes:
+            cpus: Comma-separated list of CPU numbers to run 'stc-agent' and the statistics
+                  collectors on.
+            nice: The niceness to run 'stc-agent' and the statistics collectors with.
+            cgroup: Path to the cgroup directory to run 'stc-agent' and the statistics collectors
+                    in.
+        """
+
+        cpus: str
+        nice: int
+        cgroup: Path
+
     class _BaseCollectorPropsTypedDict(_BasePropsTypedDict, total=False):
         """
         Base properties shared by all statistics collectors.
@@ -67,12 +90,19 @@ if typing.TYPE_CHECKING:
             logdir: The directory for collector standard error output.
             interval: The statistics collection interval.
             toolpath: Path to the collector tool binary.
+            compress: The output file compression method, e.g., "gzip".
+            segment_time: Roll the output over to a new segment every 'segment_time' seconds.
+            segment_size: Roll the output over to a new segment when the current segment size
+                          reaches 'segment_size' bytes.
         """
 
         fallible: bool
         logdir: Path
         interval: str
         toolpath: Path
+        compress: str
+        segment_time: int
+        segment_size: int
 
     class _TurbostatPropsTypedDict(_BaseCollectorPropsTypedDict, total=False):
         """
@@ -84,6 +114,20 @@ if typing.TYPE_CHECKING:
 
         opts: str
 
+    class _InterruptsPropsTypedDict(_BaseCollectorPropsTypedDict, total=False):
+        """
+        Properties for the interrupts statistics collector.
+
+        Attributes:
+            keyframes: Write every 'keyframes'-th '/proc/interrupts' snapshot in full, and only the
+                       changed interrupt counters in between.
+            helper: Take the '/proc/interrupts' snapshots with the external 'toolpath' helper
+                    process instead of taking them in the 'stc-agent' process.
+        """
+
+        keyframes: int
+        helper: bool
+
     class _IPMIPropsTypedDict(_BaseCollectorPropsTypedDict, total=False):
         """
         Base properties for IPMI statistics collectors.
@@ -91,10 +135,12 @@ if typing.TYPE_CHECKING:
         Attributes:
             retries: Number of retries for IPMI commands.
             count: Number of IPMI readings per interval.
+            sensors: Comma-separated list of IPMI sensor names and metric categories to collect.
         """
 
         retries: int
         count: int
+        sensors: str
 
     class _IPMIOOBPropsTypedDict(_IPMIPropsTypedDict, total=False):
         """
@@ -163,14 +209,63 @@ _DELIMITER: Final[str] = "--"
 
 # Names of the supported statistics.
 _SUPPORTED_STATS: Final[tuple[str, ...]] = ("turbostat", "interrupts", "ipmi-oob", "ipmi-inband",
-                                            "acpower")
+                                            "ipmi-power", "acpower", "stc-overhead")
 
 # Idle time in seconds after which 'stc-agent' exits if no client connects.
 _NO_CLIENT_TIMEOUT: Final[int] = 3600
 
+# Maximum count of client connections waiting to be accepted.
+_MAX_PENDING_CLIENTS: Final[int] = 16
+
+# Maximum size of a client command in bytes.
+_MAX_COMMAND_SIZE: Final[int] = 1024 * 1024
+
+# The commands that only query the agent state. They do not wait for the commands that change the
+# agent state and are being processed for other clients.
+_QUERY_COMMANDS: Final[tuple[str, ...]] = ("get-failed-collectors", "get-latest")
+
+# How often in seconds the output files of the collectors are checked for new samples when
+# following them.
+_TAIL_POLL_INTERVAL: Final[float] = 0.1
+
+# Maximum amount of bytes read from a collector output file at a time when following it.
+_TAIL_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# Maximum amount of bytes buffered for sending to a subscriber. When the subscriber reads slower
+# than the collectors write, streaming to it pauses until it catches up.
+_SUBSCRIBE_BUFFER_SIZE: Final[int] = 256 * 1024
+
+# The commands that cannot be sent in a batch.
+_NON_BATCH_COMMANDS: Final[tuple[str, ...]] = ("batch", "exit", "subscribe")
+
+# How often in seconds the compressed collector output is flushed. Everything written by a collector
+# before the last flush can be decompressed even if the agent is terminated abruptly.
+_COMPRESS_FLUSH_INTERVAL: Final[float] = 1.0
+
+# Maximum amount of bytes read from a collector output pipe at a time when compressing the output.
+_COMPRESS_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# The maximum size of the collector output preceding the first sample. This output is copied to the
+# beginning of every output segment. If the first sample is not found within this size, the output
+# is not split into segments.
+_SEGMENT_MAX_HEADER_SIZE: Final[int] = 1024 * 1024
+
+# Names of the statistics the recent samples are kept for the 'get-latest' command.
+_LATEST_STATS: Final[tuple[str, ...]] = ("turbostat", "interrupts")
+
+# Maximum count of the recent samples kept for the 'get-latest' command per statistic.
+_LATEST_SAMPLES_CNT: Final[int] = 3600
+
+# Maximum time in seconds the first 'get-latest' command for a statistic waits for the already
+# collected samples to be parsed.
+_LATEST_CATCHUP_TIMEOUT: Final[float] = 10.0
+
 # Configure the root 'main' logger, not a child logger, to also capture 'main.pepc.*' messages.
 _LOG = Logging.getLogger(Logging.MAIN_LOGGER_NAME).configure(prefix=_TOOLNAME)
 
+# The thread taking the samples of all the in-process statistics collectors on a shared timer.
+_SAMPLER_THREAD: Final[ProcSamplers.SamplerThread] = ProcSamplers.SamplerThread("stc-agent-sampler")
+
 class _ClientDisconnected(Exception):
     """Raise when a client disconnects."""
 
@@ -183,6 +278,9 @@ class _NoClientTimeout(Exception):
 class _PrematureExitError(Error):
     """Raise when a collector process exits before it was asked to stop."""
 
+class _StopFollowing(Exception):
+    """Raise to stop parsing the output file of a statistics collector."""
+
 class _BaseCollector(ClassHelpers.SimpleCloseContext):
     """
     The base class for statistics collectors.
@@ -226,6 +324,12 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
         self.props["logdir"] = _UNINITIALIZED["required_path"]
         # The statistics collection interval.
         self.props["interval"] = _UNINITIALIZED["required_str"]
+        # The output file compression method. The output is not compressed by default.
+        self.props["compress"] = _UNINITIALIZED["str"]
+        # The output file roll over period and size. The output is not split into segments by
+        # default.
+        self.props["segment_time"] = _UNINITIALIZED["int"]
+        self.props["segment_size"] = _UNINITIALIZED["int"]
 
         # The local process manager object.
         self._pman: LocalProcessManager.LocalProcessManager = pman
@@ -242,10 +346,44 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
         self._fobj: IO[bytes] | None = None
         # The statistics collector process.
         self._proc: LocalProcessManager.LocalProcess | None = None
-        # The full path to the output file.
+        # The full path to the output file. In case of segmented output, the path to the segment
+        # currently written to.
         self._outpath: Path | None = None
+        # The output file path and the size of the header it starts with, for '_StatsTail'. The
+        # header size is non-zero only for the output segments following the first one.
+        self._output: tuple[Path, int] | None = None
         # Whether 'configure()' has been called and the collector is ready to use.
         self._configured: bool = False
+        # Whether the collector output is piped through the '_pump()' thread.
+        self._piped: bool = False
+        # The thread writing the piped collector output, and the error message if it failed.
+        self._pump_thread: threading.Thread | None = None
+        self._pump_error: str = ""
+        # The compressor writing to the output file, 'None' if the output is not compressed.
+        self._compressor: Compression.StreamCompressor | None = None
+        # The first and the last bytes of the piped collector output, for 'validate()'.
+        self._head: bytes = b""
+        self._tail: bytes = b""
+        # Whether the in-process sampler has been started and the output has not been saved yet.
+        self._sampling: bool = False
+        # The monotonic time the compressed output of the in-process sampler has to be flushed by,
+        # 'None' if there is no data to flush.
+        self._flush_time: float | None = None
+
+        # The segmented output manifest path and contents. The path is 'None' if the output is not
+        # segmented.
+        self._manifest_path: Path | None = None
+        self._manifest: Segments.ManifestTypedDict = Segments.new_manifest()
+        # The output file name segment file names are derived from.
+        self._segments_outfile: str = ""
+        # The header copied to the beginning of every segment, 'None' until the first sample is
+        # found. The output preceding the first sample is accumulated in '_header_buf'.
+        self._header: bytes | None = None
+        self._header_buf: bytes = b""
+        # Whether the output can be rolled over to a new segment.
+        self._can_roll: bool = False
+        # The monotonic time the current segment was started at.
+        self._segment_start: float = 0.0
 
         #
         # These attributes can/should be set by child classes.
@@ -257,11 +395,26 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
         self._valid_start: bytes = b""
         self._valid_end: bytes = b""
         self._signal: signal.Signals = signal.SIGTERM
+        # The in-process sampler and the sampling interval in seconds. If the sampler is set, the
+        # statistics are sampled in the 'stc-agent' process instead of running '_command'.
+        self._sampler: ProcSamplers.SamplerBase | None = None
+        self._sample_interval: float = 0.0
+        # The regular expression matching the beginning of a sample in the collector output, used
+        # for splitting the output into segments. The 'ts' group must match the sample time-stamp,
+        # if it is available. The optional 'cont' group matches if the sample depends on the
+        # preceding samples, so that a new segment cannot start with it. 'None' means that
+        # segmented output is not supported.
+        self._sample_regex: re.Pattern[bytes] | None = None
 
     def close(self):
         """Close the collector and release its resources."""
 
-        ClassHelpers.close(self, close_attrs=("_proc", "_fobj"), unref_attrs=("_pman",))
+        if getattr(self, "_sampling", False):
+            _SAMPLER_THREAD.remove(self.name)
+            self._sampling = False
+
+        ClassHelpers.close(self, close_attrs=("_proc", "_fobj", "_sampler"),
+                           unref_attrs=("_pman",))
 
     def _error(self, msgformat, *args) -> NoReturn:
         """The collector error handler."""
@@ -273,6 +426,38 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
 
         raise Error(f"The '{self.name}' statistics collector failed:\n{msg}")
 
+    @property
+    def outpath(self) -> Path | None:
+        """Return the output file path, or 'None' if the collector is not configured."""
+
+        return self.output[0]
+
+    @property
+    def output(self) -> tuple[Path | None, int]:
+        """
+        Return the output file path and the size of the header at the beginning of the file, which
+        is a copy of the header of the first output segment. The path is 'None' if the collector is
+        not configured.
+        """
+
+        # Take a reference to the tuple, because it is replaced by the '_pump()' thread.
+        output = self._output
+        if not self._configured or not output:
+            return None, 0
+        return output
+
+    @property
+    def pid(self) -> int | None:
+        """
+        Return PID of the collector process, or 'None' if the collector process is not running,
+        e.g., if the statistics are sampled in the 'stc-agent' process.
+        """
+
+        proc = self._proc
+        if proc is None:
+            return None
+        return proc.pid
+
     def _sync(self):
         """Synchronize all the collector files."""
 
@@ -317,7 +502,28 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
 
         self._handle_dirs()
 
-        self._outpath = self.props["outdir"] / self._outfile
+        outfile = self._outfile
+        if self.props["compress"] is not _UNINITIALIZED["str"]:
+            try:
+                Compression.check_method(self.props["compress"])
+            except Error as err:
+                self._error(err)
+            outfile = Compression.add_suffix(outfile, self.props["compress"])
+
+        self._manifest_path = None
+        if self._segmented():
+            if not self._sample_regex:
+                self._error("Segmented output is not supported")
+            for prop in ("segment_time", "segment_size"):
+                val = self.props[prop]
+                if val is not _UNINITIALIZED["int"] and val <= 0:
+                    self._error("Bad '%s' value %d: Must be a positive integer", prop, val)
+
+            self._manifest_path = self.props["outdir"] / Segments.get_manifest_name(self._outfile)
+            self._segments_outfile = outfile
+            outfile = Segments.get_segment_name(outfile, 0)
+
+        self._outpath = self.props["outdir"] / outfile
 
         if self._fobj is not None:
             self._fobj.close()
@@ -331,8 +537,36 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
 
         # Paranoid sync to minimise the chance of data loss if the process is terminated.
         self._sync()
+
+        if self._manifest_path:
+            # Write the manifest right away, so that the output is readable even if the collector
+            # crashes before the first roll over.
+            self._manifest = Segments.new_manifest()
+            self._manifest["segments"].append({"name": outfile, "begin": None, "end": None})
+            try:
+                Segments.write_manifest(self._manifest_path, self._manifest)
+            except Error as err:
+                self._error(err)
+
+        self._output = (self._outpath, 0)
         self._configured = True
 
+    def _set_sample_interval(self):
+        """Set the in-process sampling interval to the value of the 'interval' property."""
+
+        try:
+            self._sample_interval = float(self.props["interval"])
+        except ValueError:
+            self._error("Bad interval '%s': Must be a number", self.props["interval"])
+        if self._sample_interval <= 0:
+            self._error("Bad interval '%s': Must be positive", self.props["interval"])
+
+    def _segmented(self) -> bool:
+        """Return 'True' if the collector output should be split into segments."""
+
+        return self.props["segment_time"] is not _UNINITIALIZED["int"] or \
+               self.props["segment_size"] is not _UNINITIALIZED["int"]
+
     def _kill_stale(self, regex: str = ""):
         """Kill stale collector processes that might still be running."""
 
@@ -354,15 +588,285 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
         if not self._configured:
             self._error("The collector was not configured")
 
-        if self._proc is not None:
+        if self._proc is not None or self._sampling:
             self._error("BUG: The collector is already running")
 
-        self._proc = self._pman.run_async(self._command, stderr=self._fobj, stdout=self._fobj,
-                                          newgrp=True, su=self._su)
+        self._piped = self._sampler is not None or \
+                      self.props["compress"] is not _UNINITIALIZED["str"] or \
+                      self._manifest_path is not None
+
+        if not self._piped:
+            self._proc = self._pman.run_async(self._command, stderr=self._fobj, stdout=self._fobj,
+                                              newgrp=True, su=self._su)
+            return
+
+        # Pipe the collector output through the thread compressing it and splitting it into
+        # segments, or write the in-process sampler output the same way.
+        assert self._fobj is not None
+        self._compressor = None
+        if self.props["compress"] is not _UNINITIALIZED["str"]:
+            self._compressor = Compression.StreamCompressor(self.props["compress"], self._fobj)
+
+        self._header = None
+        self._header_buf = b""
+        self._can_roll = self._manifest_path is not None
+        self._segment_start = time.monotonic()
+        self._pump_error = ""
+        self._head = self._tail = b""
+
+        if self._sampler:
+            self._flush_time = None
+            _SAMPLER_THREAD.add(self.name, self._sample_interval, self._sample)
+            self._sampling = True
+            return
+
+        rfd, wfd = os.pipe()
+        try:
+            with open(wfd, "wb", buffering=0) as wfobj:
+                self._proc = self._pman.run_async(self._command, stderr=wfobj, stdout=wfobj,
+                                                  newgrp=True, su=self._su)
+        except BaseException:
+            os.close(rfd)
+            raise
+
+        self._pump_thread = threading.Thread(target=self._pump, args=(rfd,),
+                                             name=f"{self.name}-pump", daemon=True)
+        self._pump_thread.start()
+
+    def _write_output(self, data: bytes):
+        """
+        Write the collector output to the output file, compress it if needed.
+
+        Args:
+            data: The collector output to write.
+        """
+
+        if self._compressor:
+            self._compressor.write(data)
+        else:
+            assert self._fobj is not None
+            self._fobj.write(data)
+
+    def _track(self, data: bytes):
+        """
+        Remember the first and the last bytes of the collector output for 'validate()'.
+
+        Args:
+            data: The collector output chunk to remember the bytes of.
+        """
+
+        if len(self._head) < len(self._valid_start):
+            self._head += data[:len(self._valid_start) - len(self._head)]
+        if self._valid_end:
+            self._tail = (self._tail + data)[-len(self._valid_end):]
+
+    def _finish_output(self):
+        """Flush the compressed output and write the final segments manifest."""
+
+        if self._compressor:
+            self._compressor.close()
+        if self._manifest_path:
+            Segments.write_manifest(self._manifest_path, self._manifest)
+
+    def _segment_full(self) -> bool:
+        """Return 'True' if the output should be rolled over to a new segment."""
+
+        segment_time = self.props["segment_time"]
+        if segment_time is not _UNINITIALIZED["int"] and \
+           time.monotonic() - self._segment_start >= segment_time:
+            return True
+
+        segment_size = self.props["segment_size"]
+        assert self._fobj is not None
+        return segment_size is not _UNINITIALIZED["int"] and self._fobj.tell() >= segment_size
+
+    def _roll_over(self):
+        """Finish the current output segment and start a new one."""
+
+        assert self._fobj is not None and self._manifest_path is not None
+        assert self._header is not None
+
+        if self._compressor:
+            self._compressor.close()
+        self._sync()
+
+        name = Segments.get_segment_name(self._segments_outfile, len(self._manifest["segments"]))
+        path = self.props["outdir"] / name
+
+        # pylint: disable-next=consider-using-with
+        fobj = open(path, "wb+", buffering=0)
+        self._fobj.close()
+        self._fobj = fobj
+        self._outpath = path
+
+        if self._compressor:
+            self._compressor = Compression.StreamCompressor(self._compressor.method, self._fobj)
+
+        self._write_output(self._header)
+        self._segment_start = time.monotonic()
+
+        self._manifest["segments"].append({"name": name, "begin": None, "end": None})
+        Segments.write_manifest(self._manifest_path, self._manifest)
+
+        _LOG.debug("'%s': Rolled the output over to '%s'", self.name, path)
+        self._output = (path, len(self._header))
+
+    def _write_segmented(self, data: bytes):
+        """
+        Write complete lines of the collector output to the output segments. Roll the output over
+        to a new segment at the beginning of a sample, if the current segment is full.
+
+        Args:
+            data: The collector output to write, must end at a line boundary.
+        """
+
+        assert self._sample_regex is not None
+
+        pos = 0
+        segment = self._manifest["segments"][-1]
+
+        for match in self._sample_regex.finditer(data):
+            if self._header is None:
+                if not self._can_roll:
+                    break
+                # The output preceding the first sample is copied to the beginning of every
+                # segment.
+                self._header = self._header_buf + data[:match.start()]
+                self._header_buf = b""
+                self._manifest["header_size"] = len(self._header)
+            elif self._can_roll and not match.groupdict().get("cont") and self._segment_full():
+                self._write_output(data[pos:match.start()])
+                pos = match.start()
+                self._roll_over()
+                segment = self._manifest["segments"][-1]
+
+            ts = match["ts"]
+            if ts:
+                if segment["begin"] is None:
+                    segment["begin"] = float(ts)
+                segment["end"] = float(ts)
+
+        if self._header is None and self._can_roll:
+            self._header_buf += data
+            if len(self._header_buf) > _SEGMENT_MAX_HEADER_SIZE:
+                _LOG.warning("'%s': No samples found in the first %d bytes of the output, not "
+                             "splitting it into segments", self.name, _SEGMENT_MAX_HEADER_SIZE)
+                self._can_roll = False
+                self._header_buf = b""
+
+        self._write_output(data[pos:])
+
+    def _pump(self, rfd: int):
+        """
+        Read the collector output from a pipe and write it to the output file until the collector
+        process exits. Compress the output and split it into segments, if configured. Runs in a
+        separate thread.
+
+        Args:
+            rfd: The read end of the collector output pipe, closed when the collector exits.
+
+        Notes:
+            - The compressed output is flushed '_COMPRESS_FLUSH_INTERVAL' seconds after the oldest
+              not flushed data were written by the collector.
+            - In case of segmented output, the incomplete last line of the output is not written
+              until it is complete, because the output is rolled over only at line boundaries.
+        """
+
+        flush_time: float | None = None
+        # The incomplete last line of the collector output.
+        pending = b""
+
+        try:
+            with open(rfd, "rb", buffering=0) as pipe:
+                while True:
+                    timeout = None
+                    if flush_time is not None:
+                        timeout = max(0.0, flush_time - time.monotonic())
+
+                    if not select.select([pipe], [], [], timeout)[0]:
+                        assert self._compressor is not None
+                        self._compressor.flush()
+                        flush_time = None
+                        continue
+
+                    data = pipe.read(_COMPRESS_CHUNK_SIZE)
+                    if not data:
+                        break
+
+                    self._track(data)
+
+                    if self._manifest_path:
+                        data = pending + data
+                        idx = data.rfind(b"\n") + 1
+                        if not idx and len(data) < _COMPRESS_CHUNK_SIZE:
+                            pending = data
+                            continue
+                        if idx:
+                            data, pending = data[:idx], data[idx:]
+                        else:
+                            # A very long line, do not hold it back.
+                            pending = b""
+                        self._write_segmented(data)
+                    else:
+                        self._write_output(data)
+
+                    if self._compressor and flush_time is None:
+                        flush_time = time.monotonic() + _COMPRESS_FLUSH_INTERVAL
+
+            if pending:
+                self._write_output(pending)
+            self._finish_output()
+        except (OSError, ValueError, Error) as err:
+            self._pump_error = f"Failed to write the output to '{self._outpath}':\n{err}"
+
+    def _sample(self) -> bool:
+        """
+        Take a sample with the in-process sampler and write it to the output file. Compress the
+        output and split it into segments, if configured. Runs in the sampler thread.
+
+        Returns:
+            'True' if sampling should continue, 'False' if it failed.
+
+        Notes:
+            - The compressed output is flushed no later than '_COMPRESS_FLUSH_INTERVAL' seconds
+              after the oldest not flushed sample was taken, same as in '_pump()'.
+        """
+
+        assert self._sampler is not None
+
+        try:
+            data = self._sampler.sample()
+            self._track(data)
+
+            if self._manifest_path:
+                self._write_segmented(data)
+            else:
+                self._write_output(data)
+
+            if self._compressor:
+                now = time.monotonic()
+                if self._flush_time is None:
+                    self._flush_time = now + _COMPRESS_FLUSH_INTERVAL
+                # Flush now if the next sample is due after the flush time.
+                if now + self._sample_interval >= self._flush_time:
+                    self._compressor.flush()
+                    self._flush_time = None
+        except (OSError, ValueError, Error) as err:
+            self._pump_error = f"Failed to write the output to '{self._outpath}':\n{err}"
+            return False
+
+        return True
 
     def end(self):
         """Signal the collector process to stop."""
 
+        if self._sampler and self._sampling:
+            _SAMPLER_THREAD.remove(self.name)
+            if self._pump_error:
+                raise _PrematureExitError(f"The '{self.name}' statistics collector failed:\n"
+                                          f"Sampling stopped prematurely:\n{self._pump_error}")
+            return
+
         if self._proc is None:
             self._error("BUG: The collector is not running")
 
@@ -389,6 +893,19 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
     def save(self):
         """Wait for the collector process to exit and save the collected statistics."""
 
+        if self._sampler and self._sampling:
+            _SAMPLER_THREAD.remove(self.name)
+            self._sampling = False
+            try:
+                self._finish_output()
+            except (OSError, ValueError, Error) as err:
+                if not self._pump_error:
+                    self._pump_error = f"Failed to write the output to '{self._outpath}':\n{err}"
+            if self._pump_error:
+                self._error(self._pump_error)
+            self._sync()
+            return
+
         if self._proc is None:
             self._error("BUG: The collector is not running")
 
@@ -403,6 +920,16 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
             self._proc.close()
             self._proc = None
 
+        if self._pump_thread:
+            # The collector process exited, so the output pipe is closed, unless the collector
+            # child processes are still running.
+            self._pump_thread.join(timeout=10)
+            if self._pump_thread.is_alive():
+                self._error("The output pipe of the collector is still open")
+            self._pump_thread = None
+            if self._pump_error:
+                self._error(self._pump_error)
+
         self._sync()
 
     def validate(self):
@@ -412,17 +939,23 @@ class _BaseCollector(ClassHelpers.SimpleCloseContext):
             self._error("BUG: The output file object is not initialized")
 
         if self._valid_start:
-            self._fobj.seek(0)
-            buf = self._fobj.read(len(self._valid_start))
+            if self._piped:
+                buf = self._head
+            else:
+                self._fobj.seek(0)
+                buf = self._fobj.read(len(self._valid_start))
             if buf != self._valid_start:
                 self._error("Failed to validate the collected statistics:\nThe output file '%s' "
                             "does not start with the required pattern\nExpected '%s', got '%s'",
                             self._outpath, self._valid_start.decode("utf-8"), buf.decode("utf-8"))
 
         if self._valid_end:
-            length = len(self._valid_end)
-            self._fobj.seek(-length, 2)
-            buf = self._fobj.read(len(self._valid_end))
+            if self._piped:
+                buf = self._tail
+            else:
+                length = len(self._valid_end)
+                self._fobj.seek(-length, 2)
+                buf = self._fobj.read(len(self._valid_end))
             if buf != self._valid_end:
                 self._error("Failed to validate the collected statistics:\nThe output file '%s' "
                             "does not end with the required pattern\nExpected '%s', got '%s'",
@@ -441,6 +974,9 @@ class _TurbostatCollector(_BaseCollector):
 
         self.props["toolpath"] = Path("turbostat")
         self.props["opts"] = _UNINITIALIZED["str"]
+        # Every turbostat table starts with the heading line, followed by the system totals line.
+        self._sample_regex = re.compile(rb"^Time_Of_Day_Seconds\s[^\n]*\n(?:(?P<ts>\d+\.\d+)\s)?",
+                                        re.MULTILINE)
 
         # Kill any stale 'turbostat' processes left over from a previous run.
         self._kill_stale()
@@ -473,8 +1009,19 @@ class _InterruptsCollector(_BaseCollector):
 
         super().__init__("interrupts", pman=pman)
 
+        if typing.TYPE_CHECKING:
+            self.props = cast(_InterruptsPropsTypedDict, self.props)
+
         self.props["toolpath"] = Path("stc-agent-proc-interrupts-helper")
+        self.props["keyframes"] = _UNINITIALIZED["int"]
+        # The snapshots are taken in the 'stc-agent' process by default, which is cheaper than
+        # running the helper process.
+        self.props["helper"] = False
         self._signal = signal.SIGINT
+        # The delta snapshots of the compact format depend on the preceding snapshots, so a segment
+        # must start with a complete snapshot.
+        self._sample_regex = re.compile(rb"^(?:Timestamp|(?P<cont>Delta)): (?P<ts>\d+\.\d+)",
+                                        re.MULTILINE)
 
         # Kill any stale interrupts helper processes left over from a previous run.
         self._kill_stale()
@@ -484,7 +1031,29 @@ class _InterruptsCollector(_BaseCollector):
 
         super().configure()
 
-        self._command = f"{self.props['toolpath']} --interval {self.props['interval']}"
+        if typing.TYPE_CHECKING:
+            self.props = cast(_InterruptsPropsTypedDict, self.props)
+
+        if self._sampler:
+            self._sampler.close()
+            self._sampler = None
+
+        if self.props["helper"]:
+            self._command = f"{self.props['toolpath']} --interval {self.props['interval']}"
+            if self.props["keyframes"] is not _UNINITIALIZED["int"]:
+                self._command += f" --keyframes '{self.props['keyframes']}'"
+            return
+
+        self._set_sample_interval()
+
+        keyframes = 1
+        if self.props["keyframes"] is not _UNINITIALIZED["int"]:
+            keyframes = self.props["keyframes"]
+
+        try:
+            self._sampler = ProcSamplers.InterruptsSampler(keyframes=keyframes)
+        except Error as err:
+            self._error(err)
 
 class _IPMICollector(_BaseCollector):
     """Base class for IPMI statistics collectors."""
@@ -500,7 +1069,9 @@ class _IPMICollector(_BaseCollector):
         self.props["toolpath"] = Path("stc-agent-ipmi-helper")
         self.props["retries"] = _UNINITIALIZED["int"]
         self.props["count"] = _UNINITIALIZED["int"]
-        self._valid_start = b"timestamp | "
+        self.props["sensors"] = _UNINITIALIZED["str"]
+        self._valid_start = b"Timestamp | "
+        self._sample_regex = re.compile(rb"^Timestamp \| (?P<ts>\d+\.\d+)", re.MULTILINE)
 
     def configure(self):
         """Configure the statistics collector."""
@@ -515,6 +1086,8 @@ class _IPMICollector(_BaseCollector):
             self._command += f" --retries '{self.props['retries']}'"
         if self.props["count"] is not _UNINITIALIZED["int"]:
             self._command += f" --count '{self.props['count']}'"
+        if self.props["sensors"] is not _UNINITIALIZED["str"]:
+            self._command += f" --sensors '{self.props['sensors']}'"
 
 class _IPMIInBandCollector(_IPMICollector):
     """The in-band IPMI statistics collector."""
@@ -530,10 +1103,10 @@ class _IPMIInBandCollector(_IPMICollector):
 class _IPMIOOBCollector(_IPMICollector):
     """The out-of-band IPMI statistics collector."""
 
-    def __init__(self, pman: LocalProcessManager.LocalProcessManager):
+    def __init__(self, pman: LocalProcessManager.LocalProcessManager, name: str = "ipmi-oob"):
         """Initialize a class instance."""
 
-        super().__init__("ipmi-oob", pman=pman)
+        super().__init__(name, pman=pman)
 
         if typing.TYPE_CHECKING:
             self.props = cast(_IPMIOOBPropsTypedDict, self.props)
@@ -543,6 +1116,22 @@ class _IPMIOOBCollector(_IPMICollector):
         self.props["pwdfile"] = _UNINITIALIZED["path"]
         self.props["interface"] = _UNINITIALIZED["str"]
 
+        # The helper mode option, empty string means the default (sensors reading) mode.
+        self._modeopt = ""
+
+    def _get_stale_regex(self) -> str:
+        """
+        Return the regular expression matching the stale helper processes of the collector. The
+        'ipmi-oob' and 'ipmi-power' collectors run the same helper for the same host, so the regular
+        expression includes the helper mode.
+        """
+
+        toolname = re.escape(os.path.basename(self.props["toolpath"]))
+        hostopt = f" --host '?{re.escape(self.props['host'])}'?(?: |$)"
+        if self._modeopt:
+            return f"{toolname}.*{hostopt}.* {self._modeopt}"
+        return f"{toolname}(?!.* --dcmi-power).*{hostopt}"
+
     def configure(self):
         """Configure the statistics collector."""
 
@@ -551,17 +1140,27 @@ class _IPMIOOBCollector(_IPMICollector):
         if typing.TYPE_CHECKING:
             self.props = cast(_IPMIOOBPropsTypedDict, self.props)
 
-        hostopt = f" --host '{self.props['host']}'"
-        self._command += hostopt
+        self._command += f" --host '{self.props['host']}'"
         if self.props["user"] is not _UNINITIALIZED["str"]:
             self._command += f" --user '{self.props['user']}'"
         if self.props["pwdfile"] is not _UNINITIALIZED["path"]:
             self._command += f" --password-file '{self.props['pwdfile']}'"
         if self.props["interface"] is not _UNINITIALIZED["str"]:
             self._command += f" -I '{self.props['interface']}'"
+        if self._modeopt:
+            self._command += f" {self._modeopt}"
 
-        toolname = os.path.basename(self.props["toolpath"])
-        self._kill_stale(regex=f"{toolname}.*{hostopt}")
+        self._kill_stale(regex=self._get_stale_regex())
+
+class _IPMIPowerCollector(_IPMIOOBCollector):
+    """The out-of-band DCMI power reading statistics collector."""
+
+    def __init__(self, pman: LocalProcessManager.LocalProcessManager):
+        """Initialize a class instance."""
+
+        super().__init__(pman, name="ipmi-power")
+
+        self._modeopt = "--dcmi-power"
 
 class _ACPowerCollector(_BaseCollector):
     """The ACPower statistics collector."""
@@ -578,6 +1177,8 @@ class _ACPowerCollector(_BaseCollector):
         self.props["devnode"] = _UNINITIALIZED["required_str"]
         self.props["pmtype"] = _UNINITIALIZED["str"]
         self._signal: signal.Signals = signal.SIGINT
+        # Every CSV line following the heading line is a sample starting with the time-stamp.
+        self._sample_regex = re.compile(rb"^(?P<ts>\d+\.\d+),", re.MULTILINE)
 
     def configure(self):
         """Configure the statistics collector."""
@@ -611,6 +1212,43 @@ class _ACPowerCollector(_BaseCollector):
         items = "T,P,I,V,S,Q,Phi,Fv,Vrange,Irange"
         self._command = f"{cmd} read {items}"
 
+class _OverheadCollector(_BaseCollector):
+    """
+    The collection overhead statistics collector - periodically sample the CPU time, memory, context
+    switches, and disk I/O of the 'stc-agent' process and of the other collectors processes.
+    """
+
+    def __init__(self, pman: LocalProcessManager.LocalProcessManager,
+                 get_pids: Callable[[], dict[str, int]]):
+        """
+        Initialize a class instance.
+
+        Args:
+            pman: The process manager to use for running collector processes.
+            get_pids: A function returning PIDs of the running collector processes, indexed by the
+                      collector names.
+        """
+
+        super().__init__("stc-overhead", pman=pman)
+
+        self._get_pids = get_pids
+        self._valid_start = b"Timestamp: "
+        self._sample_regex = re.compile(rb"^Timestamp: (?P<ts>\d+\.\d+)", re.MULTILINE)
+
+    def configure(self):
+        """Configure the statistics collector."""
+
+        super().configure()
+
+        if self._sampler:
+            self._sampler.close()
+            self._sampler = None
+
+        self._set_sample_interval()
+        # The in-process collectors are sampled in the 'stc-agent' process, so their overhead is
+        # accounted to 'stc-agent'.
+        self._sampler = ProcSamplers.OverheadSampler(self._get_pids, self_name="stc-agent")
+
 class _STCAgent(ClassHelpers.SimpleCloseContext):
     """
     The statistics collection agent class implementing all statistics collection functionality.
@@ -624,6 +1262,7 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
     - 'add_label()': add a label.
     - 'start()': start collecting the statistics.
     - 'stop()': stop collecting the statistics.
+    - 'get_latest()': return the aggregates of the recently collected samples.
     - 'close()': stop all running collectors and release resources.
     """
 
@@ -639,11 +1278,22 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
 
         # The labels file object.
         self._lfobj: IO[str] | None = None
+        # The recent samples of the running collectors, indexed by statistics names. Parsing the
+        # collector output starts on the first 'get-latest' command for the statistic.
+        self._latest: dict[str, _LatestSamples] = {}
+        # Protects 'self._latest', which is modified by the 'get-latest' command while other
+        # commands are running.
+        self._latest_lock = threading.Lock()
 
         # Statistics collection agent properties.
-        self.props: _BasePropsTypedDict = {}
+        self.props: _AgentPropsTypedDict = {}
         # The output directory where data like labels will be stored.
         self.props["outdir"] = _UNINITIALIZED["path"]
+        # The CPUs, the niceness, and the cgroup to run the statistics collectors with. Used for
+        # keeping the collectors off the measured CPUs.
+        self.props["cpus"] = _UNINITIALIZED["str"]
+        self.props["nice"] = _UNINITIALIZED["int"]
+        self.props["cgroup"] = _UNINITIALIZED["path"]
 
     @property
     def started(self) -> bool:
@@ -654,6 +1304,12 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
     def close(self):
         """Kill all running collectors and release resources."""
 
+        if hasattr(self, "_latest_lock"):
+            with self._latest_lock:
+                for latest in self._latest.values():
+                    latest.close()
+                self._latest = {}
+
         for collector in self._collectors.values():
             collector.close()
 
@@ -720,7 +1376,9 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
             "interrupts":  _InterruptsCollector,
             "ipmi-oob":    _IPMIOOBCollector,
             "ipmi-inband": _IPMIInBandCollector,
+            "ipmi-power":  _IPMIPowerCollector,
             "acpower":     _ACPowerCollector,
+            "stc-overhead": lambda pman: _OverheadCollector(pman, self._get_collector_pids),
         }
 
         for name in stnames:
@@ -746,6 +1404,47 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
 
         _LOG.debug("Created the collectors")
 
+    def _get_collector_pids(self) -> dict[str, int]:
+        """
+        Return PIDs of the running collector processes. Runs in the sampler thread.
+
+        Returns:
+            A dictionary indexed by the collector names with PIDs of the collector processes as
+            values.
+        """
+
+        pids = {}
+        # Take a copy, because the collectors may be re-created in the main thread.
+        for name, collector in list(self._collectors.items()):
+            pid = collector.pid
+            if pid is not None:
+                pids[name] = pid
+        return pids
+
+    def get_output(self, stname: str) -> tuple[Path | None, int]:
+        """
+        Return the output file path of a statistics collector, and the size of the header the
+        output file starts with. In case of segmented output, the path to the segment currently
+        written to. The header is a copy of the header of the first segment.
+
+        Args:
+            stname: Name of the statistics collected by the collector.
+
+        Returns:
+            A tuple of the output file path and the header size. The path is 'None' if the collector
+            is not configured. The header size is non-zero only for the segments following the
+            first one.
+        """
+
+        # Take a reference to the dictionary, because it may be modified by a command running in
+        # another thread.
+        collectors = self._collectors
+        if stname not in collectors:
+            active = ", ".join(collectors)
+            raise Error(f"Collector '{stname}' is not active, active collectors are:\n{active}")
+
+        return collectors[stname].output
+
     @staticmethod
     def _set_obj_property(obj: _BaseCollector | _STCAgent, name: str, value: str):
         """
@@ -855,6 +1554,98 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
             except OSError as err:
                 raise Error(f"Cannot create 'stc-agent' output directory '{path}':\n{err}") from err
 
+    def _get_cpus(self) -> list[int]:
+        """
+        Parse and validate the 'cpus' property.
+
+        Returns:
+            The list of CPU numbers to run 'stc-agent' and the statistics collectors on.
+        """
+
+        cpus = Trivial.split_csv_line_int(self.props["cpus"], what="'stc-agent' CPUs")
+        if not cpus:
+            raise Error("Bad 'stc-agent' CPUs: The CPUs list is empty")
+        for cpu in cpus:
+            if cpu < 0:
+                raise Error(f"Bad 'stc-agent' CPU number '{cpu}': Must be a non-negative integer")
+        return cpus
+
+    def _check_placement(self, pname: str):
+        """
+        Validate a property defining where the statistics collectors run.
+
+        Args:
+            pname: Name of the property to validate.
+        """
+
+        if pname == "cpus":
+            self._get_cpus()
+        elif pname == "nice":
+            if not -20 <= self.props["nice"] <= 19:
+                raise Error(f"Bad 'stc-agent' niceness '{self.props['nice']}': Must be an integer "
+                            f"in the [-20, 19] range")
+        elif pname == "cgroup":
+            path = self.props["cgroup"]
+            if not path.is_absolute():
+                raise Error(f"The 'stc-agent' cgroup path '{path}' is not absolute")
+            if not (path / "cgroup.procs").is_file():
+                raise Error(f"Bad 'stc-agent' cgroup path '{path}': Not a cgroup directory")
+
+    def _apply_placement(self):
+        """
+        Move 'stc-agent' to the configured cgroup, set its niceness, and bind it to the configured
+        CPUs.
+
+        Notes:
+            - The statistics collector processes are started by 'stc-agent', and the in-process
+              statistics collectors run in 'stc-agent' threads. They all inherit the cgroup, the
+              niceness, and the CPU affinity, so the placement is applied before starting them.
+            - The niceness and the CPU affinity are per-thread attributes, so they are applied to
+              every existing 'stc-agent' thread. The threads created later inherit them.
+        """
+
+        pid = Trivial.get_pid()
+
+        cgroup = self.props["cgroup"]
+        if cgroup is not _UNINITIALIZED["path"]:
+            _LOG.debug("Moving 'stc-agent' to cgroup '%s'", cgroup)
+            try:
+                with open(cgroup / "cgroup.procs", "w", encoding="utf-8") as fobj:
+                    fobj.write(f"{pid}\n")
+            except OSError as err:
+                errmsg = Error(str(err)).indent(2)
+                raise Error(f"Failed to move 'stc-agent' to cgroup '{cgroup}':\n"
+                            f"{errmsg}") from err
+
+        nice = self.props["nice"]
+        cpus = None
+        if self.props["cpus"] is not _UNINITIALIZED["str"]:
+            cpus = self._get_cpus()
+
+        if nice is _UNINITIALIZED["int"] and cpus is None:
+            return
+
+        try:
+            tids = [int(path.name) for path in Path(f"/proc/{pid}/task").iterdir()]
+        except OSError as err:
+            errmsg = Error(str(err)).indent(2)
+            raise Error(f"Failed to list 'stc-agent' threads:\n{errmsg}") from err
+
+        for tid in tids:
+            if nice is not _UNINITIALIZED["int"]:
+                try:
+                    os.setpriority(os.PRIO_PROCESS, tid, nice)
+                except OSError as err:
+                    errmsg = Error(str(err)).indent(2)
+                    raise Error(f"Failed to set 'stc-agent' thread {tid} niceness to {nice}:\n"
+                                f"{errmsg}") from err
+            if cpus is not None:
+                ProcHelpers.bind_pid(tid, cpus, pman=self._pman)
+
+        _LOG.debug("Set 'stc-agent' niceness to %s and CPUs to %s",
+                   nice if nice is not _UNINITIALIZED["int"] else "default",
+                   self.props["cpus"] if cpus is not None else "all")
+
     def set_property(self, args: str):
         """
         Set a property of the statistics collection agent.
@@ -884,6 +1675,8 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         self._set_obj_property(self, pname, pval)
         if pname == "outdir":
             self._set_outdir(Path(pval))
+        else:
+            self._check_placement(pname)
 
         _LOG.debug("Set 'stc-agent' property '%s' to value '%s'", pname, pval)
 
@@ -975,8 +1768,15 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         if self._started:
             raise Error("Statistics collection has already been started")
 
+        self._apply_placement()
         self._execute_collectors_methods(("start",))
-        self._started = True
+
+        # Drop the recent samples of the previous run.
+        with self._latest_lock:
+            for latest in self._latest.values():
+                latest.close()
+            self._latest = {}
+            self._started = True
 
         _LOG.debug("Started the collectors")
 
@@ -991,6 +1791,11 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
         finally:
             self._started = False
 
+            # Keep the recent samples available after the collectors stopped.
+            with self._latest_lock:
+                for latest in self._latest.values():
+                    latest.stop()
+
             if self._lfobj:
                 try:
                     self._lfobj.flush()
@@ -1005,30 +1810,536 @@ class _STCAgent(ClassHelpers.SimpleCloseContext):
 
         _LOG.debug("Stopped the collectors")
 
+    def get_latest(self, args: str) -> str:
+        """
+        Return the aggregates of the samples collected during the last seconds.
+
+        Args:
+            args: A space-separated string in the format '<stat_name> <seconds> [<metrics>]', where
+                  'metrics' is a comma-separated list of metric names to aggregate. All metrics are
+                  aggregated by default.
+
+        Returns:
+            JSON-serialized dictionary with the count of the samples, the time-stamps of the first
+            and the last samples, and the 'min', 'avg', 'max', and 'last' values for every metric.
+
+        Notes:
+            - 'args' arrives as a raw string from an external client over the network socket and is
+              validated before use.
+            - The collector output is not parsed until the first 'get-latest' command for the
+              statistic, which waits for the already collected samples to be parsed.
+        """
+
+        arg_list = args.split()
+        if len(arg_list) not in (2, 3):
+            raise Error(f"Incorrect argument '{args}'\nThe argument must be in the following "
+                        f"format:\n<stat_name> <seconds> [<metrics>]")
+
+        stname = arg_list[0]
+        if stname not in _LATEST_STATS:
+            supported = ", ".join(_LATEST_STATS)
+            raise Error(f"Recent samples are not available for '{stname}' statistics, they are "
+                        f"available for:\n{supported}")
+
+        if not Trivial.is_float(arg_list[1]) or float(arg_list[1]) <= 0:
+            raise Error(f"Bad time window size '{arg_list[1]}': Must be a positive number of "
+                        f"seconds")
+        seconds = float(arg_list[1])
+
+        metrics: list[str] = []
+        if len(arg_list) == 3:
+            metrics = Trivial.split_csv_line(arg_list[2], dedup=True)
+
+        with self._latest_lock:
+            latest = self._latest.get(stname)
+            if not latest:
+                if not self._started or stname not in self._collectors:
+                    raise Error(f"No recent '{stname}' samples, the collector was not started")
+                if stname in self.failed_collectors:
+                    raise Error(f"No recent '{stname}' samples, the collector failed")
+                latest = self._latest[stname] = _LatestSamples(stname, self)
+
+        return json.dumps(latest.get_aggregates(seconds, metrics), separators=(",", ":"))
+
+class _StatsTail(ClassHelpers.SimpleCloseContext):
+    """
+    Follow the output file of a statistics collector and return the newly written samples.
+
+    The collector output file is re-opened when the collector is re-configured, and the newly
+    written data are returned only up to the last complete line, so that a sample is never split.
+    Compressed output files are decompressed on the fly. Segmented output is followed from one
+    segment to the next one, without repeating the header every segment starts with.
+    """
+
+    def __init__(self, stname: str, stc_agent: _STCAgent, from_end: bool = True):
+        """
+        Initialize a class instance.
+
+        Args:
+            stname: Name of the statistics to follow.
+            stc_agent: The statistics collection agent running the collector.
+            from_end: If 'True', follow only the samples written after initialization, otherwise
+                      start from the beginning of the output file.
+        """
+
+        self.stname = stname
+        self._stc_agent = stc_agent
+
+        # The followed output file path, object, and inode number.
+        self._path: Path | None = None
+        self._fobj: IO[bytes] | None = None
+        self._ino: int = -1
+        # The file offset of the first byte not returned yet.
+        self._offset: int = 0
+        # Whether the data up to the first newline should be dropped.
+        self._skip_partial: bool = False
+        # The decompressor for compressed output files, the decompressed data not returned yet,
+        # and the file offset up to which the decompressed data should be dropped.
+        self._decompressor: Compression.StreamDecompressor | None = None
+        self._pending: bytes = b""
+        self._skip_to: int = 0
+        # Count of the header bytes at the beginning of the data to drop.
+        self._drop: int = 0
+
+        self._open(seek_end=from_end)
+
+    def close(self):
+        """Close the followed output file."""
+
+        ClassHelpers.close(self, close_attrs=("_fobj",), unref_attrs=("_stc_agent",))
+
+    def _open(self, seek_end: bool = False, drop_header: bool = False):
+        """
+        Open the current collector output file.
+
+        Args:
+            seek_end: If 'True', start from the end of the file, otherwise start from the beginning.
+            drop_header: If 'True', drop the header the output segment starts with.
+        """
+
+        if self._fobj:
+            self._fobj.close()
+            self._fobj = None
+
+        self._path, header_size = self._stc_agent.get_output(self.stname)
+        self._offset = 0
+        self._skip_partial = False
+        self._decompressor = None
+        self._pending = b""
+        self._skip_to = 0
+        self._drop = header_size if drop_header and not seek_end else 0
+
+        if not self._path:
+            return
+
+        try:
+            # pylint: disable=consider-using-with
+            self._fobj = open(self._path, "rb")
+            stinfo = os.fstat(self._fobj.fileno())
+        except OSError as err:
+            _LOG.debug("Failed to open '%s' output file '%s': %s", self.stname, self._path, err)
+            self._path = None
+            return
+
+        self._ino = stinfo.st_ino
+
+        method = Compression.get_method(self._path)
+        if method:
+            self._decompressor = Compression.StreamDecompressor(method)
+            # Compressed data can only be decompressed from the beginning, so the data preceding
+            # the current end of the file are decompressed and dropped chunk by chunk in 'read()'.
+            if seek_end:
+                self._skip_to = stinfo.st_size
+        elif seek_end and stinfo.st_size:
+            self._offset = stinfo.st_size
+            # The last sample may be incomplete, drop it.
+            self._fobj.seek(self._offset - 1)
+            self._skip_partial = self._fobj.read(1) != b"\n"
+
+    def _skip(self):
+        """
+        Decompress and drop the data of the compressed output file up to the '_skip_to' offset.
+        """
+
+        assert self._fobj is not None and self._decompressor is not None
+
+        self._fobj.seek(self._offset)
+        while self._offset < self._skip_to:
+            data = self._fobj.read(min(_TAIL_CHUNK_SIZE, self._skip_to - self._offset))
+            if not data:
+                break
+            self._offset += len(data)
+            data = self._decompressor.decompress(data)
+            if data:
+                # The last sample may be incomplete, drop it.
+                self._skip_partial = not data.endswith(b"\n")
+
+        self._skip_to = 0
+
+    def read(self) -> bytes:
+        """
+        Read the data written to the collector output file since the previous call.
+
+        Returns:
+            The newly written complete lines, or empty bytes if there are none.
+        """
+
+        path, _ = self._stc_agent.get_output(self.stname)
+        if path != self._path:
+            # The collector was re-configured with a different output directory, or the output was
+            # rolled over to a new segment. In the latter case, the previous segment is complete,
+            # return the rest of it first.
+            data = self._read()
+            if data:
+                return data
+            rolled_over = bool(path and self._path and path.parent == self._path.parent)
+            self._open(drop_header=rolled_over)
+
+        return self._read()
+
+    def _read(self) -> bytes:
+        """
+        Read the data written to the currently followed output file since the previous call.
+
+        Returns:
+            The newly written complete lines, or empty bytes if there are none.
+        """
+
+        if not self._fobj:
+            return b""
+
+        try:
+            stinfo = os.stat(self._fobj.name)
+            if stinfo.st_ino != self._ino:
+                # The output file was re-created.
+                self._open()
+                if not self._fobj:
+                    return b""
+            elif stinfo.st_size < self._offset:
+                # The output file was truncated by re-configuring the collector.
+                self._offset = 0
+                self._skip_partial = False
+                if self._decompressor:
+                    self._decompressor = Compression.StreamDecompressor(self._decompressor.method)
+                    self._pending = b""
+                    self._skip_to = 0
+
+            if self._offset < self._skip_to:
+                self._skip()
+
+            self._fobj.seek(self._offset)
+            data = self._fobj.read(_TAIL_CHUNK_SIZE)
+
+            if self._decompressor:
+                # All the compressed data are consumed, the incomplete last line is kept pending.
+                self._offset += len(data)
+                data = self._pending + self._decompressor.decompress(data)
+                self._pending = b""
+        except OSError as err:
+            _LOG.debug("Failed to read '%s' output file '%s': %s", self.stname, self._path, err)
+            return b""
+        except Error as err:
+            _LOG.debug("Failed to decompress '%s' output file '%s': %s",
+                       self.stname, self._path, err)
+            self._fobj.close()
+            self._fobj = None
+            return b""
+
+        # Return complete lines only, unless a line does not fit the chunk.
+        idx = data.rfind(b"\n")
+        if idx != -1 or len(data) < _TAIL_CHUNK_SIZE:
+            if self._decompressor:
+                self._pending = data[idx + 1:]
+            data = data[:idx + 1]
+        if not self._decompressor:
+            self._offset += len(data)
+
+        if self._skip_partial and data:
+            idx = data.find(b"\n")
+            if idx == -1:
+                return b""
+            data = data[idx + 1:]
+            self._skip_partial = False
+
+        if self._drop and data:
+            size = min(self._drop, len(data))
+            data = data[size:]
+            self._drop -= size
+
+        return data
+
+class _LatestSamples(ClassHelpers.SimpleCloseContext):
+    """
+    Parse the output file of a running statistics collector in a background thread and keep the
+    recent samples in a ring buffer.
+
+    Public methods overview:
+
+    - 'stop()': stop parsing the output file, keep the parsed samples.
+    - 'get_aggregates()': return the aggregates of the recent samples.
+
+    Notes:
+        - Parsing starts from the beginning of the output file, so that the samples collected
+          before the class instance was created are available.
+
+        - The ring buffer size is limited to '_LATEST_SAMPLES_CNT' samples, so the memory usage
+          does not depend on how long the statistics are collected.
+    """
+
+    def __init__(self, stname: str, stc_agent: _STCAgent):
+        """
+        Initialize a class instance and start parsing the collector output file.
+
+        Args:
+            stname: Name of the statistics to parse. Must be one of '_LATEST_STATS'.
+            stc_agent: The statistics collection agent running the collector.
+        """
+
+        self.stname = stname
+
+        # The ring buffer of '(timestamp, names, values)' tuples, where 'names' is a tuple of metric
+        # names and 'values' is an array of the corresponding metric values. The 'names' tuple
+        # object is shared between samples with the same metrics to save memory.
+        self._samples: collections.deque[tuple[float, tuple[str, ...], array.array]] = \
+                                                collections.deque(maxlen=_LATEST_SAMPLES_CNT)
+        # Protects the ring buffer, which is modified by the parsing thread.
+        self._lock = threading.Lock()
+        # Set to stop the parsing thread.
+        self._stop_event = threading.Event()
+        # Set when the parsing thread reached the end of the output file for the first time, or
+        # stopped.
+        self._caught_up = threading.Event()
+        # The error the parsing thread stopped with.
+        self._parse_error: str = ""
+
+        self._tail: _StatsTail | None = _StatsTail(stname, stc_agent, from_end=False)
+        self._thread: threading.Thread | None = threading.Thread(target=self._parse,
+                                                                 name=f"{stname}-latest",
+                                                                 daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop parsing the output file and release resources."""
+
+        self.stop()
+        ClassHelpers.close(self, close_attrs=("_tail",))
+
+    def stop(self):
+        """Stop parsing the output file, keep the parsed samples."""
+
+        if getattr(self, "_thread", None):
+            if typing.TYPE_CHECKING:
+                assert self._thread is not None
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def _get_lines(self) -> Generator[str, None, None]:
+        """
+        Yield the lines of the collector output file as they are written.
+
+        Yields:
+            The collector output file lines.
+
+        Raises:
+            _StopFollowing: Parsing was stopped.
+        """
+
+        if typing.TYPE_CHECKING:
+            assert self._tail is not None
+
+        while not self._stop_event.is_set():
+            data = self._tail.read()
+            if data:
+                yield from data.decode("utf-8", errors="replace").splitlines()
+            else:
+                self._caught_up.set()
+                self._stop_event.wait(_TAIL_POLL_INTERVAL)
+
+        raise _StopFollowing()
+
+    @staticmethod
+    def _parse_turbostat(lines: Iterator[str]) -> Generator[tuple[float, dict[str, float]],
+                                                             None, None]:
+        """
+        Parse turbostat output and yield the system-wide metrics of every snapshot.
+
+        Args:
+            lines: The turbostat output lines.
+
+        Yields:
+            '(timestamp, metrics)' tuples.
+        """
+
+        # The parsers depend on 'numpy', so import them only when needed.
+        # pylint: disable-next=import-outside-toplevel
+        from statscollectlibs.parsers import TurbostatParser
+
+        parser = TurbostatParser.TurbostatParser(lines=lines, derivatives=True)
+        for tdict in parser.next():
+            totals = tdict["totals"]
+            metrics = {metric: float(val) for metric, val in totals.items()
+                       if isinstance(val, (int, float)) and metric != "Time_Of_Day_Seconds"}
+            yield totals["Time_Of_Day_Seconds"], metrics
+
+    @staticmethod
+    def _parse_interrupts(lines: Iterator[str]) -> Generator[tuple[float, dict[str, float]],
+                                                              None, None]:
+        """
+        Parse interrupts statistics and yield the interrupts rate of every snapshot.
+
+        Args:
+            lines: The interrupts statistics lines.
+
+        Yields:
+            '(timestamp, metrics)' tuples.
+        """
+
+        # pylint: disable-next=import-outside-toplevel
+        from statscollectlibs.parsers import InterruptsParser
+
+        prev_ts: float | None = None
+        prev_total = 0
+
+        parser = InterruptsParser.InterruptsParser(lines=lines)
+        for dataset in parser.next_matrix():
+            timestamp = dataset["timestamp"]
+            total = int(dataset["counts"].sum())
+
+            # The counters go backwards when a CPU goes offline, skip such snapshots.
+            if prev_ts is not None and timestamp > prev_ts and total >= prev_total:
+                yield timestamp, {"IRQ/s": (total - prev_total) / (timestamp - prev_ts)}
+
+            prev_ts = timestamp
+            prev_total = total
+
+    def _parse(self):
+        """Parse the collector output file and add the samples to the ring buffer."""
+
+        if self.stname == "turbostat":
+            parse_func = self._parse_turbostat
+        else:
+            parse_func = self._parse_interrupts
+
+        names: tuple[str, ...] = ()
+
+        try:
+            for timestamp, metrics in parse_func(self._get_lines()):
+                if tuple(metrics) != names:
+                    names = tuple(metrics)
+                values = array.array("d", metrics.values())
+                with self._lock:
+                    self._samples.append((timestamp, names, values))
+        except _StopFollowing:
+            pass
+        except Exception as err: # pylint: disable=broad-except
+            # The recent samples are optional, do not fail statistics collection, but report the
+            # error to the 'get-latest' clients.
+            errmsg = Error(f"{type(err).__name__}: {err}").indent(2)
+            self._parse_error = f"Failed to parse '{self.stname}' statistics:\n{errmsg}"
+            _LOG.debug(self._parse_error)
+        finally:
+            self._caught_up.set()
+
+    def get_aggregates(self, seconds: float, metrics: Sequence[str]) -> dict[str, Any]:
+        """
+        Return the aggregates of the samples collected during the last 'seconds' seconds.
+
+        Args:
+            seconds: The time window size in seconds.
+            metrics: Names of the metrics to aggregate. Aggregate all metrics if empty.
+
+        Returns:
+            A dictionary with the count of the samples ('samples'), the time-stamps of the first
+            and the last samples ('begin', 'end'), and the 'min', 'avg', 'max', and 'last' values
+            for every metric ('metrics').
+
+        Raises:
+            Error: Parsing the collector output file failed.
+        """
+
+        self._caught_up.wait(_LATEST_CATCHUP_TIMEOUT)
+        if self._parse_error:
+            raise Error(self._parse_error)
+
+        since = time.time() - seconds
+        samples: list[tuple[float, tuple[str, ...], array.array]] = []
+        with self._lock:
+            for sample in reversed(self._samples):
+                if sample[0] < since:
+                    break
+                samples.append(sample)
+        samples.reverse()
+
+        result: dict[str, Any] = {"samples": len(samples)}
+        if not samples:
+            result["metrics"] = {}
+            return result
+
+        result["begin"] = samples[0][0]
+        result["end"] = samples[-1][0]
+
+        if not metrics:
+            metrics = samples[-1][1]
+
+        # The '[min, sum, max, last, count]' lists indexed by metric names.
+        aggrs: dict[str, list[float]] = {}
+        names: tuple[str, ...] = ()
+        name2idx: dict[str, int] = {}
+
+        for _, sample_names, values in samples:
+            if sample_names is not names:
+                names = sample_names
+                name2idx = {name: idx for idx, name in enumerate(names)}
+
+            for metric in metrics:
+                idx = name2idx.get(metric)
+                if idx is None:
+                    continue
+                val = values[idx]
+                aggr = aggrs.get(metric)
+                if aggr is None:
+                    aggrs[metric] = [val, val, val, val, 1]
+                else:
+                    aggr[0] = min(aggr[0], val)
+                    aggr[1] += val
+                    aggr[2] = max(aggr[2], val)
+                    aggr[3] = val
+                    aggr[4] += 1
+
+        result["metrics"] = {metric: {"min": aggr[0], "avg": aggr[1] / aggr[4], "max": aggr[2],
+                                      "last": aggr[3]}
+                             for metric, aggr in aggrs.items()}
+        return result
+
 class _Client(ClassHelpers.SimpleCloseContext):
     """The statistics collection agent network client."""
 
-    def __init__(self, sock: socket.socket, clientid: str):
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, clientid: str):
         """
         Initialize the client.
 
         Args:
-            sock: The client connection socket.
+            reader: The client connection stream reader.
+            writer: The client connection stream writer.
             clientid: A printable client ID string used in log messages.
         """
 
-        self._sock: socket.socket = sock
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter | None = writer
         self.clientid: str = clientid
 
     def close(self):
         """Close the client connection."""
 
-        if getattr(self, "_sock", None):
-            with contextlib.suppress(socket.error):
-                self._sock.shutdown(socket.SHUT_RDWR)
-                self._sock.close()
+        if getattr(self, "_writer", None):
+            if typing.TYPE_CHECKING:
+                assert self._writer is not None
+            with contextlib.suppress(OSError):
+                self._writer.close()
+            self._writer = None
 
-    def respond(self, msg: str):
+    async def respond(self, msg: str):
         """
         Respond to the client by sending it a message.
 
@@ -1036,19 +2347,63 @@ class _Client(ClassHelpers.SimpleCloseContext):
             msg: The message to send.
         """
 
+        if typing.TYPE_CHECKING:
+            assert self._writer is not None
+
         _LOG.debug("Sending the following response to client '%s': %s", self.clientid, msg)
 
-        buf: bytes = (msg + _DELIMITER + "\n").encode("utf-8")
-        total: int = 0
+        try:
+            self._writer.write((msg + _DELIMITER + "\n").encode("utf-8"))
+            await self._writer.drain()
+        except OSError as err:
+            raise _ClientDisconnected(f"Client '{self.clientid}' disconnected, cannot send it "
+                                      f"the following message: {msg}") from err
 
-        while total < len(buf):
-            sent = self._sock.send(buf[total:])
-            if sent == 0:
-                raise _ClientDisconnected(f"Client '{self.clientid}' disconnected, cannot send it "
-                                          f"the following message: {msg}")
-            total += sent
+    @property
+    def disconnected(self) -> bool:
+        """Return 'True' if the client closed the connection."""
 
-    def get_command(self) -> str:
+        return self._reader.at_eof()
+
+    async def send_frame(self, stname: str, data: bytes):
+        """
+        Send a frame of statistics samples to the client.
+
+        Args:
+            stname: Name of the statistics the samples belong to.
+            data: The samples to send.
+
+        Notes:
+            - A frame consists of a '<stname> <size>' header line followed by 'size' bytes of raw
+              collector output.
+            - Wait until the client reads the previously sent frames if too much data is buffered
+              for it.
+        """
+
+        if typing.TYPE_CHECKING:
+            assert self._writer is not None
+
+        try:
+            self._writer.write(f"{stname} {len(data)}\n".encode("utf-8") + data)
+            await self._writer.drain()
+        except OSError as err:
+            raise _ClientDisconnected(f"Client '{self.clientid}' disconnected, cannot send it "
+                                      f"'{stname}' samples") from err
+
+    def set_write_buffer_size(self, size: int):
+        """
+        Set the maximum amount of bytes buffered for sending to the client.
+
+        Args:
+            size: The buffer size in bytes.
+        """
+
+        if typing.TYPE_CHECKING:
+            assert self._writer is not None
+
+        self._writer.transport.set_write_buffer_limits(high=size)
+
+    async def get_command(self) -> str:
         """
         Receive and return the next client command.
 
@@ -1058,21 +2413,21 @@ class _Client(ClassHelpers.SimpleCloseContext):
 
         _LOG.debug("Waiting for a command from client '%s'", self.clientid)
 
-        bufs: list[bytes] = []
         cmd: bytes = b""
         msg: bytes = b""
 
         while not cmd:
-            buf = self._sock.recv(1)
-            if not buf:
+            try:
+                line = await self._reader.readline()
+            except (OSError, ValueError) as err:
+                # 'ValueError' means the line is longer than the stream reader limit.
+                raise _ClientDisconnected(f"Client '{self.clientid}' disconnected, failed to "
+                                          f"receive a command from it: {err}") from err
+            if not line.endswith(b"\n"):
                 raise _ClientDisconnected(f"Client '{self.clientid}' disconnected, failed to "
                                           f"receive a command from it")
-            bufs.append(buf)
-            if buf != b"\n":
-                continue
 
-            msg += b"".join(bufs)
-            bufs = []
+            msg += line
             # Handle both Linux and Windows newlines.
             for delim in (_DELIMITER + "\n", _DELIMITER + "\r\n"):
                 delim_bytes = delim.encode("utf-8")
@@ -1083,7 +2438,7 @@ class _Client(ClassHelpers.SimpleCloseContext):
         try:
             cmd_str = cmd.decode("utf-8").strip()
         except UnicodeError as err:
-            self.respond("Failed to decode the command from UTF-8")
+            await self.respond("Failed to decode the command from UTF-8")
             errmsg = Error(str(err)).indent(2)
             raise _ClientDisconnected(f"Failed to decode the command from UTF-8 from client "
                                       f"'{self.clientid}':\n{errmsg}") from err
@@ -1095,9 +2450,10 @@ class _Server(ClassHelpers.SimpleCloseContext):
     """
     Statistics collection agent network server.
 
-    Manage a server-side socket (Unix or TCP) that listens for and accepts one client connection at
-    a time. Create the server with either a Unix socket path or a TCP port number. If neither is
-    provided, use a Unix socket with a random name created in the temporary directory.
+    Manage a server-side socket (Unix or TCP) that listens for and accepts client connections. The
+    clients are served concurrently by an 'asyncio' event loop. Create the server with either a
+    Unix socket path or a TCP port number. If neither is provided, use a Unix socket with a random
+    name created in the temporary directory.
     """
 
     def __init__(self, unix: Path | None = None, port: int = -1, sutname: str = ""):
@@ -1122,6 +2478,16 @@ class _Server(ClassHelpers.SimpleCloseContext):
         # 'True' means the path was created internally, user-provided paths are left alone.
         self._remove_unix: bool = False
 
+        # Count of connected clients, the monotonic time the last client disconnected, and whether
+        # the last connected client asked the server to exit.
+        self._clients_cnt: int = 0
+        self._idle_since: float = time.monotonic()
+        self._exit: bool = False
+        # Set every time a client connects or disconnects.
+        self._changed: asyncio.Event | None = None
+        # The count of clients served so far, used for generating Unix socket client IDs.
+        self._served_cnt: int = 0
+
         if self._port != -1 and self._unix is not None:
             raise Error("Specify either TCP port or Unix socket path, not both of them")
 
@@ -1174,7 +2540,7 @@ class _Server(ClassHelpers.SimpleCloseContext):
             try:
                 self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
                 self._sock.bind(str(self._unix))
-                self._sock.listen(1)
+                self._sock.listen(_MAX_PENDING_CLIENTS)
             except socket.error as err:
                 errmsg = Error(str(err)).indent(2)
                 raise Error(f"Failed to start listening on Unix socket '{self._unix}': "
@@ -1187,7 +2553,7 @@ class _Server(ClassHelpers.SimpleCloseContext):
                 self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 self._sock.bind(("", self._port))
                 _, self._port = self._sock.getsockname()
-                self._sock.listen(1)
+                self._sock.listen(_MAX_PENDING_CLIENTS)
             except socket.error as err:
                 errmsg = Error(str(err)).indent(2)
                 raise Error(f"Failed to start listening on TCP port {self._port}:\n"
@@ -1195,40 +2561,142 @@ class _Server(ClassHelpers.SimpleCloseContext):
 
             msg = f"Listening on TCP port {self._port}"
 
-        # Timeout so the server exits if no client connects within the configured period.
-        self._sock.settimeout(_NO_CLIENT_TIMEOUT)
-
         _LOG.debug(msg)
         _LOG.info(msg)
 
-    def wait_for_client(self):
+    async def serve(self, handler: Callable[[_Client], Awaitable[None]]):
         """
-        Accept the next incoming client connection.
+        Accept client connections and serve them concurrently until the last connected client asks
+        the server to exit.
 
-        Returns:
-            A '_Client' instance wrapping the accepted socket connection.
+        Args:
+            handler: The coroutine function serving a client. It returns when the client
+                     disconnects, and raises '_ExitCommand' when the client asks the server to exit.
+
+        Notes:
+            - A client asking the server to exit while other clients are connected is only
+              disconnected, the other clients continue to be served.
+
+        Raises:
+            _NoClientTimeout: No client was connected for '_NO_CLIENT_TIMEOUT' seconds.
         """
 
         if typing.TYPE_CHECKING:
             assert self._sock is not None
 
+        self._changed = asyncio.Event()
+        # The tasks serving the connected clients.
+        tasks: set[asyncio.Task] = set()
+
+        async def serve_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            """Serve a single client connection."""
+
+            if typing.TYPE_CHECKING:
+                assert self._changed is not None
+
+            self._served_cnt += 1
+            if self._is_unix:
+                clientid = f"local_client{self._served_cnt}"
+            else:
+                client_host, client_port = writer.get_extra_info("peername")[:2]
+                clientid = f"{client_host}:{client_port}"
+            _LOG.debug("Client connected: %s", clientid)
+
+            task = asyncio.current_task()
+            if task:
+                tasks.add(task)
+            self._clients_cnt += 1
+            self._changed.set()
+
+            try:
+                with _Client(reader, writer, clientid) as client:
+                    await handler(client)
+            except _ClientDisconnected as err:
+                _LOG.debug(err)
+            except _ExitCommand:
+                if self._clients_cnt == 1:
+                    self._exit = True
+                else:
+                    _LOG.debug("Client '%s' exited, other clients are still connected", clientid)
+            except asyncio.CancelledError:
+                # The server is exiting.
+                _LOG.debug("Closing the connection to client '%s'", clientid)
+            finally:
+                tasks.discard(task)
+                self._clients_cnt -= 1
+                self._idle_since = time.monotonic()
+                self._changed.set()
+
         try:
-            client_sock, _ = self._sock.accept()
-        except socket.timeout as err:
-            raise _NoClientTimeout(f"No client connected for {_NO_CLIENT_TIMEOUT} seconds, "
-                                   f"exiting") from err
-        except (OSError, socket.error) as err:
+            if self._is_unix:
+                server = await asyncio.start_unix_server(serve_client, sock=self._sock,
+                                                         limit=_MAX_COMMAND_SIZE)
+            else:
+                server = await asyncio.start_server(serve_client, sock=self._sock,
+                                                    limit=_MAX_COMMAND_SIZE)
+        except OSError as err:
             errmsg = Error(str(err)).indent(2)
-            raise Error(f"Error while accepting a client connection:\n{errmsg}") from err
+            raise Error(f"Failed to start accepting client connections:\n{errmsg}") from err
 
-        if self._is_unix:
-            clientid = "local_client"
+        # The server owns the socket now.
+        self._sock = None
+
+        try:
+            while not self._exit:
+                self._changed.clear()
+                if self._clients_cnt:
+                    await self._changed.wait()
+                    continue
+
+                timeout = _NO_CLIENT_TIMEOUT - (time.monotonic() - self._idle_since)
+                if timeout <= 0:
+                    raise _NoClientTimeout(f"No client connected for {_NO_CLIENT_TIMEOUT} seconds, "
+                                           f"exiting")
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+        finally:
+            # Do not wait for the other clients to disconnect, close their connections.
+            server.close()
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+def _handle_batch(args: str, stc_agent: _STCAgent) -> str:
+    """
+    Handle the 'batch' command: execute a list of commands in order.
+
+    Args:
+        args: JSON-serialized list of commands.
+        stc_agent: The statistics collection agent to dispatch the commands to.
+
+    Returns:
+        'OK' followed by the JSON-serialized list of the responses to the commands. The commands
+        following a failed command are not executed, so the list of responses is shorter than the
+        list of commands if a command failed.
+    """
+
+    try:
+        cmds = json.loads(args)
+    except ValueError as err:
+        raise Error(f"Failed to parse the batch commands JSON:\n{Error(str(err)).indent(2)}") \
+              from err
+
+    if not isinstance(cmds, list) or not all(isinstance(cmd, str) for cmd in cmds):
+        raise Error("The batch commands must be a JSON list of strings")
+
+    responses: list[str] = []
+    for cmd in cmds:
+        name = cmd.partition(" ")[0].strip()
+        if name in _NON_BATCH_COMMANDS:
+            response = f"Bad command in batch: {name}"
         else:
-            client_host, client_port = client_sock.getpeername()
-            clientid = f"{client_host}:{client_port}"
-        _LOG.debug("Client connected: %s", clientid)
+            response = _handle_command(cmd, stc_agent)
 
-        return _Client(client_sock, clientid)
+        responses.append(response)
+        if response != "OK" and not response.startswith("OK "):
+            break
+
+    return f"OK {json.dumps(responses)}"
 
 def _handle_command(cmd: str, stc_agent: _STCAgent) -> str:
     """
@@ -1265,11 +2733,13 @@ def _handle_command(cmd: str, stc_agent: _STCAgent) -> str:
             stc_agent.stop()
         elif cmd == "add-label":
             stc_agent.add_label(args)
+        elif cmd == "batch":
+            response = _handle_batch(args, stc_agent)
+        elif cmd == "get-latest":
+            response += f" {stc_agent.get_latest(args)}"
         elif cmd == "get-failed-collectors":
-            response += f" {','.join(stc_agent.failed_collectors)}"
-        elif cmd == "exit":
-            if stc_agent.started:
-                stc_agent.stop()
+            # Copy the set, because it may be modified by a command running in another thread.
+            response += f" {','.join(stc_agent.failed_collectors.copy())}"
         else:
             response = f"Bad command: {cmd}"
     except Exception as err: # pylint: disable=broad-except
@@ -1277,31 +2747,105 @@ def _handle_command(cmd: str, stc_agent: _STCAgent) -> str:
 
     return response
 
-def _handle_client(client: _Client, stc_agent: _STCAgent):
+async def _stream_stats(client: _Client, stc_agent: _STCAgent, args: str) -> str:
+    """
+    Handle the 'subscribe' command: stream the newly collected statistics samples to the client
+    until it disconnects.
+
+    Args:
+        client: The subscribed client.
+        stc_agent: The statistics collection agent running the collectors.
+        args: Comma-separated names of the statistics to stream.
+
+    Returns:
+        The error response to send to the client if the subscription failed.
+
+    Raises:
+        _ClientDisconnected: The client disconnected.
+
+    Notes:
+        - The samples are read from the collector output files, so a slow client does not slow
+          down the collectors. If the client reads slower than the collectors write, the client
+          falls behind, but no data are lost or buffered in memory.
+    """
+
+    stnames = Trivial.split_csv_line(args, dedup=True)
+
+    try:
+        if not stnames:
+            raise Error("Please, specify at least one statistic name")
+        with contextlib.ExitStack() as stack:
+            tails = [stack.enter_context(_StatsTail(stname, stc_agent)) for stname in stnames]
+            tails_stack = stack.pop_all()
+    except Error as err:
+        return f"Error: {type(err).__name__}: {err}"
+
+    with tails_stack:
+        await client.respond("OK")
+        client.set_write_buffer_size(_SUBSCRIBE_BUFFER_SIZE)
+
+        while not client.disconnected:
+            sent = False
+            for tail in tails:
+                # Reading may take a while, e.g., when a large compressed file has to be
+                # decompressed before reaching its end, so do not block the other clients.
+                data = await asyncio.to_thread(tail.read)
+                if data:
+                    await client.send_frame(tail.stname, data)
+                    sent = True
+
+            # Let the other clients be served even if there is always new data to send.
+            await asyncio.sleep(0 if sent else _TAIL_POLL_INTERVAL)
+
+    raise _ClientDisconnected(f"Client '{client.clientid}' disconnected, stopped streaming "
+                              f"statistics to it")
+
+async def _handle_client(client: _Client, stc_agent: _STCAgent, lock: asyncio.Lock):
     """
     Process all commands from a connected client until it sends 'exit'.
 
     Args:
         client: The connected client to read commands from and write responses to.
         stc_agent: The statistics collection agent to dispatch commands to.
+        lock: The lock serializing the commands that change the agent state.
 
     Raises:
-        _ExitCommand: The client sent the 'exit' command.
+        _ExitCommand: The client sent the 'exit' command. The caller disconnects the client, and
+                      stops the server if there are no other connected clients.
 
     Notes:
         - The connection is maintained for the full session: 'start', 'stop', and 'exit' are
           all sent over the same connection.
-        - If the client disconnects unexpectedly, the caller logs it and waits for the next
-          connection; any in-progress data collection continues in the background.
+        - Commands from the same client are processed in order, but multiple clients are served
+          concurrently. The commands that change the agent state run in a worker thread one at a
+          time, so that a long-running command (e.g., 'configure') does not block the other
+          clients. The query commands (e.g., 'get-failed-collectors') are processed right away.
+        - The 'batch <commands>' command executes a JSON list of commands in order and responds
+          with a JSON list of their responses, saving the round trips on high-latency links.
+        - The 'subscribe <stnames>' command turns the connection into a stream of the newly
+          collected samples of the 'stnames' comma-separated statistics. The stream continues
+          until the client closes the connection, other commands are not accepted on the
+          connection.
+        - If the client disconnects unexpectedly, the caller logs it and keeps serving the other
+          clients; any in-progress data collection continues in the background.
     """
 
-    cmd = None
-    while cmd != "exit":
-        cmd = client.get_command()
-        response = _handle_command(cmd, stc_agent)
-        client.respond(response)
-
-    raise _ExitCommand()
+    while True:
+        cmd = await client.get_command()
+        name, args = cmd.partition(" ")[::2]
+        if name == "exit":
+            await client.respond("OK")
+            raise _ExitCommand()
+        if name == "subscribe":
+            response = await _stream_stats(client, stc_agent, args)
+        elif name in _QUERY_COMMANDS:
+            # Do not block the other clients, e.g., 'get-latest' may wait for the collector output
+            # to be parsed.
+            response = await asyncio.to_thread(_handle_command, cmd, stc_agent)
+        else:
+            async with lock:
+                response = await asyncio.to_thread(_handle_command, cmd, stc_agent)
+        await client.respond(response)
 
 def _build_arguments_parser() -> ArgParse.ArgsParser:
     """Build and return the arguments parser object."""
@@ -1382,6 +2926,10 @@ def _main() -> int:
     args = _parse_arguments()
 
     if args.print_module_paths:
+        # The parsers are imported only when needed, import them here to make sure they are
+        # deployed along with 'stc-agent'.
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from statscollectlibs.parsers import TurbostatParser, InterruptsParser
         _Common.print_module_paths()
         raise SystemExit(0)
 
@@ -1392,18 +2940,20 @@ def _main() -> int:
         server.start_listening()
         _LOG.debug("Commands delimiter is '\\n%s'", _DELIMITER)
 
-        while True:
-            try:
-                with server.wait_for_client() as client:
-                    try:
-                        _handle_client(client, stc_agent)
-                    except _ClientDisconnected as err:
-                        _LOG.debug(err)
-                    except _ExitCommand:
-                        break
-            except _NoClientTimeout as err:
-                _LOG.info(str(err))
-                break
+        async def serve():
+            """Serve the clients."""
+
+            lock = asyncio.Lock()
+            await server.serve(lambda client: _handle_client(client, stc_agent, lock))
+
+        try:
+            asyncio.run(serve())
+        except _NoClientTimeout as err:
+            _LOG.info(str(err))
+        else:
+            # The last client asked to exit, stop the collection if the client did not.
+            if stc_agent.started:
+                stc_agent.stop()
 
     _LOG.debug("Exiting")
     return 0
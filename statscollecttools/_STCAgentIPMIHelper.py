@@ -11,17 +11,51 @@
 stc-agent-ipmi-helper - a wrapper over the 'ipmitool' utility for collecting the IPMI statistics.
 This is an internal sub-tool of the 'stats-collect' tool, not intended to be used directly by end
 users.
+
+The helper keeps a single long-lived 'ipmitool' process (and, for out-of-band collection, a single
+BMC session) and feeds it the 'sdr list full' command every interval. Every IPMI snapshot is
+followed by a comment line with the snapshot latency statistics, for example:
+
+# Latency: 0.412345 s, jitter: 0.012345 s, reconnects: 0
+
+The latency is how long it took 'ipmitool' to read the sensors, the jitter is the smoothed average
+latency variation (as defined in RFC 3550), and the reconnects is how many times the 'ipmitool'
+process had to be restarted because of failures.
+
+By default, all the sensors are read with the 'sdr list full' command. The '--sensors' option limits
+the collection to a subset of sensors, which are then read with the 'sdr get' command. This makes
+every reading take less time, and the raw statistics file smaller.
+
+The '--dcmi-power' option makes the helper collect only the DCMI power reading with the 'dcmi power
+reading' command. This is a single IPMI command, so it is a lot cheaper than reading the sensors,
+and can be done at a high rate. Example of a DCMI power reading snapshot:
+
+Timestamp | 1705672515.054093
+Instantaneous power reading: 180 Watts
+Minimum during sampling period: 23 Watts
+Maximum during sampling period: 350 Watts
+Average power reading over sample period: 177 Watts
+IPMI timestamp: Thu Jan 18 12:00:00 2024
+Sampling period: 00000001 Seconds.
+Power reading state is: activated
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import os
+import pty
 import sys
+import tty
 import time
+import select
 import typing
 import argparse
+import subprocess
 from pathlib import Path
-from pepclibs.helperlibs import Logging, ArgParse, KernelModule, LocalProcessManager
+from pepclibs.helperlibs import Logging, ArgParse, ClassHelpers, KernelModule
+from pepclibs.helperlibs import LocalProcessManager, Trivial
 from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.mdc import IPMIMDC
 from statscollecttools import ToolInfo, _Common
 
 if typing.TYPE_CHECKING:
@@ -39,6 +73,9 @@ if typing.TYPE_CHECKING:
             user: The IPMI user name.
             password_file: Path to the IPMI password file.
             interface: The IPMI interface to use.
+            sensors: The sensor names and metric categories to collect. Empty list means all
+                     sensors.
+            dcmi_power: Collect the DCMI power reading instead of the sensors.
         """
 
         host: str
@@ -48,6 +85,8 @@ if typing.TYPE_CHECKING:
         user: str
         password_file: Path | None
         interface: str
+        sensors: list[str]
+        dcmi_power: bool
 
 _VERSION: Final[str] = ToolInfo.VERSION
 _TOOLNAME: Final[str] = "stc-agent-ipmi-helper"
@@ -59,6 +98,158 @@ _LOG = Logging.getLogger(Logging.MAIN_LOGGER_NAME).configure(prefix=_TOOLNAME)
 # The Linux kernel modules required for local (in-band) IPMI access.
 _IPMI_MODULES: Final[tuple[str, ...]] = ("ipmi_devintf", "ipmi_si")
 
+# How long to wait for 'ipmitool' to respond to a command, in seconds.
+_QUERY_TIMEOUT: Final[float] = 60
+
+# How long to wait for 'ipmitool' to exit after closing its standard input, in seconds.
+_EXIT_TIMEOUT: Final[float] = 5
+
+class _IPMIToolSession(ClassHelpers.SimpleCloseContext):
+    """
+    A long-lived 'ipmitool' process running commands read from its standard input.
+
+    Public methods overview.
+        - run() - run an 'ipmitool' command and return its output lines.
+        - restart() - restart the 'ipmitool' process.
+
+    Notes:
+        - The 'ipmitool exec /dev/stdin' command is used instead of 'ipmitool shell', because the
+          shell prints prompts and may echo the commands.
+        - The standard output of 'ipmitool' is a pseudo-terminal, not a pipe, to make it line
+          buffered. Otherwise the output would not be flushed until 'ipmitool' exits.
+        - Every command is followed by the 'echo <marker>' command, and the output is read until
+          the marker line, which is how the end of the command output is detected.
+    """
+
+    def __init__(self, cmd: list[str]):
+        """
+        Initialize a class instance and start the 'ipmitool' process.
+
+        Args:
+            cmd: The 'ipmitool' command to run, including the connection options, but excluding the
+                 'exec' sub-command.
+        """
+
+        self._cmd = cmd + ["exec", "/dev/stdin"]
+        self._proc: subprocess.Popen | None = None
+        # The pseudo-terminal master file descriptor, 'ipmitool' prints to the slave side.
+        self._fd = -1
+        # The output data that has been read, but not consumed yet.
+        self._buf = b""
+        # The count of the commands ran so far, used for generating unique markers.
+        self._cnt = 0
+
+        self._start()
+
+    def close(self):
+        """Stop the 'ipmitool' process."""
+
+        if getattr(self, "_proc", None):
+            if typing.TYPE_CHECKING:
+                assert self._proc is not None
+            try:
+                # Closing the standard input makes 'ipmitool' close the BMC session and exit.
+                if self._proc.stdin:
+                    self._proc.stdin.close()
+                self._proc.wait(timeout=_EXIT_TIMEOUT)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait()
+            self._proc = None
+
+        if getattr(self, "_fd", -1) >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _start(self):
+        """Start the 'ipmitool' process."""
+
+        _LOG.debug("Starting '%s'", " ".join(self._cmd))
+
+        self._buf = b""
+        self._fd, slave_fd = pty.openpty()
+        try:
+            # Disable the pseudo-terminal processing, e.g., the "\n" -> "\r\n" conversion.
+            tty.setraw(slave_fd)
+            self._proc = subprocess.Popen(self._cmd, stdin=subprocess.PIPE, stdout=slave_fd,
+                                          stderr=slave_fd)
+        except OSError as err:
+            self.close()
+            raise Error(f"Failed to run '{' '.join(self._cmd)}':\n{Error(str(err)).indent(2)}") \
+                  from err
+        finally:
+            os.close(slave_fd)
+
+    def restart(self):
+        """Restart the 'ipmitool' process, e.g., after a failure."""
+
+        self.close()
+        self._start()
+
+    def _read_line(self, deadline: float) -> str:
+        """
+        Read the next output line.
+
+        Args:
+            deadline: The monotonic time to wait for the line until.
+
+        Returns:
+            The output line without the trailing newline.
+        """
+
+        while True:
+            idx = self._buf.find(b"\n")
+            if idx >= 0:
+                line = self._buf[:idx]
+                self._buf = self._buf[idx + 1:]
+                return line.decode("utf-8", errors="replace").rstrip("\r")
+
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or not select.select([self._fd], [], [], timeout)[0]:
+                raise Error(f"'ipmitool' did not respond within {_QUERY_TIMEOUT} seconds")
+
+            try:
+                data = os.read(self._fd, 65536)
+            except OSError:
+                # Reading the pseudo-terminal master fails with 'EIO' when the slave side is
+                # closed.
+                data = b""
+            if not data:
+                raise Error("'ipmitool' exited unexpectedly")
+            self._buf += data
+
+    def run(self, command: str) -> list[str]:
+        """
+        Run an 'ipmitool' command and return its output.
+
+        Args:
+            command: The 'ipmitool' command to run, e.g., 'sdr list full'.
+
+        Returns:
+            The command output lines, including the error messages 'ipmitool' printed.
+        """
+
+        if typing.TYPE_CHECKING:
+            assert self._proc is not None and self._proc.stdin is not None
+
+        self._cnt += 1
+        marker = f"{_TOOLNAME}-marker-{self._cnt}"
+
+        try:
+            self._proc.stdin.write(f"{command}\necho {marker}\n".encode("utf-8"))
+            self._proc.stdin.flush()
+        except OSError as err:
+            raise Error(f"Failed to send a command to 'ipmitool':\n{Error(str(err)).indent(2)}") \
+                  from err
+
+        deadline = time.monotonic() + _QUERY_TIMEOUT
+        lines: list[str] = []
+        while True:
+            line = self._read_line(deadline)
+            if line == marker:
+                return lines
+            lines.append(line)
+
 def _build_arguments_parser() -> ArgParse.ArgsParser:
     """Build and return the arguments parser object."""
 
@@ -87,6 +278,17 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
     text = "The IPMI interface to use (passed to 'ipmitool -I'). Default is 'lanplus'."
     parser.add_argument("-I", "--interface", help=text, default="lanplus")
 
+    categories = ", ".join(sorted(set(IPMIMDC.UNIT2CATEGORY.values())))
+    text = f"""Comma-separated list of sensors to collect. The list may include sensor names (e.g.,
+               'PS1 Input Power') and IPMI metric categories, which select all sensors of the
+               category. The categories are: {categories}. By default, all sensors are
+               collected."""
+    parser.add_argument("--sensors", help=text)
+
+    text = """Collect the DCMI power reading ('ipmitool dcmi power reading') instead of the
+              sensors."""
+    parser.add_argument("--dcmi-power", action="store_true", help=text)
+
     # Hidden option: print paths to 'stc-agent-ipmi-helper' module dependencies and exit.
     parser.add_argument("--print-module-paths", action="store_true", help=argparse.SUPPRESS)
     return parser
@@ -121,6 +323,8 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
     cmdl["user"] = args.user or ""
     cmdl["password_file"] = args.password_file
     cmdl["interface"] = args.interface
+    cmdl["sensors"] = Trivial.split_csv_line(args.sensors) if args.sensors else []
+    cmdl["dcmi_power"] = args.dcmi_power
 
     if (cmdl["user"] or cmdl["password_file"]) and not cmdl["host"]:
         raise Error("Please, specify the host: '--user' and '--password-file' require '--host'")
@@ -130,6 +334,12 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
         raise Error(f"Bad '--count' value '{cmdl['count']}': Must be non-negative")
     if cmdl["interval"] <= 0:
         raise Error(f"Bad '--interval' value '{cmdl['interval']}': Must be positive")
+    if cmdl["sensors"] and cmdl["dcmi_power"]:
+        raise Error("'--sensors' and '--dcmi-power' options are mutually exclusive")
+    for sensor in cmdl["sensors"]:
+        if '"' in sensor:
+            raise Error(f"Bad '--sensors' value '{args.sensors}': Sensor names must not include "
+                        f"the '\"' character")
     if cmdl["password_file"] and not cmdl["password_file"].is_file():
         raise Error(f"Password file does not exist: {cmdl['password_file']}")
 
@@ -138,6 +348,176 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
 
     return cmdl
 
+def _format_sdr_list(lines: list[str]) -> list[str]:
+    """
+    Filter out everything but the sensor lines from the 'sdr list full' command output.
+
+    Args:
+        lines: The 'sdr list full' command output lines.
+
+    Returns:
+        The sensor lines.
+    """
+
+    # Sensor lines look like "System Fan 4 | 2491 RPM | ok". Anything else is an 'ipmitool' error
+    # message.
+    return [line for line in lines if line.count("|") >= 2]
+
+def _format_dcmi_power(lines: list[str]) -> list[str]:
+    """
+    Strip the padding white-spaces from the 'dcmi power reading' command output lines.
+
+    Args:
+        lines: The 'dcmi power reading' command output lines.
+
+    Returns:
+        The '<name>: <value>' lines, or an empty list if the output does not include the power
+        reading.
+
+    Notes:
+        - Example of the 'dcmi power reading' command output line.
+              Instantaneous power reading:                   180 Watts
+    """
+
+    output: list[str] = []
+    found = False
+
+    for line in lines:
+        name, sep, val = line.partition(":")
+        if not sep:
+            continue
+
+        name = name.strip()
+        if name == "Instantaneous power reading":
+            found = True
+        output.append(f"{name}: {' '.join(val.split())}")
+
+    if not found:
+        return []
+    return output
+
+def _parse_sdr_list(lines: list[str]) -> dict[str, str | None]:
+    """
+    Parse the 'sdr list full' command output.
+
+    Args:
+        lines: The command output lines.
+
+    Returns:
+        A dictionary mapping sensor names to their units. The unit is 'None' for the sensors that
+        have no reading.
+    """
+
+    units: dict[str, str | None] = {}
+    for line in lines:
+        # Example of the line: "System Fan 4     | 2491 RPM          | ok".
+        elts = line.rsplit("|", 2)
+        if len(elts) != 3:
+            continue
+
+        name = elts[0].strip()
+        num, sep, unit = elts[1].strip().partition(" ")
+        if sep and num != "no":
+            units[name] = unit
+        else:
+            units.setdefault(name, None)
+
+    return units
+
+def _resolve_sensors(session: _IPMIToolSession, entries: list[str]) -> list[str]:
+    """
+    Resolve the sensor names and metric categories from the '--sensors' option into sensor names.
+
+    Args:
+        session: The 'ipmitool' session to use for listing the sensors.
+        entries: The sensor names and metric categories from the '--sensors' option.
+
+    Returns:
+        The list of sensor names to collect.
+    """
+
+    units = _parse_sdr_list(session.run("sdr list full"))
+    if not units:
+        raise Error("'ipmitool' did not print any sensor readings")
+
+    categories = set(IPMIMDC.UNIT2CATEGORY.values())
+    sensors: list[str] = []
+
+    for entry in entries:
+        if entry in categories:
+            names = [name for name, unit in units.items()
+                     if unit and IPMIMDC.UNIT2CATEGORY.get(unit) == entry]
+            if not names:
+                _LOG.debug("No sensors of the '%s' category found", entry)
+        elif entry in units:
+            names = [entry]
+        else:
+            available = "\n  ".join(units)
+            raise Error(f"Sensor '{entry}' was not found, available sensors are:\n  {available}")
+
+        for name in names:
+            if name not in sensors:
+                sensors.append(name)
+
+    if not sensors:
+        raise Error(f"No sensors matching '{', '.join(entries)}' were found")
+
+    _LOG.debug("Collecting the following sensors: %s", ", ".join(sensors))
+    return sensors
+
+def _format_sdr_get(lines: list[str]) -> list[str]:
+    """
+    Convert the verbose 'sdr get' command output into the 'sdr list full' command output format.
+
+    Args:
+        lines: The 'sdr get' command output lines.
+
+    Returns:
+        The sensor lines in the 'sdr list full' format.
+
+    Notes:
+        - Example of the 'sdr get' command output for a sensor.
+            Sensor ID              : PS1 Input Power (0x32)
+             Entity ID             : 10.1 (Power Supply)
+             Sensor Type (Threshold)  : Current (0x03)
+             Sensor Reading        : 180 (+/- 0) Watts
+             Status                : ok
+    """
+
+    output: list[str] = []
+    name: str | None = None
+    reading = status = ""
+
+    for line in lines + ["Sensor ID : "]:
+        key, sep, val = line.partition(":")
+        if not sep:
+            continue
+
+        key = key.strip()
+        val = val.strip()
+
+        if key == "Sensor ID":
+            if name:
+                output.append(f"{name:<16} | {reading:<17} | {status}")
+
+            # Strip the sensor number, e.g., "PS1 Input Power (0x32)" -> "PS1 Input Power".
+            name = val.rsplit(" (", 1)[0] if val.endswith(")") else val
+            reading = "no reading"
+            status = "ns"
+        elif not name:
+            continue
+        elif key == "Sensor Reading":
+            # Example of the reading: "180 (+/- 0) Watts".
+            num, sep, tolerance = val.partition(" (+/- ")
+            if sep:
+                unit = tolerance.partition(") ")[2]
+                reading = f"{num} {unit}" if unit else num
+                status = "ok"
+        elif key == "Status":
+            status = val
+
+    return output
+
 def _main() -> int:
     """Implement main logic."""
 
@@ -149,43 +529,75 @@ def _main() -> int:
 
     cmdl = _get_cmdline_args(args)
 
-    cmd = "ipmitool"
+    cmd = ["ipmitool"]
     if cmdl["host"]:
-        cmd += f" -I '{cmdl['interface']}' -H '{cmdl['host']}'"
+        cmd += ["-I", cmdl["interface"], "-H", cmdl["host"]]
     if cmdl["user"]:
-        cmd += f" -U '{cmdl['user']}'"
+        cmd += ["-U", cmdl["user"]]
     if cmdl["password_file"]:
-        cmd += f" -f '{cmdl['password_file']}'"
-    cmd += " sdr list full"
+        cmd += ["-f", str(cmdl["password_file"])]
 
-    with LocalProcessManager.LocalProcessManager() as pman:
-        if not cmdl["host"]:
-            # Make sure the IPMI Linux kernel modules are loaded.
+    if not cmdl["host"]:
+        # Make sure the IPMI Linux kernel modules are loaded.
+        with LocalProcessManager.LocalProcessManager() as pman:
             for modname in _IPMI_MODULES:
                 with KernelModule.KernelModule(modname, pman=pman) as kmod:
                     kmod.load()
 
-        interval = cmdl["interval"]
-        retries = count = 0
+    interval = cmdl["interval"]
+    retries = count = reconnects = 0
+    jitter = 0.0
+    prev_latency: float | None = None
+
+    with _IPMIToolSession(cmd) as session:
+        if cmdl["dcmi_power"]:
+            query = "dcmi power reading"
+            formatter = _format_dcmi_power
+        elif cmdl["sensors"]:
+            sensors = _resolve_sensors(session, cmdl["sensors"])
+            query = "sdr get " + " ".join(f'"{name}"' for name in sensors)
+            formatter = _format_sdr_get
+        else:
+            query = "sdr list full"
+            formatter = _format_sdr_list
+
+        # Use absolute monotonic deadlines, so that the time it takes to read the sensors does not
+        # accumulate and the snapshots do not drift.
+        deadline = time.monotonic()
 
         while True:
-            start = time.time()
+            start = time.monotonic()
             try:
-                output, _ = pman.run_verify(cmd)
-            except Error:
+                lines = session.run(query)
+                output = formatter(lines)
+                if not output:
+                    raise Error("'ipmitool' did not print any readings:\n" +
+                                Error("\n".join(lines)).indent(2))
+            except Error as err:
                 if retries >= cmdl["retries"]:
                     # Too many failures.
                     raise
                 retries += 1
+                reconnects += 1
+                _LOG.debug("Restarting 'ipmitool':\n%s", err.indent(2))
+                session.restart()
                 continue
             else:
-                _LOG.info("Timestamp | %s", time.time())
-                _LOG.info(output)
+                latency = time.monotonic() - start
+                if prev_latency is not None:
+                    jitter += (abs(latency - prev_latency) - jitter) / 16
+                prev_latency = latency
+
+                _LOG.info("Timestamp | %s\n%s\n# Latency: %.6f s, jitter: %.6f s, reconnects: %d",
+                          time.time(), "\n".join(output), latency, jitter, reconnects)
                 retries = 0
             finally:
-                elapsed = time.time() - start
-                if elapsed < interval:
-                    time.sleep(interval - elapsed)
+                deadline += interval
+                now = time.monotonic()
+                if now >= deadline:
+                    # The reading took longer than the interval, skip the missed deadlines.
+                    deadline += (int((now - deadline) / interval) + 1) * interval
+                time.sleep(deadline - now)
 
             if cmdl["count"]:
                 count += 1
@@ -11,17 +11,36 @@
 stc-agent-proc-interrupts-helper - collect interrupts statistics by making a periodic snapshot of
 the '/proc/interrupts' file. This is an internal sub-tool of the 'stats-collect' tool, not intended
 to be used directly by end users.
+
+By default, every snapshot is printed in full: a "Timestamp: <time_since_epoch>" line followed by
+the '/proc/interrupts' file contents with extra white-spaces removed.
+
+In the compact mode ('--keyframes' is greater than 1), only every N-th snapshot is printed in full
+(a keyframe). The snapshots in between are printed as a "Delta: <time_since_epoch> <lines_count>"
+line followed by '<lines_count>' lines of the following format:
+
+<IRQ>: <column>:<increment> <column>:<increment> ...
+
+The lines include only the IRQs with changed counters. The columns are the 0-based interrupt counter
+columns, and the increments are relative to the preceding snapshot. A keyframe is also printed
+whenever the CPUs, the IRQs, or the IRQ descriptions change.
+
+Every snapshot is followed by a "# CPU time: <seconds>" comment line with the CPU time the helper
+spent making the snapshot.
+
+Note, 'stc-agent' takes the same snapshots in-process by default, this helper is used only when the
+'helper' interrupts collector property is set.
 """
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
-import re
 import sys
 import time
 import typing
 import argparse
 from pepclibs.helperlibs import Logging, ArgParse
 from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import ProcSamplers
 from statscollecttools import ToolInfo, _Common
 
 if typing.TYPE_CHECKING:
@@ -33,9 +52,12 @@ if typing.TYPE_CHECKING:
 
         Attributes:
             interval: The interval between '/proc/interrupts' snapshots in seconds.
+            keyframes: Print every 'keyframes'-th snapshot in full, and only the changed counters
+                       in between.
         """
 
         interval: float
+        keyframes: int
 
 _VERSION: Final[str] = ToolInfo.VERSION
 _TOOLNAME: Final[str] = "stc-agent-proc-interrupts-helper"
@@ -53,6 +75,11 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
     text = "The interval between '/proc/interrupts' snapshots in seconds. Default is 5."
     parser.add_argument("--interval", help=text, type=float, default=5)
 
+    text = """Print every N-th '/proc/interrupts' snapshot in full, and only the changed interrupt
+              counters in between. Default is 1, which means that every snapshot is printed in
+              full."""
+    parser.add_argument("--keyframes", metavar="N", help=text, type=int, default=1)
+
     # Hidden option: print paths to 'stc-agent-proc-interrupts-helper' module dependencies and exit.
     parser.add_argument("--print-module-paths", action="store_true", help=argparse.SUPPRESS)
     return parser
@@ -85,6 +112,11 @@ def _get_cmdline_args(args: argparse.Namespace) -> _CmdlineArgsTypedDict:
     if cmdl["interval"] <= 0:
         raise Error(f"Bad '--interval' value '{cmdl['interval']}': Must be positive")
 
+    cmdl["keyframes"] = args.keyframes
+
+    if cmdl["keyframes"] <= 0:
+        raise Error(f"Bad '--keyframes' value '{cmdl['keyframes']}': Must be positive")
+
     return cmdl
 
 def _main() -> int:
@@ -98,39 +130,25 @@ def _main() -> int:
 
     cmdl = _get_cmdline_args(args)
 
-    fname = "/proc/interrupts"
-    regex = re.compile(r" +")
+    interval = cmdl["interval"]
+    outfobj = sys.stdout.buffer
 
-    try:
-        fobj = open(fname, "r", encoding="utf-8")
-    except OSError as err:
-        raise Error(f"Failed to open '{fname}': {err}") from err
+    with ProcSamplers.InterruptsSampler(keyframes=cmdl["keyframes"]) as sampler:
+        # Use absolute monotonic deadlines, so that the time it takes to make a snapshot does not
+        # accumulate and the snapshots do not drift.
+        deadline = time.monotonic()
 
-    with fobj:
         while True:
-            start = time.time()
-
-            try:
-                fobj.seek(0)
-            except OSError as err:
-                raise Error(f"Failed to seek in '{fname}': {err}") from err
-
-            try:
-                # It is OK to read the entire file in one go, it should not be huge.
-                contents = fobj.read()
-            except OSError as err:
-                raise Error(f"Failed to read '{fname}': {err}") from err
-
-            # The file contents is very sparse and on large servers takes a lot of space.
-            # Shrink it by removing the extra white-spaces.
-            new_contents = re.sub(regex, " ", contents).rstrip()
-
-            _LOG.info("Timestamp: %s", time.time())
-            _LOG.info(new_contents)
-
-            elapsed = time.time() - start
-            if elapsed < cmdl["interval"]:
-                time.sleep(cmdl["interval"] - elapsed)
+            # Print the snapshot with a single call to minimize the chances of a cut snapshot.
+            outfobj.write(sampler.sample())
+            outfobj.flush()
+
+            deadline += interval
+            now = time.monotonic()
+            if now >= deadline:
+                # The snapshot took longer than the interval, skip the missed deadlines.
+                deadline += (int((now - deadline) / interval) + 1) * interval
+            time.sleep(deadline - now)
 
     return 0
 
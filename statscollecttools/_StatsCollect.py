@@ -142,6 +142,33 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
               values. """ + man_msg
     subpars.add_argument("--stats-intervals", help=text)
 
+    text = """Compress the collected statistics on the fly, specified as a comma-separated list,
+              e.g. 'turbostat:gzip,interrupts:zstd' to compress turbostat data with gzip and
+              interrupts data with zstd. Supported methods are 'gzip', 'zstd', and 'lz4'. The
+              latter two require the 'zstandard' and 'lz4' Python modules on the system the
+              statistics are collected on. """ + man_msg
+    subpars.add_argument("--stats-compression", help=text)
+
+    text = """Split the collected statistics into segments, specified as a comma-separated list of
+              segment time or size limits, e.g. 'turbostat:1h,interrupts:500MiB' to start a new
+              turbostat data segment every hour and a new interrupts data segment every 500MiB.
+              Supported time units are 's', 'm', 'h', and 'd', supported size units are 'KiB',
+              'MiB', and 'GiB'. """ + man_msg
+    subpars.add_argument("--stats-segments", help=text)
+
+    text = """Comma-separated list of CPU numbers and ranges (e.g. '0-1,8') to run the in-band
+              statistics collectors on. Use housekeeping CPUs to keep the collectors off the
+              measured CPUs. By default, the collectors may run on any CPU. """ + man_msg
+    subpars.add_argument("--stats-cpus", help=text)
+
+    text = """The niceness to run the in-band statistics collectors with, an integer in the
+              [-20, 19] range."""
+    subpars.add_argument("--stats-nice", help=text)
+
+    text = """Path to the cgroup directory on the SUT to run the in-band statistics collectors
+              in."""
+    subpars.add_argument("--stats-cgroup", help=text)
+
     text = f"""Print information about the statistics '{ToolInfo.TOOLNAME}' can collect and exit."""
     subpars.add_argument("--list-stats", action="store_true", help=text)
 
@@ -211,6 +238,20 @@ def _build_arguments_parser() -> ArgParse.ArgsParser:
               would mean CPUs 1 to 4, CPUs 7, 8, and 10 to 12."""
     subpars.add_argument("--cpus", help=text)
 
+    text = """Count of worker processes to use for parsing large raw statistics files. Currently
+              only turbostat statistics are parsed in parallel. The default is 1, which means
+              parsing sequentially."""
+    subpars.add_argument("-j", "--jobs", type=int, default=1, help=text)
+
+    text = """Path to the directory for caching the dataframes built from raw statistics files.
+              Re-generating reports for the same test results takes the dataframes from the cache
+              instead of parsing the raw statistics files again. The default is
+              '$XDG_CACHE_HOME/stats-collect' or '~/.cache/stats-collect'."""
+    subpars.add_argument("--cache-dir", type=Path, help=text)
+
+    text = """Do not use the cache, always parse the raw statistics files."""
+    subpars.add_argument("--no-cache", action="store_true", help=text)
+
     if argcomplete is not None:
         getattr(argcomplete, "autocomplete")(parser)
 
@@ -19,6 +19,7 @@ from pepclibs.helperlibs import Trivial
 from pepclibs.helperlibs.Exceptions import Error
 from statscollectlibs.helperlibs import ReportID
 from statscollectlibs.result import RORawResult
+from statscollectlibs.result._StatsCache import StatsCache
 from statscollectlibs.htmlreport import _StatsCollectHTMLReport
 from statscollecttools import ToolInfo, _Common
 
@@ -37,6 +38,9 @@ if typing.TYPE_CHECKING:
             respaths: Paths to the raw test results.
             cpus: CPU numbers to use for generating CPU-specific charts. By default, use CPUs
                   numbers found in the raw test results.
+            jobs: Count of worker processes to use for parsing raw statistics files.
+            cache: The cache of the dataframes built from raw statistics files, or 'None' if the
+                   cache should not be used.
         """
 
         outdir: Path
@@ -44,6 +48,8 @@ if typing.TYPE_CHECKING:
         copy_raw: bool
         respaths: list[Path]
         cpus: list[int] | None
+        jobs: int
+        cache: StatsCache | None
 
 def _open_raw_results(cmdl: _ReportCmdlArgsTypedDict) -> list[RORawResult.RORawResult]:
     """
@@ -115,12 +121,21 @@ def _format_args(args: argparse.Namespace) -> _ReportCmdlArgsTypedDict:
     if args.cpus:
         cpus = Trivial.split_csv_line_int(args.cpus, what="--cpus argument")
 
+    if args.jobs < 1:
+        raise Error(f"Bad count of jobs '{args.jobs}': should be a positive integer")
+
+    cache: StatsCache | None = None
+    if not args.no_cache:
+        cache = StatsCache(cachedir=args.cache_dir)
+
     cmdl: _ReportCmdlArgsTypedDict = {}
     cmdl["outdir"] = outdir
     cmdl["reportids"] = reportids
     cmdl["copy_raw"] = args.copy_raw
     cmdl["respaths"] = respaths
     cmdl["cpus"] = cpus
+    cmdl["jobs"] = args.jobs
+    cmdl["cache"] = cache
     return cmdl
 
 def report_command(args: argparse.Namespace):
@@ -139,6 +154,7 @@ def report_command(args: argparse.Namespace):
     logpath = Path(logpath).relative_to(cmdl["outdir"])
 
     rep = _StatsCollectHTMLReport.StatsCollectHTMLReport(rsts, cmdl["outdir"], cpus=cmdl["cpus"],
-                                                         logpath=logpath)
+                                                         logpath=logpath, jobs=cmdl["jobs"],
+                                                         cache=cmdl["cache"])
     rep.copy_raw = cmdl["copy_raw"]
     rep.generate()
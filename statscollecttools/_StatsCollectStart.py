@@ -44,6 +44,11 @@ if typing.TYPE_CHECKING:
             stats: The comma-separated list of statistics to collect.
             list_stats: Whether to list the available statistics and exit.
             stats_intervals: The comma-separated list of statistics collection intervals.
+            stats_compression: The comma-separated list of statistics compression methods.
+            stats_segments: The comma-separated list of statistics segment limits.
+            stats_cpus: The comma-separated list of CPUs to run the statistics collectors on.
+            stats_nice: The niceness to run the statistics collectors with.
+            stats_cgroup: The cgroup to run the statistics collectors in.
             report: Whether to generate the HTML report after the command execution.
             cmd_local: Whether to run the command locally instead of on the remote host.
             pipe_path: The path to the named pipe for inter-process communication.
@@ -57,6 +62,11 @@ if typing.TYPE_CHECKING:
         stats: str | None
         list_stats: bool
         stats_intervals: str | None
+        stats_compression: str | None
+        stats_segments: str | None
+        stats_cpus: str | None
+        stats_nice: str | None
+        stats_cgroup: str | None
         report: bool
         cmd_local: bool
         pipe_path: Path | None
@@ -122,6 +132,11 @@ def _format_args(args: argparse.Namespace) -> _StartCmdlArgsTypedDict:
     cmdl["stats"] = args.stats
     cmdl["list_stats"] = args.list_stats
     cmdl["stats_intervals"] = args.stats_intervals
+    cmdl["stats_compression"] = args.stats_compression
+    cmdl["stats_segments"] = args.stats_segments
+    cmdl["stats_cpus"] = args.stats_cpus
+    cmdl["stats_nice"] = args.stats_nice
+    cmdl["stats_cgroup"] = args.stats_cgroup
     cmdl["report"] = args.report
     cmdl["cmd_local"] = args.cmd_local
     cmdl["pipe_path"] = pipe_path
@@ -245,6 +260,12 @@ def start_command(args: argparse.Namespace):
             stcoll_builder.parse_stnames(cmdl["stats"])
             if cmdl["stats_intervals"]:
                 stcoll_builder.parse_intervals(cmdl["stats_intervals"])
+            if cmdl["stats_compression"]:
+                stcoll_builder.parse_compression(cmdl["stats_compression"])
+            if cmdl["stats_segments"]:
+                stcoll_builder.parse_segments(cmdl["stats_segments"])
+            stcoll_builder.parse_placement(cpus=cmdl["stats_cpus"], nice=cmdl["stats_nice"],
+                                           cgroup=cmdl["stats_cgroup"])
 
             stcoll = stcoll_builder.build_stcoll(pman, res, local_outdir=cmdl["outdir"])
             if not stcoll:
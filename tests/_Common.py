@@ -10,12 +10,13 @@
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+import sys
 import typing
 from pathlib import Path
 from pepclibs.helperlibs import ProcessManager
 
 if typing.TYPE_CHECKING:
-    from typing import TypedDict
+    from typing import Final, TypedDict
     from pepclibs.helperlibs.ProcessManager import ProcessManagerType
 
     class CommonTestParamsTypedDict(TypedDict):
@@ -30,6 +31,65 @@ if typing.TYPE_CHECKING:
         hostname: str
         pman: ProcessManagerType
 
+# A fake 'ipmitool' that runs the 'exec' commands and prints canned DCMI power readings and sensors
+# list. The instantaneous power reading is incremented on every 'dcmi power reading' command. If the
+# 'FAKE_IPMITOOL_EXIT_AFTER' environment variable is set to N, the fake 'ipmitool' exits without
+# printing the N-th power reading, but only once, to emulate a BMC session failure.
+_FAKE_IPMITOOL: Final[str] = '''
+import os
+import sys
+from pathlib import Path
+
+assert sys.argv[-2:] == ["exec", "/dev/stdin"], sys.argv
+
+exit_after = int(os.environ.get("FAKE_IPMITOOL_EXIT_AFTER", "0"))
+exited_path = Path(sys.argv[0]).parent / "fake-ipmitool-exited"
+
+power = 100
+with open("/dev/stdin", "r", encoding="utf-8") as fobj:
+    for line in fobj:
+        cmd = line.split()
+        if cmd == ["dcmi", "power", "reading"]:
+            power += 1
+            if power - 100 == exit_after and not exited_path.exists():
+                exited_path.touch()
+                sys.exit(1)
+            print("")
+            print(f"    Instantaneous power reading:                   {power} Watts")
+            print("    Minimum during sampling period:                 23 Watts")
+            print("    Maximum during sampling period:                350 Watts")
+            print("    Average power reading over sample period:      177 Watts")
+            print("    IPMI timestamp:                           Thu Jan 18 12:00:00 2024")
+            print("    Sampling period:                          00000001 Seconds.")
+            print("    Power reading state is:                   activated")
+            print("")
+        elif cmd == ["sdr", "list", "full"]:
+            print("System Fan 1a    | 7252 RPM          | ok")
+            print("BB Inlet Temp    | 22 degrees C      | ok")
+            print("PS1 Input Power  | 180 Watts         | ok")
+            print("PS2 Input Power  | no reading        | ns")
+            print("PS1 Curr Out %   | 9 percent         | ok")
+            print("BB +12.0V        | 11.83 Volts       | ok")
+        elif cmd[:1] == ["echo"]:
+            print(" ".join(cmd[1:]))
+'''
+
+def create_fake_ipmitool(bindir: Path) -> Path:
+    """
+    Create the fake 'ipmitool' script.
+
+    Args:
+        bindir: The directory to create the fake 'ipmitool' script in.
+
+    Returns:
+        Path to the fake 'ipmitool' script.
+    """
+
+    path = bindir / "ipmitool"
+    path.write_text(f"#!{sys.executable}\n{_FAKE_IPMITOOL}", encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
 def get_prj_src_path() -> Path:
     """
     Return the path to the stats-collect project source tree root directory.
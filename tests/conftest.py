@@ -26,8 +26,19 @@ if typing.TYPE_CHECKING:
 # The test modules that do not require a host connection.
 _NOHOST_MODULES: frozenset[str] = frozenset({
     "tests.test_logging_cmdl",
+    "tests.test_module_ACPowerDFBuilder",
+    "tests.test_module_Compression",
     "tests.test_module_InterruptsDFBuilder",
     "tests.test_module_InterruptsParser",
+    "tests.test_module_IPMIDFBuilder",
+    "tests.test_module_IPMIParser",
+    "tests.test_module_IPMIPowerDFBuilder",
+    "tests.test_module_OverheadDFBuilder",
+    "tests.test_module_ProcSamplers",
+    "tests.test_module_Segments",
+    "tests.test_module_STCAgentIPMIHelper",
+    "tests.test_module_TurbostatDFBuilder",
+    "tests.test_module_TurbostatParser",
     "tests.test_report_command",
 })
 
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'ACPowerDFBuilder' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+from tests import _Common
+from statscollectlibs.dfbuilders import _ACPowerDFBuilder
+
+_TEST_FILES = sorted(_Common.get_test_data_base().glob("results/good/*/stats/acpower.raw.txt"))
+
+# The raw AC power statistics CSV header and an example of a row.
+_HEADER = "T,P,I,V,S,Q,Phi,Fv,Vrange,Irange\n"
+_ROW = "{ts}, 327.37, 1.4519, 229.85, 333.73, -64.82, -11.2, 49.944, 300.0, 2.0\n"
+
+def _generate_acpower_file(path: Path, rows_cnt: int, footer: str):
+    """
+    Generate a synthetic raw AC power statistics file.
+
+    Args:
+        path: Path to the file to generate.
+        rows_cnt: Count of rows to generate.
+        footer: The last line to append to the file.
+    """
+
+    with open(path, "w", encoding="utf-8") as fobj:
+        fobj.write(_HEADER)
+        fobj.writelines(_ROW.format(ts=1737461935.5 + idx / 10) for idx in range(rows_cnt))
+        fobj.write(footer)
+
+def test_good_results():
+    """
+    Test the 'ACPowerDFBuilder' module with well-formatted raw AC power statistics files.
+    """
+
+    assert _TEST_FILES, "No raw AC power statistics test files found"
+
+    for path in _TEST_FILES:
+        pfx = f"DataFrame for '{path}'"
+        dfbldr = _ACPowerDFBuilder.ACPowerDFBuilder()
+        df = dfbldr.build_df(path)
+
+        # Every line except for the header and the last line ("Interrupted, exiting") is a row.
+        with open(path, "r", encoding="utf-8") as fobj:
+            rows_cnt = len(fobj.readlines()) - 2
+
+        assert len(df) == rows_cnt, f"{pfx}: Expected {rows_cnt} datapoints, got {len(df)}"
+        assert set(df.columns) == set(dfbldr.mdo.mdd), \
+               f"{pfx}: Expected one column per metric definition"
+        assert df["T"].is_monotonic_increasing, f"{pfx}: Time-stamps are not increasing"
+        assert df["TimeElapsed"].iloc[0] == 0, f"{pfx}: Elapsed time does not start at 0"
+
+def test_truncated_last_line(tmp_path: Path):
+    """
+    Test that a partially written last line is excluded, whether or not it is newline-terminated.
+    """
+
+    for footer in ("Interrupted, exiting\n", "1737461999.5, 32", "1737461999.5, 32\n"):
+        path = tmp_path / "acpower.raw.txt"
+        _generate_acpower_file(path, 10, footer)
+
+        df = _ACPowerDFBuilder.ACPowerDFBuilder().build_df(path)
+
+        assert len(df) == 10, f"Footer '{footer.strip()}': Expected 10 datapoints, got {len(df)}"
+        assert (df["P"] == 327.37).all(), f"Footer '{footer.strip()}': Unexpected 'P' values"
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'Compression' module and for loading compressed raw statistics files."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import typing
+import pytest
+from pepclibs.helperlibs.Exceptions import Error
+from statscollectlibs.helperlibs import Compression
+from statscollectlibs.parsers import InterruptsParser, TurbostatParser
+from statscollectlibs.dfbuilders import _ACPowerDFBuilder
+
+from tests import _Common
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+_TEST_RESULTS_DIR = _Common.get_test_data_base() / "results" / "good"
+
+def _compress_file(src: Path, dst_dir: Path, method: str, flush_every: int = 0) -> Path:
+    """
+    Compress a file the same way 'stc-agent' compresses the collector output.
+
+    Args:
+        src: Path to the file to compress.
+        dst_dir: The directory to create the compressed file in.
+        method: The compression method.
+        flush_every: If non-zero, create a flush point every 'flush_every' lines.
+
+    Returns:
+        Path to the compressed file.
+    """
+
+    dst = dst_dir / Compression.add_suffix(src.name, method)
+    with open(src, "rb") as srcobj, open(dst, "wb") as dstobj:
+        compressor = Compression.StreamCompressor(method, dstobj)
+        for idx, line in enumerate(srcobj):
+            compressor.write(line)
+            if flush_every and idx % flush_every == 0:
+                compressor.flush()
+        compressor.close()
+
+    return dst
+
+def _check_method(method: str):
+    """
+    Skip the test if a compression method is not available.
+
+    Args:
+        method: The compression method to check.
+    """
+
+    try:
+        Compression.check_method(method)
+    except Error as err:
+        pytest.skip(str(err))
+
+@pytest.mark.parametrize("method", list(Compression.SUFFIXES))
+def test_truncated(tmp_path: Path, method: str):
+    """
+    Test that the data written before a flush point are decompressed from a truncated file, and
+    that multiple concatenated compressed streams are decompressed.
+    """
+
+    _check_method(method)
+
+    lines = [f"Line {idx}: {'x' * (idx % 100)}\n".encode("utf-8") for idx in range(10000)]
+
+    path = tmp_path / Compression.add_suffix("test.raw.txt", method)
+    with open(path, "wb") as fobj:
+        compressor = Compression.StreamCompressor(method, fobj)
+        compressor.write(b"".join(lines[:5000]))
+        compressor.flush()
+        cut = fobj.tell()
+        compressor.write(b"".join(lines[5000:]))
+        compressor.close()
+
+    with Compression.open_binary(path) as fobj:
+        assert fobj.read() == b"".join(lines), f"{method}: Bad decompressed data"
+
+    data = path.read_bytes()
+    # Cut the file in the middle of the data following the flush point.
+    path.write_bytes(data[:cut + 10])
+    with Compression.open_binary(path) as fobj:
+        assert fobj.read().startswith(b"".join(lines[:5000])), \
+               f"{method}: The data before the flush point were not decompressed"
+
+    path.write_bytes(data + data)
+    with Compression.open_text(path) as fobj:
+        assert fobj.readlines() == [line.decode("utf-8") for line in lines] * 2, \
+               f"{method}: Bad decompressed data of concatenated streams"
+
+def test_parsers(tmp_path: Path):
+    """
+    Test that the parsers yield the same data for compressed and not compressed raw statistics
+    files.
+    """
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/turbostat.raw.txt"))[:2]:
+        cpath = _compress_file(path, tmp_path, "gzip", flush_every=100)
+        tdicts = list(TurbostatParser.TurbostatParser(path, derivatives=True).next())
+        ctdicts = list(TurbostatParser.TurbostatParser(cpath, derivatives=True).next_parallel(2))
+        assert tdicts == ctdicts, f"Different turbostat data for compressed '{path}'"
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/interrupts.raw.txt"))[:2]:
+        cpath = _compress_file(path, tmp_path, "gzip", flush_every=100)
+        parser = InterruptsParser.InterruptsParser(path=path)
+        cparser = InterruptsParser.InterruptsParser(path=cpath, index_dir=tmp_path / "index")
+
+        timestamps = [dataset["timestamp"] for dataset in parser.next()]
+        ctimestamps = [dataset["timestamp"] for dataset in cparser.next()]
+        assert timestamps == ctimestamps, f"Different interrupts data for compressed '{path}'"
+
+        assert cparser.get_snapshots_count() == len(timestamps)
+        assert cparser.get_snapshot(-1)["timestamp"] == timestamps[-1]
+        ctimestamps = [dataset["timestamp"] for dataset in
+                       cparser.next(begin_ts=timestamps[1], end_ts=timestamps[-2])]
+        assert ctimestamps == timestamps[1:-1], \
+               f"Different interrupts time window for compressed '{path}'"
+        assert not (tmp_path / "index").exists(), \
+               "The snapshots index should not be saved for compressed files"
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/acpower.raw.txt"))[:1]:
+        cpath = _compress_file(path, tmp_path, "gzip")
+        df = _ACPowerDFBuilder.ACPowerDFBuilder().build_df(path)
+        cdf = _ACPowerDFBuilder.ACPowerDFBuilder().build_df(cpath)
+        assert df.equals(cdf), f"Different AC power data for compressed '{path}'"
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'IPMIDFBuilder' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+from tests import _Common
+from statscollectlibs.dfbuilders import _IPMIDFBuilder
+
+_TEST_RESULTS_DIR = _Common.get_test_data_base() / "results" / "good"
+
+# The raw IPMI statistics file used as a template for generating synthetic files.
+_TEMPLATE_PATH = _TEST_RESULTS_DIR / "knl0" / "stats" / "ipmi-oob.raw.txt"
+
+def _generate_ipmi_file(path: Path,
+                        snapshots_cnt: int,
+                        drop_every: int = 0,
+                        no_readings: dict[int, tuple[str, str]] | None = None):
+    """
+    Generate a synthetic raw IPMI statistics file by replicating the first snapshot of the template
+    file 'snapshots_cnt' times with shifted time-stamps.
+
+    Args:
+        path: Path to the file to generate.
+        snapshots_cnt: Count of snapshots to generate.
+        drop_every: If non-zero, drop the "BB Inlet Temp" sensor line from every 'drop_every'-th
+                    snapshot, except for the first one.
+        no_readings: A snapshot index to a '(sensor name, reading)' tuple dictionary, for replacing
+                     the reading of a sensor in a snapshot (e.g., with "na").
+    """
+
+    with open(_TEMPLATE_PATH, "r", encoding="utf-8") as fobj:
+        lines = fobj.read().splitlines()
+
+    ts_idxs = [idx for idx, line in enumerate(lines) if line.startswith("Timestamp")]
+    timestamp = float(lines[0].split("|")[1])
+    snapshot = lines[ts_idxs[0] + 1:ts_idxs[1]]
+
+    with open(path, "w", encoding="utf-8") as fobj:
+        for idx in range(snapshots_cnt):
+            fobj.write(f"Timestamp | {timestamp + idx:.6f}\n")
+            if drop_every and idx and idx % drop_every == 0:
+                fobj.write("\n".join(line for line in snapshot
+                                     if not line.startswith("BB Inlet Temp")) + "\n")
+            elif no_readings and idx in no_readings:
+                sensor, reading = no_readings[idx]
+                for line in snapshot:
+                    elts = line.split("|")
+                    if elts[0].strip() == sensor:
+                        line = f"{elts[0]}| {reading} | {elts[2].strip()}"
+                    fobj.write(line + "\n")
+            else:
+                fobj.write("\n".join(snapshot) + "\n")
+
+def _build_df(path: Path):
+    """
+    Build the IPMI dataframe for a raw IPMI statistics file.
+
+    Args:
+        path: Path to the raw IPMI statistics file.
+
+    Returns:
+        A tuple of the dataframe builder and the built dataframe.
+    """
+
+    dfbldr = _IPMIDFBuilder.IPMIDFBuilder()
+    df = dfbldr.build_df(path)
+    return dfbldr, df
+
+def test_good_results():
+    """
+    Test the 'IPMIDFBuilder' module with well-formatted raw IPMI statistics files.
+    """
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/ipmi-*.raw.txt")):
+        pfx = f"DataFrame for '{path}'"
+        dfbldr, df = _build_df(path)
+
+        assert dfbldr.mdo is not None, f"{pfx}: No metrics definitions"
+        assert list(df.columns) == list(dfbldr.mdo.mdd), \
+               f"{pfx}: Expected one column per metric definition"
+        assert df["Timestamp"].is_monotonic_increasing, f"{pfx}: Time-stamps are not increasing"
+        assert df["TimeElapsed"].iloc[0] == 0, f"{pfx}: Elapsed time does not start at 0"
+
+def test_missing_readings(tmp_path: Path):
+    """
+    Test that readings of sensors missing in some snapshots are NaN.
+    """
+
+    path = tmp_path / "ipmi-oob.raw.txt"
+    _generate_ipmi_file(path, 30, drop_every=10)
+
+    _, df = _build_df(path)
+
+    assert len(df) == 30, f"Expected 30 datapoints, got {len(df)}"
+    nan_rows = list(df.index[df["BB Inlet Temp"].isnull()])
+    assert nan_rows == [10, 20], f"Expected NaN readings in rows 10 and 20, got {nan_rows}"
+    assert not df.drop(columns="BB Inlet Temp").isnull().values.any(), \
+           "Expected NaN readings only for the 'BB Inlet Temp' sensor"
+
+def test_dtypes_and_no_readings(tmp_path: Path):
+    """
+    Test the datapoints count and the column types, and that "na" and "disabled" readings are NaN.
+    """
+
+    snapshots_cnt = 100
+    no_readings = {10: ("BB Inlet Temp", "na"), 20: ("BB +12.0V", "disabled")}
+
+    path = tmp_path / "ipmi-oob.raw.txt"
+    _generate_ipmi_file(path, snapshots_cnt, no_readings=no_readings)
+
+    _, df = _build_df(path)
+
+    assert len(df) == snapshots_cnt, f"Expected {snapshots_cnt} datapoints, got {len(df)}"
+    assert "DIMM Thrm Mrgn 1" not in df, "Expected no column for a sensor without a reading"
+
+    for colname in ("Timestamp", "TimeElapsed", "BB Inlet Temp", "BB +12.0V"):
+        assert df[colname].dtype == "float64", \
+               f"Expected 'float64' type of '{colname}', got '{df[colname].dtype}'"
+    # The readings of this sensor are all integers.
+    assert df["System Fan 1a"].dtype == "int64", \
+           f"Expected 'int64' type of 'System Fan 1a', got '{df['System Fan 1a'].dtype}'"
+
+    for idx, (sensor, _) in no_readings.items():
+        nan_rows = list(df.index[df[sensor].isnull()])
+        assert nan_rows == [idx], f"Expected NaN '{sensor}' reading in row {idx}, got {nan_rows}"
+    sensors = [sensor for sensor, _ in no_readings.values()]
+    assert not df.drop(columns=sensors).isnull().values.any(), \
+           "Expected NaN readings only for the sensors without a reading"
+    assert df["BB Inlet Temp"].iloc[0] == 22
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'IPMIParser' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import math
+import typing
+from statscollectlibs.parsers import IPMIParser
+
+from tests import _Common
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from statscollectlibs.parsers.IPMIParser import ColumnsTypedDict
+
+_TEST_FILES = sorted(_Common.get_test_data_base().glob("results/good/*/stats/ipmi-*.raw.txt"))
+
+def _check_columns(pfx: str, datasets: list[dict], columns: ColumnsTypedDict):
+    """
+    Check that the columns from 'IPMIParser.get_columns()' include the same sensor readings as the
+    datasets from 'IPMIParser.next()'.
+
+    Args:
+        pfx: The assertion messages prefix.
+        datasets: The datasets from 'IPMIParser.next()'.
+        columns: The columns from 'IPMIParser.get_columns()'.
+    """
+
+    timestamps = [dataset["Timestamp"][0] for dataset in datasets]
+    assert list(columns["timestamps"]) == timestamps, f"{pfx}: Different time-stamps"
+
+    for idx, dataset in enumerate(datasets):
+        for name, col in columns["columns"].items():
+            assert len(col) == len(datasets), f"{pfx}: Bad '{name}' column length {len(col)}"
+
+            val, unit = dataset.get(name, (None, None))
+            if val is None:
+                assert math.isnan(col[idx]), \
+                       f"{pfx}: Expected no '{name}' reading in snapshot {idx}, got {col[idx]}"
+            else:
+                assert col[idx] == val, \
+                       f"{pfx}: Expected '{name}' reading {val} in snapshot {idx}, got {col[idx]}"
+                assert columns["units"][name] == unit, \
+                       f"{pfx}: Expected '{name}' unit '{unit}', got '{columns['units'][name]}'"
+
+        for name in dataset:
+            if name != "Timestamp":
+                assert name in columns["columns"], f"{pfx}: Missing '{name}' column"
+
+def test_columns_mode():
+    """
+    Test that 'IPMIParser.get_columns()' yields the same sensor readings as 'IPMIParser.next()'.
+    """
+
+    assert _TEST_FILES, "No raw IPMI statistics test files found"
+
+    for test_file in _TEST_FILES:
+        datasets = list(IPMIParser.IPMIParser(path=test_file).next())
+        columns = IPMIParser.IPMIParser(path=test_file).get_columns()
+        _check_columns(str(test_file), datasets, columns)
+
+def test_columns_mode_reordered(tmp_path: Path):
+    """
+    Test 'IPMIParser.get_columns()' with sensors that change order, appear and disappear, have no
+    readings, and have duplicate names.
+    """
+
+    lines = """Timestamp | 1705672515.054093
+System Fan 1     | 2491 RPM          | ok
+PS1 Input Power  | 180 Watts         | ok
+PS1 Input Power  | 181 Watts         | ok
+Inlet Temp       | no reading        | ns
+Timestamp | 1705672516.054093
+System Fan 1     | 2492 RPM          | ok
+PS1 Input Power  | 182 Watts         | ok
+PS1 Input Power  | 183 Watts         | ok
+Inlet Temp       | 22 degrees C      | ok
+Timestamp | 1705672517.054093
+PS1 Input Power  | 184 Watts         | ok
+System Fan 1     | disabled          | ns
+Exit Air Temp    | 38 degrees C      | ok
+PS1 Input Power  | 185 Watts         | ok
+Timestamp | 1705672518.054093
+System Fan 1 | 2494 RPM | ok
+"""
+
+    path = tmp_path / "ipmi-oob.raw.txt"
+    path.write_text(lines, encoding="utf-8")
+
+    datasets = list(IPMIParser.IPMIParser(path=path).next())
+    columns = IPMIParser.IPMIParser(path=path).get_columns()
+    _check_columns(str(path), datasets, columns)
+
+    assert set(columns["columns"]) == {"System Fan 1", "PS1 Input Power", "PS1 Input Power_1",
+                                       "Inlet Temp", "Exit Air Temp"}
+    assert columns["units"]["Inlet Temp"] == "degrees C"
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'IPMIPowerDFBuilder' module and the DCMI power mode of 'stc-agent-ipmi-helper'."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import sys
+import math
+from pathlib import Path
+from tests import _Common
+from statscollectlibs.dfbuilders import _IPMIPowerDFBuilder
+
+def test_fake_ipmitool(tmp_path: Path):
+    """
+    Test collecting DCMI power readings with 'stc-agent-ipmi-helper' and a fake 'ipmitool', and
+    building the dataframe from the collected statistics.
+    """
+
+    _Common.create_fake_ipmitool(tmp_path)
+
+    helper_path = _Common.get_prj_src_path() / "stc-agent-ipmi-helper"
+    cmd = f"PATH='{tmp_path}':\"$PATH\" {sys.executable} {helper_path} --host bmc --dcmi-power " \
+          f"--count 5 --interval 0.1"
+
+    with _Common.get_pman("localhost") as pman:
+        stdout, stderr, exitcode = pman.run_join(cmd)
+
+    assert exitcode == 0, f"'{cmd}' exited with code {exitcode}\nstderr:\n{stderr}"
+
+    path = tmp_path / "ipmi-power.raw.txt"
+    path.write_text(stdout, encoding="utf-8")
+
+    df = _IPMIPowerDFBuilder.IPMIPowerDFBuilder().build_df(path)
+
+    assert len(df) == 5, f"Expected 5 datapoints, got {len(df)}"
+    assert list(df["InstPower"]) == [101, 102, 103, 104, 105], \
+           f"Unexpected instantaneous power readings: {list(df['InstPower'])}"
+    assert (df["AvgPower"] == 177).all(), "Unexpected average power readings"
+    assert df["Timestamp"].is_monotonic_increasing, "Time-stamps are not increasing"
+    assert df["TimeElapsed"].iloc[0] == 0, "Elapsed time does not start at 0"
+
+def test_power_reading_deactivated(tmp_path: Path):
+    """
+    Test that readings are NaN when the BMC reports that power reading is not activated.
+    """
+
+    lines = """Timestamp | 1705672515.054093
+Instantaneous power reading: 180 Watts
+Minimum during sampling period: 23 Watts
+Maximum during sampling period: 350 Watts
+Average power reading over sample period: 177 Watts
+Power reading state is: activated
+# Latency: 0.012345 s, jitter: 0.000000 s, reconnects: 0
+Timestamp | 1705672516.054093
+Instantaneous power reading: 0 Watts
+Minimum during sampling period: 0 Watts
+Maximum during sampling period: 0 Watts
+Average power reading over sample period: 0 Watts
+Power reading state is: deactivated
+"""
+
+    path = tmp_path / "ipmi-power.raw.txt"
+    path.write_text(lines, encoding="utf-8")
+
+    df = _IPMIPowerDFBuilder.IPMIPowerDFBuilder().build_df(path)
+
+    assert len(df) == 2, f"Expected 2 datapoints, got {len(df)}"
+    assert df["InstPower"].iloc[0] == 180, f"Expected 180 Watts, got {df['InstPower'].iloc[0]}"
+    assert math.isnan(df["InstPower"].iloc[1]), \
+           f"Expected no reading when power reading is deactivated, got {df['InstPower'].iloc[1]}"
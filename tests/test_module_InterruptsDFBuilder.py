@@ -10,11 +10,70 @@
 
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
+from pathlib import Path
 from tests import _Common
 from statscollectlibs.result import RORawResult, LoadedResult
+from statscollectlibs.dfbuilders import _InterruptsDFBuilder
+from statscollectlibs.parsers import InterruptsParser
 
 _TEST_RESULTS_DIR = _Common.get_test_data_base() / "test_module_InterruptsDFBuilder" / "results"
 
+def _generate_interrupts_file(path: Path, cpus_cnt: int, irqs_cnt: int, snapshots_cnt: int):
+    """
+    Generate a synthetic raw interrupts statistics file.
+
+    Args:
+        path: Path to the file to generate.
+        cpus_cnt: Count of CPUs.
+        irqs_cnt: Count of numbered IRQs.
+        snapshots_cnt: Count of '/proc/interrupts' snapshots to generate.
+    """
+
+    header = " ".join(f"CPU{cpu}" for cpu in range(cpus_cnt))
+
+    with open(path, "w", encoding="utf-8") as fobj:
+        for snapshot in range(snapshots_cnt):
+            fobj.write(f"Timestamp: {1700000000 + snapshot:.6f}\n")
+            fobj.write(f"{header}\n")
+            for irq in range(irqs_cnt):
+                counts = " ".join(str(snapshot * ((irq * 7 + cpu) % 13)) for cpu in range(cpus_cnt))
+                fobj.write(f"{irq}: {counts} IR-PCI-MSI {irq}-edge dev{irq}\n")
+            for name in ("NMI", "LOC"):
+                counts = " ".join(str(snapshot * (cpu % 5 + 1)) for cpu in range(cpus_cnt))
+                fobj.write(f"{name}: {counts} Synthetic interrupts\n")
+            fobj.write("ERR: 0\n")
+
+def _build_system_columns_reference(path: Path, colnames: list[str]) -> dict[str, list[int]]:
+    """
+    Calculate the System scope interrupt count columns the straightforward way: parse the file in
+    the dictionary mode and sum the counts of every IRQ over all CPUs in Python loops.
+
+    Args:
+        path: Path to the raw interrupts statistics file.
+        colnames: The System scope column names to calculate.
+
+    Returns:
+        A dictionary indexed by column names, with lists of per-snapshot interrupt count deltas as
+        values.
+    """
+
+    values: dict[str, list[int]] = {colname: [] for colname in colnames}
+
+    for dataset in InterruptsParser.InterruptsParser(path).next():
+        for colname in colnames:
+            irqname = colname.split("-", 1)[1]
+            total = 0
+            for irqs_info in dataset["cpu2irqs"].values():
+                for name, cnt in irqs_info.items():
+                    if irqname == name or irqname == "Total" or \
+                       (irqname == "Total_IRQ" and name.startswith("IRQ")) or \
+                       (irqname == "Total_XYZ" and not name.startswith("IRQ")):
+                        total += cnt
+            values[colname].append(total)
+
+    return {colname: [val2 - val1 for val1, val2 in zip(vals, vals[1:])]
+            for colname, vals in values.items()}
+
 def _is_valid_cpu_scope(scope: str) -> bool:
     """
     Check if the given scope is a valid CPU scope.
@@ -94,3 +153,23 @@ def test_good_results():
             rate_colname = f"{colname}_rate"
             assert rate_colname in df.columns, \
                     f"{pfx}: Missing interrupt rate column '{rate_colname}' for '{colname}'"
+
+def test_system_scope_reference(tmp_path: Path):
+    """
+    Verify that the 'InterruptsDFBuilder' System scope values built for a synthetic 448-CPU
+    interrupts statistics file are the same as the values of the straightforward per-CPU summation.
+    """
+
+    path = tmp_path / "interrupts.raw.txt"
+    _generate_interrupts_file(path, cpus_cnt=448, irqs_cnt=200, snapshots_cnt=10)
+
+    df = _InterruptsDFBuilder.InterruptsDFBuilder(cpus=[0, 447]).build_df(path)
+
+    colnames = [colname for colname in df.columns
+                if colname.startswith("System-") and not colname.endswith("_rate")]
+    assert colnames, "No System scope columns"
+
+    ref = _build_system_columns_reference(path, colnames)
+
+    for colname in colnames:
+        assert list(df[colname]) == ref[colname], f"Different values in column '{colname}'"
@@ -11,8 +11,11 @@
 from __future__ import annotations # Remove when switching to Python 3.10+.
 
 import typing
+import shutil
+from pathlib import Path
 from pepclibs.helperlibs.Exceptions import ErrorBadFormat
 from pepclibs.helperlibs import Trivial
+from statscollectlibs.helperlibs import ProcSamplers
 from statscollectlibs.parsers import InterruptsParser
 
 from tests import _Common
@@ -111,6 +114,163 @@ def test_complete_files():
                 assert "hwirq" in info, f"Missing 'hwirq' for '{name}'"
                 assert "action" in info, f"Missing 'action' for '{name}'"
 
+def test_matrix_mode():
+    """
+    Test that 'InterruptsParser' yields the same interrupt counts in the matrix mode as in the
+    dictionary mode.
+    """
+
+    for test_file in _TEST_FILES_DIR.iterdir():
+        pfx = str(test_file)
+
+        parser = InterruptsParser.InterruptsParser(path=test_file)
+        dict_datasets = list(parser.next())
+        matrix_datasets = list(parser.next_matrix())
+
+        assert len(dict_datasets) == len(matrix_datasets), \
+               f"{pfx}: Got {len(dict_datasets)} datasets in the dictionary mode, but " \
+               f"{len(matrix_datasets)} datasets in the matrix mode"
+
+        for dict_ds, matrix_ds in zip(dict_datasets, matrix_datasets):
+            assert dict_ds["timestamp"] == matrix_ds["timestamp"], \
+                   f"{pfx}: Different timestamps {dict_ds['timestamp']} and " \
+                   f"{matrix_ds['timestamp']}"
+
+            counts = matrix_ds["counts"]
+            assert counts.shape == (len(matrix_ds["irqs"]), len(matrix_ds["cpus"])), \
+                   f"{pfx}: Bad interrupt counts matrix shape {counts.shape}"
+
+            for col, cpu in enumerate(matrix_ds["cpus"]):
+                cpu_irqs = dict_ds["cpu2irqs"][cpu]
+                for row, irqname in enumerate(matrix_ds["irqs"]):
+                    assert counts[row, col] == cpu_irqs.get(irqname, 0), \
+                           f"{pfx}: Different '{irqname}' count for CPU{cpu} at timestamp " \
+                           f"{dict_ds['timestamp']}"
+
+            for irqname in dict_ds["irq_info"]:
+                assert irqname in matrix_ds["irq_info"], f"{pfx}: Missing '{irqname}' IRQ info"
+
+def test_snapshots_index(tmp_path: Path):
+    """
+    Test that direct snapshot access and time window reads using the snapshots index produce the
+    same datasets as parsing the entire file, with and without the saved index file.
+    """
+
+    for test_file in _TEST_FILES_DIR.iterdir():
+        pfx = str(test_file)
+
+        path = tmp_path / test_file.name
+        shutil.copy(test_file, path)
+        index_dir = tmp_path / f"{test_file.name}-index"
+
+        datasets = list(InterruptsParser.InterruptsParser(path=path).next())
+        timestamps = [dataset["timestamp"] for dataset in datasets]
+
+        # Parse twice: the first time builds and saves the index, the second time loads it.
+        for _ in range(2):
+            parser = InterruptsParser.InterruptsParser(path=path, index_dir=index_dir)
+
+            for idx, dataset in enumerate(datasets):
+                assert parser.get_snapshot(idx) == dataset, \
+                       f"{pfx}: Different dataset for snapshot number {idx}"
+
+            begin_ts = timestamps[len(timestamps) // 3]
+            end_ts = timestamps[-1]
+            window = [dataset["timestamp"] for dataset in parser.next(begin_ts=begin_ts,
+                                                                      end_ts=end_ts)]
+            expected = [ts for ts in timestamps if begin_ts <= ts <= end_ts]
+            assert window == expected, \
+                   f"{pfx}: Expected snapshots with timestamps {expected} in the time window, " \
+                   f"got {window}"
+
+            window_matrix = [dataset["timestamp"] for dataset in
+                             parser.next_matrix(begin_ts=begin_ts, end_ts=end_ts)]
+            assert window_matrix == expected, \
+                   f"{pfx}: Expected snapshots with timestamps {expected} in the time window in " \
+                   f"the matrix mode, got {window_matrix}"
+
+            if "-cut" not in test_file.name:
+                assert not list(parser.next(begin_ts=timestamps[-1] + 1)), \
+                       f"{pfx}: Expected no snapshots after the last time-stamp"
+
+            index_paths = list(index_dir.glob("*.npz"))
+            assert len(index_paths) == 1, \
+                   f"{pfx}: Expected one snapshots index file in '{index_dir}', got {index_paths}"
+
+def _write_compact_file(src: Path, dst: Path, keyframes: int):
+    """
+    Convert a raw interrupts statistics file to the compact format the same way the
+    'stc-agent-proc-interrupts-helper' tool does it.
+
+    Args:
+        src: Path to the raw interrupts statistics file to convert.
+        dst: Path to the compact raw interrupts statistics file to create.
+        keyframes: Write every 'keyframes'-th snapshot in full, and only the changed counters in
+                   between.
+    """
+
+    snapshots: list[tuple[str, list[str]]] = []
+    with open(src, "r", encoding="utf-8") as fobj:
+        for line in fobj:
+            line = line.rstrip()
+            if line.startswith(("Timestamp:", "timestamp:")):
+                snapshots.append((line.split()[1], []))
+            elif snapshots and line:
+                snapshots[-1][1].append(line)
+
+    encoder = ProcSamplers._DeltaEncoder() # pylint: disable=protected-access
+    with open(dst, "w", encoding="utf-8") as fobj:
+        for idx, (timestamp, lines) in enumerate(snapshots):
+            contents = "\n".join(lines)
+            deltas = None
+            if idx % keyframes:
+                deltas = encoder.encode(contents)
+            if deltas is None:
+                fobj.write(f"Timestamp: {timestamp}\n{contents}\n")
+                encoder.keyframe(contents)
+            else:
+                fobj.write("\n".join([f"Delta: {timestamp} {len(deltas)}"] + deltas) + "\n")
+
+def test_compact_format(tmp_path: Path):
+    """
+    Test that 'InterruptsParser' yields the same datasets for the compact raw interrupts
+    statistics files as for the original files.
+    """
+
+    for test_file in _TEST_FILES_DIR.iterdir():
+        if "-cut" in test_file.name:
+            continue
+
+        pfx = str(test_file)
+        path = tmp_path / test_file.name
+        _write_compact_file(test_file, path, 4)
+
+        assert path.stat().st_size < test_file.stat().st_size, \
+               f"{pfx}: The compact file is not smaller than the original file"
+
+        parser = InterruptsParser.InterruptsParser(path=test_file)
+        datasets = list(parser.next())
+        matrix_datasets = list(parser.next_matrix())
+
+        parser = InterruptsParser.InterruptsParser(path=path)
+        assert list(parser.next()) == datasets, f"{pfx}: Different datasets in the compact file"
+
+        for idx, dataset in enumerate(parser.next_matrix()):
+            assert dataset["irqs"] == matrix_datasets[idx]["irqs"], \
+                   f"{pfx}: Different IRQs in snapshot number {idx} of the compact file"
+            assert (dataset["counts"] == matrix_datasets[idx]["counts"]).all(), \
+                   f"{pfx}: Different interrupt counts in snapshot number {idx} of the compact " \
+                   f"file"
+
+        for idx in (1, 3, len(datasets) - 1):
+            assert parser.get_snapshot(idx) == datasets[idx], \
+                   f"{pfx}: Different dataset for snapshot number {idx} of the compact file"
+
+        begin_ts = datasets[len(datasets) // 3]["timestamp"]
+        window = list(parser.next(begin_ts=begin_ts))
+        assert window == [dataset for dataset in datasets if dataset["timestamp"] >= begin_ts], \
+               f"{pfx}: Different datasets in the time window of the compact file"
+
 _BAD_INPUT: dict[str, str] = {
     "Too short input #1": "Timestamp: 1234567890",
 
@@ -135,6 +295,39 @@ CPU-1 CPU2
     "Bad interrupts count value": r"""Timestamp: 1234567890.1
 CPU1 CPU2
 1: x""",
+
+    "Bad delta header": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 1
+Delta: 1234567890.2""",
+
+    "Unknown delta IRQ": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 1
+Delta: 1234567890.2 1
+2: 0:1""",
+
+    "Bad delta column": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 1
+Delta: 1234567890.2 1
+1: 2:1""",
+
+    "Too many delta lines": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 1
+Delta: 1234567890.2 1
+1: 0:1
+1: 1:1""",
+
+    "Too few delta lines": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 1
+Delta: 1234567890.2 2
+1: 0:1
+Timestamp: 1234567890.3
+CPU1 CPU2
+1: 2 1""",
 }
 
 def test_bad_input():
@@ -143,14 +336,16 @@ def test_bad_input():
     """
 
     for name, bad_input in _BAD_INPUT.items():
-        parser = InterruptsParser.InterruptsParser(lines=iter(bad_input.splitlines()))
-        try:
-            for _ in parser.next():
-                pass
-        except ErrorBadFormat:
-            continue
+        for matrix in (False, True):
+            parser = InterruptsParser.InterruptsParser(lines=iter(bad_input.splitlines()))
+            generator = parser.next_matrix() if matrix else parser.next()
+            try:
+                for _ in generator:
+                    pass
+            except ErrorBadFormat:
+                continue
 
-        assert False, f"Did not get 'ErrorBadFormat' with the following bad input: '{name}'"
+            assert False, f"Did not get 'ErrorBadFormat' with the following bad input: '{name}'"
 
 _GOOD_INPUT: dict[str, _GoodInputEntry] = {
     "Good input #1": {
@@ -195,6 +390,23 @@ CPU1
 Timestamp: 1234567890.2
 CPU1
 1: 2
+Interrupted, exiting""",
+    },
+
+    "Good input #6": {
+        "yield_cnt": 3,
+        "input": r"""Timestamp: 1234567890.1
+CPU1 CPU2
+1: 1 3
+ERR: 0
+# CPU time: 0.000210
+Delta: 1234567890.2 2
+1: 1:2
+ERR: 0:1
+# CPU time: 0.000120
+Delta: 1234567890.3 0
+# CPU time: 0.000110
+Delta: 1234567890.4 1
 Interrupted, exiting""",
     },
 }
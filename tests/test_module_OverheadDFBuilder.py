@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'OverheadDFBuilder' module and for the 'OverheadSampler' sampler."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import time
+import subprocess
+from pathlib import Path
+from statscollectlibs.helperlibs import ProcSamplers
+from statscollectlibs.dfbuilders import _OverheadDFBuilder
+
+def test_overhead_sampler(tmp_path: Path):
+    """
+    Test sampling a process group with 'OverheadSampler' and building the dataframe from the
+    samples.
+    """
+
+    # A shell process with a child process consuming CPU time.
+    cmd = "(while :; do :; done) & sleep 10"
+    proc = subprocess.Popen(["sh", "-c", cmd]) # pylint: disable=consider-using-with
+    path = tmp_path / "stc-overhead.raw.txt"
+
+    try:
+        groups = {"busy-loop": proc.pid, "no-such-pid": 2**22 + 1}
+        with ProcSamplers.OverheadSampler(lambda: groups, self_name="stc-agent") as sampler, \
+             open(path, "wb") as fobj:
+            for _ in range(5):
+                fobj.write(sampler.sample())
+                time.sleep(0.2)
+    finally:
+        subprocess.run(["pkill", "-KILL", "-P", str(proc.pid)], check=False)
+        proc.kill()
+        proc.wait()
+
+    df = _OverheadDFBuilder.OverheadDFBuilder().build_df(path)
+
+    assert len(df) == 4, f"Expected 4 datapoints, got {len(df)}"
+    assert not any(colname.startswith("no_such_pid-") for colname in df.columns), \
+           "Got columns for a non-existing process"
+
+    # The shell, the busy loop sub-shell, and the 'sleep' processes.
+    assert (df["busy_loop-Processes"] == 3).all(), "Unexpected processes count"
+    # The busy loop keeps a CPU busy, allow for the coarse CPU time granularity.
+    assert df["busy_loop-CPU%"].mean() > 50, "Unexpected busy loop CPU usage"
+    assert (df["stc_agent-Processes"] == 1).all(), "Unexpected 'stc-agent' processes count"
+    assert (df["stc_agent-RSS"] > 0).all(), "Unexpected 'stc-agent' RSS"
+
+    total = df["busy_loop-CPU%"] + df["stc_agent-CPU%"]
+    assert (df["Total-CPU%"] - total).abs().max() < 1e-6, "Bad total CPU usage"
+
+def test_overhead_gaps(tmp_path: Path):
+    """
+    Test that the collection overhead of missing or restarted process groups is never negative.
+    """
+
+    lines = """Timestamp: 100.0
+stc-agent: pids=1 cpu=1.00 rss=1048576 vcsw=10 nvcsw=1
+Timestamp: 101.0
+stc-agent: pids=1 cpu=1.50 rss=1048576 vcsw=20 nvcsw=1
+turbostat: pids=2 cpu=3.00 rss=2097152 vcsw=5 nvcsw=0 read=0 write=0
+Timestamp: 102.0
+stc-agent: pids=1 cpu=1.75 rss=1048576 vcsw=40 nvcsw=2
+turbostat: pids=2 cpu=0.10 rss=2097152 vcsw=6 nvcsw=0 read=0 write=2048
+Timestamp: 103.0
+stc-agent: pids=1 cpu=2.00 rss=1048576 vcsw=50 nvcsw=2
+turbostat: pids=2 cpu=0.20 rss=2097152 vcsw=7 nvcsw=0 read=0 write=4096
+"""
+
+    path = tmp_path / "stc-overhead.raw.txt"
+    path.write_text(lines, encoding="utf-8")
+
+    dfbldr = _OverheadDFBuilder.OverheadDFBuilder()
+    df = dfbldr.build_df(path)
+
+    assert list(df["stc_agent-CPU%"]) == [50, 25, 25]
+    assert list(df["stc_agent-Wakeups"]) == [10, 20, 10]
+    assert "stc_agent-DiskWrite" not in df, "Got disk I/O columns without disk I/O data"
+    # Turbostat was not running in the first sample, and was restarted in the second one.
+    assert list(df["turbostat-Processes"]) == [2, 2, 2]
+    assert df["turbostat-CPU%"].round(6).tolist() == [0, 0, 10]
+    assert list(df["turbostat-DiskWrite"]) == [0, 2, 2]
+    assert list(df["Total-RSS"]) == [3, 3, 3]
+    assert list(df["Total-DiskWrite"]) == [0, 2, 2]
+    assert not df.isnull().values.any(), "Got NaN values"
+
+    assert dfbldr.mdo is not None
+    assert "Total-CPU%" not in dfbldr.mdo.mdd and "CPU%" in dfbldr.mdo.mdd
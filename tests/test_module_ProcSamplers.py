@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'ProcSamplers' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import time
+import typing
+import threading
+import pytest
+from statscollectlibs.helperlibs import ProcSamplers
+from statscollectlibs.parsers import InterruptsParser
+
+from tests import _Common
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+_TEST_FILES_DIR = _Common.get_test_data_base() / "test_module_InterruptsParser" / "files"
+
+def _get_snapshots(path: Path) -> list[bytes]:
+    """
+    Split a raw interrupts statistics file into '/proc/interrupts' snapshots.
+
+    Args:
+        path: Path to the raw interrupts statistics file.
+
+    Returns:
+        The '/proc/interrupts' snapshots contents.
+    """
+
+    snapshots: list[list[bytes]] = []
+    with open(path, "rb") as fobj:
+        for line in fobj:
+            if line.startswith(b"Timestamp:"):
+                snapshots.append([])
+            elif snapshots and line.strip():
+                snapshots[-1].append(line)
+
+    return [b"".join(lines) for lines in snapshots]
+
+@pytest.mark.parametrize("keyframes", [1, 3])
+def test_interrupts_sampler(tmp_path: Path, keyframes: int):
+    """
+    Test that 'InterruptsSampler' snapshots are parsed into the same datasets as the original
+    '/proc/interrupts' snapshots.
+    """
+
+    for test_file in sorted(_TEST_FILES_DIR.glob("*-interrupts.raw.txt")):
+        pfx = f"{test_file}, keyframes {keyframes}"
+        procfile = tmp_path / "interrupts"
+        procfile.write_bytes(b"")
+
+        outpath = tmp_path / "interrupts.raw.txt"
+        with ProcSamplers.InterruptsSampler(keyframes=keyframes, path=str(procfile)) as sampler, \
+             open(outpath, "wb") as fobj:
+            for snapshot in _get_snapshots(test_file):
+                # Re-write the file in place, the sampler keeps it open.
+                procfile.write_bytes(snapshot)
+                fobj.write(sampler.sample())
+
+        datasets = list(InterruptsParser.InterruptsParser(path=test_file).next())
+        sdatasets = list(InterruptsParser.InterruptsParser(path=outpath).next())
+        assert len(datasets) == len(sdatasets), f"{pfx}: Different snapshots count"
+
+        for dataset, sdataset in zip(datasets, sdatasets):
+            assert dataset["cpu2irqs"] == sdataset["cpu2irqs"], f"{pfx}: Different counters"
+            # The IRQ descriptions differ in white-spaces, which the sampler compacts.
+            assert dataset["irq_info"].keys() == sdataset["irq_info"].keys(), \
+                   f"{pfx}: Different IRQs"
+
+        if keyframes > 1 and len(datasets) > 1:
+            assert b"Delta: " in outpath.read_bytes(), f"{pfx}: No delta snapshots"
+
+def test_delta_encoder_rename():
+    """
+    Test that '_DeltaEncoder' requests a keyframe when an IRQ is renamed or its description changes
+    after a delta-encoded snapshot.
+    """
+
+    encoder = ProcSamplers._DeltaEncoder() # pylint: disable=protected-access
+    header = "CPU0 CPU1"
+    encoder.keyframe(f"{header}\n8: 1 2 IR-IO-APIC 8-edge rtc0\n9: 0 0 IR-IO-APIC 9-fasteoi acpi")
+
+    # Only the counters changed, the snapshot is delta-encoded.
+    deltas = encoder.encode(f"{header}\n8: 1 5 IR-IO-APIC 8-edge rtc0\n"
+                            f"9: 0 0 IR-IO-APIC 9-fasteoi acpi")
+    assert deltas == ["8: 1:3"]
+
+    # The IRQ description changed after the delta-encoded snapshot.
+    assert encoder.encode(f"{header}\n8: 1 6 IR-IO-APIC 8-edge nvme0\n"
+                          f"9: 0 0 IR-IO-APIC 9-fasteoi acpi") is None
+
+    # The IRQ name changed after the delta-encoded snapshot.
+    assert encoder.encode(f"{header}\n10: 1 6 IR-IO-APIC 8-edge rtc0\n"
+                          f"9: 0 0 IR-IO-APIC 9-fasteoi acpi") is None
+
+def test_sampler_thread():
+    """Test running callbacks on the shared timer of 'SamplerThread'."""
+
+    thread = ProcSamplers.SamplerThread("test-sampler")
+    counts = {"fast": 0, "slow": 0, "once": 0}
+
+    def _callback(name: str) -> bool:
+        """Count the callback runs, stop running the "once" callback after the first run."""
+
+        counts[name] += 1
+        return name != "once"
+
+    for name, interval in (("fast", 0.01), ("slow", 0.1), ("once", 0.01)):
+        thread.add(name, interval, lambda name=name: _callback(name))
+
+    time.sleep(0.5)
+    thread.remove("fast")
+    fast = counts["fast"]
+    thread.remove("slow")
+
+    assert counts["once"] == 1
+    assert fast > 2 * counts["slow"] > 0, f"Bad callback runs counts {counts}"
+
+    time.sleep(0.1)
+    assert counts["fast"] == fast, "The callback was run after it was removed"
+    assert "test-sampler" not in [thr.name for thr in threading.enumerate()], \
+           "The thread did not exit after all callbacks were removed"
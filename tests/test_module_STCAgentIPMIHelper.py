@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the '_STCAgentIPMIHelper' module, using a fake 'ipmitool'."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import re
+import sys
+import typing
+import pytest
+from pepclibs.helperlibs.Exceptions import Error
+from statscollecttools import _STCAgentIPMIHelper
+
+from tests import _Common
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+# The comment line following every IPMI snapshot printed by 'stc-agent-ipmi-helper'.
+_LATENCY_REGEX = re.compile(r"^# Latency: (\d+\.\d{6}) s, jitter: (\d+\.\d{6}) s, "
+                            r"reconnects: (\d+)$")
+
+def _get_power(lines: list[str]) -> int:
+    """
+    Return the instantaneous power reading from the 'dcmi power reading' command output.
+
+    Args:
+        lines: The 'dcmi power reading' command output lines.
+
+    Returns:
+        The instantaneous power reading in Watts.
+    """
+
+    for line in _STCAgentIPMIHelper._format_dcmi_power(lines): # pylint: disable=protected-access
+        name, _, val = line.partition(": ")
+        if name == "Instantaneous power reading":
+            return int(val.split()[0])
+
+    raise AssertionError(f"No instantaneous power reading in the output:\n{lines}")
+
+def test_session_run(tmp_path: Path):
+    """
+    Test that the '_IPMIToolSession' class returns the output of every command, and only of that
+    command.
+    """
+
+    ipmitool = _Common.create_fake_ipmitool(tmp_path)
+
+    # pylint: disable-next=protected-access
+    with _STCAgentIPMIHelper._IPMIToolSession([str(ipmitool)]) as session:
+        for power in range(101, 106):
+            lines = session.run("dcmi power reading")
+            assert _get_power(lines) == power, f"Unexpected power reading output:\n{lines}"
+            assert not any("marker" in line for line in lines), \
+                   f"The echo marker leaked into the output:\n{lines}"
+
+        # The fake 'ipmitool' prints nothing for unknown commands.
+        assert session.run("sdr type Fan") == []
+        assert session.run("echo 1 2 3") == ["1 2 3"]
+
+def test_session_restart(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the '_IPMIToolSession' class detects that 'ipmitool' exited in the middle of the
+    session, and that the session can be restarted.
+    """
+
+    ipmitool = _Common.create_fake_ipmitool(tmp_path)
+    monkeypatch.setenv("FAKE_IPMITOOL_EXIT_AFTER", "3")
+
+    # pylint: disable-next=protected-access
+    with _STCAgentIPMIHelper._IPMIToolSession([str(ipmitool)]) as session:
+        assert _get_power(session.run("dcmi power reading")) == 101
+        assert _get_power(session.run("dcmi power reading")) == 102
+
+        with pytest.raises(Error, match="exited unexpectedly"):
+            session.run("dcmi power reading")
+
+        # The restarted 'ipmitool' process starts counting from the beginning.
+        session.restart()
+        for power in range(101, 104):
+            assert _get_power(session.run("dcmi power reading")) == power
+
+def test_resolve_sensors(tmp_path: Path):
+    """
+    Test resolving the sensor names and metric categories into sensor names using the 'sdr list
+    full' command output.
+    """
+
+    ipmitool = _Common.create_fake_ipmitool(tmp_path)
+    # pylint: disable-next=protected-access
+    resolve_sensors = _STCAgentIPMIHelper._resolve_sensors
+
+    # pylint: disable-next=protected-access
+    with _STCAgentIPMIHelper._IPMIToolSession([str(ipmitool)]) as session:
+        # The sensors without a reading do not belong to any category.
+        assert resolve_sensors(session, ["Power"]) == ["PS1 Input Power"]
+        # The sensors are not duplicated.
+        assert resolve_sensors(session, ["BB Inlet Temp", "Temperature", "FanSpeed"]) == \
+               ["BB Inlet Temp", "System Fan 1a"]
+        # The sensors without a reading and with an unknown unit can be selected by name.
+        assert resolve_sensors(session, ["PS2 Input Power", "PS1 Curr Out %"]) == \
+               ["PS2 Input Power", "PS1 Curr Out %"]
+
+        with pytest.raises(Error, match="Sensor 'PS3 Input Power' was not found"):
+            resolve_sensors(session, ["Power", "PS3 Input Power"])
+        with pytest.raises(Error, match="No sensors matching 'Current' were found"):
+            resolve_sensors(session, ["Current"])
+
+def test_format_sdr_get():
+    """
+    Test converting the 'sdr get' command output into the 'sdr list full' command output format.
+    """
+
+    lines = """Sensor ID              : PS1 Input Power (0x32)
+ Entity ID             : 10.1 (Power Supply)
+ Sensor Type (Threshold)  : Current (0x03)
+ Sensor Reading        : 180 (+/- 0) Watts
+ Status                : ok
+ Lower Non-Recoverable : na
+ Upper Critical        : 1000.000
+Sensor ID              : BB +12.0V (0xd0)
+ Entity ID             : 7.1 (System Board)
+ Sensor Type (Threshold)  : Voltage (0x02)
+ Sensor Reading        : 11.83 (+/- 0.06) Volts
+ Status                : ok
+Sensor ID              : PS1 Curr Out % (0x3a)
+ Sensor Reading        : 9 (+/- 0) unspecified
+ Status                : ok
+Sensor ID              : Raw Count (0x55)
+ Sensor Reading        : 5 (+/- 0)
+Sensor ID              : DIMM Thrm Mrgn 1 (0xb0)
+ Entity ID             : 32.1 (Memory Device)
+ Sensor Reading        : No Reading
+Unable to find sensor id 'PS3 Input Power'
+Sensor ID              : P1 Status
+ Sensor Reading        : 0h
+ Status                : cr"""
+
+    # pylint: disable-next=protected-access
+    output = _STCAgentIPMIHelper._format_sdr_get(lines.splitlines())
+
+    assert output == ["PS1 Input Power  | 180 Watts         | ok",
+                      "BB +12.0V        | 11.83 Volts       | ok",
+                      "PS1 Curr Out %   | 9 unspecified     | ok",
+                      "Raw Count        | 5                 | ok",
+                      "DIMM Thrm Mrgn 1 | no reading        | ns",
+                      "P1 Status        | no reading        | cr"], \
+           "Unexpected 'sdr get' output conversion result:\n" + "\n".join(output)
+
+    # The converted output is parsed the same way as the 'sdr list full' command output.
+    # pylint: disable-next=protected-access
+    units = _STCAgentIPMIHelper._parse_sdr_list(output)
+    assert units == {"PS1 Input Power": "Watts", "BB +12.0V": "Volts",
+                     "PS1 Curr Out %": "unspecified", "Raw Count": None,
+                     "DIMM Thrm Mrgn 1": None, "P1 Status": None}
+
+def test_latency_lines(tmp_path: Path):
+    """
+    Test that every snapshot printed by 'stc-agent-ipmi-helper' is followed by the latency and
+    jitter comment line, and that 'ipmitool' restarts are counted as reconnects.
+    """
+
+    _Common.create_fake_ipmitool(tmp_path)
+
+    helper_path = _Common.get_prj_src_path() / "stc-agent-ipmi-helper"
+    cmd = f"FAKE_IPMITOOL_EXIT_AFTER=3 PATH='{tmp_path}':\"$PATH\" {sys.executable} " \
+          f"{helper_path} --host bmc --dcmi-power --count 5 --interval 0.1"
+
+    with _Common.get_pman("localhost") as pman:
+        stdout, stderr, exitcode = pman.run_join(cmd)
+
+    assert exitcode == 0, f"'{cmd}' exited with code {exitcode}\nstderr:\n{stderr}"
+
+    lines = stdout.splitlines()
+    idxs = [idx for idx, line in enumerate(lines) if line.startswith("Timestamp |")]
+    assert len(idxs) == 5, f"Expected 5 snapshots, got {len(idxs)}:\n{stdout}"
+
+    powers: list[int] = []
+    reconnects: list[int] = []
+    for idx, next_idx in zip(idxs, idxs[1:] + [len(lines)]):
+        snapshot = lines[idx + 1:next_idx]
+        match = _LATENCY_REGEX.match(snapshot[-1])
+        assert match, "Snapshot does not end with the latency line:\n" + "\n".join(snapshot)
+        assert float(match[1]) > 0, f"Bad latency in '{snapshot[-1]}'"
+        if not powers:
+            assert float(match[2]) == 0, f"Non-zero jitter of the first snapshot: {snapshot[-1]}"
+
+        powers.append(_get_power(snapshot[:-1]))
+        reconnects.append(int(match[3]))
+
+    # The fake 'ipmitool' exits on the 3rd reading, and the restarted process starts counting from
+    # the beginning.
+    assert powers == [101, 102, 101, 102, 103], f"Unexpected power readings: {powers}"
+    assert reconnects == [0, 0, 1, 1, 1], f"Unexpected reconnects counts: {reconnects}"
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'Segments' module and for loading segmented raw statistics files."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+import re
+import json
+import typing
+import pytest
+from pepclibs.helperlibs.Exceptions import ErrorBadFormat
+from statscollectlibs.helperlibs import Compression, Segments
+from statscollectlibs.parsers import InterruptsParser, TurbostatParser
+from statscollectlibs.dfbuilders import _ACPowerDFBuilder, _InterruptsDFBuilder
+from statscollectlibs.result import _StatsCache
+
+from tests import _Common
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+_TEST_RESULTS_DIR = _Common.get_test_data_base() / "results" / "good"
+
+# Regular expressions matching the beginning of a sample in the raw statistics files, the same as
+# 'stc-agent' uses for splitting the collector output into segments.
+_SAMPLE_REGEXES = {
+    "turbostat": re.compile(rb"^Time_Of_Day_Seconds\s[^\n]*\n(?P<ts>\d+\.\d+)\s", re.MULTILINE),
+    "interrupts": re.compile(rb"^Timestamp: (?P<ts>\d+\.\d+)", re.MULTILINE),
+    "acpower": re.compile(rb"^(?P<ts>\d+\.\d+),", re.MULTILINE),
+}
+
+def _split_file(src: Path, dst_dir: Path, stname: str, samples_per_segment: int,
+                method: str = "") -> Path:
+    """
+    Split a raw statistics file into segments the same way 'stc-agent' does it: every segment
+    starts with a copy of the header (the data preceding the first sample) and contains whole
+    samples.
+
+    Args:
+        src: Path to the raw statistics file to split.
+        dst_dir: The directory to create the segments and the manifest in.
+        stname: Name of the statistics in the raw statistics file.
+        samples_per_segment: Count of samples in every segment.
+        method: If specified, compress the segments with this compression method.
+
+    Returns:
+        Path to the segments manifest.
+    """
+
+    data = src.read_bytes()
+    matches = list(_SAMPLE_REGEXES[stname].finditer(data))
+    header = data[:matches[0].start()]
+
+    manifest = Segments.new_manifest()
+    manifest["header_size"] = len(header)
+
+    for idx in range(0, len(matches), samples_per_segment):
+        group = matches[idx:idx + samples_per_segment]
+        if idx + samples_per_segment < len(matches):
+            end = matches[idx + samples_per_segment].start()
+        else:
+            end = len(data)
+
+        name = Segments.get_segment_name(src.name, len(manifest["segments"]))
+        if method:
+            name = Compression.add_suffix(name, method)
+        with open(dst_dir / name, "wb") as fobj:
+            segment_data = header + data[group[0].start():end]
+            if method:
+                compressor = Compression.StreamCompressor(method, fobj)
+                compressor.write(segment_data)
+                compressor.close()
+            else:
+                fobj.write(segment_data)
+
+        manifest["segments"].append({"name": name, "begin": float(group[0].group("ts")),
+                                     "end": float(group[-1].group("ts"))})
+
+    path = dst_dir / Segments.get_manifest_name(src.name)
+    Segments.write_manifest(path, manifest)
+    return path
+
+def test_parsers(tmp_path: Path):
+    """
+    Test that the parsers yield the same data for segmented and not segmented raw statistics files.
+    """
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/turbostat.raw.txt"))[:2]:
+        spath = _split_file(path, tmp_path, "turbostat", 3, method="gzip")
+        tdicts = list(TurbostatParser.TurbostatParser(path, derivatives=True).next())
+        stdicts = list(TurbostatParser.TurbostatParser(spath, derivatives=True).next_parallel(2))
+        assert tdicts == stdicts, f"Different turbostat data for segmented '{path}'"
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/interrupts.raw.txt"))[:2]:
+        spath = _split_file(path, tmp_path, "interrupts", 4)
+        parser = InterruptsParser.InterruptsParser(path=path)
+        sparser = InterruptsParser.InterruptsParser(path=spath, index_dir=tmp_path / "index")
+
+        timestamps = [dataset["timestamp"] for dataset in parser.next()]
+        stimestamps = [dataset["timestamp"] for dataset in sparser.next()]
+        assert timestamps == stimestamps, f"Different interrupts data for segmented '{path}'"
+
+        assert sparser.get_snapshots_count() == len(timestamps)
+        assert sparser.get_snapshot(-1)["timestamp"] == timestamps[-1]
+        assert not (tmp_path / "index").exists(), \
+               "The snapshots index should not be saved for segmented files"
+
+    for path in sorted(_TEST_RESULTS_DIR.glob("*/stats/acpower.raw.txt"))[:1]:
+        spath = _split_file(path, tmp_path, "acpower", 10)
+        df = _ACPowerDFBuilder.ACPowerDFBuilder().build_df(path)
+        sdf = _ACPowerDFBuilder.ACPowerDFBuilder().build_df(spath)
+        assert df.equals(sdf), f"Different AC power data for segmented '{path}'"
+
+def test_segments_range(tmp_path: Path):
+    """Test loading only the segments overlapping a time window."""
+
+    path = sorted(_TEST_RESULTS_DIR.glob("*/stats/interrupts.raw.txt"))[0]
+    spath = _split_file(path, tmp_path, "interrupts", 2)
+    manifest = Segments.read_manifest(spath)
+    segments = manifest["segments"]
+    assert len(segments) > 4, f"Too few interrupts samples in '{path}'"
+
+    begin_ts = segments[1]["end"]
+    end_ts = segments[3]["begin"]
+    selected = Segments.select_segments(manifest, begin_ts=begin_ts, end_ts=end_ts)
+    assert selected == segments[1:4]
+    assert Segments.select_segments(manifest) == segments
+    assert Segments.get_first_timestamp(spath) == segments[0]["begin"]
+
+    df = _InterruptsDFBuilder.InterruptsDFBuilder().build_df(path)
+    sdf = _InterruptsDFBuilder.InterruptsDFBuilder().build_df(spath,
+                                                               segments_range=(begin_ts, end_ts))
+    assert len(sdf) < len(df), "All segments were loaded instead of the time window segments"
+
+    window = df[(df["Timestamp"] >= begin_ts) & (df["Timestamp"] <= end_ts)]
+    swindow = sdf[(sdf["Timestamp"] >= begin_ts) & (sdf["Timestamp"] <= end_ts)]
+    window = window.drop(columns=["TimeElapsed"]).reset_index(drop=True)
+    swindow = swindow.drop(columns=["TimeElapsed"]).reset_index(drop=True)
+    # The interrupt columns order depends on the first loaded snapshot.
+    assert sorted(window.columns) == sorted(swindow.columns)
+    assert window.equals(swindow[window.columns]), \
+           f"Different interrupts time window data for segmented '{path}'"
+
+    # Segments with unknown time-stamps overlap any time window.
+    segments[0]["end"] = None
+    selected = Segments.select_segments(manifest, begin_ts=begin_ts, end_ts=end_ts)
+    assert selected == segments[0:4]
+
+def test_cache_key(tmp_path: Path):
+    """Test that the dataframe cache key of a segmented file depends on the selected segments."""
+
+    path = sorted(_TEST_RESULTS_DIR.glob("*/stats/interrupts.raw.txt"))[0]
+    spath = _split_file(path, tmp_path, "interrupts", 2)
+    segments = Segments.read_manifest(spath)["segments"]
+    params = {"segments_range": [segments[0]["begin"], segments[1]["end"]]}
+
+    cache = _StatsCache.StatsCache(cachedir=tmp_path / "cache")
+    entry_path = cache.get_entry_path("interrupts", spath, params)
+    all_entry_path = cache.get_entry_path("interrupts", spath, {})
+    assert entry_path and all_entry_path and entry_path != all_entry_path
+
+    # Growing a segment changes the cache key only if the segment is selected.
+    with open(tmp_path / segments[-1]["name"], "a", encoding="utf-8") as fobj:
+        fobj.write("\n")
+    assert cache.get_entry_path("interrupts", spath, params) == entry_path
+    assert cache.get_entry_path("interrupts", spath, {}) != all_entry_path
+
+    # A missing segment file results in a cache miss.
+    (tmp_path / segments[0]["name"]).unlink()
+    assert cache.get_entry_path("interrupts", spath, params) is None
+
+@pytest.mark.parametrize("manifest", [
+    {"format": 2, "header_size": 0, "segments": [{"name": "a.raw.txt"}]},
+    {"format": 1, "header_size": -1, "segments": [{"name": "a.raw.txt"}]},
+    {"format": 1, "header_size": 0, "segments": []},
+    {"format": 1, "header_size": 0, "segments": [{"name": "../a.raw.txt"}]},
+    {"format": 1, "header_size": 0, "segments": [{"name": "a.raw.txt", "begin": "0"}]},
+])
+def test_bad_manifest(tmp_path: Path, manifest: dict):
+    """Test that bad segments manifests are rejected."""
+
+    path = tmp_path / f"test{Segments.MANIFEST_SUFFIX}"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ErrorBadFormat):
+        Segments.read_manifest(path)
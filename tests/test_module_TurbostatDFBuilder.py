@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'TurbostatDFBuilder' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from pathlib import Path
+import pandas
+from tests import _Common
+from statscollectlibs.dfbuilders import _TurbostatDFBuilder
+from statscollectlibs.parsers import TurbostatParser
+
+_TEST_RESULTS_DIR = _Common.get_test_data_base() / "results" / "good"
+
+# The raw turbostat statistics file used as a template for generating synthetic files.
+_TEMPLATE_PATH = _TEST_RESULTS_DIR / "snr0" / "stats" / "turbostat.raw.txt"
+
+def _generate_turbostat_file(path: Path, tables_cnt: int):
+    """
+    Generate a synthetic raw turbostat statistics file by replicating the first table of the
+    template file 'tables_cnt' times with shifted time-stamps.
+
+    Args:
+        path: Path to the file to generate.
+        tables_cnt: Count of turbostat tables to generate.
+    """
+
+    with open(_TEMPLATE_PATH, "r", encoding="utf-8") as fobj:
+        lines = fobj.read().splitlines()
+
+    heading_idxs = [idx for idx, line in enumerate(lines) if "Avg_MHz" in line]
+    nontable = lines[:heading_idxs[0]]
+    table = [line.split("\t") for line in lines[heading_idxs[0]:heading_idxs[1]]]
+
+    ts_idx = table[0].index("Time_Of_Day_Seconds")
+
+    with open(path, "w", encoding="utf-8") as fobj:
+        fobj.write("\n".join(nontable) + "\n")
+        for tbl_idx in range(tables_cnt):
+            fobj.write("\t".join(table[0]) + "\n")
+            for elts in table[1:]:
+                elts = list(elts)
+                elts[ts_idx] = f"{float(elts[ts_idx]) + tbl_idx:.6f}"
+                fobj.write("\t".join(elts) + "\n")
+
+def _build_df(path: Path, cpus: list[int] | None = None, jobs: int = 1):
+    """
+    Build the turbostat dataframe for a raw turbostat statistics file.
+
+    Args:
+        path: Path to the raw turbostat statistics file.
+        cpus: The CPU numbers to include to the dataframe.
+        jobs: Count of worker processes to use for parsing.
+
+    Returns:
+        The built dataframe.
+    """
+
+    return _TurbostatDFBuilder.TurbostatDFBuilder(cpus=cpus, jobs=jobs).build_df(path)
+
+def test_good_results():
+    """
+    Test the 'TurbostatDFBuilder' module with well-formatted raw turbostat statistics files.
+    """
+
+    for dirpath in _TEST_RESULTS_DIR.iterdir():
+        path = dirpath / "stats" / "turbostat.raw.txt"
+        if not path.exists() or "corrupted" in dirpath.name:
+            continue
+
+        pfx = f"DataFrame for '{path}'"
+        df = _build_df(path, cpus=[0, 1])
+
+        assert len(df) > 0, f"{pfx}: Expected at least 1 datapoint"
+        assert "Time_Of_Day_Seconds" in df.columns, \
+               f"{pfx}: Expected 'Time_Of_Day_Seconds' column"
+        assert "TimeElapsed" in df.columns, f"{pfx}: Expected 'TimeElapsed' column"
+
+        for scope in ("System", "CPU0", "CPU1"):
+            colname = f"{scope}-Busy%"
+            assert colname in df.columns, f"{pfx}: Expected '{colname}' column"
+
+        assert len(df.columns) == len(set(df.columns)), f"{pfx}: Column names are not unique"
+
+def _build_ref_df(path: Path, cpus: list[int]) -> pandas.DataFrame:
+    """
+    Build the reference turbostat dataframe for a raw turbostat statistics file the simple way: by
+    concatenating one-row dataframes built out of the sequentially parsed turbostat tables.
+
+    Args:
+        path: Path to the raw turbostat statistics file.
+        cpus: The CPU numbers to include to the dataframe.
+
+    Returns:
+        The reference dataframe.
+    """
+
+    dfbldr = _TurbostatDFBuilder.TurbostatDFBuilder(cpus=cpus)
+    # Initialize the metrics definition object and the file path.
+    dfbldr.build_df(path)
+
+    rows = [pandas.DataFrame([dfbldr._dataset_to_row(dataset)]) # pylint: disable=protected-access
+            for dataset in TurbostatParser.TurbostatParser(path, derivatives=True).next()]
+    return pandas.concat(rows, ignore_index=True)
+
+def test_reference_df(tmp_path: Path):
+    """
+    Verify that the dataframe built column-by-column, sequentially and in parallel, is the same as
+    the reference dataframe built row-by-row.
+    """
+
+    tables_cnt = 100
+    path = tmp_path / "turbostat.raw.txt"
+    _generate_turbostat_file(path, tables_cnt)
+
+    ref_df = _build_ref_df(path, cpus=[0, 1])
+    assert len(ref_df) == tables_cnt, f"Expected {tables_cnt} datapoints, got {len(ref_df)}"
+
+    for jobs in (1, 4):
+        df = _build_df(path, cpus=[0, 1], jobs=jobs)
+        pandas.testing.assert_frame_equal(df, ref_df)
+
+def test_parallel_parsing(tmp_path: Path):
+    """
+    Verify that parsing turbostat statistics in parallel produces the same dataframe as parsing
+    them sequentially, including the derivative metrics stitched across chunk boundaries.
+    """
+
+    path = tmp_path / "turbostat.raw.txt"
+    _generate_turbostat_file(path, 50)
+
+    seq_df = _build_df(path, cpus=[0, 1])
+    for jobs in (2, 3, 8):
+        par_df = _build_df(path, cpus=[0, 1], jobs=jobs)
+        pandas.testing.assert_frame_equal(seq_df, par_df)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# vim: ts=4 sw=4 tw=100 et ai si
+#
+# Copyright (C) 2026 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Author: agent <agent@local>
+
+"""Tests for the 'TurbostatParser' module."""
+
+from __future__ import annotations # Remove when switching to Python 3.10+.
+
+from tests import _Common
+from statscollectlibs.parsers import TurbostatParser
+from statscollectlibs.mdc import TurbostatMDC
+
+_TEST_RESULTS_DIR = _Common.get_test_data_base() / "results" / "good"
+
+def test_projection():
+    """
+    Verify that parsing turbostat statistics with a CPU and metric projection produces the same
+    system totals and the same projected CPU metrics as parsing everything.
+    """
+
+    for dirpath in _TEST_RESULTS_DIR.iterdir():
+        path = dirpath / "stats" / "turbostat.raw.txt"
+        if not path.exists() or "corrupted" in dirpath.name:
+            continue
+
+        full_tdicts = list(TurbostatParser.TurbostatParser(path, derivatives=True).next())
+        mdd = TurbostatMDC.TurbostatMDC(list(full_tdicts[0]["totals"])).mdd
+
+        for cpus in ([], [0, 1]):
+            pfx = f"Turbostat statistics file '{path}', projected CPUs {cpus}"
+
+            parser = TurbostatParser.TurbostatParser(path, derivatives=True, cpus=cpus,
+                                                     metrics=mdd)
+            proj_tdicts = list(parser.next())
+            assert len(proj_tdicts) == len(full_tdicts), f"{pfx}: Different count of tables"
+
+            for full_tdict, proj_tdict in zip(full_tdicts, proj_tdicts):
+                assert proj_tdict["totals"] == full_tdict["totals"], \
+                       f"{pfx}: Different system totals"
+
+                for cpu in cpus:
+                    full_cpuinfo = {metric: val for metric, val in full_tdict["cpus"][cpu].items()
+                                    if metric in mdd}
+                    proj_cpuinfo = {metric: val for metric, val in proj_tdict["cpus"][cpu].items()
+                                    if metric in mdd}
+                    assert proj_cpuinfo == full_cpuinfo, f"{pfx}: Different CPU{cpu} metrics"
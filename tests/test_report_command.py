@@ -10,8 +10,11 @@
 """Tests for 'pepc report' command."""
 
 from pathlib import Path
-from pepclibs.helperlibs.Exceptions import Error
+import pandas
+from pepclibs.helperlibs.Exceptions import Error, ErrorNotFound
 from statscollectlibs.helperlibs import TestRunner
+from statscollectlibs.result import LoadedResult, RORawResult
+from statscollectlibs.result._StatsCache import StatsCache
 from statscollecttools import _StatsCollect
 from tests import _Common
 
@@ -26,9 +29,70 @@ def test_report_command_good(tmp_path: Path):
 
     for resdir in results_dir.iterdir():
         outdir = tmp_path / resdir.name
-        args = f"report -o {outdir} {resdir}"
+        args = f"report -o {outdir} --no-cache {resdir}"
         TestRunner.run_tool(_StatsCollect, "stats-collect", args)
 
+def _get_cache_entries(cachedir: Path) -> dict[Path, int]:
+    """
+    Return the cache entries in a cache directory.
+
+    Args:
+        cachedir: The cache directory path.
+
+    Returns:
+        A dictionary with cache entry paths as keys and their inode numbers as values.
+    """
+
+    return {path: path.stat().st_ino for path in cachedir.glob("*.parquet")}
+
+def test_report_command_cache(tmp_path: Path):
+    """
+    Test the 'report' command with the dataframes cache: generate every report twice, the second
+    time the dataframes must be taken from the cache. Verify that the cached dataframes are the same
+    as the dataframes built from the raw statistics files.
+    """
+
+    results_dir = _TEST_FILES_DIR / "good"
+    cachedir = tmp_path / "cache"
+    cache = StatsCache(cachedir=cachedir)
+    entries: dict[Path, int] = {}
+
+    for idx in range(2):
+        for resdir in results_dir.iterdir():
+            outdir = tmp_path / f"{resdir.name}-{idx}"
+            args = f"report -o {outdir} --cache-dir {cachedir} {resdir}"
+            TestRunner.run_tool(_StatsCollect, "stats-collect", args)
+
+        if idx == 0:
+            entries = _get_cache_entries(cachedir)
+            assert entries, f"No cache entries were created in '{cachedir}'"
+
+    # Cache entries are written to a temporary file first, and then renamed, so re-writing an entry
+    # changes its inode number. Cache hits do not re-write the entries.
+    assert _get_cache_entries(cachedir) == entries, \
+           "The cache entries changed when generating the reports the second time"
+
+    # Identical raw statistics files in different results share the cache entry.
+    found = set()
+    for resdir in results_dir.iterdir():
+        res = RORawResult.RORawResult(resdir)
+        for stname in res.info["stinfo"]:
+            try:
+                path = res.get_stats_path(stname)
+            except ErrorNotFound:
+                continue
+            params = {"cpus": None} if stname in ("turbostat", "interrupts") else {}
+            entry_path = cache.get_entry_path(stname, path, params)
+            if not entry_path or entry_path not in entries:
+                continue
+
+            found.add(entry_path)
+            ref_df = LoadedResult.LoadedResult(res).load_stat(stname).df
+            df = LoadedResult.LoadedResult(res, cache=cache).load_stat(stname).df
+            pandas.testing.assert_frame_equal(df, ref_df, obj=f"{resdir.name} {stname} dataframe")
+
+    assert found == set(entries), "Some cache entries do not belong to any raw statistics file"
+
 def test_report_command_bad(tmp_path: Path):
     """
     Test the 'report' command with bad input data.
@@ -38,5 +102,5 @@ def test_report_command_bad(tmp_path: Path):
 
     for resdir in results_dir.iterdir():
         outdir = tmp_path / resdir.name
-        args = f"report -o {outdir} {resdir}"
+        args = f"report -o {outdir} --cache-dir {tmp_path / 'cache'} {resdir}"
         TestRunner.run_tool(_StatsCollect, "stats-collect", args, exp_exc=Error)
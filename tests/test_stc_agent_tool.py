@@ -805,3 +805,357 @@ def test_labels(params: _TestParamsTypedDict):
             assert label.get("name") == expected_name, \
                    f"Expected label name '{expected_name}', got: {line!r}"
             assert "ts" in label, f"Label line missing 'ts' key: {line!r}"
+
+def _recv_frame(sock: socket.socket) -> tuple[str, bytes]:
+    """
+    Receive one frame of statistics samples streamed by 'stc-agent' to a subscriber.
+
+    Args:
+        sock: The subscribed socket to receive from.
+
+    Returns:
+        A tuple of the statistics name and the samples data.
+    """
+
+    header = b""
+    while not header.endswith(b"\n"):
+        chunk = sock.recv(1)
+        assert chunk, "Connection closed before a complete frame header was received"
+        header += chunk
+
+    stname, size = header.decode("utf-8").split()
+    data = b""
+    while len(data) < int(size):
+        chunk = sock.recv(int(size) - len(data))
+        assert chunk, "Connection closed before a complete frame was received"
+        data += chunk
+
+    return stname, data
+
+def test_subscribe(params: _TestParamsTypedDict):
+    """
+    Test that 'subscribe' streams the newly collected samples to the client.
+
+    Scenario:
+     1. Start stc-agent and configure the interrupts collector.
+     2. Verify that subscribing to an inactive collector fails.
+     3. Start collection and subscribe to the interrupts statistics over a second connection.
+     4. Receive frames for a few collection intervals and verify they contain complete lines and
+        '/proc/interrupts' snapshots.
+     5. Close the subscriber connection, stop and exit stc-agent cleanly.
+
+    Args:
+        params: Test parameters including the process manager and 'stc-agent' path.
+    """
+
+    pman = params["pman"]
+    stc_agent_path = params["stc_agent_path"]
+    interrupts_helper_path = params["interrupts_helper_path"]
+
+    if interrupts_helper_path is None:
+        pytest.skip("The interrupts collector is not available")
+
+    with contextlib.ExitStack() as stack:
+        proc, port = stack.enter_context(_start_stc_agent(pman, stc_agent_path=stc_agent_path))
+        outdir = stack.enter_context(pman.mkdtemp_ctx(prefix="stc_subscribe_"))
+        sock = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+
+        _send_cmd(sock, "set-stats interrupts")
+        _send_cmd(sock, f"set-collector-property interrupts outdir {outdir}")
+        _send_cmd(sock, f"set-collector-property interrupts logdir {outdir / 'log'}")
+        _send_cmd(sock, "set-collector-property interrupts interval 1")
+        _send_cmd(sock, f"set-collector-property interrupts toolpath {interrupts_helper_path}")
+        _send_cmd(sock, "configure")
+
+        with socket.create_connection((pman.hostname, port), timeout=10) as subsock:
+            with pytest.raises(Error):
+                _send_cmd(subsock, "subscribe turbostat")
+
+            _send_cmd(sock, "start")
+            _send_cmd(subsock, "subscribe interrupts")
+
+            data = b""
+            start = time.time()
+            while time.time() - start < 3:
+                stname, frame = _recv_frame(subsock)
+                assert stname == "interrupts", f"Unexpected statistics name '{stname}' in a frame"
+                assert frame.endswith(b"\n"), "A frame does not end with a complete line"
+                data += frame
+
+        _send_cmd(sock, "stop")
+        _send_cmd(sock, "exit")
+        _, _, exitcode = proc.wait(timeout=10)
+        assert exitcode == 0, f"'stc-agent' exited with code {exitcode}"
+
+    # The subscription may start in the middle of a snapshot, skip to the first complete one.
+    idx = data.find(b"Timestamp: ")
+    assert idx != -1, "The streamed interrupts statistics contain no snapshots"
+
+    parser = InterruptsParser.InterruptsParser(lines=iter(data[idx:].decode("utf-8").splitlines()))
+    for _ in parser.next():
+        break
+    else:
+        assert False, "The streamed interrupts statistics contain no snapshots"
+
+def test_get_latest(params: _TestParamsTypedDict):
+    """
+    Test that 'get-latest' returns the aggregates of the recently collected samples.
+
+    Scenario:
+     1. Start stc-agent and configure the interrupts collector.
+     2. Verify that 'get-latest' fails before the collector is started.
+     3. Start collection and wait for a few collection intervals.
+     4. Verify that 'get-latest' returns the interrupts rate aggregates.
+     5. Stop collection and verify that the recent samples are still available.
+
+    Args:
+        params: Test parameters including the process manager and 'stc-agent' path.
+    """
+
+    pman = params["pman"]
+    stc_agent_path = params["stc_agent_path"]
+    interrupts_helper_path = params["interrupts_helper_path"]
+
+    if interrupts_helper_path is None:
+        pytest.skip("The interrupts collector is not available")
+
+    with contextlib.ExitStack() as stack:
+        proc, port = stack.enter_context(_start_stc_agent(pman, stc_agent_path=stc_agent_path))
+        outdir = stack.enter_context(pman.mkdtemp_ctx(prefix="stc_get_latest_"))
+        sock = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+
+        _send_cmd(sock, "set-stats interrupts")
+        _send_cmd(sock, f"set-collector-property interrupts outdir {outdir}")
+        _send_cmd(sock, f"set-collector-property interrupts logdir {outdir / 'log'}")
+        _send_cmd(sock, "set-collector-property interrupts interval 1")
+        _send_cmd(sock, f"set-collector-property interrupts toolpath {interrupts_helper_path}")
+        _send_cmd(sock, "configure")
+
+        with pytest.raises(Error):
+            _send_cmd(sock, "get-latest interrupts 10")
+
+        _send_cmd(sock, "start")
+        time.sleep(4)
+
+        for stop in (False, True):
+            if stop:
+                _send_cmd(sock, "stop")
+
+            sock.sendall(b"get-latest interrupts 60" + _Collectors.DELIMITER)
+            msg = _recv_msg(sock)
+            assert msg.startswith("OK "), f"'get-latest' command failed: {msg}"
+
+            result = json.loads(msg[len("OK "):])
+            assert result["samples"] > 0, f"No recent interrupts samples: {result}"
+            aggr = result["metrics"]["IRQ/s"]
+            assert aggr["min"] <= aggr["avg"] <= aggr["max"], \
+                   f"Bad interrupts rate aggregates: {aggr}"
+
+        _send_cmd(sock, "exit")
+        _, _, exitcode = proc.wait(timeout=10)
+        assert exitcode == 0, f"'stc-agent' exited with code {exitcode}"
+
+def test_batch(params: _TestParamsTypedDict):
+    """
+    Test that 'batch' executes a list of commands and responds with the list of their responses.
+
+    Scenario:
+     1. Start stc-agent and send a batch of commands configuring the interrupts collector.
+     2. Verify that every command succeeded.
+     3. Send a batch with a failing command in the middle and verify that the commands following
+        it are not executed.
+     4. Verify that 'exit' is rejected in a batch, then exit stc-agent cleanly.
+
+    Args:
+        params: Test parameters including the process manager and 'stc-agent' path.
+    """
+
+    pman = params["pman"]
+    stc_agent_path = params["stc_agent_path"]
+    interrupts_helper_path = params["interrupts_helper_path"]
+
+    if interrupts_helper_path is None:
+        pytest.skip("The interrupts collector is not available")
+
+    def _send_batch(sock: socket.socket, cmds: list[str]) -> list[str]:
+        """Send a batch of commands and return the list of the responses."""
+
+        sock.sendall(f"batch {json.dumps(cmds)}".encode() + _Collectors.DELIMITER)
+        msg = _recv_msg(sock)
+        assert msg.startswith("OK "), f"'batch' command failed: {msg}"
+        return json.loads(msg[len("OK "):])
+
+    with contextlib.ExitStack() as stack:
+        proc, port = stack.enter_context(_start_stc_agent(pman, stc_agent_path=stc_agent_path))
+        outdir = stack.enter_context(pman.mkdtemp_ctx(prefix="stc_batch_"))
+        sock = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+
+        cmds = ["set-stats interrupts",
+                f"set-collector-property interrupts outdir {outdir}",
+                f"set-collector-property interrupts logdir {outdir / 'log'}",
+                "set-collector-property interrupts interval 1",
+                f"set-collector-property interrupts toolpath {interrupts_helper_path}",
+                "configure"]
+        responses = _send_batch(sock, cmds)
+        assert responses == ["OK"] * len(cmds), f"Unexpected batch responses: {responses}"
+
+        cmds = ["set-collector-property interrupts interval 2",
+                "set-collector-property interrupts bogus 1",
+                "configure"]
+        responses = _send_batch(sock, cmds)
+        assert len(responses) == 2, f"Expected 2 batch responses, got: {responses}"
+        assert responses[0] == "OK", f"Unexpected batch response: {responses[0]}"
+        assert responses[1].startswith("Error: "), f"Expected an error, got: {responses[1]}"
+
+        responses = _send_batch(sock, ["exit"])
+        assert responses[0].startswith("Bad command in batch:"), \
+               f"Expected 'exit' to be rejected in a batch, got: {responses[0]}"
+
+        _send_cmd(sock, "exit")
+        _, _, exitcode = proc.wait(timeout=10)
+        assert exitcode == 0, f"'stc-agent' exited with code {exitcode}"
+
+def test_placement(params: _TestParamsTypedDict):
+    """
+    Test that the 'cpus' and 'nice' 'stc-agent' properties apply to the collector processes.
+
+    Scenario:
+     1. Start stc-agent and verify that bad 'cpus', 'nice', and 'cgroup' values are rejected.
+     2. Configure the interrupts collector to run the helper process, bind 'stc-agent' to a single
+        CPU and make it nicer.
+     3. Start collection and verify that the helper process runs on the CPU with the niceness.
+     4. Stop collection and exit stc-agent cleanly.
+
+    Args:
+        params: Test parameters including the process manager and 'stc-agent' path.
+    """
+
+    pman = params["pman"]
+    stc_agent_path = params["stc_agent_path"]
+    interrupts_helper_path = params["interrupts_helper_path"]
+
+    if interrupts_helper_path is None:
+        pytest.skip("The interrupts collector is not available")
+
+    def _get_status(pid: int, key: str) -> str:
+        """Return the value of the 'key' key of the '/proc/<pid>/status' file."""
+
+        stdout, _ = pman.run_verify(f"grep '^{key}:' /proc/{pid}/status")
+        return stdout.split(":", maxsplit=1)[1].strip()
+
+    with contextlib.ExitStack() as stack:
+        proc, port = stack.enter_context(_start_stc_agent(pman, stc_agent_path=stc_agent_path))
+        outdir = stack.enter_context(pman.mkdtemp_ctx(prefix="stc_placement_"))
+        sock = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+
+        for prop in ("cpus -1", "nice 20", "cgroup relative/path", f"cgroup {outdir}"):
+            with pytest.raises(Error):
+                _send_cmd(sock, f"set-agent-property {prop}")
+
+        # Pick the first CPU 'stc-agent' is allowed to run on.
+        cpus = _get_status(proc.pid, "Cpus_allowed_list")
+        cpu = Trivial.str_to_int(cpus.split(",")[0].split("-")[0])
+
+        _send_cmd(sock, "set-stats interrupts")
+        _send_cmd(sock, f"set-collector-property interrupts outdir {outdir}")
+        _send_cmd(sock, f"set-collector-property interrupts logdir {outdir / 'log'}")
+        _send_cmd(sock, "set-collector-property interrupts interval 1")
+        _send_cmd(sock, f"set-collector-property interrupts toolpath {interrupts_helper_path}")
+        _send_cmd(sock, "set-collector-property interrupts helper True")
+        _send_cmd(sock, "configure")
+        _send_cmd(sock, f"set-agent-property cpus {cpu}")
+        _send_cmd(sock, "set-agent-property nice 5")
+        _send_cmd(sock, "start")
+
+        procs = _wait_for_processes(interrupts_helper_path.name, pman=pman)
+        assert procs, f"Expected '{interrupts_helper_path.name}' to be running after 'start'"
+
+        for pid, _ in procs:
+            assert _get_status(pid, "Cpus_allowed_list") == str(cpu), \
+                   f"Collector process {pid} is not bound to CPU {cpu}"
+            stdout, _ = pman.run_verify(f"ps -o ni= -p {pid}")
+            assert stdout.strip() == "5", f"Unexpected collector process {pid} niceness {stdout}"
+
+        # The properties cannot be changed while the collectors are running.
+        with pytest.raises(Error):
+            _send_cmd(sock, "set-agent-property nice 0")
+
+        _send_cmd(sock, "stop")
+        _send_cmd(sock, "exit")
+        _, _, exitcode = proc.wait(timeout=10)
+        assert exitcode == 0, f"'stc-agent' exited with code {exitcode}"
+
+def test_concurrent_clients(params: _TestParamsTypedDict):
+    """
+    Test that 'stc-agent' serves multiple clients concurrently.
+
+    Scenario:
+     1. Start stc-agent and connect two clients.
+     2. Configure the interrupts collector to run a helper wrapper that takes a few seconds to exit
+        on 'SIGINT', and start collection on the first client.
+     3. Send 'stop' on the first client, and verify that 'get-failed-collectors' on the second
+        client is answered while 'stop' is still in progress.
+     4. Verify that 'exit' on the first client disconnects only the first client, and that the
+        second client is still served.
+     5. Send 'exit' on the second client and verify stc-agent exits cleanly.
+
+    Args:
+        params: Test parameters including the process manager and 'stc-agent' path.
+    """
+
+    pman = params["pman"]
+    stc_agent_path = params["stc_agent_path"]
+    interrupts_helper_path = params["interrupts_helper_path"]
+
+    if interrupts_helper_path is None:
+        pytest.skip("The interrupts collector is not available")
+
+    # Seconds the helper wrapper waits before exiting on 'SIGINT'.
+    stop_delay = 3
+
+    with contextlib.ExitStack() as stack:
+        proc, port = stack.enter_context(_start_stc_agent(pman, stc_agent_path=stc_agent_path))
+        outdir = stack.enter_context(pman.mkdtemp_ctx(prefix="stc_concurrent_clients_"))
+        sock1 = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+        sock2 = stack.enter_context(socket.create_connection((pman.hostname, port), timeout=10))
+
+        toolpath = outdir / "slow-interrupts-helper"
+        with pman.open(toolpath, "w") as fobj:
+            fobj.write(f"#!/bin/sh\n"
+                       f"trap 'sleep {stop_delay}; exit 0' INT\n"
+                       f"{interrupts_helper_path} \"$@\"\n")
+        pman.run_verify(f"chmod +x {toolpath}")
+
+        _send_cmd(sock1, "set-stats interrupts")
+        _send_cmd(sock1, f"set-collector-property interrupts outdir {outdir}")
+        _send_cmd(sock1, f"set-collector-property interrupts logdir {outdir / 'log'}")
+        _send_cmd(sock1, "set-collector-property interrupts interval 1")
+        _send_cmd(sock1, f"set-collector-property interrupts toolpath {toolpath}")
+        _send_cmd(sock1, "set-collector-property interrupts helper True")
+        _send_cmd(sock1, "configure")
+        _send_cmd(sock1, "start")
+
+        procs = _wait_for_processes(interrupts_helper_path.name, pman=pman)
+        assert procs, f"Expected '{interrupts_helper_path.name}' to be running after 'start'"
+
+        # Do not wait for the 'stop' response, it takes 'stop_delay' seconds.
+        start_time = time.monotonic()
+        sock1.sendall(b"stop" + _Collectors.DELIMITER)
+        time.sleep(0.5)
+
+        assert _get_failed_collectors(sock2) == [], "Unexpected failed collectors"
+        elapsed = time.monotonic() - start_time
+        assert elapsed < stop_delay, \
+               f"'get-failed-collectors' was blocked by 'stop' for {elapsed:.1f} seconds"
+
+        msg = _recv_msg(sock1)
+        assert msg == "OK", f"'stop' command failed: {msg}"
+
+        # 'exit' disconnects only the client that sent it.
+        _send_cmd(sock1, "exit")
+        assert _get_failed_collectors(sock2) == [], "Unexpected failed collectors"
+        assert proc.poll() is None, "'stc-agent' exited while a client was still connected"
+
+        _send_cmd(sock2, "exit")
+        _, _, exitcode = proc.wait(timeout=10)
+        assert exitcode == 0, f"'stc-agent' exited with code {exitcode}"